@@ -0,0 +1,76 @@
+"""Compare the per-iteration latency of a training loop saving checkpoints synchronously and with
+``Checkpoint(async_save=True)``.
+
+Each iteration updates a model of ``--num_params`` parameters, and a checkpoint of the model and optimizer is saved to
+a temporary directory every ``--every`` iterations.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/checkpoint.py --num_params 100000000 --every 10 --device cuda
+"""
+
+import argparse
+import tempfile
+import time
+from typing import Tuple
+
+import torch
+
+from ignite.engine import Engine, Events
+from ignite.handlers import Checkpoint
+
+
+def run(async_save: bool, args: argparse.Namespace, device: torch.device) -> Tuple[float, float]:
+    model = torch.nn.Linear(args.num_params // 1000, 1000, bias=False).to(device)
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.01, momentum=0.9)
+    x = torch.rand(8, args.num_params // 1000, device=device)
+
+    def train_step(engine, batch):
+        optimizer.zero_grad()
+        model(x).sum().backward()
+        optimizer.step()
+
+    trainer = Engine(train_step)
+    with tempfile.TemporaryDirectory() as dirname:
+        checkpointer = Checkpoint({"model": model, "optimizer": optimizer}, dirname, n_saved=2, async_save=async_save)
+        blocked = []
+
+        def save(engine: Engine) -> None:
+            start = time.perf_counter()
+            checkpointer(engine)
+            blocked.append(time.perf_counter() - start)
+
+        trainer.add_event_handler(Events.ITERATION_COMPLETED(every=args.every), save)
+        # warm-up
+        trainer.run(range(args.every))
+
+        blocked.clear()
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+        start = time.perf_counter()
+        # the elapsed time includes waiting for the pending checkpoints on COMPLETED
+        trainer.run(range(args.num_iters))
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+        return time.perf_counter() - start, sum(blocked) / len(blocked)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--num_params", type=int, default=10_000_000)
+    parser.add_argument("--num_iters", type=int, default=100)
+    parser.add_argument("--every", type=int, default=10)
+    parser.add_argument("--device", type=str, default="cpu")
+    args = parser.parse_args()
+    device = torch.device(args.device)
+
+    print(f"{'mode':>5} | {'ms/iteration':>12} | {'ms blocked/save':>15}")
+    for mode, async_save in [("sync", False), ("async", True)]:
+        elapsed, blocked = run(async_save, args, device)
+        print(f"{mode:>5} | {elapsed * 1e3 / args.num_iters:>12.3f} | {blocked * 1e3:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
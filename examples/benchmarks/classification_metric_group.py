@@ -0,0 +1,91 @@
+"""Compare the evaluation time of classification metrics attached one by one and computed by
+``ClassificationMetricGroup``.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/classification_metric_group.py --num_iters 500 --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from ignite.engine import Engine
+from ignite.metrics import (
+    Accuracy,
+    ClassificationMetricGroup,
+    ClassificationReport,
+    ConfusionMatrix,
+    Fbeta,
+    mIoU,
+    Precision,
+    Recall,
+    TopKCategoricalAccuracy,
+)
+
+
+def create_metrics(num_classes: int) -> dict:
+    precision = Precision(average=False)
+    recall = Recall(average=False)
+    cm = ConfusionMatrix(num_classes)
+    return {
+        "accuracy": Accuracy(),
+        "precision": Precision(average="macro"),
+        "recall": Recall(average="macro"),
+        "f1": Fbeta(1.0, precision=precision, recall=recall),
+        "report": ClassificationReport(output_dict=True),
+        "cm": cm,
+        "miou": mIoU(cm),
+        "top5": TopKCategoricalAccuracy(k=5),
+    }
+
+
+def run(attach, data, device) -> float:
+    evaluator = Engine(lambda e, batch: batch)
+    attach(evaluator)
+    # warm-up
+    evaluator.run(data[:2])
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    evaluator.run(data)
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--num_iters", type=int, default=200)
+    parser.add_argument("--batch_size", type=int, default=256)
+    parser.add_argument("--num_classes", type=int, default=100)
+    parser.add_argument("--device", type=str, default="cpu")
+    args = parser.parse_args()
+    device = torch.device(args.device)
+
+    data = [
+        (
+            torch.rand(args.batch_size, args.num_classes, device=device),
+            torch.randint(0, args.num_classes, size=(args.batch_size,), device=device),
+        )
+        for _ in range(args.num_iters)
+    ]
+
+    def attach_separately(evaluator):
+        for name, metric in create_metrics(args.num_classes).items():
+            metric.attach(evaluator, name)
+
+    def attach_group(evaluator):
+        group = ClassificationMetricGroup(create_metrics(args.num_classes), args.num_classes, device=device)
+        group.attach(evaluator, "classification")
+
+    for mode, attach in [("separately", attach_separately), ("group", attach_group)]:
+        elapsed = run(attach, data, device)
+        print(f"{mode:>10} | {elapsed * 1e3 / args.num_iters:.3f} ms/iteration")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measure per-iteration overhead of :class:`~ignite.engine.engine.Engine` depending on the number of handlers.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/engine_overhead.py --num_iters 20000 --num_handlers 0 10 100
+"""
+
+import argparse
+import time
+
+from ignite.engine import Engine, Events
+
+
+def measure(num_handlers: int, num_iters: int, filtered: bool = False) -> float:
+    engine = Engine(lambda e, b: None)
+
+    def handler(engine):
+        pass
+
+    event = Events.ITERATION_COMPLETED(every=num_iters) if filtered else Events.ITERATION_COMPLETED
+    for _ in range(num_handlers):
+        engine.add_event_handler(event, handler)
+
+    data = list(range(num_iters))
+    start = time.perf_counter()
+    engine.run(data, max_epochs=1)
+    elapsed = time.perf_counter() - start
+    return elapsed / num_iters
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--num_iters", type=int, default=20000)
+    parser.add_argument("--num_handlers", type=int, nargs="+", default=[0, 10, 100])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'handlers':>10} | {'plain (us/iter)':>16} | {'every=N (us/iter)':>18}")
+    for n in args.num_handlers:
+        plain = min(measure(n, args.num_iters) for _ in range(args.repeats))
+        filtered = min(measure(n, args.num_iters, filtered=True) for _ in range(args.repeats))
+        print(f"{n:>10} | {plain * 1e6:>16.2f} | {filtered * 1e6:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compare the time to compute the trace of the matrix square root of FID with ``scipy.linalg.sqrtm`` on CPU and with
+the torch implementation of ignite.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/fid_score.py --num_features 2048 --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from ignite.metrics.gan.fid import _trace_sqrt_product
+
+try:
+    import scipy.linalg
+except ImportError:
+    scipy = None
+
+
+def timeit(fn, num_repeats: int, device: torch.device) -> float:
+    fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / num_repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--num_features", type=int, default=2048)
+    parser.add_argument("--num_samples", type=int, default=10000)
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--num_repeats", type=int, default=3)
+    args = parser.parse_args()
+    device = torch.device(args.device)
+
+    sigma1 = torch.cov(torch.rand(args.num_samples, args.num_features, dtype=torch.float64).T)
+    sigma2 = torch.cov(torch.rand(args.num_samples, args.num_features, dtype=torch.float64).T)
+
+    if scipy is not None:
+        product = (sigma1 @ sigma2).numpy()
+        elapsed = timeit(lambda: scipy.linalg.sqrtm(product).trace(), args.num_repeats, torch.device("cpu"))
+        print(f"{'scipy':>6} | {elapsed:.3f} s")
+
+    sigma1, sigma2 = sigma1.to(device), sigma2.to(device)
+    elapsed = timeit(lambda: _trace_sqrt_product(sigma1, sigma2), args.num_repeats, device)
+    print(f"{'torch':>6} | {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare the time to accumulate the FID statistics of a batch of features with one outer product per sample, with
+one matrix product per batch and with the merge of the moments of the batch done by ``FID``.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/fid_update.py --num_features 2048 --batch_size 64 --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from ignite.metrics import FID
+
+
+def per_sample_update(features: torch.Tensor, total: torch.Tensor, sigma: torch.Tensor) -> None:
+    for f in features:
+        total += f
+        sigma += torch.outer(f, f)
+
+
+def batched_update(features: torch.Tensor, total: torch.Tensor, sigma: torch.Tensor) -> None:
+    total += features.sum(dim=0)
+    sigma += features.t() @ features
+
+
+def timeit(fn, num_repeats: int, device: torch.device) -> float:
+    fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / num_repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--num_features", type=int, default=2048)
+    parser.add_argument("--batch_size", type=int, default=64)
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--num_repeats", type=int, default=5)
+    args = parser.parse_args()
+    device = torch.device(args.device)
+
+    features = torch.rand(args.batch_size, args.num_features, dtype=torch.float64, device=device)
+    total = torch.zeros(args.num_features, dtype=torch.float64, device=device)
+    sigma = torch.zeros(args.num_features, args.num_features, dtype=torch.float64, device=device)
+
+    for name, update in [("per sample", per_sample_update), ("batched", batched_update)]:
+        elapsed = timeit(lambda: update(features, total, sigma), args.num_repeats, device)
+        print(f"{name:>10} | {elapsed * 1e3:.3f} ms/batch")
+
+    k = args.num_features
+    moments = torch.zeros(1 + k + k * k, dtype=torch.float64, device=device)
+    elapsed = timeit(lambda: FID._online_update(features, moments), args.num_repeats, device)
+    print(f"{'merged':>10} | {elapsed * 1e3:.3f} ms/batch")
+
+
+if __name__ == "__main__":
+    main()
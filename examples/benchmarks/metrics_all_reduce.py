@@ -0,0 +1,113 @@
+"""Measure the time spent reducing metrics at the end of an evaluation, with gloo on CPU.
+
+Three modes are compared:
+
+- ``per-attribute``: one collective per reduced attribute (previous behaviour of ``sync_all_reduce``),
+- ``per-metric``: attributes of a metric sharing the same reduction operation and dtype are reduced together,
+- ``evaluator``: attributes of all the metrics are reduced in one round with ``coalesce_sync_all_reduce``.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/metrics_all_reduce.py --nproc_per_node 4 --num_epochs 50
+"""
+
+import argparse
+import time
+from unittest.mock import patch
+
+import torch
+import torch.nn as nn
+
+import ignite.distributed as idist
+import ignite.metrics.metric as metric_module
+from ignite.engine import Engine, Events
+from ignite.metrics import Accuracy, ConfusionMatrix, Loss, Precision, Recall, TopKCategoricalAccuracy
+from ignite.metrics.metric import coalesce_sync_all_reduce
+
+MODES = ["per-attribute", "per-metric", "evaluator"]
+
+
+def _all_reduce_per_attribute(values_ops):
+    return [idist.all_reduce(v.clone() if isinstance(v, torch.Tensor) else v, op=op) for v, op in values_ops]
+
+
+def create_metrics(num_classes: int) -> dict:
+    metrics = {
+        "accuracy": Accuracy(),
+        "precision": Precision(average=False),
+        "recall": Recall(average=False),
+        "macro_precision": Precision(average="macro"),
+        "macro_recall": Recall(average="macro"),
+        "weighted_precision": Precision(average="weighted"),
+        "weighted_recall": Recall(average="weighted"),
+        "cm": ConfusionMatrix(num_classes=num_classes),
+        "loss": Loss(nn.CrossEntropyLoss()),
+    }
+    for k in range(2, 8):
+        metrics[f"top{k}"] = TopKCategoricalAccuracy(k=k)
+    return metrics
+
+
+def run(local_rank: int, config: dict) -> None:
+    rank = idist.get_rank()
+    torch.manual_seed(12 + rank)
+    num_classes = config["num_classes"]
+    data = [
+        (torch.rand(config["batch_size"], num_classes), torch.randint(0, num_classes, size=(config["batch_size"],)))
+        for _ in range(config["num_iters"])
+    ]
+
+    if rank == 0:
+        print(f"{'mode':>14} | {'collectives/epoch':>18} | {'reduction (ms/epoch)':>21}")
+
+    for mode in MODES:
+        evaluator = Engine(lambda e, batch: batch)
+        elapsed = []
+
+        @evaluator.on(Events.EPOCH_COMPLETED)
+        def start_timer():
+            idist.barrier()
+            elapsed.append(time.perf_counter())
+
+        metrics = create_metrics(num_classes)
+        for name, metric in metrics.items():
+            metric.attach(evaluator, name)
+
+        @evaluator.on(Events.EPOCH_COMPLETED)
+        def stop_timer():
+            elapsed[-1] = time.perf_counter() - elapsed[-1]
+
+        if mode == "evaluator":
+            coalesce_sync_all_reduce(evaluator, metrics.values())
+
+        with patch.object(idist, "all_reduce", wraps=idist.all_reduce) as all_reduce:
+            if mode == "per-attribute":
+                with patch.object(metric_module, "_all_reduce_coalesced", _all_reduce_per_attribute):
+                    evaluator.run(data, max_epochs=config["num_epochs"])
+            else:
+                evaluator.run(data, max_epochs=config["num_epochs"])
+
+        # skip the warm-up epoch
+        mean_elapsed = sum(elapsed[1:]) / max(len(elapsed) - 1, 1)
+        if rank == 0:
+            num_collectives = all_reduce.call_count / config["num_epochs"]
+            print(f"{mode:>14} | {num_collectives:>18.1f} | {mean_elapsed * 1e3:>21.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nproc_per_node", type=int, default=4)
+    parser.add_argument("--num_epochs", type=int, default=20)
+    parser.add_argument("--num_iters", type=int, default=4)
+    parser.add_argument("--batch_size", type=int, default=32)
+    parser.add_argument("--num_classes", type=int, default=10)
+    args = parser.parse_args()
+
+    with idist.Parallel(backend="gloo", nproc_per_node=args.nproc_per_node) as parallel:
+        parallel.run(run, vars(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compare the time to compute ranking metrics with scikit-learn on CPU and with the torch kernels of ignite.
+
+The torch kernels run on the device of the data, use ``--device cuda`` to benchmark them on GPU.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/ranking_metrics.py --sizes 1000000 10000000 --device cuda
+"""
+
+import argparse
+import time
+
+import torch
+
+from ignite.metrics import _ranking
+
+try:
+    from sklearn import metrics as sk_metrics
+except ImportError:
+    sk_metrics = None
+
+METRICS = ["roc_auc_score", "average_precision_score"]
+
+
+def timeit(fn, num_repeats: int, device: torch.device) -> float:
+    fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / num_repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--num_repeats", type=int, default=3)
+    args = parser.parse_args()
+    device = torch.device(args.device)
+
+    print(f"{'metric':>24} | {'size':>10} | {'sklearn (s)':>11} | {'torch (s)':>9}")
+    for size in args.sizes:
+        y_pred = torch.rand(size)
+        y_true = torch.randint(0, 2, size=(size,))
+        y_pred_device, y_true_device = y_pred.to(device), y_true.to(device)
+        for name in METRICS:
+            sk_elapsed = float("nan")
+            if sk_metrics is not None:
+                sk_fn = getattr(sk_metrics, name)
+                sk_elapsed = timeit(lambda: sk_fn(y_true.numpy(), y_pred.numpy()), args.num_repeats, device)
+            torch_fn = getattr(_ranking, name)
+            torch_elapsed = timeit(lambda: torch_fn(y_pred_device, y_true_device), args.num_repeats, device)
+            print(f"{name:>24} | {size:>10} | {sk_elapsed:>11.3f} | {torch_elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare the per-iteration latency of a distributed training loop smoothing its loss with ``RunningAverage``,
+reducing the loss on every iteration or synchronizing the running average every ``sync_every`` iterations.
+
+The processes are spawned on the local machine with the gloo backend. Each iteration all-reduces a fake gradient,
+as a data-parallel training step would.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/running_average.py --nprocs 2 4 8 --sync_every 1 10 100
+"""
+
+import argparse
+import time
+
+import torch
+
+import ignite.distributed as idist
+from ignite.engine import Engine
+from ignite.metrics import RunningAverage
+
+
+def training(local_rank: int, config: dict) -> None:
+    grads = torch.rand(config["grad_size"])
+
+    def train_step(engine, batch):
+        idist.all_reduce(grads)
+        return torch.rand(1).squeeze()
+
+    for sync_every in config["sync_every"]:
+        trainer = Engine(train_step)
+        avg = RunningAverage(output_transform=lambda x: x, sync_every=sync_every)
+        avg.attach(trainer, "loss")
+        # warm-up
+        trainer.run(range(10))
+
+        idist.barrier()
+        start = time.perf_counter()
+        trainer.run(range(config["num_iters"]))
+        elapsed = torch.tensor(time.perf_counter() - start, dtype=torch.float64)
+        # the slowest process sets the pace
+        elapsed = idist.all_reduce(elapsed, op="MAX").item()
+        if idist.get_rank() == 0:
+            ms = elapsed * 1e3 / config["num_iters"]
+            print(f"{idist.get_world_size():>6} | {sync_every:>10} | {ms:>13.3f}", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--nprocs", type=int, nargs="+", default=[2, 4, 8])
+    parser.add_argument("--sync_every", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--num_iters", type=int, default=1000)
+    parser.add_argument("--grad_size", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'nprocs':>6} | {'sync_every':>10} | {'ms/iteration':>13}")
+    for nprocs in args.nprocs:
+        with idist.Parallel(backend="gloo", nproc_per_node=nprocs) as parallel:
+            parallel.run(training, vars(args))
+
+
+if __name__ == "__main__":
+    main()
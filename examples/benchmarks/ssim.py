@@ -0,0 +1,124 @@
+"""Compare the time and the peak memory of ``SSIM.update`` with the stacked 2D convolution of the previous
+implementation and with the separable one, in the default and the channels last layout, and of
+``MultiScaleSSIM.update``.
+
+Each mode runs in a new process. On CPU, the peak memory is the increase of the peak resident memory of the process
+during the first update.
+
+Usage:
+
+.. code-block:: bash
+
+    python examples/benchmarks/ssim.py --sizes 512 1024 2048 --device cpu
+"""
+
+import argparse
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Tuple
+
+import torch
+import torch.nn.functional as F
+
+from ignite.metrics import MultiScaleSSIM, SSIM
+
+
+def stacked_update(ssim: SSIM, y_pred: torch.Tensor, y: torch.Tensor) -> None:
+    # previous implementation: the five moments are filtered at once with the 2D kernel
+    y_pred, y = ssim._prepare_inputs((y_pred, y))
+    nb_channel = y_pred.size(1)
+    y_pred = F.pad(y_pred, [ssim.pad_w, ssim.pad_w, ssim.pad_h, ssim.pad_h], mode="reflect")
+    y = F.pad(y, [ssim.pad_w, ssim.pad_w, ssim.pad_h, ssim.pad_h], mode="reflect")
+
+    input_list = [y_pred, y, y_pred * y_pred, y * y, y_pred * y]
+    outputs = F.conv2d(torch.cat(input_list), ssim._kernel, groups=nb_channel)
+    batch_size = y_pred.size(0)
+    output_list = [outputs[x * batch_size : (x + 1) * batch_size] for x in range(len(input_list))]
+
+    mu_pred_sq = output_list[0].pow(2)
+    mu_target_sq = output_list[1].pow(2)
+    mu_pred_target = output_list[0] * output_list[1]
+    sigma_pred_sq = output_list[2] - mu_pred_sq
+    sigma_target_sq = output_list[3] - mu_target_sq
+    sigma_pred_target = output_list[4] - mu_pred_target
+
+    a1 = 2 * mu_pred_target + ssim.c1
+    a2 = 2 * sigma_pred_target + ssim.c2
+    b1 = mu_pred_sq + mu_target_sq + ssim.c1
+    b2 = sigma_pred_sq + sigma_target_sq + ssim.c2
+    ssim_idx = (a1 * a2) / (b1 * b2)
+    ssim._sum_of_ssim += torch.mean(ssim_idx, (1, 2, 3), dtype=torch.float64).sum().to(device=ssim._device)
+    ssim._num_examples += batch_size
+
+
+def timeit(fn, num_repeats: int, device: torch.device) -> float:
+    fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        fn()
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / num_repeats
+
+
+def run(mode: str, size: int, args: argparse.Namespace) -> Tuple[float, float]:
+    # executed in a new process, such that the peak resident memory on CPU is the one of this mode
+    device = torch.device(args.device)
+    y_pred = torch.rand(args.batch_size, args.num_channels, size, size, device=device)
+    y = y_pred * 0.8
+    if mode == "multi-scale":
+        metric: SSIM = MultiScaleSSIM(data_range=1.0, device=device)
+    else:
+        metric = SSIM(data_range=1.0, device=device, channels_last=mode == "channels last")
+
+    def fn():
+        if mode == "stacked conv2d":
+            stacked_update(metric, y_pred, y)
+        else:
+            metric.update((y_pred, y))
+
+    if device.type == "cuda":
+        torch.cuda.synchronize()
+        torch.cuda.reset_peak_memory_stats(device)
+        start = torch.cuda.memory_allocated(device)
+        fn()
+        torch.cuda.synchronize()
+        memory = (torch.cuda.max_memory_allocated(device) - start) / 2**20
+    else:
+        # ru_maxrss is in KiB on Linux
+        start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        fn()
+        memory = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - start) / 2**10
+    return timeit(fn, args.num_repeats, device), memory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[512, 1024, 2048])
+    parser.add_argument("--batch_size", type=int, default=2)
+    parser.add_argument("--num_channels", type=int, default=3)
+    parser.add_argument("--device", type=str, default="cpu")
+    parser.add_argument("--num_repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} | {'mode':>14} | {'time (s)':>8} | {'peak memory (MiB)':>17}")
+    context = multiprocessing.get_context("spawn")
+    for size in args.sizes:
+        for mode in ["stacked conv2d", "separable", "channels last", "multi-scale"]:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                try:
+                    elapsed, memory = executor.submit(run, mode, size, args).result()
+                except BrokenProcessPool:
+                    # the process is killed when it runs out of memory
+                    print(f"{size:>6} | {mode:>14} | {'killed':>8} | {'killed':>17}")
+                    continue
+            print(f"{size:>6} | {mode:>14} | {elapsed:>8.3f} | {memory:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
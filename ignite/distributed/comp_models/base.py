@@ -220,9 +220,28 @@ class ComputationModel(metaclass=ABCMeta):
     ) -> Union[torch.Tensor, float, List[float], List[str], List[Any]]:
         if not isinstance(tensor, (torch.Tensor, Number, str)):
             return self._do_all_gather_object(tensor, group=group)
+        if isinstance(tensor, torch.Tensor):
+            return self._collective_op(tensor, self._do_all_gather_variable_size, group=group)
 
         return self._collective_op(tensor, self._do_all_gather, group=group)
 
+    def _do_all_gather_variable_size(self, tensor: torch.Tensor, group: Optional[Any] = None) -> torch.Tensor:
+        # Tensors may have different first dimensions across processes: sizes are exchanged first, tensors
+        # are padded to the largest size, gathered with a single collective and the padding is stripped
+        if tensor.ndimension() == 0:
+            return self._do_all_gather(tensor, group=group)
+
+        size = torch.tensor([tensor.shape[0]], device=tensor.device, dtype=self._collective_op_dtype or torch.long)
+        sizes = [int(s) for s in self._do_all_gather(size, group=group).tolist()]
+        max_size = max(sizes)
+        if min(sizes) == max_size:
+            return self._do_all_gather(tensor, group=group)
+
+        padded_tensor = tensor.new_zeros((max_size,) + tensor.shape[1:])
+        padded_tensor[: tensor.shape[0]] = tensor
+        output = self._do_all_gather(padded_tensor, group=group)
+        return torch.cat([chunk[:s] for chunk, s in zip(output.split(max_size), sizes)], dim=0)
+
     def new_group(self, ranks: List[int], **kwargs: Any) -> Any:
         if isinstance(ranks, list) and all(isinstance(item, int) for item in ranks):
             return self._do_new_group(ranks, **kwargs)
@@ -192,6 +192,10 @@ if has_hvd_support:
                 tensor = tensor.unsqueeze(0)
             return hvd.allgather(tensor)
 
+        def _do_all_gather_variable_size(self, tensor: torch.Tensor, group: Optional[Any] = None) -> torch.Tensor:
+            # hvd.allgather natively supports tensors with different first dimensions
+            return self._do_all_gather(tensor, group=group)
+
         def _do_all_gather_object(self, tensor: Any, group: Optional[Any] = None) -> List[Any]:
             if group is not None:
                 raise NotImplementedError("all_gather with group for horovod is not implemented")
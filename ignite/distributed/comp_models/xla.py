@@ -155,6 +155,12 @@ if has_xla_support:
             xm.all_reduce("sum", [output], groups=group)
             return output.reshape(-1, *output.shape[2:])
 
+        def _do_all_gather_variable_size(self, tensor: torch.Tensor, group: Optional[Any] = None) -> torch.Tensor:
+            if group is not None:
+                # processes outside of the groups contribute zero-filled outputs, sizes can't be exchanged
+                return self._do_all_gather(tensor, group=group)
+            return super(_XlaDistModel, self)._do_all_gather_variable_size(tensor, group=group)
+
         def _do_all_gather_object(self, tensor: Any, group: Optional[Any] = None) -> List[Any]:
             raise NotImplementedError("all_gather on object is not implemented for xla")
 
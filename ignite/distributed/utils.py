@@ -357,17 +357,22 @@ def all_gather(
 
     Args:
         tensor: tensor or number or str to collect across participating processes. If tensor, it should have the
-            same shape across processes.
+            same shape across processes, except for the first dimension.
         group: list of integer or the process group for each backend. If None, the default process group will be used.
 
     Returns:
-        If input is a tensor, returns a torch.Tensor of shape ``(world_size * tensor.shape[0], tensor.shape[1], ...)``.
+        If input is a tensor, returns a torch.Tensor of shape ``(world_size * tensor.shape[0], tensor.shape[1], ...)``
+        or, if first dimensions are different, ``(sum of tensor.shape[0] over processes, tensor.shape[1], ...)``.
         If input is a number, a torch.Tensor of shape ``(world_size, )`` is returned and finally a list of strings
         is returned if input is a string. If current process does not belong to `group`, the very ``tensor`` is
         returned.
 
     .. versionchanged:: 0.4.11
         added ``group``
+
+    .. versionchanged:: 0.6.0
+        tensors can have different first dimensions across processes. Sizes are exchanged first, then tensors are
+        padded to the largest size and gathered with a single collective operation.
     """
     if _need_to_sync and isinstance(_model, _SerialModel):
         sync(temporary=True)
@@ -524,6 +524,13 @@ def create_supervised_trainer(
         `engine.state.output` for this engine is defined by `output_transform` parameter and is the loss
         of the processed batch by default.
 
+    Note:
+        The default `output_transform` calls ``loss.item()`` which synchronizes the device with the host on each
+        iteration. With ``output_transform=lambda x, y, y_pred, loss: loss.detach()``, the loss stays on the device
+        and is converted to a number only when it is logged, e.g. with
+        :class:`~ignite.metrics.RunningAverage` accumulated on the same device with ``keep_on_device=True`` and
+        :class:`~ignite.handlers.tqdm_logger.ProgressBar` or logger output handlers.
+
     .. warning::
         The internal use of `device` has changed.
         `device` will now *only* be used to move the input data to the correct device.
@@ -10,6 +10,7 @@ from torch.utils.data.sampler import BatchSampler
 
 from ignite.engine.engine import Engine
 from ignite.engine.events import Events
+from ignite.engine.utils import _PrefetchIterator
 from ignite.utils import manual_seed
 
 __all__ = ["update_dataloader", "keep_random_state", "ReproducibleBatchSampler", "DeterministicEngine"]
@@ -176,6 +177,9 @@ class DeterministicEngine(Engine):
             in each iteration, and returns data to be stored in the engine's state.
     """
 
+    # prefetching in a background thread would make random number generation order depend on thread scheduling
+    _prefetch_use_thread = False
+
     def __init__(self, process_function: Callable[[Engine, Any], Any]):
         super(DeterministicEngine, self).__init__(process_function)
         self.state_dict_user_keys.append("rng_states")
@@ -231,7 +235,7 @@ class DeterministicEngine(Engine):
                     )
 
         iteration = self.state.iteration
-        self._dataloader_iter = self._from_iteration(iteration)
+        self._dataloader_iter = self._maybe_prefetch(self._from_iteration(iteration))
 
         # Below we define initial counter value for _run_once_on_dataset to measure a single epoch
         if self.state.epoch_length is not None:
@@ -245,6 +249,13 @@ class DeterministicEngine(Engine):
             _set_rng_states(rng_states)
             setattr(self.state, "rng_states", None)
 
+    def _maybe_prefetch(self, data_iter: Iterator) -> Iterator:
+        if self._prefetch_kwargs is None:
+            return data_iter
+        # fetching a batch in advance would draw its random numbers before the current iteration and before the
+        # random state is restored when resuming, so batches are fetched when requested and only copied to the device
+        return _PrefetchIterator(data_iter, **dict(self._prefetch_kwargs, use_thread=False, fetch_ahead=False))
+
     def _from_iteration(self, iteration: int) -> Iterator:
         if self.state.dataloader is None:
             raise RuntimeError(
@@ -8,11 +8,12 @@ from collections import defaultdict, OrderedDict
 from collections.abc import Mapping
 from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union
 
+import torch
 from torch.utils.data import DataLoader
 
 from ignite.base import Serializable
 from ignite.engine.events import CallableEventWithFilter, EventEnum, Events, EventsList, RemovableEventHandle, State
-from ignite.engine.utils import _check_signature, _to_hours_mins_secs
+from ignite.engine.utils import _check_signature, _PrefetchIterator, _to_hours_mins_secs
 
 __all__ = ["Engine"]
 
@@ -134,8 +135,13 @@ class Engine(Serializable):
     # Flag to disable engine._internal_run as generator feature for BC
     interrupt_resume_enabled = True
 
+    # Default of set_prefetch's use_thread argument
+    _prefetch_use_thread = True
+
     def __init__(self, process_function: Callable[["Engine", Any], Any]):
         self._event_handlers: Dict[Any, List] = defaultdict(list)
+        # per-event cache of ready-to-call handlers built from self._event_handlers, see _CompiledEventHandlers
+        self._compiled_event_handlers: Dict[Any, _CompiledEventHandlers] = {}
         self.logger = logging.getLogger(__name__ + "." + self.__class__.__name__)
         self._process_function = process_function
         self.last_event_name: Optional[Events] = None
@@ -148,6 +154,7 @@ class Engine(Serializable):
 
         self._dataloader_iter: Optional[Iterator[Any]] = None
         self._init_iter: Optional[int] = None
+        self._prefetch_kwargs: Optional[Dict[str, Any]] = None
 
         self.register_events(*Events)
 
@@ -256,6 +263,9 @@ class Engine(Serializable):
 
         # setup input handler as parent to make has_event_handler work
         setattr(wrapper, "_parent", weakref.ref(handler))
+        # built-in filters can tell when they fire next, this is used to skip the wrapper until then
+        if hasattr(event_filter, "_next_event"):
+            setattr(wrapper, "_next_event", event_filter._next_event)
         return wrapper
 
     def _assert_allowed_event(self, event_name: Any) -> None:
@@ -328,6 +338,7 @@ class Engine(Serializable):
         except ValueError:
             _check_signature(handler, "handler", *(event_args + args), **kwargs)
             self._event_handlers[event_name].append((handler, args, kwargs))
+        self._invalidate_compiled_event_handlers(event_name)
         self.logger.debug(f"Added handler for event {event_name}")
 
         return RemovableEventHandle(event_name, handler, self)
@@ -377,6 +388,7 @@ class Engine(Serializable):
         if len(new_event_handlers) == len(self._event_handlers[event_name]):
             raise ValueError(f"Input handler '{handler}' is not found among registered event handlers")
         self._event_handlers[event_name] = new_event_handlers
+        self._invalidate_compiled_event_handlers(event_name)
 
     def on(self, event_name: Any, *args: Any, **kwargs: Any) -> Callable:
         """Decorator shortcut for :meth:`~ignite.engine.engine.Engine.add_event_handler`.
@@ -424,12 +436,51 @@ class Engine(Serializable):
             **event_kwargs: optional keyword args to be passed to all handlers.
 
         """
-        self.logger.debug(f"{self.state.epoch} | {self.state.iteration}, Firing handlers for event {event_name}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{self.state.epoch} | {self.state.iteration}, Firing handlers for event {event_name}")
         self.last_event_name = event_name
-        for func, args, kwargs in self._event_handlers[event_name]:
-            kwargs.update(event_kwargs)
-            first, others = ((args[0],), args[1:]) if (args and args[0] == self) else ((), args)
-            func(*first, *(event_args + others), **kwargs)
+        compiled = self._compiled_event_handlers.get(event_name)
+        if compiled is None:
+            compiled = self._compile_event_handlers(event_name)
+        if compiled.scheduled:
+            indices = compiled.due_indices(self.state.get_event_attrib_value(event_name))
+        else:
+            indices = compiled.all_indices
+        if not indices:
+            return
+
+        handlers = compiled.handlers
+        i = 0
+        while i < len(indices):
+            index = indices[i]
+            call, func, first, others, kwargs, _ = handlers[index]
+            if event_args or event_kwargs:
+                func(*first, *(event_args + others), **{**kwargs, **event_kwargs})
+            else:
+                call()
+            i += 1
+            if self._compiled_event_handlers.get(event_name) is not compiled:
+                # Handlers were changed by the handler that just ran. As with a plain list iteration, handlers
+                # inserted in place into the current list are taken into account while a replaced list is not.
+                if self._event_handlers[event_name] is compiled.source:
+                    compiled = self._compile_event_handlers(event_name)
+                    handlers = compiled.handlers
+                    # filtered handlers check their filter when called, so the schedule can be skipped here
+                    indices = tuple(range(index + 1, len(handlers)))
+                    i = 0
+
+    def _compile_event_handlers(self, event_name: Any) -> "_CompiledEventHandlers":
+        compiled = _CompiledEventHandlers(self, self._event_handlers[event_name], event_name in State.event_to_attr)
+        self._compiled_event_handlers[event_name] = compiled
+        return compiled
+
+    def _invalidate_compiled_event_handlers(self, event_name: Optional[Any] = None) -> None:
+        # Drop compiled handlers of event_name (or of all events if None). Should be called whenever
+        # self._event_handlers is modified directly, i.e. without add_event_handler/remove_event_handler.
+        if event_name is None:
+            self._compiled_event_handlers.clear()
+        else:
+            self._compiled_event_handlers.pop(event_name, None)
 
     def fire_event(self, event_name: Any) -> None:
         """Execute all the handlers associated with given event.
@@ -774,7 +825,82 @@ class Engine(Serializable):
 
         """
         self.state.dataloader = data
-        self._dataloader_iter = iter(self.state.dataloader)
+        self._close_dataloader_iter()
+        self._dataloader_iter = self._maybe_prefetch(iter(self.state.dataloader))
+
+    def set_prefetch(
+        self,
+        num_batches: int = 1,
+        device: Optional[Union[str, torch.device]] = None,
+        non_blocking: bool = True,
+        use_thread: Optional[bool] = None,
+    ) -> None:
+        """Method to fetch next batches in advance, while the current iteration is running. Batches are fetched by a
+        background thread and, if ``device`` is a CUDA device, copied to it on a side CUDA stream. This way, data
+        loading and host-to-device copy of the next batch overlap with the current ``process_function`` call.
+        Prefetching applies to data iterators created from the next call, e.g. by
+        :meth:`~ignite.engine.engine.Engine.run` or :meth:`~ignite.engine.engine.Engine.set_data`.
+
+        :attr:`~ignite.engine.events.Events.GET_BATCH_STARTED` and
+        :attr:`~ignite.engine.events.Events.GET_BATCH_COMPLETED` are still fired around getting each batch, such that
+        the measured dataflow time is the time the engine waits for a prefetched batch.
+
+        Args:
+            num_batches: number of batches to fetch in advance. If 0, prefetching is disabled. Default, 1.
+            device: if provided, tensors of the batch are moved to this device with
+                :meth:`~ignite.utils.convert_tensor`. Batches should be tensors or collections of tensors.
+            non_blocking: ``non_blocking`` argument of the device copy. For asynchronous copies, the data loader
+                should provide pinned memory, e.g. ``DataLoader(..., pin_memory=True)``.
+            use_thread: if True, batches are fetched by a background thread. Otherwise, the next batch is fetched
+                right after the current one is returned, such that only the device copy overlaps with the iteration.
+                By default, True for :class:`~ignite.engine.engine.Engine` and False for
+                :class:`~ignite.engine.deterministic.DeterministicEngine`. To keep the dataflow reproducible,
+                :class:`~ignite.engine.deterministic.DeterministicEngine` never fetches batches in advance: they are
+                fetched when requested and only copied to ``device``.
+
+        Examples:
+            .. code-block:: python
+
+                train_loader = DataLoader(train_dataset, batch_size=32, pin_memory=True, num_workers=4)
+                trainer = create_supervised_trainer(model, optimizer, loss_fn, device="cuda")
+                trainer.set_prefetch(num_batches=2, device="cuda")
+                trainer.run(train_loader, max_epochs=10)
+
+        .. versionadded:: 0.6.0
+        """
+        if not (isinstance(num_batches, int) and num_batches >= 0):
+            raise ValueError(f"Argument num_batches should be a non-negative integer, but given {num_batches}")
+
+        if num_batches == 0:
+            self._prefetch_kwargs = None
+            return
+
+        self._prefetch_kwargs = {
+            "num_batches": num_batches,
+            "device": device,
+            "non_blocking": non_blocking,
+            "use_thread": self._prefetch_use_thread if use_thread is None else use_thread,
+        }
+
+    def _maybe_prefetch(self, data_iter: Iterator) -> Iterator:
+        if self._prefetch_kwargs is None:
+            return data_iter
+        return _PrefetchIterator(data_iter, max_batches=self._get_num_remaining_iterations(), **self._prefetch_kwargs)
+
+    def _get_num_remaining_iterations(self) -> Optional[int]:
+        if self.state.max_iters is not None:
+            total_iters = self.state.max_iters
+        elif self.state.epoch_length is not None and self.state.max_epochs is not None:
+            total_iters = self.state.epoch_length * self.state.max_epochs
+        else:
+            return None
+        return max(total_iters - self.state.iteration, 0)
+
+    def _close_dataloader_iter(self) -> None:
+        # stops fetching batches in advance
+        if isinstance(self._dataloader_iter, _PrefetchIterator):
+            self._dataloader_iter.close()
+        self._dataloader_iter = None
 
     def run(
         self,
@@ -922,6 +1048,7 @@ class Engine(Serializable):
         return None
 
     def _setup_dataloader_iter(self) -> None:
+        self._close_dataloader_iter()
         if self.state.dataloader is None:
             if self.state.epoch_length is None:
                 raise RuntimeError(
@@ -930,7 +1057,7 @@ class Engine(Serializable):
                 )
             self._dataloader_iter = _get_none_data_iter(self.state.epoch_length)
         else:
-            self._dataloader_iter = iter(self.state.dataloader)
+            self._dataloader_iter = self._maybe_prefetch(iter(self.state.dataloader))
 
     def _setup_engine(self) -> None:
         self._setup_dataloader_iter()
@@ -1002,11 +1129,11 @@ class Engine(Serializable):
             self.logger.info(f"Engine run complete. Time taken: {hours:02d}:{mins:02d}:{secs:06.3f}")
 
         except BaseException as e:
-            self._dataloader_iter = None
+            self._close_dataloader_iter()
             self.logger.error(f"Engine run is terminating due to exception: {e}")
             self._handle_exception(e)
 
-        self._dataloader_iter = None
+        self._close_dataloader_iter()
         return self.state
 
     def _maybe_terminate_or_interrupt(self) -> Generator:
@@ -1183,11 +1310,11 @@ class Engine(Serializable):
             self.logger.info(f"Engine run complete. Time taken: {hours:02d}:{mins:02d}:{secs:06.3f}")
 
         except BaseException as e:
-            self._dataloader_iter = None
+            self._close_dataloader_iter()
             self.logger.error(f"Engine run is terminating due to exception: {e}")
             self._handle_exception(e)
 
-        self._dataloader_iter = None
+        self._close_dataloader_iter()
         return self.state
 
     def _run_once_on_dataset_legacy(self) -> float:
@@ -1292,6 +1419,54 @@ class Engine(Serializable):
         return time.time() - start_time
 
 
+class _CompiledEventHandlers:
+    # Ready-to-call handlers of a single event built from Engine._event_handlers: whether the engine is passed as
+    # first argument is resolved once here instead of on every call to Engine._fire_event.
+    # Handlers registered with built-in filters (every, once, before/after) expose the next event value at which
+    # they fire. These values are kept as a schedule, such that filtered handlers are not called at all until the
+    # smallest of them is reached.
+
+    def __init__(self, engine: Engine, source: List, schedulable: bool) -> None:
+        self.source = source
+        handlers = []
+        for func, args, kwargs in source:
+            first, others = ((args[0],), args[1:]) if (args and args[0] == engine) else ((), args)
+            call = functools.partial(func, *first, *others, **kwargs)
+            # look up instance attributes only, e.g. mocks create any attribute on access
+            next_event_fn = getattr(func, "__dict__", {}).get("_next_event") if schedulable else None
+            handlers.append((call, func, first, others, kwargs, next_event_fn))
+        self.handlers = tuple(handlers)
+        self.all_indices = tuple(range(len(handlers)))
+        self.unscheduled_indices = tuple(i for i, h in enumerate(handlers) if h[-1] is None)
+        self.scheduled = len(self.unscheduled_indices) < len(handlers)
+        self.next_events: Dict[int, Union[int, float]] = {}
+        # empty range to force the schedule to be computed on the first event
+        self.last_event: Union[int, float] = math.inf
+        self.min_next_event: Union[int, float] = -math.inf
+
+    def due_indices(self, event: int) -> Tuple[int, ...]:
+        if self.last_event <= event < self.min_next_event:
+            return self.unscheduled_indices
+
+        # next events are recomputed if the event value went back (e.g. new run) or passed them
+        went_back = event < self.last_event
+        due = list(self.unscheduled_indices)
+        for i, h in enumerate(self.handlers):
+            next_event_fn = h[-1]
+            if next_event_fn is None:
+                continue
+            next_event = self.next_events.get(i)
+            if next_event is None or went_back or next_event < event:
+                next_event = next_event_fn(event)
+                next_event = math.inf if next_event is None else next_event
+                self.next_events[i] = next_event
+            if next_event == event:
+                due.append(i)
+        self.last_event = event
+        self.min_next_event = min(self.next_events.values())
+        return tuple(sorted(due))
+
+
 def _get_none_data_iter(size: int) -> Iterator:
     # Sized iterator for data as None
     for _ in range(size):
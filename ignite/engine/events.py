@@ -135,6 +135,11 @@ class CallableEventWithFilter:
                 return True
             return False
 
+        def next_event(event: int) -> int:
+            return -(-event // every) * every
+
+        # smallest event value greater or equal to the given one where the filter returns True, used by the engine
+        setattr(wrapper, "_next_event", next_event)
         return wrapper
 
     @staticmethod
@@ -146,6 +151,10 @@ class CallableEventWithFilter:
                 return True
             return False
 
+        def next_event(event: int) -> Optional[int]:
+            return min((e for e in once if e >= event), default=None)
+
+        setattr(wrapper, "_next_event", next_event)
         return wrapper
 
     @staticmethod
@@ -159,6 +168,11 @@ class CallableEventWithFilter:
                 return True
             return False
 
+        def next_event(event: int) -> Optional[int]:
+            event = max(event, after_ + 1)
+            return event if event < before_ else None
+
+        setattr(wrapper, "_next_event", next_event)
         return wrapper
 
     @staticmethod
@@ -174,6 +188,12 @@ class CallableEventWithFilter:
                 return True
             return False
 
+        def next_event(event: int) -> Optional[int]:
+            start = after_ + 1
+            event = start + -(-max(event - start, 0) // every) * every
+            return event if event < before_ else None
+
+        setattr(wrapper, "_next_event", next_event)
         return wrapper
 
     @staticmethod
@@ -1,5 +1,11 @@
 import inspect
-from typing import Any, Callable, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Iterator, Optional, Tuple, Union
+
+import torch
+
+from ignite.utils import apply_to_tensor, convert_tensor
 
 
 def _check_signature(fn: Callable, fn_description: str, *args: Any, **kwargs: Any) -> None:
@@ -26,3 +32,107 @@ def _to_hours_mins_secs(time_taken: Union[float, int]) -> Tuple[int, int, float]
     mins, secs = divmod(time_taken, 60)
     hours, mins = divmod(mins, 60)
     return round(hours), round(mins), secs
+
+
+class _PrefetchIterator:
+    # Iterator wrapper fetching the next `num_batches` batches in advance. Batches are fetched by a background thread
+    # if `use_thread` is True, otherwise right after the previous batch is returned. If `fetch_ahead` is False, batches
+    # are only fetched when requested and the wrapper is limited to the device copy. If `device` is a CUDA device,
+    # batches are copied to it on a side stream, such that the copy of the next batch overlaps with the current step.
+    # At most `max_batches` batches are fetched in advance in total, such that the batches of the iterator beyond the
+    # ones which will be requested are left to it.
+    _stop = object()
+
+    def __init__(
+        self,
+        iterator: Iterator,
+        num_batches: int = 1,
+        device: Optional[Union[str, torch.device]] = None,
+        non_blocking: bool = True,
+        use_thread: bool = True,
+        fetch_ahead: bool = True,
+        max_batches: Optional[int] = None,
+    ) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._iterator = iterator
+        self._num_batches = num_batches
+        self._max_batches = max_batches
+        self._num_returned = 0
+        self._device = torch.device(device) if device is not None else None
+        self._non_blocking = non_blocking
+        self._stream = None
+        if self._device is not None and self._device.type == "cuda" and torch.cuda.is_available():
+            self._stream = torch.cuda.Stream(device=self._device)
+        if use_thread and fetch_ahead:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._fetch_ahead = fetch_ahead
+        self._pending: Deque[Future] = deque()
+        self._exhausted = False
+        if fetch_ahead:
+            self._fill()
+
+    def _fetch(self) -> Any:
+        try:
+            batch = next(self._iterator)
+        except StopIteration:
+            return self._stop, None
+        if self._device is None:
+            return batch, None
+        if self._stream is None:
+            return convert_tensor(batch, device=self._device, non_blocking=self._non_blocking), None
+        with torch.cuda.stream(self._stream):
+            batch = convert_tensor(batch, device=self._device, non_blocking=self._non_blocking)
+            event = torch.cuda.Event()
+            event.record(self._stream)
+        return batch, event
+
+    def _fill(self, min_batches: int = 0) -> None:
+        num_batches = self._num_batches if self._fetch_ahead else 1
+        if self._max_batches is not None:
+            num_batches = min(num_batches, self._max_batches - self._num_returned)
+        num_batches = max(num_batches, min_batches)
+        while not self._exhausted and len(self._pending) < num_batches:
+            if self._executor is not None:
+                self._pending.append(self._executor.submit(self._fetch))
+            else:
+                future: Future = Future()
+                try:
+                    future.set_result(self._fetch())
+                except Exception as e:
+                    future.set_exception(e)
+                self._pending.append(future)
+
+    def __iter__(self) -> "_PrefetchIterator":
+        return self
+
+    def __next__(self) -> Any:
+        if not self._pending:
+            self._fill(min_batches=1)
+        if not self._pending:
+            raise StopIteration
+        batch, event = self._pending.popleft().result()
+        if batch is self._stop:
+            self._exhausted = True
+            self.close()
+            raise StopIteration
+        self._num_returned += 1
+        if self._fetch_ahead:
+            self._fill()
+        if event is not None:
+            current_stream = torch.cuda.current_stream(self._device)
+            current_stream.wait_event(event)
+            # tell the caching allocator that the tensors are used by the current stream
+            apply_to_tensor(batch, lambda t: t.record_stream(current_stream))
+        return batch
+
+    def close(self, wait: bool = True) -> None:
+        # batches not yet fetched are left to the iterator, a fetch in progress is awaited if `wait` is True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __del__(self) -> None:
+        self.close(wait=False)
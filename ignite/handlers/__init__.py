@@ -2,6 +2,7 @@ from typing import Any, Callable, Optional
 
 from ignite.engine import Engine
 from ignite.engine.events import Events
+from ignite.handlers.async_handler import AsyncHandler
 from ignite.handlers.checkpoint import Checkpoint, DiskSaver, ModelCheckpoint
 from ignite.handlers.clearml_logger import ClearMLLogger
 from ignite.handlers.early_stopping import EarlyStopping
@@ -83,4 +84,5 @@ __all__ = [
     "ProgressBar",
     "VisdomLogger",
     "WandBLogger",
+    "AsyncHandler",
 ]
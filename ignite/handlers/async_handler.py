@@ -0,0 +1,156 @@
+import copy
+import queue
+import threading
+import weakref
+from typing import Any, Callable, Optional, Tuple
+
+from ignite.engine import Engine, Events
+from ignite.engine.utils import _check_signature
+from ignite.utils import setup_logger
+
+__all__ = ["AsyncHandler"]
+
+
+class AsyncHandler:
+    """AsyncHandler runs a given handler on a dedicated background thread, such that slow handlers (e.g. doing I/O)
+    overlap with the next iterations instead of blocking the engine.
+
+    When triggered, a snapshot of the engine state is queued and the engine continues immediately. The worker
+    thread calls the handler with a shallow copy of the engine whose ``state`` is the snapshot, in the order the
+    calls were queued. All pending calls are waited for on :attr:`~ignite.engine.events.Events.COMPLETED` of the
+    engine the handler is triggered by. If the handler raises an exception, it is re-raised on the engine's thread
+    on the next trigger or when waiting for the pending calls.
+
+    Args:
+        handler: the handler to run in background. As for :meth:`~ignite.engine.engine.Engine.add_event_handler`,
+            the first argument can be optionally the engine.
+        max_queue_size: maximum number of pending calls. Default, 1.
+        blocking: if True, the engine waits for a free slot when the queue is full, otherwise the call is skipped
+            and a warning is logged. Default, True.
+
+    Examples:
+        .. code-block:: python
+
+            from ignite.engine import Events
+            from ignite.handlers import AsyncHandler
+
+            def log_to_remote_server(engine):
+                # slow I/O using engine.state.iteration, engine.state.metrics, ...
+                ...
+
+            trainer.add_event_handler(Events.ITERATION_COMPLETED(every=100), AsyncHandler(log_to_remote_server))
+
+    Note:
+        The state snapshot is shallow: objects referenced by the state (e.g. ``state.output`` tensors, the model or
+        the optimizer used by the handler) are shared with the training loop. The handler should only read from the
+        given engine and should not call methods controlling the run like
+        :meth:`~ignite.engine.engine.Engine.terminate`.
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(self, handler: Callable, max_queue_size: int = 1, blocking: bool = True):
+        if not callable(handler):
+            raise TypeError(f"Argument handler should be callable, but given {type(handler)}")
+        if not (isinstance(max_queue_size, int) and max_queue_size > 0):
+            raise ValueError(f"Argument max_queue_size should be a positive integer, but given {max_queue_size}")
+
+        self.handler = handler
+        self.max_queue_size = max_queue_size
+        self.blocking = blocking
+        self.logger = setup_logger(__name__ + "." + self.__class__.__name__)
+
+        self._queue: "queue.Queue[Optional[Tuple[int, Callable, Tuple, dict]]]" = queue.Queue(maxsize=max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        # incremented when an error is reported, calls queued before are dropped
+        self._generation = 0
+        self._pass_engine: Optional[bool] = None
+        self._engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+    def __call__(self, engine: Engine, *args: Any, **kwargs: Any) -> None:
+        self._raise_if_failed()
+
+        if engine not in self._engines:
+            self._engines.add(engine)
+            if not engine.has_event_handler(self.wait, Events.COMPLETED):
+                engine.add_event_handler(Events.COMPLETED, self.wait)
+
+        if self._pass_engine is None:
+            try:
+                _check_signature(self.handler, "handler", engine, *args, **kwargs)
+                self._pass_engine = True
+            except ValueError:
+                _check_signature(self.handler, "handler", *args, **kwargs)
+                self._pass_engine = False
+
+        if self._pass_engine:
+            args = (self._snapshot(engine),) + args
+
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+            self._worker.start()
+
+        try:
+            self._queue.put((self._generation, self.handler, args, kwargs), block=self.blocking)
+        except queue.Full:
+            self.logger.warning(
+                f"{self.__class__.__name__}: {self.max_queue_size} calls are pending, skipping the call "
+                f"at iteration {engine.state.iteration}"
+            )
+
+    @staticmethod
+    def _snapshot(engine: Engine) -> Engine:
+        state = copy.copy(engine.state)
+        state.metrics = dict(state.metrics)
+        state.times = dict(state.times)
+        snapshot = copy.copy(engine)
+        snapshot.state = state
+        return snapshot
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                generation, handler, args, kwargs = item
+                if self._error is None and generation == self._generation:
+                    handler(*args, **kwargs)
+            except BaseException as e:
+                self.logger.error(f"{self.__class__.__name__}: exception raised by the handler: {e}")
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            # calls queued before the error is reported are dropped, the worker thread may drop them concurrently
+            self._generation += 1
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._queue.task_done()
+            error, self._error = self._error, None
+            raise error
+
+    @property
+    def num_pending(self) -> int:
+        """Number of queued calls not yet started by the worker thread."""
+        return self._queue.qsize()
+
+    def wait(self) -> None:
+        """Wait for all pending calls to finish. An exception raised by the handler is re-raised here."""
+        if self._worker is not None:
+            self._queue.join()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """Wait for all pending calls to finish and stop the worker thread."""
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join()
+        self._worker = None
+        self._raise_if_failed()
@@ -1,10 +1,14 @@
 """Base logger and its helper handlers."""
 
 import numbers
+import threading
+import time
 import warnings
+import weakref
 from abc import ABCMeta, abstractmethod
+from array import array
 from collections import OrderedDict
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import torch
 import torch.nn as nn
@@ -12,6 +16,7 @@ from torch.optim import Optimizer
 
 from ignite.engine import Engine, Events, EventsList, State
 from ignite.engine.events import CallableEventWithFilter, RemovableEventHandle
+from ignite.utils import setup_logger
 
 
 class BaseHandler(metaclass=ABCMeta):
@@ -113,11 +118,19 @@ class BaseOutputHandler(BaseHandler):
         self.output_transform = output_transform
         self.global_step_transform = global_step_transform
         self.state_attributes = state_attributes
+        # keys of the rendered tensors, by tag, name, shape and key type
+        self._rendered_keys: Dict[Tuple[Any, ...], List[Any]] = {}
 
     def _setup_output_metrics_state_attrs(
         self, engine: Engine, log_text: Optional[bool] = False, key_tuple: Optional[bool] = True
     ) -> Dict[Any, Any]:
         """Helper method to setup metrics and state attributes to log"""
+        return self._render_output_metrics_state_attrs(
+            self._get_output_metrics_state_attrs(engine), log_text=log_text, key_tuple=key_tuple
+        )
+
+    def _get_output_metrics_state_attrs(self, engine: Engine) -> Dict[str, Any]:
+        """Helper method to gather metrics and state attributes to log, values are not converted"""
         metrics_state_attrs = OrderedDict()
         if self.metric_names is not None:
             if isinstance(self.metric_names, str) and self.metric_names == "all":
@@ -143,6 +156,12 @@ class BaseOutputHandler(BaseHandler):
         if self.state_attributes is not None:
             metrics_state_attrs.update({name: getattr(engine.state, name, None) for name in self.state_attributes})
 
+        return metrics_state_attrs
+
+    def _render_output_metrics_state_attrs(
+        self, metrics_state_attrs: Dict[str, Any], log_text: Optional[bool] = False, key_tuple: Optional[bool] = True
+    ) -> Dict[Any, Any]:
+        """Helper method to convert gathered metrics and state attributes to loggable values"""
         metrics_state_attrs_dict: Dict[Any, Union[str, float, numbers.Number]] = OrderedDict()
 
         def key_tuple_tf(tag: str, name: str, *args: str) -> Tuple[str, ...]:
@@ -153,19 +172,32 @@ class BaseOutputHandler(BaseHandler):
 
         key_tf = key_tuple_tf if key_tuple else key_str_tf
 
+        # tensors are transferred to the host at once, with one copy per device and dtype
+        tensors: Dict[Tuple[torch.device, torch.dtype], List[Tuple[List[Any], torch.Tensor]]] = OrderedDict()
         for name, value in metrics_state_attrs.items():
             if isinstance(value, numbers.Number):
                 metrics_state_attrs_dict[key_tf(self.tag, name)] = value
-            elif isinstance(value, torch.Tensor) and value.ndimension() == 0:
-                metrics_state_attrs_dict[key_tf(self.tag, name)] = value.item()
-            elif isinstance(value, torch.Tensor) and value.ndimension() == 1:
-                for i, v in enumerate(value):
-                    metrics_state_attrs_dict[key_tf(self.tag, name, str(i))] = v.item()
+            elif isinstance(value, torch.Tensor) and value.ndimension() in (0, 1):
+                cache_key = (self.tag, name, value.shape, key_tuple)
+                keys = self._rendered_keys.get(cache_key)
+                if keys is None:
+                    if value.ndimension() == 0:
+                        keys = [key_tf(self.tag, name)]
+                    else:
+                        keys = [key_tf(self.tag, name, str(i)) for i in range(len(value))]
+                    self._rendered_keys[cache_key] = keys
+                # values are set below, the keys keep the order of the metrics
+                metrics_state_attrs_dict.update(dict.fromkeys(keys))
+                tensors.setdefault((value.device, value.dtype), []).append((keys, value))
             else:
                 if isinstance(value, str) and log_text:
                     metrics_state_attrs_dict[key_tf(self.tag, name)] = value
                 else:
                     warnings.warn(f"Logger output_handler can not log metrics value type {type(value)}")
+
+        for group in tensors.values():
+            values = torch.cat([value.detach().reshape(-1) for _, value in group]).tolist()
+            metrics_state_attrs_dict.update(zip([key for keys, _ in group for key in keys], values))
         return metrics_state_attrs_dict
 
 
@@ -196,6 +228,170 @@ class BaseWeightsScalarHandler(BaseWeightsHandler):
 
         self.reduction = reduction
 
+    def _reduce(self, named_tensors: Sequence[Tuple[str, torch.Tensor]]) -> List[Tuple[str, Any]]:
+        """Applies the reduction to the tensors and returns their names and values. ``torch.norm`` and ``torch.max``
+        are computed with a single multi-tensor kernel if available, and the reduced tensors are transferred to the
+        host at once, instead of one synchronization per tensor.
+        """
+        names = [name for name, _ in named_tensors]
+        tensors = [t for _, t in named_tensors]
+        if len(tensors) == 0:
+            return []
+
+        foreach_reduction = None
+        if self.reduction is torch.norm:
+            foreach_reduction = getattr(torch, "_foreach_norm", None)
+        elif self.reduction is torch.max:
+            foreach_reduction = getattr(torch, "_foreach_max", None)
+        if foreach_reduction is not None:
+            values: List[Any] = list(foreach_reduction(tensors))
+        else:
+            values = [self.reduction(t) for t in tensors]
+
+        groups: Dict[Tuple[torch.device, torch.dtype], List[int]] = OrderedDict()
+        for i, value in enumerate(values):
+            if isinstance(value, torch.Tensor):
+                groups.setdefault((value.device, value.dtype), []).append(i)
+        for indices in groups.values():
+            # values are given to the writers as before, as 0-d tensors, but on CPU
+            for i, value in zip(indices, torch.stack([values[i] for i in indices]).cpu().unbind()):
+                values[i] = value
+        return list(zip(names, values))
+
+
+class _ScalarBuffer:
+    """Buffer of the scalars logged by the handlers, submitted in bulk to the logger's backend.
+
+    The records ``(key, value, step, timestamp)`` are stored by columns and submitted by ``submit_fn`` on a
+    background thread when ``max_size`` records are pending or every ``flush_interval`` seconds. Pending records
+    are submitted on the training thread on :attr:`~ignite.engine.events.Events.COMPLETED` of the engines logging
+    to the buffer and on ``close``. If ``submit_fn`` raises an exception in background, it is re-raised by the next
+    call to ``extend``, ``flush`` or ``close``.
+
+    Args:
+        submit_fn: callable submitting the lists of keys, values, steps and timestamps of the records.
+        max_size: number of pending records triggering a submission. If None, the size is not limited.
+        flush_interval: time in seconds between the submissions. If None, records are submitted by size only.
+    """
+
+    def __init__(
+        self,
+        submit_fn: Callable[[List[Any], List[float], List[int], List[float]], None],
+        max_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
+        if max_size is not None and not (isinstance(max_size, int) and max_size > 0):
+            raise ValueError(f"Argument max_buffer_size should be a positive integer, but given {max_size}")
+        if flush_interval is not None and not flush_interval > 0:
+            raise ValueError(f"Argument flush_interval should be a positive number, but given {flush_interval}")
+
+        self.submit_fn = submit_fn
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.logger = setup_logger(__name__ + "." + self.__class__.__name__)
+
+        self._keys: List[Any] = []
+        self._values = array("d")
+        self._steps = array("q")
+        self._timestamps = array("d")
+        # guards the columns, submissions are serialized to keep the order of the records
+        self._lock = threading.Lock()
+        self._submit_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._worker: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._engines: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def extend(self, engine: Engine, scalars: Iterable[Tuple[Any, Any]], step: int) -> None:
+        """Buffers the scalars ``(key, value)`` logged at ``step`` by a handler of ``engine``."""
+        self._raise_if_failed()
+
+        if engine not in self._engines:
+            self._engines.add(engine)
+            if not engine.has_event_handler(self.flush, Events.COMPLETED):
+                engine.add_event_handler(Events.COMPLETED, self.flush)
+
+        if self._worker is None or not self._worker.is_alive():
+            self._stopped = False
+            self._worker = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+            self._worker.start()
+
+        timestamp = time.time()
+        with self._lock:
+            size = len(self._keys)
+            for key, value in scalars:
+                self._keys.append(key)
+                self._values.append(float(value))
+            n = len(self._keys) - size
+            self._steps.extend(array("q", [step]) * n)
+            self._timestamps.extend(array("d", [timestamp]) * n)
+            full = self.max_size is not None and len(self._keys) >= self.max_size
+        if full:
+            self._wakeup.set()
+
+    def _submit(self) -> None:
+        with self._submit_lock:
+            with self._lock:
+                keys, values, steps, timestamps = self._keys, self._values, self._steps, self._timestamps
+                self._keys, self._values, self._steps, self._timestamps = [], array("d"), array("q"), array("d")
+            if keys:
+                self.submit_fn(keys, values.tolist(), steps.tolist(), timestamps.tolist())
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self._stopped:
+                return
+            try:
+                self._submit()
+            except BaseException as e:
+                self.logger.error(f"{self.__class__.__name__}: exception raised while submitting scalars: {e}")
+                self._error = e
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self) -> None:
+        """Submits the pending records."""
+        self._raise_if_failed()
+        self._submit()
+
+    def close(self) -> None:
+        """Stops the background thread and submits the pending records."""
+        if self._worker is not None and self._worker.is_alive():
+            self._stopped = True
+            self._wakeup.set()
+            self._worker.join()
+        self._worker = None
+        self.flush()
+
+
+class _BufferedScalarsMixin(metaclass=ABCMeta):
+    """Mixin of the loggers whose scalars can be buffered with :class:`_ScalarBuffer` and submitted in bulk by
+    ``_submit_scalars``. Loggers without the mixin do not accept ``max_buffer_size`` and ``flush_interval``.
+    """
+
+    def _setup_scalar_buffer(self, max_buffer_size: Optional[int], flush_interval: Optional[float]) -> None:
+        # scalars are logged directly to the backend if no threshold is given
+        self._scalar_buffer: Optional[_ScalarBuffer] = None
+        if max_buffer_size is not None or flush_interval is not None:
+            self._scalar_buffer = _ScalarBuffer(self._submit_scalars, max_buffer_size, flush_interval)
+
+    def _close_scalar_buffer(self) -> None:
+        if self._scalar_buffer is not None:
+            self._scalar_buffer.close()
+
+    @abstractmethod
+    def _submit_scalars(self, keys: List[Any], values: List[float], steps: List[int], timestamps: List[float]) -> None:
+        pass
+
 
 class BaseLogger(metaclass=ABCMeta):
     """
@@ -1,12 +1,14 @@
 import collections.abc as collections
+import copy
 import numbers
 import os
 import stat
 import tempfile
+import threading
 from abc import ABCMeta, abstractmethod
-from collections import OrderedDict
+from collections import deque, OrderedDict
 from pathlib import Path
-from typing import Any, Callable, cast, Dict, List, Mapping, NamedTuple, Optional, Union
+from typing import Any, Callable, cast, Deque, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
 
 import torch
 import torch.nn as nn
@@ -111,6 +113,11 @@ class Checkpoint(Serializable):
             Default, `False`.
         save_on_rank: Which rank to save the objects on, in the distributed configuration. If ``save_handler`` is
             string or :class:`~pathlib.Path`, this is also used to instantiate a :class:`~ignite.handlers.DiskSaver`.
+        async_save: if True, the tensors of the checkpoint are copied to CPU memory, pinned for CUDA tensors, and the
+            checkpoint is saved by ``save_handler`` on a background thread while the engine continues. See Note for
+            details. Default, False.
+        max_pending_saves: maximum number of checkpoints copied and not yet saved in ``async_save`` mode. When
+            reached, the engine waits for the oldest save to finish. Default, 1.
 
     .. _DistributedDataParallel: https://pytorch.org/docs/stable/generated/
         torch.nn.parallel.DistributedDataParallel.html
@@ -151,6 +158,18 @@ class Checkpoint(Serializable):
     For example, ``score_name="neg_val_loss"`` and ``score_function`` that returns `-loss` (as objects with highest
     scores will be retained), then saved filename will be ``{filename_prefix}_{name}_neg_val_loss=-0.1234.pt``.
 
+    Note:
+        With ``async_save=True``, the objects' ``state_dict`` and the checkpoints to keep are computed when the
+        handler is called, as in synchronous mode, and the checkpoints are saved in order by a background thread.
+        Outdated checkpoints are removed only once the new one is saved, and a
+        :class:`~ignite.handlers.DiskSaver` still writes through a temporary file. :attr:`last_checkpoint` only
+        reports checkpoints whose saving is finished. Pending saves are waited for on
+        :attr:`~ignite.engine.events.Events.COMPLETED` of the engine the handler is triggered by, unless the handler
+        is itself triggered by ``COMPLETED``, e.g. to save the best model after each evaluation, and can be waited
+        for with :meth:`wait`. If saving fails, the exception is re-raised on the next call to the handler or to
+        :meth:`wait`. Only tensors are copied: other objects of the ``state_dict`` are shared with the training
+        loop. Asynchronous saving is not supported on XLA devices.
+
     Note:
         If ``filename_pattern`` is given, it will be used to render the filenames. ``filename_pattern`` is a string
         that can contain ``{filename_prefix}``, ``{name}``, ``{score}``, ``{score_name}`` and ``{global_step}`` as
@@ -274,6 +293,9 @@ class Checkpoint(Serializable):
         - `score_name` can be used to define `score_function` automatically without providing `score_function`.
         - `save_handler` automatically saves to disk if path to directory is provided.
         - `save_on_rank` saves objects on this rank in a distributed configuration.
+
+    .. versionchanged:: 0.6.0
+        added ``async_save`` and ``max_pending_saves`` arguments.
     """
 
     Item = NamedTuple("Item", [("priority", int), ("filename", str)])
@@ -292,6 +314,8 @@ class Checkpoint(Serializable):
         include_self: bool = False,
         greater_or_equal: bool = False,
         save_on_rank: int = 0,
+        async_save: bool = False,
+        max_pending_saves: int = 1,
     ):
         if not isinstance(to_save, collections.Mapping):
             raise TypeError(f"Argument `to_save` should be a dictionary, but given {type(to_save)}")
@@ -320,6 +344,9 @@ class Checkpoint(Serializable):
         if global_step_transform is not None and not callable(global_step_transform):
             raise TypeError(f"global_step_transform should be a function, got {type(global_step_transform)} instead.")
 
+        if not (isinstance(max_pending_saves, int) and max_pending_saves > 0):
+            raise ValueError(f"Argument max_pending_saves should be a positive integer, but given {max_pending_saves}")
+
         self.to_save = to_save
         self.filename_prefix = filename_prefix
         if isinstance(save_handler, str) or isinstance(save_handler, Path):
@@ -338,6 +365,13 @@ class Checkpoint(Serializable):
         self.include_self = include_self
         self.greater_or_equal = greater_or_equal
         self.save_on_rank = save_on_rank
+        self.async_save = async_save
+        self.max_pending_saves = max_pending_saves
+        # saves queued or in progress in async_save mode, the first one is being saved by the worker thread
+        self._pending_saves: Deque[Tuple[Any, List[Any], str, Dict[str, Any], List[str]]] = deque()
+        self._pending_saves_changed = threading.Condition()
+        self._save_worker: Optional[threading.Thread] = None
+        self._save_error: Optional[BaseException] = None
 
     def _get_filename_pattern(self, global_step: Optional[int]) -> str:
         if self.filename_pattern is None:
@@ -378,15 +412,24 @@ class Checkpoint(Serializable):
         """
         self._saved = []
 
+    def _last_saved_filename(self) -> Optional[str]:
+        with self._pending_saves_changed:
+            pending = {filename for _, _, filename, _, _ in self._pending_saves}
+        for item in reversed(self._saved):
+            if item.filename not in pending:
+                return item.filename
+        return None
+
     @property
     def last_checkpoint(self) -> Optional[Union[str, Path]]:
-        if len(self._saved) < 1:
+        filename = self._last_saved_filename()
+        if filename is None:
             return None
 
         if not isinstance(self.save_handler, DiskSaver):
-            return self._saved[-1].filename
+            return filename
 
-        return self.save_handler.dirname / self._saved[-1].filename
+        return self.save_handler.dirname / filename
 
     def _check_lt_n_saved(self, or_equal: bool = False) -> bool:
         if self.n_saved is None:
@@ -400,6 +443,8 @@ class Checkpoint(Serializable):
             return new > self._saved[0].priority
 
     def __call__(self, engine: Engine) -> None:
+        self._raise_if_save_failed()
+
         global_step = None
         if self.global_step_transform is not None:
             global_step = self.global_step_transform(engine, engine.last_event_name)
@@ -449,10 +494,14 @@ class Checkpoint(Serializable):
                 index = 0
                 to_remove = not self._check_lt_n_saved()
 
+            removed = []
             if to_remove:
                 item = self._saved.pop(index)
                 if isinstance(self.save_handler, BaseSaveHandler):
-                    self.save_handler.remove(item.filename)
+                    if self.async_save:
+                        removed.append(item.filename)
+                    else:
+                        self.save_handler.remove(item.filename)
 
             self._saved.append(Checkpoint.Item(priority, filename))
             self._saved.sort(key=lambda it: it[0])
@@ -461,10 +510,80 @@ class Checkpoint(Serializable):
                 # Now that we've updated _saved, we can add our own state_dict.
                 checkpoint["checkpointer"] = self.state_dict()
 
+            if self.async_save:
+                self._save_async(engine, checkpoint, filename, metadata, removed)
+            else:
+                self._save(checkpoint, filename, metadata)
+
+    def _save(self, checkpoint: Mapping, filename: str, metadata: Dict[str, Any]) -> None:
+        try:
+            self.save_handler(checkpoint, filename, metadata)
+        except TypeError:
+            self.save_handler(checkpoint, filename)
+
+    def _save_async(
+        self, engine: Engine, checkpoint: Mapping, filename: str, metadata: Dict[str, Any], removed: List[str]
+    ) -> None:
+        if engine.last_event_name != Events.COMPLETED and not engine.has_event_handler(self.wait, Events.COMPLETED):
+            engine.add_event_handler(Events.COMPLETED, self.wait)
+
+        if isinstance(self.save_handler, DiskSaver) and self.save_handler.save_on_rank != idist.get_rank():
+            # DiskSaver neither writes nor removes files on this rank
+            return
+
+        with self._pending_saves_changed:
+            while len(self._pending_saves) >= self.max_pending_saves:
+                self._pending_saves_changed.wait()
+
+        cuda_devices: Set[torch.device] = set()
+        snapshot = _snapshot_to_cpu(checkpoint, {}, cuda_devices)
+        # the worker thread waits for the copies from the devices
+        events = [torch.cuda.current_stream(device).record_event() for device in cuda_devices]
+
+        with self._pending_saves_changed:
+            self._pending_saves.append((snapshot, events, filename, metadata, removed))
+            if self._save_worker is None:
+                # not a daemon thread, the pending checkpoints are saved before the interpreter exits
+                self._save_worker = threading.Thread(target=self._run_saves, name="Checkpoint")
+                self._save_worker.start()
+
+    def _run_saves(self) -> None:
+        while True:
+            with self._pending_saves_changed:
+                if len(self._pending_saves) == 0:
+                    self._save_worker = None
+                    return
+                checkpoint, events, filename, metadata, removed = self._pending_saves[0]
             try:
-                self.save_handler(checkpoint, filename, metadata)
-            except TypeError:
-                self.save_handler(checkpoint, filename)
+                for event in events:
+                    event.synchronize()
+                self._save(checkpoint, filename, metadata)
+                for removed_filename in removed:
+                    # a checkpoint saved with the same filename is replaced by the new one
+                    if removed_filename != filename:
+                        cast(BaseSaveHandler, self.save_handler).remove(removed_filename)
+            except BaseException as e:
+                self._save_error = e
+            finally:
+                with self._pending_saves_changed:
+                    self._pending_saves.popleft()
+                    self._pending_saves_changed.notify_all()
+
+    def _raise_if_save_failed(self) -> None:
+        if self._save_error is not None:
+            error, self._save_error = self._save_error, None
+            raise error
+
+    def wait(self) -> None:
+        """Waits for the pending checkpoints to be saved in ``async_save`` mode. An exception raised while saving a
+        checkpoint is re-raised here.
+
+        .. versionadded:: 0.6.0
+        """
+        with self._pending_saves_changed:
+            while len(self._pending_saves) > 0:
+                self._pending_saves_changed.wait()
+        self._raise_if_save_failed()
 
     def _setup_checkpoint(self) -> Dict[str, Any]:
         if self.to_save is not None:
@@ -769,6 +888,29 @@ class Checkpoint(Serializable):
         return wrapper
 
 
+def _snapshot_to_cpu(obj: Any, copies: Dict[int, torch.Tensor], cuda_devices: Set[torch.device]) -> Any:
+    # copies the tensors of a state_dict, keeping the containers' types and attributes like `_metadata`
+    if isinstance(obj, torch.Tensor):
+        if id(obj) not in copies:
+            t = obj.detach()
+            if t.is_cuda and t.layout == torch.strided:
+                copies[id(obj)] = torch.empty(t.shape, dtype=t.dtype, pin_memory=True).copy_(t, non_blocking=True)
+                cuda_devices.add(t.device)
+            else:
+                copies[id(obj)] = t.to("cpu", copy=True)
+        return copies[id(obj)]
+    if isinstance(obj, dict):
+        snapshot = copy.copy(obj)
+        for k, v in obj.items():
+            snapshot[k] = _snapshot_to_cpu(v, copies, cuda_devices)
+        return snapshot
+    if isinstance(obj, tuple) and hasattr(obj, "_fields"):  # namedtuple
+        return type(obj)(*(_snapshot_to_cpu(v, copies, cuda_devices) for v in obj))
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_snapshot_to_cpu(v, copies, cuda_devices) for v in obj)
+    return obj
+
+
 class DiskSaver(BaseSaveHandler):
     """Handler that saves input checkpoint on a disk.
 
@@ -917,6 +1059,10 @@ class ModelCheckpoint(Checkpoint):
             Default, `False`.
         save_on_rank: Which rank to save the objects on, in the distributed configuration. Used to
             instantiate a :class:`~ignite.handlers.DiskSaver` and is also passed to the parent class.
+        async_save: if True, objects are saved on a background thread. See
+            :class:`~ignite.handlers.checkpoint.Checkpoint` for details. Default, False.
+        max_pending_saves: maximum number of checkpoints copied and not yet saved in ``async_save`` mode.
+            Default, 1.
         kwargs: Accepted keyword arguments for `torch.save` or `xm.save` in `DiskSaver`.
 
     .. versionchanged:: 0.4.2
@@ -929,6 +1075,9 @@ class ModelCheckpoint(Checkpoint):
     .. versionchanged:: 0.4.10
         Added `save_on_rank` arg to save objects on this rank in a distributed configuration
 
+    .. versionchanged:: 0.6.0
+        Added ``async_save`` and ``max_pending_saves`` arguments.
+
     Examples:
         .. testcode:: python
 
@@ -965,6 +1114,8 @@ class ModelCheckpoint(Checkpoint):
         include_self: bool = False,
         greater_or_equal: bool = False,
         save_on_rank: int = 0,
+        async_save: bool = False,
+        max_pending_saves: int = 1,
         **kwargs: Any,
     ):
         disk_saver = DiskSaver(
@@ -988,17 +1139,20 @@ class ModelCheckpoint(Checkpoint):
             include_self=include_self,
             greater_or_equal=greater_or_equal,
             save_on_rank=save_on_rank,
+            async_save=async_save,
+            max_pending_saves=max_pending_saves,
         )
 
     @property
     def last_checkpoint(self) -> Optional[Union[str, Path]]:
-        if len(self._saved) < 1:
+        filename = self._last_saved_filename()
+        if filename is None:
             return None
 
         if not isinstance(self.save_handler, DiskSaver):
             raise RuntimeError(f"Internal error, save_handler should be DiskSaver, but has {type(self.save_handler)}.")
 
-        return self.save_handler.dirname / self._saved[-1].filename
+        return self.save_handler.dirname / filename
 
     def __call__(self, engine: Engine, to_save: Mapping):  # type: ignore
         if len(to_save) == 0:
@@ -6,13 +6,14 @@ import warnings
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, DefaultDict, List, Mapping, Optional, Tuple, Type, Union
+from typing import Any, Callable, DefaultDict, Iterable, List, Mapping, Optional, Tuple, Type, Union
 
 from torch.optim import Optimizer
 
 import ignite.distributed as idist
 from ignite.engine import Engine, Events
 from ignite.handlers.base_logger import (
+    _BufferedScalarsMixin,
     BaseLogger,
     BaseOptimizerParamsHandler,
     BaseOutputHandler,
@@ -35,7 +36,7 @@ __all__ = [
 ]
 
 
-class ClearMLLogger(BaseLogger):
+class ClearMLLogger(BaseLogger, _BufferedScalarsMixin):
     """
     `ClearML <https://github.com/allegroai/clearml>`_ handler to log metrics, text, model/optimizer parameters,
     plots during training and validation.
@@ -48,10 +49,18 @@ class ClearMLLogger(BaseLogger):
         clearml-init
 
     Args:
+        max_buffer_size: if given, the scalars logged by the handlers are buffered and reported on a background
+            thread when ``max_buffer_size`` values are pending.
+        flush_interval: if given, the scalars logged by the handlers are buffered and reported on a background
+            thread every ``flush_interval`` seconds.
         kwargs: Keyword arguments accepted from ``Task.init`` method.
             All arguments are optional. If a ClearML Task has already been created,
             kwargs will be ignored and the current ClearML Task will be used.
 
+    Note:
+        Buffered scalars are reported on :attr:`~ignite.engine.events.Events.COMPLETED` of the engines the handlers
+        are attached to and when the logger is closed.
+
     Examples:
         .. code-block:: python
 
@@ -109,9 +118,17 @@ class ClearMLLogger(BaseLogger):
                 log_handler=WeightsScalarHandler(model)
             )
 
+        Buffer the scalars logged at each iteration and report them by batches of 1000 values
+
+        .. code-block:: python
+
+            clearml_logger = ClearMLLogger(max_buffer_size=1000)
+
+    .. versionchanged:: 0.6.0
+        added ``max_buffer_size`` and ``flush_interval`` arguments.
     """
 
-    def __init__(self, **kwargs: Any):
+    def __init__(self, max_buffer_size: Optional[int] = None, flush_interval: Optional[float] = None, **kwargs: Any):
         try:
             from clearml import Task
             from clearml.binding.frameworks.tensorflow_bind import WeightsGradientHistHelper
@@ -141,6 +158,8 @@ class ClearMLLogger(BaseLogger):
 
         self.grad_helper = WeightsGradientHistHelper(logger=self.clearml_logger, report_freq=1)
 
+        self._setup_scalar_buffer(max_buffer_size, flush_interval)
+
     @classmethod
     def set_bypass_mode(cls, bypass: bool) -> None:
         """
@@ -194,8 +213,13 @@ class ClearMLLogger(BaseLogger):
         return self._task
 
     def close(self) -> None:
+        self._close_scalar_buffer()
         self.clearml_logger.flush()
 
+    def _submit_scalars(self, keys: List[Any], values: List[float], steps: List[int], timestamps: List[float]) -> None:
+        for (title, series), value, step in zip(keys, values, steps):
+            self.clearml_logger.report_scalar(title=title, series=series, value=value, iteration=step)
+
     def _create_output_handler(self, *args: Any, **kwargs: Any) -> "OutputHandler":
         return OutputHandler(*args, **kwargs)
 
@@ -203,6 +227,17 @@ class ClearMLLogger(BaseLogger):
         return OptimizerParamsHandler(*args, **kwargs)
 
 
+def _report_scalars(
+    logger: ClearMLLogger, engine: Engine, scalars: Iterable[Tuple[Tuple[str, str], Any]], step: int
+) -> None:
+    scalar_buffer = getattr(logger, "_scalar_buffer", None)
+    if scalar_buffer is not None:
+        scalar_buffer.extend(engine, scalars, step)
+    else:
+        for (title, series), value in scalars:
+            logger.clearml_logger.report_scalar(title=title, series=series, iteration=step, value=value)
+
+
 class OutputHandler(BaseOutputHandler):
     """Helper handler to log engine's output and/or metrics
 
@@ -339,13 +374,13 @@ class OutputHandler(BaseOutputHandler):
                 " Please check the output of global_step_transform."
             )
 
+        scalars = []
         for key, value in metrics.items():
             if len(key) == 2:
-                logger.clearml_logger.report_scalar(title=key[0], series=key[1], iteration=global_step, value=value)
+                scalars.append(((key[0], key[1]), value))
             elif len(key) == 3:
-                logger.clearml_logger.report_scalar(
-                    title=f"{key[0]}/{key[1]}", series=key[2], iteration=global_step, value=value
-                )
+                scalars.append(((f"{key[0]}/{key[1]}", key[2]), value))
+        _report_scalars(logger, engine, scalars, global_step)
 
 
 class OptimizerParamsHandler(BaseOptimizerParamsHandler):
@@ -396,10 +431,8 @@ class OptimizerParamsHandler(BaseOptimizerParamsHandler):
             str(i): float(param_group[self.param_name]) for i, param_group in enumerate(self.optimizer.param_groups)
         }
 
-        for k, v in params.items():
-            logger.clearml_logger.report_scalar(
-                title=f"{tag_prefix}{self.param_name}", series=k, value=v, iteration=global_step
-            )
+        scalars = [((f"{tag_prefix}{self.param_name}", k), v) for k, v in params.items()]
+        _report_scalars(logger, engine, scalars, global_step)
 
 
 class WeightsScalarHandler(BaseWeightsScalarHandler):
@@ -486,14 +519,11 @@ class WeightsScalarHandler(BaseWeightsScalarHandler):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = f"{self.tag}/" if self.tag else ""
-        for name, p in self.weights:
+        scalars = []
+        for name, value in self._reduce([(name, p.data) for name, p in self.weights]):
             title_name, _, series_name = name.partition(".")
-            logger.clearml_logger.report_scalar(
-                title=f"{tag_prefix}weights_{self.reduction.__name__}/{title_name}",
-                series=series_name,
-                value=self.reduction(p.data),
-                iteration=global_step,
-            )
+            scalars.append(((f"{tag_prefix}weights_{self.reduction.__name__}/{title_name}", series_name), value))
+        _report_scalars(logger, engine, scalars, global_step)
 
 
 class WeightsHistHandler(BaseWeightsHandler):
@@ -672,17 +702,11 @@ class GradsScalarHandler(BaseWeightsScalarHandler):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = f"{self.tag}/" if self.tag else ""
-        for name, p in self.weights:
-            if p.grad is None:
-                continue
-
+        scalars = []
+        for name, value in self._reduce([(name, p.grad) for name, p in self.weights if p.grad is not None]):
             title_name, _, series_name = name.partition(".")
-            logger.clearml_logger.report_scalar(
-                title=f"{tag_prefix}grads_{self.reduction.__name__}/{title_name}",
-                series=series_name,
-                value=self.reduction(p.grad),
-                iteration=global_step,
-            )
+            scalars.append(((f"{tag_prefix}grads_{self.reduction.__name__}/{title_name}", series_name), value))
+        _report_scalars(logger, engine, scalars, global_step)
 
 
 class GradsHistHandler(BaseWeightsHandler):
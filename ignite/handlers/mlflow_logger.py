@@ -1,19 +1,19 @@
 """MLflow logger and its helper handlers."""
 
 import warnings
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from torch.optim import Optimizer
 
 from ignite.engine import Engine, Events
 
-from ignite.handlers.base_logger import BaseLogger, BaseOptimizerParamsHandler, BaseOutputHandler
+from ignite.handlers.base_logger import _BufferedScalarsMixin, BaseLogger, BaseOptimizerParamsHandler, BaseOutputHandler
 from ignite.handlers.utils import global_step_from_engine  # noqa
 
 __all__ = ["MLflowLogger", "OutputHandler", "OptimizerParamsHandler", "global_step_from_engine"]
 
 
-class MLflowLogger(BaseLogger):
+class MLflowLogger(BaseLogger, _BufferedScalarsMixin):
     """
     `MLflow <https://mlflow.org>`_ tracking client handler to log parameters and metrics during the training
     and validation.
@@ -26,6 +26,14 @@ class MLflowLogger(BaseLogger):
 
     Args:
         tracking_uri: MLflow tracking uri. See MLflow docs for more details
+        max_buffer_size: if given, the metrics logged by the handlers are buffered and submitted in batches with
+            ``MlflowClient.log_batch`` on a background thread when ``max_buffer_size`` values are pending.
+        flush_interval: if given, the metrics logged by the handlers are buffered and submitted in batches on a
+            background thread every ``flush_interval`` seconds.
+
+    Note:
+        Buffered metrics are submitted on :attr:`~ignite.engine.events.Events.COMPLETED` of the engines the handlers
+        are attached to and when the logger is closed.
 
     Examples:
         .. code-block:: python
@@ -84,9 +92,23 @@ class MLflowLogger(BaseLogger):
                 optimizer=optimizer,
                 param_name='lr'  # optional
             )
+
+        Buffer the metrics logged at each iteration and submit them every 10 seconds
+
+        .. code-block:: python
+
+            mlflow_logger = MLflowLogger(flush_interval=10.0)
+
+    .. versionchanged:: 0.6.0
+        added ``max_buffer_size`` and ``flush_interval`` arguments.
     """
 
-    def __init__(self, tracking_uri: Optional[str] = None):
+    def __init__(
+        self,
+        tracking_uri: Optional[str] = None,
+        max_buffer_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ):
         try:
             import mlflow
         except ImportError:
@@ -102,6 +124,8 @@ class MLflowLogger(BaseLogger):
         if self.active_run is None:
             self.active_run = mlflow.start_run()
 
+        self._setup_scalar_buffer(max_buffer_size, flush_interval)
+
     def __getattr__(self, attr: Any) -> Any:
         import mlflow
 
@@ -110,8 +134,25 @@ class MLflowLogger(BaseLogger):
     def close(self) -> None:
         import mlflow
 
+        self._close_scalar_buffer()
         mlflow.end_run()
 
+    def _submit_scalars(self, keys: List[Any], values: List[float], steps: List[int], timestamps: List[float]) -> None:
+        from mlflow.entities import Metric
+        from mlflow.tracking import MlflowClient
+        from mlflow.utils.validation import MAX_METRICS_PER_BATCH
+
+        if self.active_run is None:
+            raise RuntimeError("MLflowLogger has no active run to log the metrics to")
+
+        metrics = [
+            Metric(key, value, int(timestamp * 1000), step)
+            for key, value, step, timestamp in zip(keys, values, steps, timestamps)
+        ]
+        client = MlflowClient()
+        for i in range(0, len(metrics), MAX_METRICS_PER_BATCH):
+            client.log_batch(self.active_run.info.run_id, metrics=metrics[i : i + MAX_METRICS_PER_BATCH])
+
     def _create_output_handler(self, *args: Any, **kwargs: Any) -> "OutputHandler":
         return OutputHandler(*args, **kwargs)
 
@@ -119,6 +160,14 @@ class MLflowLogger(BaseLogger):
         return OptimizerParamsHandler(*args, **kwargs)
 
 
+def _log_metrics(logger: MLflowLogger, engine: Engine, metrics: Dict[str, Any], step: int) -> None:
+    scalar_buffer = getattr(logger, "_scalar_buffer", None)
+    if scalar_buffer is not None:
+        scalar_buffer.extend(engine, metrics.items(), step)
+    else:
+        logger.log_metrics(metrics, step=step)
+
+
 class OutputHandler(BaseOutputHandler):
     """Helper handler to log engine's output and/or metrics.
 
@@ -260,7 +309,7 @@ class OutputHandler(BaseOutputHandler):
                 )
                 del metrics[key]
 
-        logger.log_metrics(metrics, step=global_step)
+        _log_metrics(logger, engine, metrics, global_step)
 
 
 class OptimizerParamsHandler(BaseOptimizerParamsHandler):
@@ -310,4 +359,4 @@ class OptimizerParamsHandler(BaseOptimizerParamsHandler):
             for i, param_group in enumerate(self.optimizer.param_groups)
         }
 
-        logger.log_metrics(params, step=global_step)
+        _log_metrics(logger, engine, params, global_step)
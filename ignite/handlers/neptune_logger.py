@@ -2,7 +2,7 @@
 
 import tempfile
 import warnings
-from typing import Any, Callable, List, Mapping, Optional, Union
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import torch
 from torch.optim import Optimizer
@@ -11,6 +11,7 @@ import ignite.distributed as idist
 
 from ignite.engine import Engine, Events
 from ignite.handlers.base_logger import (
+    _BufferedScalarsMixin,
     BaseLogger,
     BaseOptimizerParamsHandler,
     BaseOutputHandler,
@@ -32,7 +33,7 @@ __all__ = [
 _INTEGRATION_VERSION_KEY = "source_code/integrations/neptune-pytorch-ignite"
 
 
-class NeptuneLogger(BaseLogger):
+class NeptuneLogger(BaseLogger, _BufferedScalarsMixin):
     """
     `Neptune <https://neptune.ai/>`_ handler to log metrics, model/optimizer parameters and gradients during training
     and validation. It can also log model checkpoints to Neptune.
@@ -48,8 +49,16 @@ class NeptuneLogger(BaseLogger):
         project: Name of a Neptune project, in the form "workspace-name/project-name".
            For example "tom/mnist-classification".
            If None, the value of the NEPTUNE_PROJECT environment variable is used.
+        max_buffer_size: if given, the scalars logged by the handlers are buffered and appended to their series in
+            batches with ``extend`` on a background thread when ``max_buffer_size`` values are pending.
+        flush_interval: if given, the scalars logged by the handlers are buffered and appended to their series in
+            batches on a background thread every ``flush_interval`` seconds.
         **kwargs: Other arguments to be passed to the `init_run()` function.
 
+    Note:
+        Buffered scalars are submitted on :attr:`~ignite.engine.events.Events.COMPLETED` of the engines the handlers
+        are attached to and when the logger is closed.
+
     Examples:
         .. code-block:: python
 
@@ -153,6 +162,14 @@ class NeptuneLogger(BaseLogger):
                     output_transform=lambda loss: {"loss": loss},
                 )
 
+        Buffer the scalars logged at each iteration and submit them every 10 seconds:
+
+        .. code-block:: python
+
+            npt_logger = NeptuneLogger(flush_interval=10.0)
+
+    .. versionchanged:: 0.6.0
+        added ``max_buffer_size`` and ``flush_interval`` arguments.
     """
 
     def __getattr__(self, attr: Any) -> Any:
@@ -164,7 +181,14 @@ class NeptuneLogger(BaseLogger):
     def __setitem__(self, key: str, val: Any) -> Any:
         self.experiment[key] = val
 
-    def __init__(self, api_token: Optional[str] = None, project: Optional[str] = None, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        project: Optional[str] = None,
+        max_buffer_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
         try:
             try:
                 # neptune-client<1.0.0 package structure
@@ -191,10 +215,22 @@ class NeptuneLogger(BaseLogger):
         run[_INTEGRATION_VERSION_KEY] = __version__
 
         self.experiment = run
+        self._setup_scalar_buffer(max_buffer_size, flush_interval)
 
     def close(self) -> None:
+        self._close_scalar_buffer()
         self.experiment.stop()
 
+    def _submit_scalars(self, keys: List[Any], values: List[float], steps: List[int], timestamps: List[float]) -> None:
+        series: Dict[str, Tuple[List[float], List[int], List[float]]] = {}
+        for key, value, step, timestamp in zip(keys, values, steps, timestamps):
+            series_values, series_steps, series_timestamps = series.setdefault(key, ([], [], []))
+            series_values.append(value)
+            series_steps.append(step)
+            series_timestamps.append(timestamp)
+        for key, (series_values, series_steps, series_timestamps) in series.items():
+            self.experiment[key].extend(series_values, steps=series_steps, timestamps=series_timestamps)
+
     def _create_output_handler(self, *args: Any, **kwargs: Any) -> "OutputHandler":
         return OutputHandler(*args, **kwargs)
 
@@ -202,6 +238,15 @@ class NeptuneLogger(BaseLogger):
         return OptimizerParamsHandler(*args, **kwargs)
 
 
+def _append_scalars(logger: NeptuneLogger, engine: Engine, scalars: Iterable[Tuple[str, Any]], step: int) -> None:
+    scalar_buffer = getattr(logger, "_scalar_buffer", None)
+    if scalar_buffer is not None:
+        scalar_buffer.extend(engine, scalars, step)
+    else:
+        for key, value in scalars:
+            logger[key].append(value, step=step)
+
+
 class OutputHandler(BaseOutputHandler):
     """Helper handler to log engine's output and/or metrics.
 
@@ -343,8 +388,7 @@ class OutputHandler(BaseOutputHandler):
                 " Please check the output of global_step_transform."
             )
 
-        for key, value in metrics.items():
-            logger[key].append(value, step=global_step)
+        _append_scalars(logger, engine, metrics.items(), global_step)
 
 
 class OptimizerParamsHandler(BaseOptimizerParamsHandler):
@@ -400,8 +444,7 @@ class OptimizerParamsHandler(BaseOptimizerParamsHandler):
             for i, param_group in enumerate(self.optimizer.param_groups)
         }
 
-        for k, v in params.items():
-            logger[k].append(v, step=global_step)
+        _append_scalars(logger, engine, params.items(), global_step)
 
 
 class WeightsScalarHandler(BaseWeightsScalarHandler):
@@ -498,13 +541,11 @@ class WeightsScalarHandler(BaseWeightsScalarHandler):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = f"{self.tag}/" if self.tag else ""
-        for name, p in self.weights:
-            if p.grad is None:
-                continue
-
+        scalars = []
+        for name, value in self._reduce([(name, p.data) for name, p in self.weights if p.grad is not None]):
             name = name.replace(".", "/")
-            key = f"{tag_prefix}weights_{self.reduction.__name__}/{name}"
-            logger[key].append(self.reduction(p.data), step=global_step)
+            scalars.append((f"{tag_prefix}weights_{self.reduction.__name__}/{name}", value))
+        _append_scalars(logger, engine, scalars, global_step)
 
 
 class GradsScalarHandler(BaseWeightsScalarHandler):
@@ -602,13 +643,11 @@ class GradsScalarHandler(BaseWeightsScalarHandler):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = f"{self.tag}/" if self.tag else ""
-        for name, p in self.weights:
-            if p.grad is None:
-                continue
-
+        scalars = []
+        for name, value in self._reduce([(name, p.grad) for name, p in self.weights if p.grad is not None]):
             name = name.replace(".", "/")
-            key = f"{tag_prefix}grads_{self.reduction.__name__}/{name}"
-            logger[key].append(self.reduction(p.grad), step=global_step)
+            scalars.append((f"{tag_prefix}grads_{self.reduction.__name__}/{name}", value))
+        _append_scalars(logger, engine, scalars, global_step)
 
 
 class NeptuneSaver(BaseSaveHandler):
@@ -1,18 +1,18 @@
 """Polyaxon logger and its helper handlers."""
 
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from torch.optim import Optimizer
 
 from ignite.engine import Engine, Events
 
-from ignite.handlers.base_logger import BaseLogger, BaseOptimizerParamsHandler, BaseOutputHandler
+from ignite.handlers.base_logger import _BufferedScalarsMixin, BaseLogger, BaseOptimizerParamsHandler, BaseOutputHandler
 from ignite.handlers.utils import global_step_from_engine  # noqa
 
 __all__ = ["PolyaxonLogger", "OutputHandler", "OptimizerParamsHandler", "global_step_from_engine"]
 
 
-class PolyaxonLogger(BaseLogger):
+class PolyaxonLogger(BaseLogger, _BufferedScalarsMixin):
     """
     `Polyaxon tracking client <https://polyaxon.com/>`_ handler to log parameters and metrics during the training
     and validation.
@@ -30,9 +30,17 @@ class PolyaxonLogger(BaseLogger):
     Args:
         args: Positional arguments accepted from
             `Experiment <https://polyaxon.com/docs/experimentation/tracking/client/>`_.
+        max_buffer_size: if given, the metrics logged by the handlers are buffered and logged by step on a
+            background thread when ``max_buffer_size`` values are pending.
+        flush_interval: if given, the metrics logged by the handlers are buffered and logged by step on a
+            background thread every ``flush_interval`` seconds.
         kwargs: Keyword arguments accepted from
             `Experiment <https://polyaxon.com/docs/experimentation/tracking/client/>`_.
 
+    Note:
+        Buffered metrics are logged on :attr:`~ignite.engine.events.Events.COMPLETED` of the engines the handlers
+        are attached to and when the logger is closed.
+
     Examples:
         .. code-block:: python
 
@@ -92,9 +100,14 @@ class PolyaxonLogger(BaseLogger):
             )
             # to manually end a run
             plx_logger.close()
+
+    .. versionchanged:: 0.6.0
+        added ``max_buffer_size`` and ``flush_interval`` arguments.
     """
 
-    def __init__(self, *args: Any, **kwargs: Any):
+    def __init__(
+        self, *args: Any, max_buffer_size: Optional[int] = None, flush_interval: Optional[float] = None, **kwargs: Any
+    ):
         try:
             from polyaxon.tracking import Run
 
@@ -112,7 +125,10 @@ class PolyaxonLogger(BaseLogger):
                     "For Polyaxon v0.x please install it with command: \n pip install polyaxon-client"
                 )
 
+        self._setup_scalar_buffer(max_buffer_size, flush_interval)
+
     def close(self) -> None:
+        self._close_scalar_buffer()
         try:
             self.experiment.end()
         except:
@@ -121,6 +137,13 @@ class PolyaxonLogger(BaseLogger):
     def __getattr__(self, attr: Any) -> Any:
         return getattr(self.experiment, attr)
 
+    def _submit_scalars(self, keys: List[Any], values: List[float], steps: List[int], timestamps: List[float]) -> None:
+        metrics_per_step: Dict[int, Dict[str, float]] = {}
+        for key, value, step in zip(keys, values, steps):
+            metrics_per_step.setdefault(step, {})[key] = value
+        for step, metrics in metrics_per_step.items():
+            self.experiment.log_metrics(step=step, **metrics)
+
     def _create_output_handler(self, *args: Any, **kwargs: Any) -> "OutputHandler":
         return OutputHandler(*args, **kwargs)
 
@@ -128,6 +151,14 @@ class PolyaxonLogger(BaseLogger):
         return OptimizerParamsHandler(*args, **kwargs)
 
 
+def _log_metrics(logger: PolyaxonLogger, engine: Engine, metrics: Dict[str, Any], step: int) -> None:
+    scalar_buffer = getattr(logger, "_scalar_buffer", None)
+    if scalar_buffer is not None:
+        scalar_buffer.extend(engine, metrics.items(), step)
+    else:
+        logger.log_metrics(step=step, **metrics)
+
+
 class OutputHandler(BaseOutputHandler):
     """Helper handler to log engine's output and/or metrics.
 
@@ -253,9 +284,7 @@ class OutputHandler(BaseOutputHandler):
                 " Please check the output of global_step_transform."
             )
 
-        metrics.update({"step": global_step})
-
-        logger.log_metrics(**metrics)
+        _log_metrics(logger, engine, metrics, global_step)
 
 
 class OptimizerParamsHandler(BaseOptimizerParamsHandler):
@@ -302,5 +331,4 @@ class OptimizerParamsHandler(BaseOptimizerParamsHandler):
             f"{tag_prefix}{self.param_name}/group_{i}": float(param_group[self.param_name])
             for i, param_group in enumerate(self.optimizer.param_groups)
         }
-        params["step"] = global_step
-        logger.log_metrics(**params)
+        _log_metrics(logger, engine, params, global_step)
@@ -428,13 +428,9 @@ class WeightsScalarHandler(BaseWeightsScalarHandler):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = f"{self.tag}/" if self.tag else ""
-        for name, p in self.weights:
+        for name, value in self._reduce([(name, p.data) for name, p in self.weights]):
             name = name.replace(".", "/")
-            logger.writer.add_scalar(
-                f"{tag_prefix}weights_{self.reduction.__name__}/{name}",
-                self.reduction(p.data),
-                global_step,
-            )
+            logger.writer.add_scalar(f"{tag_prefix}weights_{self.reduction.__name__}/{name}", value, global_step)
 
 
 class WeightsHistHandler(BaseWeightsHandler):
@@ -589,14 +585,9 @@ class GradsScalarHandler(BaseWeightsScalarHandler):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = f"{self.tag}/" if self.tag else ""
-        for name, p in self.weights:
-            if p.grad is None:
-                continue
-
+        for name, value in self._reduce([(name, p.grad) for name, p in self.weights if p.grad is not None]):
             name = name.replace(".", "/")
-            logger.writer.add_scalar(
-                f"{tag_prefix}grads_{self.reduction.__name__}/{name}", self.reduction(p.grad), global_step
-            )
+            logger.writer.add_scalar(f"{tag_prefix}grads_{self.reduction.__name__}/{name}", value, global_step)
 
 
 class GradsHistHandler(BaseWeightsHandler):
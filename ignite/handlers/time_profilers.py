@@ -127,6 +127,7 @@ class BasicTimeProfiler:
 
         for e, m in zip(self._events, self._lmethods):
             engine._event_handlers[e].append((m, (engine,), {}))
+        engine._invalidate_compiled_event_handlers()
 
         # Let's go
         self._event_handlers_timer.reset()
@@ -220,6 +221,7 @@ class BasicTimeProfiler:
 
         if not engine.has_event_handler(self._as_first_started):
             engine._event_handlers[Events.STARTED].insert(0, (self._as_first_started, (engine,), {}))
+            engine._invalidate_compiled_event_handlers(Events.STARTED)
 
     @staticmethod
     def _compute_basic_stats(data: torch.Tensor) -> Dict[str, Union[str, float, Tuple[float, float]]]:
@@ -545,6 +547,7 @@ class HandlersTimeProfiler:
             for i, (func, args, kwargs) in enumerate(engine._event_handlers[e]):
                 if hasattr(func, "_profiler_original"):
                     engine._event_handlers[e][i] = (func._profiler_original, args, kwargs)
+        engine._invalidate_compiled_event_handlers()
 
     def _as_first_started(self, engine: Engine) -> None:
         # wraps original handlers for profiling
@@ -564,14 +567,17 @@ class HandlersTimeProfiler:
             for i, (func, args, kwargs) in enumerate(engine._event_handlers[e]):
                 if not self._is_internal_handler(func):
                     engine._event_handlers[e][i] = (self._create_wrapped_handler(func, e), args, kwargs)
+        engine._invalidate_compiled_event_handlers()
 
         # processing timer
         engine.add_event_handler(Events.ITERATION_STARTED, self._processing_timer.reset)
         engine._event_handlers[Events.ITERATION_COMPLETED].insert(0, (self._timeit_processing, (), {}))
+        engine._invalidate_compiled_event_handlers(Events.ITERATION_COMPLETED)
 
         # dataflow timer
         engine.add_event_handler(Events.GET_BATCH_STARTED, self._dataflow_timer.reset)
         engine._event_handlers[Events.GET_BATCH_COMPLETED].insert(0, (self._timeit_dataflow, (), {}))
+        engine._invalidate_compiled_event_handlers(Events.GET_BATCH_COMPLETED)
 
         # revert back the wrapped handlers with original handlers at the end
         engine.add_event_handler(Events.COMPLETED, self._detach_profiler_handlers)
@@ -587,6 +593,7 @@ class HandlersTimeProfiler:
 
         if not engine.has_event_handler(self._as_first_started):
             engine._event_handlers[Events.STARTED].insert(0, (self._as_first_started, (engine,), {}))
+            engine._invalidate_compiled_event_handlers(Events.STARTED)
 
     def get_results(self) -> List[List[Union[str, float, Tuple[Union[str, float], Union[str, float]]]]]:
         """
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 """TQDM logger."""
+import time
 from collections import OrderedDict
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import torch
 
 from ignite.engine import Engine, Events
 from ignite.engine.events import CallableEventWithFilter, RemovableEventHandle
@@ -221,6 +224,9 @@ class ProgressBar(BaseLogger):
         )
 
         super(ProgressBar, self).attach(engine, log_handler, event_name)
+        # the values skipped by the last deferred rendering are shown at the end of the epoch and of the run
+        for refresh_event_name in (Events.EPOCH_COMPLETED, Events.COMPLETED):
+            engine.add_event_handler(refresh_event_name, log_handler._refresh_postfix, self)
         engine.add_event_handler(closing_event_name, self._close)
 
     def attach_opt_params_handler(  # type: ignore[empty-body]
@@ -271,6 +277,8 @@ class _OutputHandler(BaseOutputHandler):
             description, metric_names, output_transform, global_step_transform=None, state_attributes=state_attributes
         )
         self.closing_event_name = closing_event_name
+        # values whose rendering was deferred by the last call
+        self._deferred_metrics_state_attrs: Optional[Dict[str, Any]] = None
 
     @staticmethod
     def get_max_number_events(event_name: Union[str, Events, CallableEventWithFilter], engine: Engine) -> Optional[int]:
@@ -280,6 +288,16 @@ class _OutputHandler(BaseOutputHandler):
             return engine.state.max_epochs
         return 1
 
+    @staticmethod
+    def _has_device_tensors(metrics_state_attrs: Dict[str, Any]) -> bool:
+        return any(isinstance(v, torch.Tensor) and v.device.type != "cpu" for v in metrics_state_attrs.values())
+
+    @staticmethod
+    def _is_refresh_due(pbar: Any, global_step: int) -> bool:
+        if pbar.total is not None and global_step >= pbar.total:
+            return True
+        return time.time() - getattr(pbar, "last_print_t", 0.0) >= getattr(pbar, "mininterval", 0.0)
+
     def __call__(self, engine: Engine, logger: ProgressBar, event_name: Union[str, Events]) -> None:
         pbar_total = self.get_max_number_events(event_name, engine)
         if logger.pbar is None:
@@ -295,7 +313,23 @@ class _OutputHandler(BaseOutputHandler):
             desc += f" [{global_step}/{max_num_of_closing_events}]"
         logger.pbar.set_description(desc)  # type: ignore[attr-defined]
 
-        rendered_metrics = self._setup_output_metrics_state_attrs(engine, log_text=True)
+        global_step = engine.state.get_event_attrib_value(event_name)
+        if pbar_total is not None:
+            global_step = (global_step - 1) % pbar_total + 1
+
+        metrics_state_attrs = self._get_output_metrics_state_attrs(engine)
+        # Values kept on a device (e.g. loss tensors not converted with `.item()`) are only transferred to the host
+        # when the progress bar is going to be redrawn, to avoid a synchronization on each iteration.
+        self._deferred_metrics_state_attrs = None
+        if not self._has_device_tensors(metrics_state_attrs) or self._is_refresh_due(logger.pbar, global_step):
+            self._set_postfix(metrics_state_attrs, logger)
+        else:
+            self._deferred_metrics_state_attrs = metrics_state_attrs
+
+        logger.pbar.update(global_step - logger.pbar.n)  # type: ignore[attr-defined]
+
+    def _set_postfix(self, metrics_state_attrs: Dict[str, Any], logger: ProgressBar) -> None:
+        rendered_metrics = self._render_output_metrics_state_attrs(metrics_state_attrs, log_text=True)
         metrics = OrderedDict()
         for key, value in rendered_metrics.items():
             key = "_".join(key[1:])  # tqdm has tag as description
@@ -305,7 +339,7 @@ class _OutputHandler(BaseOutputHandler):
         if metrics:
             logger.pbar.set_postfix(metrics)  # type: ignore[attr-defined]
 
-        global_step = engine.state.get_event_attrib_value(event_name)
-        if pbar_total is not None:
-            global_step = (global_step - 1) % pbar_total + 1
-        logger.pbar.update(global_step - logger.pbar.n)  # type: ignore[attr-defined]
+    def _refresh_postfix(self, engine: Engine, logger: ProgressBar) -> None:
+        if self._deferred_metrics_state_attrs is not None and logger.pbar is not None:
+            self._set_postfix(self._deferred_metrics_state_attrs, logger)
+        self._deferred_metrics_state_attrs = None
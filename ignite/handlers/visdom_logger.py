@@ -479,10 +479,9 @@ class WeightsScalarHandler(BaseWeightsScalarHandler, _BaseVisDrawer):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = f"{self.tag}/" if self.tag else ""
-        for name, p in self.model.named_parameters():
+        for name, v in self._reduce([(name, p.data) for name, p in self.model.named_parameters()]):
             name = name.replace(".", "/")
             k = f"{tag_prefix}weights_{self.reduction.__name__}/{name}"
-            v = self.reduction(p.data)
             self.add_scalar(logger, k, v, event_name, global_step)
 
         logger._save()
@@ -527,13 +526,10 @@ class GradsScalarHandler(BaseWeightsScalarHandler, _BaseVisDrawer):
 
         global_step = engine.state.get_event_attrib_value(event_name)
         tag_prefix = f"{self.tag}/" if self.tag else ""
-        for name, p in self.model.named_parameters():
-            if p.grad is None:
-                continue
-
+        named_grads = [(name, p.grad) for name, p in self.model.named_parameters() if p.grad is not None]
+        for name, v in self._reduce(named_grads):
             name = name.replace(".", "/")
             k = f"{tag_prefix}grads_{self.reduction.__name__}/{name}"
-            v = self.reduction(p.grad)
             self.add_scalar(logger, k, v, event_name, global_step)
 
         logger._save()
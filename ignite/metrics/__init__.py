@@ -3,6 +3,7 @@ import ignite.metrics.regression
 from ignite.metrics.accumulation import Average, GeometricAverage, VariableAccumulation
 from ignite.metrics.accuracy import Accuracy
 from ignite.metrics.average_precision import AveragePrecision
+from ignite.metrics.classification_metric_group import ClassificationMetricGroup
 from ignite.metrics.classification_report import ClassificationReport
 from ignite.metrics.cohen_kappa import CohenKappa
 from ignite.metrics.confusion_matrix import ConfusionMatrix, DiceCoefficient, IoU, JaccardIndex, mIoU
@@ -34,7 +35,7 @@ from ignite.metrics.recall import Recall
 from ignite.metrics.roc_auc import ROC_AUC, RocCurve
 from ignite.metrics.root_mean_squared_error import RootMeanSquaredError
 from ignite.metrics.running_average import RunningAverage
-from ignite.metrics.ssim import SSIM
+from ignite.metrics.ssim import MultiScaleSSIM, SSIM
 from ignite.metrics.top_k_categorical_accuracy import TopKCategoricalAccuracy
 
 __all__ = [
@@ -48,6 +49,7 @@ __all__ = [
     "ConfusionMatrix",
     "CosineSimilarity",
     "ClassificationReport",
+    "ClassificationMetricGroup",
     "TopKCategoricalAccuracy",
     "Average",
     "DiceCoefficient",
@@ -73,6 +75,7 @@ __all__ = [
     "VariableAccumulation",
     "Frequency",
     "SSIM",
+    "MultiScaleSSIM",
     "Bleu",
     "Rouge",
     "RougeN",
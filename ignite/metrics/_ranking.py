@@ -0,0 +1,232 @@
+"""Sort-based implementations of ranking metrics on torch tensors, matching scikit-learn's outputs including ties."""
+
+import warnings
+from typing import Callable, Tuple
+
+import torch
+
+__all__ = [
+    "roc_curve",
+    "roc_auc_score",
+    "precision_recall_curve",
+    "average_precision_score",
+    "binned_roc_curve",
+    "binned_roc_auc_score",
+    "binned_precision_recall_curve",
+    "binned_average_precision_score",
+]
+
+
+def _binary_clf_curve(y_pred: torch.Tensor, y_true: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Returns false and true positives counts for each distinct decision threshold, in decreasing order."""
+    y_pred, indices = torch.sort(y_pred, descending=True)
+    y_true = (y_true[indices] == 1).to(torch.float64)
+
+    # last index of each group of tied scores
+    distinct_value_indices = torch.nonzero(y_pred[1:] != y_pred[:-1]).squeeze(dim=1)
+    last_index = torch.tensor([y_true.numel() - 1], device=distinct_value_indices.device)
+    threshold_indices = torch.cat([distinct_value_indices, last_index])
+
+    tps = torch.cumsum(y_true, dim=0)[threshold_indices]
+    fps = 1 + threshold_indices - tps
+    return fps, tps, y_pred[threshold_indices]
+
+
+def _check_binary(y_pred: torch.Tensor, y_true: torch.Tensor, name: str) -> None:
+    if y_pred.ndimension() != 1 or y_true.ndimension() != 1:
+        raise ValueError(f"{name} supports only binary targets of shape (batch_size, ).")
+
+
+def roc_curve(y_pred: torch.Tensor, y_true: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Binary ROC curve, as ``sklearn.metrics.roc_curve`` with ``drop_intermediate=True``."""
+    _check_binary(y_pred, y_true, "roc_curve")
+    return _roc_curve(*_binary_clf_curve(y_pred, y_true))
+
+
+def _roc_curve(
+    fps: torch.Tensor, tps: torch.Tensor, thresholds: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    if fps.numel() > 2:
+        # drop thresholds that are collinear with their neighbours
+        collinear = ((fps[2:] - 2 * fps[1:-1] + fps[:-2]) == 0) & ((tps[2:] - 2 * tps[1:-1] + tps[:-2]) == 0)
+        keep = torch.cat([collinear.new_ones(1), ~collinear, collinear.new_ones(1)])
+        fps, tps, thresholds = fps[keep], tps[keep], thresholds[keep]
+
+    if not thresholds.is_floating_point():
+        thresholds = thresholds.to(torch.float64)
+    zero = fps.new_zeros(1)
+    fps = torch.cat([zero, fps])
+    tps = torch.cat([zero, tps])
+    thresholds = torch.cat([thresholds.new_full((1,), float("inf")), thresholds])
+
+    if fps[-1] <= 0:
+        warnings.warn("No negative samples in y_true, false positive value should be meaningless", UserWarning)
+        fpr = torch.full_like(fps, float("nan"))
+    else:
+        fpr = fps / fps[-1]
+
+    if tps[-1] <= 0:
+        warnings.warn("No positive samples in y_true, true positive value should be meaningless", UserWarning)
+        tpr = torch.full_like(tps, float("nan"))
+    else:
+        tpr = tps / tps[-1]
+
+    return fpr, tpr, thresholds
+
+
+def precision_recall_curve(
+    y_pred: torch.Tensor, y_true: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Binary precision-recall curve, as ``sklearn.metrics.precision_recall_curve``."""
+    _check_binary(y_pred, y_true, "precision_recall_curve")
+    return _precision_recall_curve(*_binary_clf_curve(y_pred, y_true))
+
+
+def _precision_recall_curve(
+    fps: torch.Tensor, tps: torch.Tensor, thresholds: torch.Tensor
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    ps = tps + fps
+    precision = torch.where(ps != 0, tps / ps.clamp(min=1), torch.zeros_like(tps))
+    if tps[-1] == 0:
+        warnings.warn(
+            "No positive class found in y_true, recall is set to one for all thresholds which leads to a single "
+            "point curve",
+            UserWarning,
+        )
+        recall = torch.ones_like(tps)
+    else:
+        recall = tps / tps[-1]
+
+    precision = torch.cat([precision.flip(0), precision.new_ones(1)])
+    recall = torch.cat([recall.flip(0), recall.new_zeros(1)])
+    return precision, recall, thresholds.flip(0)
+
+
+def _roc_auc(fps: torch.Tensor, tps: torch.Tensor, thresholds: torch.Tensor) -> torch.Tensor:
+    if fps[-1] <= 0 or tps[-1] <= 0:
+        raise ValueError("Only one class is present in y_true. ROC AUC score is not defined in that case.")
+    fpr, tpr, _ = _roc_curve(fps, tps, thresholds)
+    return torch.trapezoid(tpr, fpr)
+
+
+def _average_precision(fps: torch.Tensor, tps: torch.Tensor, thresholds: torch.Tensor) -> torch.Tensor:
+    precision, recall, _ = _precision_recall_curve(fps, tps, thresholds)
+    return (-torch.sum((recall[1:] - recall[:-1]) * precision[:-1])).clamp(min=0)
+
+
+def _binary_roc_auc_score(y_pred: torch.Tensor, y_true: torch.Tensor) -> torch.Tensor:
+    if torch.unique(y_true).numel() != 2:
+        raise ValueError("Only one class is present in y_true. ROC AUC score is not defined in that case.")
+    return _roc_auc(*_binary_clf_curve(y_pred, y_true))
+
+
+def _binary_average_precision_score(y_pred: torch.Tensor, y_true: torch.Tensor) -> torch.Tensor:
+    return _average_precision(*_binary_clf_curve(y_pred, y_true))
+
+
+def _average_binary_score(
+    binary_metric: Callable[[torch.Tensor, torch.Tensor], torch.Tensor], y_pred: torch.Tensor, y_true: torch.Tensor
+) -> float:
+    if y_pred.ndimension() == 1:
+        return binary_metric(y_pred, y_true).item()
+
+    if y_true.ndimension() == 1:
+        # multiclass, one-vs-rest
+        y_true = torch.nn.functional.one_hot(y_true.long(), num_classes=y_pred.shape[1])
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"y_true and y_pred have different shapes: {y_true.shape} vs {y_pred.shape}")
+
+    # macro average over the classes
+    scores = [binary_metric(y_pred[:, c], y_true[:, c]) for c in range(y_pred.shape[1])]
+    return torch.stack(scores).mean().item()
+
+
+def roc_auc_score(y_pred: torch.Tensor, y_true: torch.Tensor) -> float:
+    """Area under the ROC curve, as ``sklearn.metrics.roc_auc_score``. Binary inputs have shape ``(N, )``,
+    multilabel inputs ``(N, C)`` and multiclass inputs are targets of shape ``(N, )`` with scores of shape ``(N, C)``.
+    Scores of multilabel and multiclass (one-vs-rest) inputs are macro averaged.
+    """
+    return _average_binary_score(_binary_roc_auc_score, y_pred, y_true)
+
+
+def average_precision_score(y_pred: torch.Tensor, y_true: torch.Tensor) -> float:
+    """Average precision, as ``sklearn.metrics.average_precision_score``. Inputs are as for
+    :func:`roc_auc_score`.
+    """
+    return _average_binary_score(_binary_average_precision_score, y_pred, y_true)
+
+
+def _binned_counts(y_pred: torch.Tensor, y_true: torch.Tensor, num_bins: int) -> torch.Tensor:
+    """Returns the histograms of the scores of negative and positive samples of each class over ``num_bins``
+    thresholds evenly spaced in ``[0, 1]``, as a tensor of shape ``(num_classes, 2, num_bins)``. A score falls in
+    the bin of the largest threshold lower or equal to it, scores out of ``[0, 1]`` are clipped.
+    """
+    if y_pred.ndimension() == 1:
+        y_pred = y_pred.unsqueeze(dim=1)
+    if y_true.ndimension() == 1:
+        if y_pred.shape[1] > 1:
+            # multiclass, one-vs-rest
+            y_true = torch.nn.functional.one_hot(y_true.long(), num_classes=y_pred.shape[1])
+        else:
+            y_true = y_true.unsqueeze(dim=1)
+    if y_true.shape != y_pred.shape:
+        raise ValueError(f"y_true and y_pred have different shapes: {y_true.shape} vs {y_pred.shape}")
+
+    num_classes = y_pred.shape[1]
+    thresholds = torch.linspace(0, 1, num_bins, device=y_pred.device)
+    bins = (torch.bucketize(y_pred.float(), thresholds, right=True) - 1).clamp(0, num_bins - 1)
+    classes = torch.arange(num_classes, device=y_pred.device)
+    index = (classes * 2 + (y_true == 1).long()) * num_bins + bins
+    counts = torch.bincount(index.flatten(), minlength=num_classes * 2 * num_bins)
+    return counts.view(num_classes, 2, num_bins)
+
+
+def _binned_clf_curve(counts: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """As :func:`_binary_clf_curve` from the histograms of a class of shape ``(2, num_bins)``. Empty bins are
+    skipped, such that the result is the one of the scores rounded down to the thresholds.
+    """
+    thresholds = torch.linspace(0, 1, counts.shape[-1], device=counts.device)
+    nonempty = counts.sum(dim=0) > 0
+    fps, tps = torch.cumsum(counts[:, nonempty].flip(-1).to(torch.float64), dim=-1)
+    return fps, tps, thresholds[nonempty].flip(0)
+
+
+def _check_binned_binary(counts: torch.Tensor, name: str) -> None:
+    if counts.shape[0] != 1:
+        raise ValueError(f"{name} supports only binary targets of shape (batch_size, ).")
+
+
+def _average_binned_score(
+    metric: Callable[[torch.Tensor, torch.Tensor, torch.Tensor], torch.Tensor], counts: torch.Tensor
+) -> float:
+    # macro average over the classes
+    scores = [metric(*_binned_clf_curve(class_counts)) for class_counts in counts]
+    return torch.stack(scores).mean().item()
+
+
+def binned_roc_curve(counts: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Binary ROC curve from histograms of shape ``(1, 2, num_bins)`` returned by :func:`_binned_counts`."""
+    _check_binned_binary(counts, "roc_curve")
+    return _roc_curve(*_binned_clf_curve(counts[0]))
+
+
+def binned_precision_recall_curve(counts: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Binary precision-recall curve from histograms of shape ``(1, 2, num_bins)`` returned by
+    :func:`_binned_counts`.
+    """
+    _check_binned_binary(counts, "precision_recall_curve")
+    return _precision_recall_curve(*_binned_clf_curve(counts[0]))
+
+
+def binned_roc_auc_score(counts: torch.Tensor) -> float:
+    """Area under the ROC curve from histograms of shape ``(num_classes, 2, num_bins)`` returned by
+    :func:`_binned_counts`, macro averaged over the classes.
+    """
+    return _average_binned_score(_roc_auc, counts)
+
+
+def binned_average_precision_score(counts: torch.Tensor) -> float:
+    """Average precision from histograms of shape ``(num_classes, 2, num_bins)`` returned by
+    :func:`_binned_counts`, macro averaged over the classes.
+    """
+    return _average_binned_score(_average_precision, counts)
@@ -1,21 +1,19 @@
-from typing import Callable, Union
+from typing import Callable, Optional, Union
 
 import torch
 
-from ignite.metrics.epoch_metric import EpochMetric
+from ignite.metrics._ranking import average_precision_score, binned_average_precision_score
+from ignite.metrics.epoch_metric import _RankingEpochMetric
 
 
 def average_precision_compute_fn(y_preds: torch.Tensor, y_targets: torch.Tensor) -> float:
-    from sklearn.metrics import average_precision_score
+    return average_precision_score(y_preds, y_targets)
 
-    y_true = y_targets.cpu().numpy()
-    y_pred = y_preds.cpu().numpy()
-    return average_precision_score(y_true, y_pred)
 
-
-class AveragePrecision(EpochMetric):
-    """Computes Average Precision accumulating predictions and the ground-truth during an epoch
-    and applying `sklearn.metrics.average_precision_score <https://scikit-learn.org/stable/modules/generated/
+class AveragePrecision(_RankingEpochMetric):
+    """Computes Average Precision accumulating predictions and the ground-truth during an epoch. The result is
+    computed with torch on the device of the stored data and matches
+    `sklearn.metrics.average_precision_score <https://scikit-learn.org/stable/modules/generated/
     sklearn.metrics.average_precision_score.html#sklearn.metrics.average_precision_score>`_ .
 
     Args:
@@ -23,18 +21,30 @@ class AveragePrecision(EpochMetric):
             :class:`~ignite.engine.engine.Engine`'s ``process_function``'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
-        check_compute_fn: Default False. If True, `average_precision_score
-            <https://scikit-learn.org/stable/modules/generated/sklearn.metrics.average_precision_score.html
-            #sklearn.metrics.average_precision_score>`_ is run on the first batch of data to ensure there are
-            no issues. User will be warned in case there are any issues computing the function.
+        check_compute_fn: Default False. If True, ``average_precision_score``, the torch implementation computing
+            the metric, is run on the first batch of data to ensure there are no issues. User will be warned in case
+            there are any issues computing the function. Not applicable if ``num_bins`` is given.
         device: optional device specification for internal storage.
         skip_unrolling: specifies whether output should be unrolled before being fed to update method. Should be
             true for multi-output model, for example, if ``y_pred`` contains multi-ouput as ``(y_pred_a, y_pred_b)``
             Alternatively, ``output_transform`` can be used to handle this.
+        buffered: if True, predictions and targets are stored in geometrically growing contiguous buffers. See
+            :class:`~ignite.metrics.epoch_metric.EpochMetric`. Default, False.
+        mmap_dir: optional directory where the buffers are stored as memory-mapped files. Implies ``buffered=True``.
+        predictions_dtype: optional dtype to store the predictions with, e.g. ``torch.float16``.
+            Implies ``buffered=True``.
+        targets_dtype: optional dtype to store the targets with, e.g. ``torch.uint8``. Implies ``buffered=True``.
+        num_bins: optional number of thresholds evenly spaced in ``[0, 1]``. If given, the metric is approximated
+            from per-class histograms of the scores over these thresholds instead of storing all the data: memory is
+            O(num_bins), ``update`` is a single scatter-add and processes are synchronized with an ``all_reduce``.
+            The result is then exact for scores rounded down to the thresholds. Scores out of ``[0, 1]`` are clipped
+            and storage arguments are ignored. Default, None.
 
     Note:
         AveragePrecision expects y to be comprised of 0's and 1's. y_pred must either be probability estimates or
-        confidence values. To apply an activation to y_pred, use output_transform as shown below:
+        confidence values. For multilabel inputs of shape ``(batch_size, n_classes)`` and multiclass inputs, i.e. y of
+        shape ``(batch_size, )`` with class indices and y_pred of shape ``(batch_size, n_classes)``, the scores of each
+        class (one-vs-rest) are macro averaged. To apply an activation to y_pred, use output_transform as shown below:
 
         .. code-block:: python
 
@@ -65,6 +75,10 @@ class AveragePrecision(EpochMetric):
 
     .. versionchanged:: 0.5.1
         ``skip_unrolling`` argument is added.
+
+    .. versionchanged:: 0.6.0
+        ``buffered``, ``mmap_dir``, ``predictions_dtype``, ``targets_dtype`` and ``num_bins`` arguments are added.
+        The metric is computed with torch, scikit-learn is no longer required.
     """
 
     def __init__(
@@ -73,16 +87,22 @@ class AveragePrecision(EpochMetric):
         check_compute_fn: bool = False,
         device: Union[str, torch.device] = torch.device("cpu"),
         skip_unrolling: bool = False,
+        buffered: bool = False,
+        mmap_dir: Optional[str] = None,
+        predictions_dtype: Optional[torch.dtype] = None,
+        targets_dtype: Optional[torch.dtype] = None,
+        num_bins: Optional[int] = None,
     ):
-        try:
-            from sklearn.metrics import average_precision_score  # noqa: F401
-        except ImportError:
-            raise ModuleNotFoundError("This contrib module requires scikit-learn to be installed.")
-
         super(AveragePrecision, self).__init__(
             average_precision_compute_fn,
+            binned_average_precision_score,
+            num_bins=num_bins,
             output_transform=output_transform,
             check_compute_fn=check_compute_fn,
             device=device,
             skip_unrolling=skip_unrolling,
+            buffered=buffered,
+            mmap_dir=mmap_dir,
+            predictions_dtype=predictions_dtype,
+            targets_dtype=targets_dtype,
         )
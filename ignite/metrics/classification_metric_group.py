@@ -0,0 +1,275 @@
+from typing import Any, Callable, cast, Dict, List, Mapping, Sequence, Tuple, Union
+
+import torch
+
+from ignite.exceptions import NotComputableError
+from ignite.metrics.accuracy import Accuracy
+from ignite.metrics.confusion_matrix import ConfusionMatrix
+from ignite.metrics.metric import Metric, reinit__is_reduced, sync_all_reduce
+from ignite.metrics.metrics_lambda import MetricsLambda
+from ignite.metrics.precision import _BasePrecisionRecall, Precision
+from ignite.metrics.top_k_categorical_accuracy import TopKCategoricalAccuracy
+
+__all__ = ["ClassificationMetricGroup"]
+
+
+class ClassificationMetricGroup(Metric):
+    r"""Computes several multiclass classification metrics from a single accumulation. The output is transformed,
+    checked and reduced to predicted classes once per batch, and only a confusion matrix and the number of correct
+    top-k predictions are accumulated, instead of the states of each metric updated by its own handler.
+
+    The metrics are given as instances of :class:`~ignite.metrics.accuracy.Accuracy`,
+    :class:`~ignite.metrics.precision.Precision`, :class:`~ignite.metrics.recall.Recall`,
+    :class:`~ignite.metrics.confusion_matrix.ConfusionMatrix` and
+    :class:`~ignite.metrics.top_k_categorical_accuracy.TopKCategoricalAccuracy`, or of
+    :class:`~ignite.metrics.metrics_lambda.MetricsLambda` built on them, like :func:`~ignite.metrics.fbeta.Fbeta`,
+    :func:`~ignite.metrics.classification_report.ClassificationReport`,
+    :func:`~ignite.metrics.confusion_matrix.IoU` or :func:`~ignite.metrics.confusion_matrix.mIoU`. These instances
+    only describe the metrics to compute: they are never updated and their ``output_transform`` and ``device`` are
+    not used.
+
+    - ``update`` must receive output of the form ``(y_pred, y)``.
+    - `y_pred` must be in the following shape (batch_size, num_classes, ...).
+    - `y` must be in the following shape (batch_size, ...). Targets out of ``[0, num_classes)``, e.g. an ignore
+      index, are handled as by each metric: they are ignored by
+      :class:`~ignite.metrics.confusion_matrix.ConfusionMatrix` and the metrics derived from it, counted as wrong
+      predictions by ``Accuracy`` and ``TopKCategoricalAccuracy``, and rejected if ``Precision`` or ``Recall`` are
+      computed.
+
+    ``compute`` returns a dictionary with the value of each metric, which is flattened into
+    ``engine.state.metrics`` by :meth:`~ignite.metrics.metric.Metric.completed`. As there, tensor values are put on
+    CPU and scalar tensors are converted to numbers.
+
+    Args:
+        metrics: a dictionary of names and metrics to compute.
+        num_classes: number of classes.
+        output_transform: a callable that is used to transform the
+            :class:`~ignite.engine.engine.Engine`'s ``process_function``'s output into the
+            form expected by the metric. This can be useful if, for example, you have a multi-output model and
+            you want to compute the metric with respect to one of the outputs.
+        device: specifies which device updates are accumulated on. Setting the
+            metric's device to be the same as your ``update`` arguments ensures the ``update`` method is
+            non-blocking. By default, CPU.
+        skip_unrolling: specifies whether output should be unrolled before being fed to update method. Should be
+            true for multi-output model, for example, if ``y_pred`` contains multi-ouput as ``(y_pred_a, y_pred_b)``
+            Alternatively, ``output_transform`` can be used to handle this.
+
+    Examples:
+
+        For more information on how metric works with :class:`~ignite.engine.engine.Engine`, visit :ref:`attach-engine`.
+
+        .. include:: defaults.rst
+            :start-after: :orphan:
+
+        .. testcode::
+
+            precision = Precision(average=False)
+            recall = Recall(average=False)
+            metrics = ClassificationMetricGroup(
+                {
+                    "accuracy": Accuracy(),
+                    "precision": Precision(average="macro"),
+                    "f1": Fbeta(1.0, precision=precision, recall=recall),
+                    "top2": TopKCategoricalAccuracy(k=2),
+                },
+                num_classes=3,
+            )
+            metrics.attach(default_evaluator, "classification")
+
+            y_true = torch.tensor([2, 0, 2, 1, 0, 1])
+            y_pred = torch.tensor([
+                [0.0266, 0.1719, 0.3055],
+                [0.6886, 0.3978, 0.8176],
+                [0.9230, 0.0197, 0.8395],
+                [0.1785, 0.2670, 0.6084],
+                [0.8448, 0.7177, 0.7288],
+                [0.7748, 0.9542, 0.8573],
+            ])
+            state = default_evaluator.run([[y_pred, y_true]])
+            print(state.metrics["accuracy"])
+            print(state.metrics["precision"])
+            print(state.metrics["f1"])
+            print(state.metrics["top2"])
+
+        .. testoutput::
+
+            0.5
+            0.6111...
+            0.5222...
+            1.0
+
+    .. versionadded:: 0.6.0
+    """
+
+    _state_dict_all_req_keys = ("_confusion_matrix", "_num_correct_topk", "_num_samples", "_num_examples")
+
+    def __init__(
+        self,
+        metrics: Dict[str, Metric],
+        num_classes: int,
+        output_transform: Callable = lambda x: x,
+        device: Union[str, torch.device] = torch.device("cpu"),
+        skip_unrolling: bool = False,
+    ):
+        if not isinstance(metrics, Mapping) or len(metrics) < 1:
+            raise TypeError(f"Argument metrics should be a non-empty dictionary of metrics, but given {metrics}")
+        if num_classes <= 1:
+            raise ValueError("Argument num_classes needs to be > 1")
+
+        self.metrics = dict(metrics)
+        self.num_classes = num_classes
+        self._has_precision_recall = False
+        topk = set()
+        for metric in self.metrics.values():
+            topk.update(self._check_metric(metric))
+        self._topk = sorted(topk)
+        super(ClassificationMetricGroup, self).__init__(
+            output_transform=output_transform, device=device, skip_unrolling=skip_unrolling
+        )
+
+    def _check_metric(self, metric: Any) -> List[int]:
+        """Checks that the metric can be computed from the accumulated data and returns the required top-k."""
+        if isinstance(metric, MetricsLambda):
+            topk = []
+            for dependency in metric._dependencies():
+                topk += self._check_metric(dependency)
+            return topk
+
+        if isinstance(metric, (Accuracy, _BasePrecisionRecall)):
+            if metric._is_multilabel:
+                raise ValueError(f"{metric.__class__.__name__} with is_multilabel=True is not supported.")
+            if isinstance(metric, _BasePrecisionRecall):
+                if metric._average == "samples":
+                    raise ValueError(f"{metric.__class__.__name__} with average='samples' is not supported.")
+                self._has_precision_recall = True
+            return []
+        if isinstance(metric, ConfusionMatrix):
+            if metric.num_classes != self.num_classes:
+                raise ValueError(
+                    f"ConfusionMatrix has a different number of classes: {metric.num_classes} vs {self.num_classes}"
+                )
+            return []
+        if isinstance(metric, TopKCategoricalAccuracy):
+            if not 1 <= metric._k <= self.num_classes:
+                raise ValueError(f"TopKCategoricalAccuracy k should be in [1, {self.num_classes}], got {metric._k}")
+            return [metric._k]
+
+        raise TypeError(f"Metric {metric.__class__.__name__} can not be computed by ClassificationMetricGroup.")
+
+    @reinit__is_reduced
+    def reset(self) -> None:
+        self._confusion_matrix = torch.zeros(self.num_classes, self.num_classes, dtype=torch.int64, device=self._device)
+        self._num_correct_topk = torch.zeros(len(self._topk), dtype=torch.int64, device=self._device)
+        self._num_samples = 0
+        self._num_examples = 0
+
+    def _check_shape(self, output: Sequence[torch.Tensor]) -> None:
+        y_pred, y = output
+        if y_pred.ndimension() < 2 or y_pred.shape[1] != self.num_classes:
+            raise ValueError(
+                f"y_pred must have shape (batch_size, num_classes (currently set to {self.num_classes}), ...), "
+                f"but given {y_pred.shape}"
+            )
+        if y.shape != (y_pred.shape[0],) + y_pred.shape[2:]:
+            raise ValueError(
+                f"y_pred must have shape (batch_size, num_classes (currently set to {self.num_classes}), ...) "
+                "and y must have shape of (batch_size, ...), "
+                f"but given {y.shape} vs {y_pred.shape}."
+            )
+
+    @reinit__is_reduced
+    def update(self, output: Sequence[torch.Tensor]) -> None:
+        y_pred, y = output[0].detach(), output[1].detach()
+        self._check_shape((y_pred, y))
+        target_mask = (y >= 0) & (y < self.num_classes)
+        if self._has_precision_recall and not bool(target_mask.all()):
+            raise ValueError(
+                f"y contains targets out of [0, {self.num_classes}), which are not supported by Precision and Recall."
+            )
+        self._num_samples += y_pred.shape[0]
+        # Accuracy and TopKCategoricalAccuracy count every target, including out of range ones
+        self._num_examples += y.numel()
+
+        # targets out of range are ignored by the confusion matrix and never equal to the predicted classes
+        indices = self.num_classes * y[target_mask] + torch.argmax(y_pred, dim=1)[target_mask]
+        m = torch.bincount(indices, minlength=self.num_classes**2).reshape(self.num_classes, self.num_classes)
+        self._confusion_matrix += m.to(self._confusion_matrix)
+
+        if self._topk:
+            # (batch_size * ..., max_k) sorted predicted classes
+            topk_indices = torch.topk(y_pred, self._topk[-1], dim=1)[1].movedim(1, -1).reshape(-1, self._topk[-1])
+            correct = torch.cumsum(topk_indices == y.reshape(-1, 1), dim=-1).sum(dim=0)
+            self._num_correct_topk += correct[[k - 1 for k in self._topk]].to(self._num_correct_topk)
+
+    @sync_all_reduce("_confusion_matrix", "_num_correct_topk", "_num_samples", "_num_examples")
+    def compute(self) -> Dict[str, Any]:
+        if self._num_samples == 0:
+            raise NotComputableError(
+                "ClassificationMetricGroup must have at least one example before it can be computed."
+            )
+
+        cm = self._confusion_matrix.double()
+        # statistics shared by the metrics: true positives, predicted and actual positives per class
+        stats = (cm.diag(), cm.sum(dim=0), cm.sum(dim=1))
+        values: Dict[int, Any] = {}
+        results = {}
+        for name, metric in self.metrics.items():
+            result = self._compute_metric(metric, stats, values)
+            # as done by Metric.completed for each metric
+            if isinstance(result, torch.Tensor):
+                result = result.item() if result.ndimension() == 0 else result.cpu()
+            results[name] = result
+        return results
+
+    def _compute_metric(
+        self, metric: Metric, stats: Tuple[torch.Tensor, torch.Tensor, torch.Tensor], values: Dict[int, Any]
+    ) -> Any:
+        # metrics shared by several MetricsLambda are computed once
+        if id(metric) in values:
+            return values[id(metric)]
+
+        if isinstance(metric, MetricsLambda):
+
+            def materialize(v: Any) -> Any:
+                if isinstance(v, Metric):
+                    v = self._compute_metric(v, stats, values)
+                if isinstance(v, torch.Tensor):
+                    v = v.cpu()
+                return v
+
+            materialized = [materialize(i) for i in metric.args]
+            materialized_kwargs = {k: materialize(v) for k, v in metric.kwargs.items()}
+            value = metric.function(*materialized, **materialized_kwargs)
+        else:
+            value = self._compute_base_metric(metric, stats)
+
+        values[id(metric)] = value
+        return value
+
+    def _compute_base_metric(self, metric: Metric, stats: Tuple[torch.Tensor, torch.Tensor, torch.Tensor]) -> Any:
+        true_positives, predicted_positives, actual_positives = stats
+        if isinstance(metric, Accuracy):
+            return true_positives.sum().item() / self._num_examples
+
+        if isinstance(metric, TopKCategoricalAccuracy):
+            return self._num_correct_topk[self._topk.index(metric._k)].item() / self._num_examples
+
+        if isinstance(metric, ConfusionMatrix):
+            if metric.average is None:
+                return self._confusion_matrix
+            cm = self._confusion_matrix.float()
+            if metric.average == "samples":
+                return cm / self._num_samples
+            return ConfusionMatrix.normalize(cm, metric.average)
+
+        metric = cast(_BasePrecisionRecall, metric)
+        denominator = predicted_positives if isinstance(metric, Precision) else actual_positives
+        if metric._average == "micro":
+            return (true_positives.sum() / (denominator.sum() + metric.eps)).item()
+
+        fraction = true_positives / (denominator + metric.eps)
+        if metric._average == "weighted":
+            return ((fraction @ actual_positives) / (actual_positives.sum() + metric.eps)).item()
+        elif metric._average == "macro":
+            return fraction.mean().item()
+        return fraction
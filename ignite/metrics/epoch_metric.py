@@ -1,10 +1,16 @@
+import math
+import os
+import tempfile
 import warnings
-from typing import Callable, cast, List, Optional, Tuple, Union
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Callable, cast, List, Optional, Tuple, Union
 
 import torch
 
 import ignite.distributed as idist
 from ignite.exceptions import NotComputableError
+from ignite.metrics._ranking import _binned_counts
 from ignite.metrics.metric import Metric, reinit__is_reduced
 
 __all__ = ["EpochMetric"]
@@ -18,10 +24,13 @@ class EpochMetric(Metric):
     .. warning::
 
         Current implementation stores all input data (output and target) in as tensors before computing a metric.
-        This can potentially lead to a memory error if the input data is larger than available RAM.
+        This can potentially lead to a memory error if the input data is larger than available RAM. Use
+        ``buffered=True``, ``mmap_dir`` and reduced ``predictions_dtype`` / ``targets_dtype`` to bound the memory
+        usage.
 
         In distributed configuration, all stored data (output and target) is mutually collected across all processes
-        using all gather collective operation. This can potentially lead to a memory error.
+        using all gather collective operation. This can potentially lead to a memory error. Processes can hold
+        different numbers of samples, e.g. with ``DistributedSampler(drop_last=False)``.
         Compute method executes ``compute_fn`` on zero rank process only and final result is broadcasted to
         all processes.
 
@@ -38,6 +47,20 @@ class EpochMetric(Metric):
             issues. If issues exist, user is warned that there might be an issue with the ``compute_fn``.
             Default, True.
         device: optional device specification for internal storage.
+        skip_unrolling: specifies whether output should be unrolled before being fed to update method. Should be
+            true for multi-output model, for example, if ``y_pred`` contains multi-ouput as ``(y_pred_a, y_pred_b)``
+            Alternatively, ``output_transform`` can be used to handle this.
+        buffered: if True, predictions and targets are copied into contiguous buffers whose capacity grows
+            geometrically instead of being kept as a list of tensors concatenated on ``compute``. The stored data
+            is then never duplicated in memory. Default, False.
+        mmap_dir: optional directory where the buffers are stored as memory-mapped files, such that stored data
+            can exceed available RAM. Files are deleted once the buffers are released. Implies ``buffered=True``
+            and requires a CPU ``device``.
+        predictions_dtype: optional dtype to store the predictions with, e.g. ``torch.float16`` or
+            ``torch.bfloat16``. ``compute_fn`` receives ``bfloat16`` predictions converted to ``float32``.
+            Implies ``buffered=True``.
+        targets_dtype: optional dtype to store the targets with, e.g. ``torch.uint8`` for binary or multiclass
+            labels. Implies ``buffered=True``.
 
     Example:
 
@@ -68,9 +91,12 @@ class EpochMetric(Metric):
 
     .. versionchanged:: 0.5.1
         ``skip_unrolling`` argument is added.
+
+    .. versionchanged:: 0.6.0
+        ``buffered``, ``mmap_dir``, ``predictions_dtype`` and ``targets_dtype`` arguments are added.
     """
 
-    _state_dict_all_req_keys = ("_predictions", "_targets")
+    _state_dict_all_req_keys: Tuple[str, ...] = ("_predictions", "_targets")
 
     def __init__(
         self,
@@ -79,12 +105,25 @@ class EpochMetric(Metric):
         check_compute_fn: bool = True,
         device: Union[str, torch.device] = torch.device("cpu"),
         skip_unrolling: bool = False,
+        buffered: bool = False,
+        mmap_dir: Optional[str] = None,
+        predictions_dtype: Optional[torch.dtype] = None,
+        targets_dtype: Optional[torch.dtype] = None,
     ) -> None:
         if not callable(compute_fn):
             raise TypeError("Argument compute_fn should be callable.")
+        if mmap_dir is not None:
+            if not os.path.isdir(mmap_dir):
+                raise ValueError(f"Argument mmap_dir should be an existing directory, but given {mmap_dir}")
+            if torch.device(device).type != "cpu":
+                raise ValueError(f"Argument mmap_dir can only be used with a CPU device, but given {device}")
 
         self.compute_fn = compute_fn
         self._check_compute_fn = check_compute_fn
+        self._buffered = buffered or mmap_dir is not None or predictions_dtype is not None or targets_dtype is not None
+        self._mmap_dir = mmap_dir
+        self._predictions_dtype = predictions_dtype
+        self._targets_dtype = targets_dtype
 
         super(EpochMetric, self).__init__(
             output_transform=output_transform, device=device, skip_unrolling=skip_unrolling
@@ -92,8 +131,15 @@ class EpochMetric(Metric):
 
     @reinit__is_reduced
     def reset(self) -> None:
-        self._predictions: List[torch.Tensor] = []
-        self._targets: List[torch.Tensor] = []
+        self._predictions: Union[List[torch.Tensor], _GrowableBuffer]
+        self._targets: Union[List[torch.Tensor], _GrowableBuffer]
+        if self._buffered:
+            self._predictions = _GrowableBuffer(self._device, self._predictions_dtype, self._mmap_dir)
+            self._targets = _GrowableBuffer(self._device, self._targets_dtype, self._mmap_dir)
+        else:
+            self._predictions = []
+            self._targets = []
+        self._num_batches = 0
         self._result: Optional[float] = None
 
     def _check_shape(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
@@ -106,16 +152,19 @@ class EpochMetric(Metric):
 
     def _check_type(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
         y_pred, y = output
-        if len(self._predictions) < 1:
+        if self._num_batches < 1:
             return
-        dtype_preds = self._predictions[-1].dtype
-        if dtype_preds != y_pred.dtype:
+        preds, targets = self._predictions, self._targets
+        dtype_preds = preds.input_dtype if isinstance(preds, _GrowableBuffer) else preds[-1].dtype
+        dtype_targets = targets.input_dtype if isinstance(targets, _GrowableBuffer) else targets[-1].dtype
+
+        # dtypes of the inputs are unknown after loading buffered stored data
+        if dtype_preds is not None and dtype_preds != y_pred.dtype:
             raise ValueError(
                 f"Incoherent types between input y_pred and stored predictions: {dtype_preds} vs {y_pred.dtype}"
             )
 
-        dtype_targets = self._targets[-1].dtype
-        if dtype_targets != y.dtype:
+        if dtype_targets is not None and dtype_targets != y.dtype:
             raise ValueError(f"Incoherent types between input y and stored targets: {dtype_targets} vs {y.dtype}")
 
     @reinit__is_reduced
@@ -129,34 +178,52 @@ class EpochMetric(Metric):
         if y.ndimension() == 2 and y.shape[1] == 1:
             y = y.squeeze(dim=-1)
 
-        y_pred = y_pred.clone().to(self._device)
-        y = y.clone().to(self._device)
-
         self._check_type((y_pred, y))
-        self._predictions.append(y_pred)
-        self._targets.append(y)
+        self._result = None
+        if isinstance(self._predictions, _GrowableBuffer) and isinstance(self._targets, _GrowableBuffer):
+            y_pred = self._predictions.append(y_pred)
+            y = self._targets.append(y)
+        else:
+            y_pred = y_pred.clone().to(self._device)
+            y = y.clone().to(self._device)
+            self._predictions.append(y_pred)
+            self._targets.append(y)
+        self._num_batches += 1
 
         # Check once the signature and execution of compute_fn
-        if len(self._predictions) == 1 and self._check_compute_fn:
+        if self._num_batches == 1 and self._check_compute_fn:
             try:
-                self.compute_fn(self._predictions[0], self._targets[0])
+                self.compute_fn(*self._to_compute_dtype(y_pred, y))
             except Exception as e:
                 warnings.warn(f"Probably, there can be a problem with `compute_fn`:\n {e}.", EpochMetricWarning)
 
+    def _to_compute_dtype(self, y_pred: torch.Tensor, y: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        # numpy, used by most of compute functions, does not support bfloat16
+        if self._predictions_dtype == torch.bfloat16:
+            y_pred = y_pred.float()
+        return y_pred, y
+
+    def _gather_stored_data(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Returns all stored predictions and targets, collected across all processes."""
+        preds, targets = self._predictions, self._targets
+        _prediction_tensor = preds.data if isinstance(preds, _GrowableBuffer) else torch.cat(preds, dim=0)
+        _target_tensor = targets.data if isinstance(targets, _GrowableBuffer) else torch.cat(targets, dim=0)
+
+        if idist.get_world_size() > 1:
+            # All gather across all processes
+            _prediction_tensor = cast(torch.Tensor, idist.all_gather(_prediction_tensor))
+            _target_tensor = cast(torch.Tensor, idist.all_gather(_target_tensor))
+
+        return self._to_compute_dtype(_prediction_tensor, _target_tensor)
+
     def compute(self) -> float:
         if len(self._predictions) < 1 or len(self._targets) < 1:
             raise NotComputableError("EpochMetric must have at least one example before it can be computed.")
 
         if self._result is None:
-            _prediction_tensor = torch.cat(self._predictions, dim=0)
-            _target_tensor = torch.cat(self._targets, dim=0)
+            _prediction_tensor, _target_tensor = self._gather_stored_data()
 
             ws = idist.get_world_size()
-            if ws > 1:
-                # All gather across all processes
-                _prediction_tensor = cast(torch.Tensor, idist.all_gather(_prediction_tensor))
-                _target_tensor = cast(torch.Tensor, idist.all_gather(_target_tensor))
-
             self._result = 0.0
             if idist.get_rank() == 0:
                 # Run compute_fn on zero rank only
@@ -168,6 +235,184 @@ class EpochMetric(Metric):
 
         return self._result
 
+    def _state_dict_per_rank(self) -> OrderedDict:
+        if not (isinstance(self._predictions, _GrowableBuffer) and isinstance(self._targets, _GrowableBuffer)):
+            return super(EpochMetric, self)._state_dict_per_rank()
+        # buffers are saved as lists of tensors, as without buffers
+        state: OrderedDict[str, List[torch.Tensor]] = OrderedDict()
+        state["_predictions"] = [self._predictions.data] if len(self._predictions) > 0 else []
+        state["_targets"] = [self._targets.data] if len(self._targets) > 0 else []
+        return state
+
+    def _load_state_dict_per_rank(self, state_dict: Mapping) -> None:
+        if not self._buffered:
+            super(EpochMetric, self)._load_state_dict_per_rank(state_dict)
+            return
+
+        super(Metric, self).load_state_dict(state_dict)
+        self.reset()
+        for y_pred, y in zip(state_dict["_predictions"], state_dict["_targets"]):
+            self._check_type((y_pred, y))
+            self._predictions.append(y_pred)
+            self._targets.append(y)
+            self._num_batches += 1
+        # the stored data may have been converted to a storage dtype, the dtypes of the inputs are set by the next
+        # update
+        for buffer in (self._predictions, self._targets):
+            if isinstance(buffer, _GrowableBuffer):
+                buffer.input_dtype = None
+
 
 class EpochMetricWarning(UserWarning):
     pass
+
+
+class _RankingEpochMetric(EpochMetric):
+    """EpochMetric of the ranking metrics which, if ``num_bins`` is given, does not store the data but accumulates
+    per-class histograms of the scores of negative and positive samples over ``num_bins`` thresholds evenly spaced
+    in ``[0, 1]``. ``binned_compute_fn`` receives the histograms, a tensor of shape ``(num_classes, 2, num_bins)``,
+    summed across all processes.
+    """
+
+    def __init__(
+        self,
+        compute_fn: Callable[[torch.Tensor, torch.Tensor], Any],
+        binned_compute_fn: Callable[[torch.Tensor], Any],
+        num_bins: Optional[int] = None,
+        **kwargs: Any,
+    ) -> None:
+        if num_bins is not None and (not isinstance(num_bins, int) or num_bins < 2):
+            raise ValueError(f"Argument num_bins should be an integer greater than 1, but given {num_bins}")
+
+        self._num_bins = num_bins
+        self._binned_compute_fn = binned_compute_fn
+        super(_RankingEpochMetric, self).__init__(compute_fn, **kwargs)
+        if num_bins is not None:
+            self._state_dict_all_req_keys = ("_counts",)
+
+    @reinit__is_reduced
+    def reset(self) -> None:
+        super(_RankingEpochMetric, self).reset()
+        self._counts: Optional[torch.Tensor] = None
+
+    @reinit__is_reduced
+    def update(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
+        if self._num_bins is None:
+            super(_RankingEpochMetric, self).update(output)
+            return
+
+        self._check_shape(output)
+        y_pred, y = output[0].detach(), output[1].detach()
+
+        if y_pred.ndimension() == 2 and y_pred.shape[1] == 1:
+            y_pred = y_pred.squeeze(dim=-1)
+
+        if y.ndimension() == 2 and y.shape[1] == 1:
+            y = y.squeeze(dim=-1)
+
+        counts = _binned_counts(y_pred.to(self._device), y.to(self._device), self._num_bins)
+        if self._counts is None:
+            self._counts = counts
+        elif self._counts.shape != counts.shape:
+            raise ValueError(
+                f"Incoherent number of classes between input and accumulated histograms: "
+                f"{counts.shape[0]} vs {self._counts.shape[0]}"
+            )
+        else:
+            self._counts += counts
+
+    def _compute_binned(self) -> Any:
+        if self._counts is None:
+            raise NotComputableError(
+                f"{self.__class__.__name__} must have at least one example before it can be computed."
+            )
+
+        counts = self._counts
+        if idist.get_world_size() > 1:
+            counts = cast(torch.Tensor, idist.all_reduce(counts.clone()))
+        return self._binned_compute_fn(counts)
+
+    def compute(self) -> Any:
+        if self._num_bins is not None:
+            return self._compute_binned()
+        return super(_RankingEpochMetric, self).compute()
+
+    def _state_dict_per_rank(self) -> OrderedDict:
+        if self._num_bins is not None:
+            return super(EpochMetric, self)._state_dict_per_rank()
+        return super(_RankingEpochMetric, self)._state_dict_per_rank()
+
+    def _load_state_dict_per_rank(self, state_dict: Mapping) -> None:
+        if self._num_bins is not None:
+            super(EpochMetric, self)._load_state_dict_per_rank(state_dict)
+            return
+        super(_RankingEpochMetric, self)._load_state_dict_per_rank(state_dict)
+
+
+class _GrowableBuffer:
+    """Contiguous storage of tensors concatenated along their first dimension. The capacity of the storage grows
+    geometrically, such that appending a tensor is amortized O(size of the tensor), and the stored data is available
+    as a view without copies. The storage can be a memory-mapped file in ``mmap_dir``.
+    """
+
+    _growth_factor = 2.0
+    _min_capacity = 1024
+
+    def __init__(
+        self, device: torch.device, dtype: Optional[torch.dtype] = None, mmap_dir: Optional[str] = None
+    ) -> None:
+        self._device = device
+        self._dtype = dtype
+        self._mmap_dir = mmap_dir
+        self._storage: Optional[torch.Tensor] = None
+        self._size = 0
+        self.input_dtype: Optional[torch.dtype] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def data(self) -> torch.Tensor:
+        if self._storage is None:
+            raise RuntimeError("Buffer is empty")
+        return self._storage[: self._size]
+
+    def _allocate(self, capacity: int, shape: Tuple[int, ...], dtype: torch.dtype) -> torch.Tensor:
+        if self._mmap_dir is None:
+            return torch.empty((capacity,) + shape, dtype=dtype, device=self._device)
+
+        numel = capacity * math.prod(shape)
+        fd, filename = tempfile.mkstemp(suffix=".bin", prefix="ignite_epoch_metric_", dir=self._mmap_dir)
+        os.close(fd)
+        try:
+            storage = torch.from_file(filename, shared=True, size=max(numel, 1), dtype=dtype)
+        finally:
+            # the file is released by the OS once the mapping is freed
+            os.remove(filename)
+        return storage[:numel].view((capacity,) + shape)
+
+    def append(self, tensor: torch.Tensor) -> torch.Tensor:
+        """Copies the tensor at the end of the buffer and returns its stored copy."""
+        if self.input_dtype is None:
+            self.input_dtype = tensor.dtype
+        if self._storage is None:
+            dtype = self._dtype if self._dtype is not None else tensor.dtype
+            capacity = max(self._min_capacity, tensor.shape[0])
+            self._storage = self._allocate(capacity, tuple(tensor.shape[1:]), dtype)
+        elif tensor.shape[1:] != self._storage.shape[1:]:
+            raise ValueError(
+                f"Incoherent shapes between input tensor and stored tensors: {tuple(tensor.shape[1:])} "
+                f"vs {tuple(self._storage.shape[1:])}"
+            )
+
+        size = self._size + tensor.shape[0]
+        if size > self._storage.shape[0]:
+            capacity = max(size, math.ceil(self._storage.shape[0] * self._growth_factor))
+            storage = self._allocate(capacity, tuple(self._storage.shape[1:]), self._storage.dtype)
+            storage[: self._size] = self._storage[: self._size]
+            self._storage = storage
+
+        stored = self._storage[self._size : size]
+        stored.copy_(tensor)
+        self._size = size
+        return stored
@@ -1,54 +1,58 @@
+import hashlib
+import os
+import tempfile
 import warnings
-from typing import Callable, Optional, Sequence, Union
+from typing import Callable, cast, Iterable, Optional, Sequence, Tuple, Union
 
 import torch
-from packaging.version import Version
 
+import ignite.distributed as idist
 from ignite.metrics.gan.utils import _BaseInceptionMetric, InceptionModel
-from ignite.metrics.metric import reinit__is_reduced, sync_all_reduce
+from ignite.metrics.metric import reinit__is_reduced
+from ignite.metrics.regression._base import _merge_moments
 
 __all__ = [
     "FID",
 ]
 
 
-if Version(torch.__version__) <= Version("1.7.0"):
-    torch_outer = torch.ger
-else:
-    torch_outer = torch.outer
+def _trace_sqrt_product(sigma1: torch.Tensor, sigma2: torch.Tensor) -> torch.Tensor:
+    """Trace of the square root of ``sigma1 @ sigma2``, the sum of the square roots of its eigenvalues."""
+    eigenvalues1, eigenvectors1 = torch.linalg.eigh(sigma1)
+    if eigenvalues1.min() >= -1e-8 * eigenvalues1.abs().max():
+        # sigma1 is positive semi-definite: sigma1 @ sigma2 has the same eigenvalues as the symmetric matrix
+        # sqrt(sigma1) @ sigma2 @ sqrt(sigma1)
+        sqrt_sigma1 = (eigenvectors1 * eigenvalues1.clamp(min=0).sqrt()) @ eigenvectors1.T
+        product = sqrt_sigma1 @ sigma2 @ sqrt_sigma1
+        eigenvalues = torch.linalg.eigvalsh((product + product.T) / 2).to(torch.complex128)
+    else:
+        eigenvalues = torch.linalg.eigvals(sigma1 @ sigma2).to(torch.complex128)
+
+    sqrt_eigenvalues = eigenvalues.sqrt()
+    # Numerical error might give slight imaginary component
+    imaginary_component = sqrt_eigenvalues.imag.abs().max().item()
+    if imaginary_component > 1e-3:
+        raise ValueError("Imaginary component {}".format(imaginary_component))
+    return sqrt_eigenvalues.real.sum()
 
 
 def fid_score(
     mu1: torch.Tensor, mu2: torch.Tensor, sigma1: torch.Tensor, sigma2: torch.Tensor, eps: float = 1e-6
 ) -> float:
-    try:
-        import numpy as np
-    except ImportError:
-        raise ModuleNotFoundError("fid_score requires numpy to be installed.")
-
-    try:
-        import scipy.linalg
-    except ImportError:
-        raise ModuleNotFoundError("fid_score requires scipy to be installed.")
-
-    mu1, mu2 = mu1.cpu(), mu2.cpu()
-    sigma1, sigma2 = sigma1.cpu(), sigma2.cpu()
+    mu1, mu2 = mu1.to(torch.float64), mu2.to(mu1.device, dtype=torch.float64)
+    sigma1, sigma2 = sigma1.to(mu1.device, dtype=torch.float64), sigma2.to(mu1.device, dtype=torch.float64)
 
     diff = mu1 - mu2
 
     # Product might be almost singular
-    covmean, _ = scipy.linalg.sqrtm(sigma1.mm(sigma2), disp=False)
-    # Numerical error might give slight imaginary component
-    if np.iscomplexobj(covmean):
-        if not np.allclose(np.diagonal(covmean).imag, 0, atol=1e-3):
-            m = np.max(np.abs(covmean.imag))
-            raise ValueError("Imaginary component {}".format(m))
-        covmean = covmean.real
-
-    tr_covmean = np.trace(covmean)
+    try:
+        tr_covmean = _trace_sqrt_product(sigma1, sigma2)
+    except RuntimeError:
+        # eigendecomposition of non-finite matrices fails
+        tr_covmean = torch.tensor(float("nan"), dtype=torch.float64)
 
-    if not np.isfinite(covmean).all():
-        tr_covmean = np.sum(np.sqrt(((np.diag(sigma1) * eps) * (np.diag(sigma2) * eps)) / (eps * eps)))
+    if not torch.isfinite(tr_covmean):
+        tr_covmean = torch.sum(torch.sqrt(((torch.diag(sigma1) * eps) * (torch.diag(sigma2) * eps)) / (eps * eps)))
 
     return float(diff.dot(diff).item() + torch.trace(sigma1) + torch.trace(sigma2) - 2 * tr_covmean)
 
@@ -78,7 +82,9 @@ class FID(_BaseInceptionMetric):
 
     .. note::
         The default Inception model requires the `torchvision` module to be installed.
-        FID also requires `scipy` library for matrix square root calculations.
+        The trace of the matrix square root is computed with torch in float64 on the metric's ``device``.
+        The means and the covariances of the features are updated batch after batch, and merged across processes,
+        with the parallel algorithm of Chan et al., which is stable for features of large means.
 
     Args:
         num_features: number of features predicted by the model or the reduced feature vector of the image.
@@ -99,6 +105,9 @@ class FID(_BaseInceptionMetric):
         device: specifies which device updates are accumulated on. Setting the
             metric's device to be the same as your ``update`` arguments ensures the ``update`` method is
             non-blocking. By default, CPU.
+        reference_statistics: optional mean and covariance of the features of the test data, e.g. of the real
+            images, as returned by :meth:`compute_reference_statistics`. If given, the features of the test data
+            are not extracted and ``update`` can receive only the train data, or ``(y_pred, None)``.
 
     Examples:
 
@@ -161,10 +170,25 @@ class FID(_BaseInceptionMetric):
 
         Important, `pytorch_fid` results depend on the batch size if the device is `cuda`.
 
+    The statistics of the real images can be computed once and cached on disk, such that repeated evaluations of a
+    generator do not extract the features of the same real images again:
+
+    .. code-block:: python
+
+        fid = FID(device="cuda")
+        fid.compute_reference_statistics(real_images_loader, cache_dir="~/.cache/fid", cache_key="cifar10-train")
+        fid.attach(evaluator, "fid")
+        # the evaluator's output is the batch of generated images only
+        evaluator.run(noise_loader)
+
     .. versionadded:: 0.4.6
+
+    .. versionchanged:: 0.6.0
+        ``reference_statistics`` argument and :meth:`compute_reference_statistics` method are added. The matrix
+        square root is computed with torch, `scipy` and `numpy` are not required anymore.
     """
 
-    _state_dict_all_req_keys = ("_num_examples", "_train_total", "_test_total", "_train_sigma", "_test_sigma")
+    _state_dict_all_req_keys = ("_num_examples", "_train_moments", "_test_moments")
 
     def __init__(
         self,
@@ -172,17 +196,8 @@ class FID(_BaseInceptionMetric):
         feature_extractor: Optional[torch.nn.Module] = None,
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = torch.device("cpu"),
+        reference_statistics: Optional[Tuple[torch.Tensor, torch.Tensor]] = None,
     ) -> None:
-        try:
-            import numpy as np  # noqa: F401
-        except ImportError:
-            raise ModuleNotFoundError("This module requires numpy to be installed.")
-
-        try:
-            import scipy  # noqa: F401
-        except ImportError:
-            raise ModuleNotFoundError("This module requires scipy to be installed.")
-
         if num_features is None and feature_extractor is None:
             num_features = 1000
             feature_extractor = InceptionModel(return_features=False, device=device)
@@ -196,70 +211,151 @@ class FID(_BaseInceptionMetric):
             device=device,
         )
 
-    @staticmethod
-    def _online_update(features: torch.Tensor, total: torch.Tensor, sigma: torch.Tensor) -> None:
-        total += features
-        sigma += torch_outer(features, features)
+        self._reference_statistics: Optional[Tuple[torch.Tensor, torch.Tensor]] = None
+        if reference_statistics is not None:
+            self._set_reference_statistics(*reference_statistics)
 
-    def _get_covariance(self, sigma: torch.Tensor, total: torch.Tensor) -> torch.Tensor:
+    def _set_reference_statistics(self, mu: torch.Tensor, sigma: torch.Tensor) -> None:
+        if mu.shape != (self._num_features,) or sigma.shape != (self._num_features, self._num_features):
+            raise ValueError(
+                f"Reference statistics should have shapes ({self._num_features},) and "
+                f"({self._num_features}, {self._num_features}), got: {tuple(mu.shape)} and {tuple(sigma.shape)}"
+            )
+        self._reference_statistics = (
+            mu.to(self._device, dtype=torch.float64),
+            sigma.to(self._device, dtype=torch.float64),
+        )
+
+    @staticmethod
+    def _online_update(features: torch.Tensor, moments: torch.Tensor) -> None:
+        # features of shape (batch_size, num_features): the co-moments of the batch are computed with one matrix
+        # product and merged inplace as Chan et al., such that large means do not cancel the sums of products
+        batch_size, k = features.shape
+        if batch_size == 0:
+            return
+        count, mean, comoment = moments[:1], moments[1 : 1 + k], moments[1 + k :].view(k, k)
+        batch_mean = features.mean(dim=0)
+        deviations = features - batch_mean
+        delta = batch_mean - mean
+        comoment.addmm_(deviations.t(), deviations)
+        comoment.addr_(delta, delta * (count * batch_size / (count + batch_size)))
+        mean.add_(delta * (batch_size / (count + batch_size)))
+        count.add_(batch_size)
+
+    def _gather_moments(self, moments: torch.Tensor) -> torch.Tensor:
+        if idist.get_world_size() > 1:
+            moments = _merge_moments(cast(torch.Tensor, idist.all_gather(moments.unsqueeze(0))), self._num_features)
+        return moments
+
+    def _get_statistics(self, moments: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
         r"""
-        Calculates covariance from mean and sum of products of variables
+        Calculates mean and covariance from the count, the means and the co-moments of the features
         """
+        k = self._num_features
+        return moments[1 : 1 + k], moments[1 + k :].view(k, k) / (moments[0] - 1)
 
-        sub_matrix = torch_outer(total, total)
-        sub_matrix = sub_matrix / self._num_examples
+    def _reference_cache_filename(self, cache_key: str) -> str:
+        key = f"{cache_key} {self._num_features} {type(self._feature_extractor).__name__}"
+        return f"fid_reference_{hashlib.sha256(key.encode()).hexdigest()}.pt"
 
-        return (sigma - sub_matrix) / (self._num_examples - 1)
+    def compute_reference_statistics(
+        self,
+        data: Iterable,
+        cache_dir: Optional[str] = None,
+        transform: Callable = lambda x: x,
+        cache_key: Optional[str] = None,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Computes the mean and covariance of the features of the reference data, e.g. of the real images, and
+        uses them in place of the statistics of the test data. In a distributed configuration, each process gives
+        its shard of the reference data.
+
+        Args:
+            data: iterable of batches of inputs of the feature extractor, e.g. a data loader of the real images.
+            cache_dir: optional directory where the statistics are saved, keyed by ``cache_key``. If the statistics
+                of the same key were already saved, they are loaded instead of extracting the features again.
+            transform: a callable applied on each batch of ``data`` to get the inputs of the feature extractor,
+                e.g. ``lambda batch: batch[0]`` for batches of images and labels.
+            cache_key: identifier of the reference data and of the feature extractor's weights, e.g.
+                ``"cifar10-train-inception-v3"``, required with ``cache_dir``. It should be the same on all processes.
+
+        Returns:
+            the mean and the covariance of the features.
+        """
+        if (cache_dir is None) != (cache_key is None):
+            raise ValueError("Arguments cache_dir and cache_key should be given together")
+
+        filepath = None
+        if cache_dir is not None and cache_key is not None:
+            cache_dir = os.path.expanduser(cache_dir)
+            filepath = os.path.join(cache_dir, self._reference_cache_filename(cache_key))
+            if os.path.isfile(filepath):
+                statistics = torch.load(filepath, map_location=self._device)
+                self._set_reference_statistics(statistics["mu"], statistics["sigma"])
+                return cast(Tuple[torch.Tensor, torch.Tensor], self._reference_statistics)
+
+        moments = torch.zeros_like(self._train_moments)
+        for batch in data:
+            self._online_update(self._extract_features(transform(batch)), moments)
+
+        moments = self._gather_moments(moments)
+        num_examples = int(moments[0].item())
+        if num_examples < 2:
+            raise ValueError(f"Reference data should have at least two examples, got: {num_examples}")
+
+        self._set_reference_statistics(*self._get_statistics(moments))
+        mu, sigma = cast(Tuple[torch.Tensor, torch.Tensor], self._reference_statistics)
+        if filepath is not None and idist.get_rank() == 0:
+            os.makedirs(cast(str, cache_dir), exist_ok=True)
+            # write then rename, such that a concurrent evaluation never loads a partial file
+            fd, tmp_filepath = tempfile.mkstemp(suffix=".pt", dir=cache_dir)
+            os.close(fd)
+            torch.save({"mu": mu.cpu(), "sigma": sigma.cpu()}, tmp_filepath)
+            os.replace(tmp_filepath, filepath)
+        return mu, sigma
 
     @reinit__is_reduced
     def reset(self) -> None:
-        self._train_sigma = torch.zeros(
-            (self._num_features, self._num_features), dtype=torch.float64, device=self._device
-        )
-
-        self._train_total = torch.zeros(self._num_features, dtype=torch.float64, device=self._device)
-
-        self._test_sigma = torch.zeros(
-            (self._num_features, self._num_features), dtype=torch.float64, device=self._device
-        )
-
-        self._test_total = torch.zeros(self._num_features, dtype=torch.float64, device=self._device)
+        # count, means and co-moments of the features, packed in a single tensor
+        k = self._num_features
+        self._train_moments = torch.zeros(1 + k + k * k, dtype=torch.float64, device=self._device)
+        self._test_moments = torch.zeros(1 + k + k * k, dtype=torch.float64, device=self._device)
         self._num_examples: int = 0
 
         super(FID, self).reset()  # type: ignore
 
     @reinit__is_reduced
-    def update(self, output: Sequence[torch.Tensor]) -> None:
-        train, test = output
-        train_features = self._extract_features(train)
-        test_features = self._extract_features(test)
-
-        if train_features.shape[0] != test_features.shape[0] or train_features.shape[1] != test_features.shape[1]:
-            raise ValueError(
-                f"""
+    def update(self, output: Union[torch.Tensor, Sequence[Optional[torch.Tensor]]]) -> None:
+        if self._reference_statistics is not None:
+            train = output if isinstance(output, torch.Tensor) else output[0]
+            train_features = self._extract_features(cast(torch.Tensor, train))
+        else:
+            train, test = cast(Sequence[torch.Tensor], output)
+            train_features = self._extract_features(train)
+            test_features = self._extract_features(test)
+
+            if train_features.shape[0] != test_features.shape[0] or train_features.shape[1] != test_features.shape[1]:
+                raise ValueError(
+                    f"""
     Number of Training Features and Testing Features should be equal ({train_features.shape} != {test_features.shape})
                 """
-            )
+                )
 
-        # Updates the mean and covariance for the train features
-        for features in train_features:
-            self._online_update(features, self._train_total, self._train_sigma)
+            # Updates the mean and covariance for the test features
+            self._online_update(test_features, self._test_moments)
 
-        # Updates the mean and covariance for the test features
-        for features in test_features:
-            self._online_update(features, self._test_total, self._test_sigma)
+        # Updates the mean and covariance for the train features
+        self._online_update(train_features, self._train_moments)
 
         self._num_examples += train_features.shape[0]
 
-    @sync_all_reduce("_num_examples", "_train_total", "_test_total", "_train_sigma", "_test_sigma")
     def compute(self) -> float:
-        fid = fid_score(
-            mu1=self._train_total / self._num_examples,
-            mu2=self._test_total / self._num_examples,
-            sigma1=self._get_covariance(self._train_sigma, self._train_total),
-            sigma2=self._get_covariance(self._test_sigma, self._test_total),
-            eps=self._eps,
-        )
+        if self._reference_statistics is not None:
+            mu2, sigma2 = self._reference_statistics
+        else:
+            mu2, sigma2 = self._get_statistics(self._gather_moments(self._test_moments))
+        mu1, sigma1 = self._get_statistics(self._gather_moments(self._train_moments))
+
+        fid = fid_score(mu1=mu1, mu2=mu2, sigma1=sigma1, sigma2=sigma2, eps=self._eps)
 
         if torch.isnan(torch.tensor(fid)) or torch.isinf(torch.tensor(fid)):
             warnings.warn("The product of covariance of train and test features is out of bounds.")
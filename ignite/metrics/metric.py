@@ -1,9 +1,11 @@
+import itertools
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from collections.abc import Mapping
 from functools import wraps
 from numbers import Number
-from typing import Any, Callable, cast, Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+from typing import Any, Callable, cast, Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING, Union
+from weakref import ref, WeakKeyDictionary
 
 import torch
 
@@ -25,6 +27,7 @@ __all__ = [
     "RunningEpochWise",
     "RunningBatchWise",
     "SingleEpochRunningBatchWise",
+    "coalesce_sync_all_reduce",
 ]
 
 
@@ -416,6 +419,7 @@ class Metric(Serializable, metaclass=ABCMeta):
         Args:
             engine: the engine to which the metric must be attached
         """
+        _invalidate_memoized_result(self)
         self.reset()
 
     @torch.no_grad()
@@ -436,6 +440,7 @@ class Metric(Serializable, metaclass=ABCMeta):
             ``y_pred`` and ``y`` can be torch tensors or list of tensors/numbers
         """
 
+        _invalidate_memoized_result(self)
         output = self._output_transform(engine.state.output)
         if isinstance(output, Mapping):
             if self.required_output_keys is None:
@@ -485,6 +490,8 @@ class Metric(Serializable, metaclass=ABCMeta):
 
         """
         result = self.compute()
+        # metrics depending on this one reuse the result until the next reset or update
+        self._memoized_result = (result,)
         if isinstance(result, Mapping):
             if name in result.keys():
                 raise ValueError(f"Argument name '{name}' is conflicting with mapping keys: {list(result.keys())}")
@@ -501,6 +508,16 @@ class Metric(Serializable, metaclass=ABCMeta):
 
             engine.state.metrics[name] = result
 
+    def _compute_memoized(self) -> Tuple[Any]:
+        """Returns the result of :meth:`compute` wrapped in a tuple. The result is cached until the metric is
+        reset or updated, such that metrics shared by several :class:`~ignite.metrics.metrics_lambda.MetricsLambda`
+        are computed, and reduced across processes, once.
+        """
+        memoized = self.__dict__.get("_memoized_result")
+        if memoized is None:
+            memoized = self._memoized_result = (self.compute(),)
+        return memoized
+
     def _check_usage(self, usage: Union[str, MetricUsage]) -> MetricUsage:
         if isinstance(usage, str):
             usages = [EpochWise, RunningEpochWise, BatchWise, RunningBatchWise, SingleEpochRunningBatchWise]
@@ -703,6 +720,7 @@ class Metric(Serializable, metaclass=ABCMeta):
             )
 
         state_dict = list_state_dicts_per_rank[rank]
+        _invalidate_memoized_result(self)
         self._load_state_dict_per_rank(state_dict)
 
     def __add__(self, other: Any) -> "MetricsLambda":
@@ -788,6 +806,59 @@ class Metric(Serializable, metaclass=ABCMeta):
         self.__dict__.update(d)
 
 
+def _get_sync_all_reduce_attrs(metric: Metric, attrs: Sequence[str]) -> Dict[str, Tuple[Any, str]]:
+    attrs_ops = {}
+    for attr in attrs:
+        op = "SUM"
+        if ":" in attr:
+            attr, op = attr.split(":")
+            valid_ops = ["MIN", "MAX", "SUM", "PRODUCT"]
+            if op not in valid_ops:
+                raise ValueError(f"Reduction operation is not valid (expected : {valid_ops}, got: {op}")
+        if attr not in metric.__dict__:
+            raise ValueError(f"Metric {type(metric)} has no attribute named `{attr}`.")
+        t = getattr(metric, attr)
+        if not isinstance(t, (Number, torch.Tensor)):
+            raise TypeError(
+                f"Attribute provided to sync_all_reduce should be a number or tensor but `{attr}` has type {type(t)}"
+            )
+        attrs_ops[attr] = (t, op)
+    return attrs_ops
+
+
+def _all_reduce_coalesced(values_ops: Sequence[Tuple[Any, str]]) -> List[Any]:
+    """Reduces the given numbers and tensors across all participating processes with a single collective per
+    reduction operation, dtype and device: values of the same kind are flattened into a buffer, reduced and split
+    back. Returned tensors never share memory with the given ones.
+    """
+    buckets: Dict[Tuple[str, Any, Any], List[int]] = OrderedDict()
+    for i, (value, op) in enumerate(values_ops):
+        if isinstance(value, torch.Tensor):
+            key: Tuple[str, Any, Any] = (op, value.dtype, value.device)
+        else:
+            key = (op, float if isinstance(value, float) else int, None)
+        buckets.setdefault(key, []).append(i)
+
+    results: List[Any] = [None] * len(values_ops)
+    for (op, dtype, device), indices in buckets.items():
+        values = [values_ops[i][0] for i in indices]
+        if device is None:
+            if len(values) == 1:
+                results[indices[0]] = idist.all_reduce(cast(float, values[0]), op=op)
+                continue
+            flat = torch.tensor(values, dtype=torch.float64 if dtype is float else torch.int64)
+            results_list = cast(torch.Tensor, idist.all_reduce(flat, op=op)).tolist()
+            for i, r in zip(indices, results_list):
+                results[i] = dtype(r)
+        else:
+            # `torch.cat` allocates a new buffer, so the reduction can't modify the metric's attributes inplace
+            flat = torch.cat([v.reshape(-1) for v in values])
+            flat = cast(torch.Tensor, idist.all_reduce(flat, op=op))
+            for i, v, r in zip(indices, values, flat.split([v.numel() for v in values])):
+                results[i] = r.view(v.shape)
+    return results
+
+
 def sync_all_reduce(*attrs: Any) -> Callable:
     """Helper decorator for distributed configuration to collect instance attribute value
     across all participating processes and apply the specified reduction operation.
@@ -799,6 +870,10 @@ def sync_all_reduce(*attrs: Any) -> Callable:
 
     .. versionchanged:: 0.4.5
         - Ability to handle different reduction operations (SUM, MAX, MIN, PRODUCT).
+
+    .. versionchanged:: 0.6.0
+        Attributes sharing the same reduction operation and dtype are reduced with a single collective. The
+        reductions of several metrics can be coalesced with :func:`~ignite.metrics.metric.coalesce_sync_all_reduce`.
     """
 
     def wrapper(func: Callable) -> Callable:
@@ -811,28 +886,14 @@ def sync_all_reduce(*attrs: Any) -> Callable:
             ws = idist.get_world_size()
             unreduced_attrs = {}
             if len(attrs) > 0 and ws > 1:
-                for attr in attrs:
-                    op_kwargs = {}
-                    if ":" in attr:
-                        attr, op = attr.split(":")
-                        valid_ops = ["MIN", "MAX", "SUM", "PRODUCT"]
-                        if op not in valid_ops:
-                            raise ValueError(f"Reduction operation is not valid (expected : {valid_ops}, got: {op}")
-                        op_kwargs["op"] = op
-                    if attr not in self.__dict__:
-                        raise ValueError(f"Metric {type(self)} has no attribute named `{attr}`.")
-                    t = getattr(self, attr)
-                    if not isinstance(t, (Number, torch.Tensor)):
-                        raise TypeError(
-                            "Attribute provided to sync_all_reduce should be a "
-                            f"number or tensor but `{attr}` has type {type(t)}"
-                        )
-                    unreduced_attrs[attr] = t
-                    # Here `clone` is necessary since `idist.all_reduce` modifies `t` inplace in the case
-                    # `t` is a tensor and its `device` is same as that of the process.
-                    # TODO: Remove this dual behavior of `all_reduce` to always either return a new tensor or
-                    #       modify it in-place.
-                    t_reduced = idist.all_reduce(cast(float, t) if isinstance(t, Number) else t.clone(), **op_kwargs)
+                group_ref = _sync_all_reduce_groups.get(self)
+                group = group_ref() if group_ref is not None else None
+                reduced_attrs = group.pop_reduced_attrs(self, attrs) if group is not None else None
+                if reduced_attrs is None:
+                    attrs_ops = _get_sync_all_reduce_attrs(self, attrs)
+                    reduced_attrs = dict(zip(attrs_ops.keys(), _all_reduce_coalesced(list(attrs_ops.values()))))
+                for attr, t_reduced in reduced_attrs.items():
+                    unreduced_attrs[attr] = getattr(self, attr)
                     setattr(self, attr, t_reduced)
 
             result = func(self, *args, **kwargs)
@@ -841,12 +902,110 @@ def sync_all_reduce(*attrs: Any) -> Callable:
                 setattr(self, attr, value)
             return result
 
+        setattr(another_wrapper, "_sync_all_reduce_attrs", attrs)
         return another_wrapper
 
     setattr(wrapper, "_decorated", True)
     return wrapper
 
 
+class _SyncAllReduceGroup:
+    """Reduces the attributes of the given metrics in one round, on the first
+    :func:`~ignite.metrics.metric.sync_all_reduce` call of the metrics at ``EPOCH_COMPLETED`` of the engine.
+    """
+
+    def __init__(self, engine: Engine, metrics: Iterable[Metric]):
+        self.engine = engine
+        self._metrics: List[Metric] = []
+        self._reduced: Optional[Dict[int, Tuple[Sequence[str], Dict[str, Any]]]] = None
+        for metric in metrics:
+            if not isinstance(metric, Metric):
+                raise TypeError(f"Argument metrics should be an iterable of Metric, but given {type(metric)}")
+            self._add_metric(metric)
+
+    def reset(self) -> None:
+        self._reduced = None
+
+    def _add_metric(self, metric: Metric) -> None:
+        if any(m is metric for m in self._metrics):
+            return
+        self._metrics.append(metric)
+        _sync_all_reduce_groups[metric] = ref(self)
+
+        from ignite.metrics.metrics_lambda import MetricsLambda
+
+        if isinstance(metric, MetricsLambda):
+            for dependency in itertools.chain(metric.args, metric.kwargs.values()):
+                if isinstance(dependency, Metric):
+                    self._add_metric(dependency)
+
+    def _reduce_all(self) -> Dict[int, Tuple[Sequence[str], Dict[str, Any]]]:
+        metrics_attrs_ops = []
+        for metric in self._metrics:
+            attrs = getattr(type(metric).compute, "_sync_all_reduce_attrs", None)
+            if not attrs:
+                continue
+            try:
+                metrics_attrs_ops.append((metric, attrs, _get_sync_all_reduce_attrs(metric, attrs)))
+            except (ValueError, TypeError):
+                # the error is raised by the metric's own sync_all_reduce call
+                continue
+
+        reduced_values = iter(
+            _all_reduce_coalesced([v for _, _, attrs_ops in metrics_attrs_ops for v in attrs_ops.values()])
+        )
+        return {
+            id(metric): (attrs, {attr: next(reduced_values) for attr in attrs_ops})
+            for metric, attrs, attrs_ops in metrics_attrs_ops
+        }
+
+    def pop_reduced_attrs(self, metric: Metric, attrs: Sequence[str]) -> Optional[Dict[str, Any]]:
+        if self.engine.last_event_name != Events.EPOCH_COMPLETED:
+            return None
+        if self._reduced is None:
+            self._reduced = self._reduce_all()
+        reduced = self._reduced.get(id(metric))
+        if reduced is None or reduced[0] != attrs:
+            return None
+        del self._reduced[id(metric)]
+        return reduced[1]
+
+
+# Groups are kept out of the metrics' state such that metrics can still be pickled. Groups are alive as long as
+# their engine keeps its handlers.
+_sync_all_reduce_groups: "WeakKeyDictionary[Metric, ref[_SyncAllReduceGroup]]" = WeakKeyDictionary()
+
+
+def coalesce_sync_all_reduce(engine: Engine, metrics: Iterable[Metric]) -> None:
+    """Reduces the attributes of the given metrics with :func:`~ignite.metrics.metric.sync_all_reduce` in a single
+    round at the end of each epoch of the engine, instead of doing the collectives metric by metric. Reduced
+    attributes sharing the same reduction operation and dtype are packed into one buffer, so an evaluator computing
+    many metrics issues a few collectives per epoch in total.
+
+    The metrics should be computed on :attr:`~ignite.engine.events.Events.EPOCH_COMPLETED` of the engine, metrics
+    computed on other events and metrics gathering their data with another collective are computed as usual. The
+    dependencies of :class:`~ignite.metrics.metrics_lambda.MetricsLambda` metrics are registered with them.
+
+    Args:
+        engine: the engine (e.g. an evaluator) the metrics are attached to.
+        metrics: the metrics whose attributes are reduced together.
+
+    Examples:
+        .. code-block:: python
+
+            from ignite.metrics import Accuracy, Precision, Recall
+            from ignite.metrics.metric import coalesce_sync_all_reduce
+
+            metrics = {"acc": Accuracy(), "prec": Precision(), "rec": Recall()}
+            evaluator = create_supervised_evaluator(model, metrics=metrics)
+            coalesce_sync_all_reduce(evaluator, metrics.values())
+
+    .. versionadded:: 0.6.0
+    """
+    group = _SyncAllReduceGroup(engine, metrics)
+    engine.add_event_handler(Events.EPOCH_STARTED, group.reset)
+
+
 def reinit__is_reduced(func: Callable) -> Callable:
     """Helper decorator for distributed configuration.
 
@@ -861,11 +1020,16 @@ def reinit__is_reduced(func: Callable) -> Callable:
         func(self, *args, **kwargs)
         if "_result" in self.__dict__:
             self._result = None  # type: ignore[attr-defined]
+        _invalidate_memoized_result(self)
 
     setattr(wrapper, "_decorated", True)
     return wrapper
 
 
+def _invalidate_memoized_result(metric: Metric) -> None:
+    metric.__dict__.pop("_memoized_result", None)
+
+
 def _is_list_of_tensors_or_numbers(x: Sequence[Union[torch.Tensor, float]]) -> bool:
     return isinstance(x, Sequence) and all([isinstance(t, (torch.Tensor, Number)) for t in x])
 
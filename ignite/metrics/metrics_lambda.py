@@ -1,10 +1,10 @@
 import itertools
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import torch
 
 from ignite.engine import Engine
-from ignite.metrics.metric import EpochWise, Metric, MetricUsage, reinit__is_reduced
+from ignite.metrics.metric import _invalidate_memoized_result, EpochWise, Metric, MetricUsage, reinit__is_reduced
 
 __all__ = ["MetricsLambda"]
 
@@ -20,6 +20,10 @@ class MetricsLambda(Metric):
     resetted as well. When attach, all its dependency metrics would be attached
     automatically (but partially, e.g :meth:`~ignite.metrics.metric.Metric.is_attached()` will return False).
 
+    Metrics and their ``MetricsLambda`` attached to an engine form a graph: each metric of the graph is computed
+    once until it is reset or updated by the engine, even if several ``MetricsLambda`` depend on it. For example,
+    in the snippet below precision and recall are computed, and reduced across processes, once per epoch.
+
     Args:
         f: the function that defines the computation
         args: Sequence of other metrics or something
@@ -102,9 +106,9 @@ class MetricsLambda(Metric):
 
     @reinit__is_reduced
     def reset(self) -> None:
-        for i in itertools.chain(self.args, self.kwargs.values()):
-            if isinstance(i, Metric):
-                i.reset()
+        for i in self._dependencies():
+            _invalidate_memoized_result(i)
+            i.reset()
         self._updated = False
 
     @reinit__is_reduced
@@ -115,17 +119,40 @@ class MetricsLambda(Metric):
                 "and MetricsLambda can't use update API while it's attached."
             )
 
-        for i in itertools.chain(self.args, self.kwargs.values()):
-            if isinstance(i, Metric):
-                i.update(output)
+        for i in self._dependencies():
+            _invalidate_memoized_result(i)
+            i.update(output)
 
         self._updated = True
 
     def compute(self) -> Any:
-        materialized = [_get_value_on_cpu(i) for i in self.args]
-        materialized_kwargs = {k: _get_value_on_cpu(v) for k, v in self.kwargs.items()}
+        # dependencies are memoized only when updated by the engine, which invalidates their cached results
+        memoized = self.engine is not None
+        materialized = [_get_value_on_cpu(i, memoized) for i in self.args]
+        materialized_kwargs = {k: _get_value_on_cpu(v, memoized) for k, v in self.kwargs.items()}
         return self.function(*materialized, **materialized_kwargs)
 
+    def _dependencies(self) -> List[Metric]:
+        return [i for i in itertools.chain(self.args, self.kwargs.values()) if isinstance(i, Metric)]
+
+    def _compute_memoized(self) -> Tuple[Any]:
+        if self.engine is None:
+            return (self.compute(),)
+        # as dependencies are updated by the engine and not through this metric, the cached result is valid as long
+        # as the cached results of the dependencies are the same
+        dependencies_results = [i._compute_memoized() for i in self._dependencies()]
+        memoized = self.__dict__.get("_memoized_result")
+        memoized_dependencies_results = self.__dict__.get("_memoized_dependencies_results")
+        if (
+            memoized is None
+            or memoized_dependencies_results is None
+            or len(memoized_dependencies_results) != len(dependencies_results)
+            or any(r1 is not r2 for r1, r2 in zip(memoized_dependencies_results, dependencies_results))
+        ):
+            memoized = self._memoized_result = (self.compute(),)
+            self._memoized_dependencies_results = dependencies_results
+        return memoized
+
     def _internal_attach(self, engine: Engine, usage: MetricUsage) -> None:
         self.engine = engine
         for index, metric in enumerate(itertools.chain(self.args, self.kwargs.values())):
@@ -179,9 +206,9 @@ class MetricsLambda(Metric):
         return not is_detached
 
 
-def _get_value_on_cpu(v: Any) -> Any:
+def _get_value_on_cpu(v: Any, memoized: bool = False) -> Any:
     if isinstance(v, Metric):
-        v = v.compute()
+        v = v._compute_memoized()[0] if memoized else v.compute()
     if isinstance(v, torch.Tensor):
         v = v.cpu()
     return v
@@ -1,19 +1,25 @@
 import math
-from typing import Any, Callable, Sequence, Tuple, Union
+from typing import Any, Callable, List, Sequence, Tuple, Union
 
 import torch
 
 from ignite.exceptions import NotComputableError
 from ignite.metrics.metric import Metric, reinit__is_reduced, sync_all_reduce
-from ignite.metrics.nlp.utils import modified_precision
+from ignite.metrics.nlp.utils import _batched_modified_precision, _map_in_processes
 
 __all__ = ["Bleu"]
 
 
-def _closest_ref_length(references: Sequence[Sequence[Any]], hyp_len: int) -> int:
-    ref_lens = (len(reference) for reference in references)
-    closest_ref_len = min(ref_lens, key=lambda ref_len: (abs(ref_len - hyp_len), ref_len))
-    return closest_ref_len
+def _closest_ref_lengths(references: Sequence[Sequence[Sequence[Any]]], hyp_lens: torch.Tensor) -> torch.Tensor:
+    ref_lens = torch.tensor([len(reference) for refs in references for reference in refs], dtype=torch.long)
+    if len(ref_lens) == 0:
+        return torch.zeros_like(hyp_lens)
+    sentences = torch.repeat_interleave(torch.tensor([len(refs) for refs in references], dtype=torch.long))
+    # the closest reference length is the shortest one in case of ties
+    max_len = int(ref_lens.max()) + 1
+    scores = (ref_lens - hyp_lens[sentences]).abs() * max_len + ref_lens
+    closest = torch.zeros_like(hyp_lens).scatter_reduce_(0, sentences, scores, "amin", include_self=False)
+    return closest % max_len
 
 
 class _Smoother:
@@ -28,36 +34,40 @@ class _Smoother:
             raise ValueError(f"Smooth is not valid (expected: {valid}, got: {method})")
         self.smooth = method
 
-    def __call__(self, numerators: torch.Tensor, denominators: torch.Tensor) -> Sequence[float]:
+    def __call__(self, numerators: torch.Tensor, denominators: torch.Tensor) -> torch.Tensor:
         method = getattr(self, self.smooth)
         return method(numerators, denominators)
 
+    # The methods work on the n-gram orders of the last dimension and compute in float64, as python floats, except
+    # no_smooth which multiplies the float32 counts by the reciprocal of the denominators, as a python float divided
+    # by a float32 tensor.
+
     @staticmethod
-    def smooth1(numerators: torch.Tensor, denominators: torch.Tensor) -> Sequence[float]:
+    def smooth1(numerators: torch.Tensor, denominators: torch.Tensor) -> torch.Tensor:
         epsilon = 0.1
-        denominators_ = [max(1, d.item()) for d in denominators]
-        return [n.item() / d if n != 0 else epsilon / d for n, d in zip(numerators, denominators_)]
+        numerators_ = numerators.double()
+        denominators_ = denominators.double().clamp(min=1)
+        return torch.where(numerators_ != 0, numerators_, epsilon) / denominators_
 
     @staticmethod
-    def nltk_smooth2(numerators: torch.Tensor, denominators: torch.Tensor) -> Sequence[float]:
-        denominators_ = torch.tensor([max(1, d.item()) for d in denominators])
-        return _Smoother._smooth2(numerators, denominators_)
+    def nltk_smooth2(numerators: torch.Tensor, denominators: torch.Tensor) -> torch.Tensor:
+        return _Smoother._smooth2(numerators, denominators.clamp(min=1))
 
     @staticmethod
-    def smooth2(numerators: torch.Tensor, denominators: torch.Tensor) -> Sequence[float]:
+    def smooth2(numerators: torch.Tensor, denominators: torch.Tensor) -> torch.Tensor:
         return _Smoother._smooth2(numerators, denominators)
 
     @staticmethod
-    def _smooth2(numerators: torch.Tensor, denominators: torch.Tensor) -> Sequence[float]:
-        return [
-            (n.item() + 1) / (d.item() + 1) if i != 0 else n.item() / d.item()
-            for i, (n, d) in enumerate(zip(numerators, denominators))
-        ]
+    def _smooth2(numerators: torch.Tensor, denominators: torch.Tensor) -> torch.Tensor:
+        numerators_ = numerators.double() + 1
+        denominators_ = denominators.double() + 1
+        numerators_[..., 0] -= 1
+        denominators_[..., 0] -= 1
+        return numerators_ / denominators_
 
     @staticmethod
-    def no_smooth(numerators: torch.Tensor, denominators: torch.Tensor) -> Sequence[float]:
-        denominators_ = [max(1, d) for d in denominators]
-        return [n.item() / d for n, d in zip(numerators, denominators_)]
+    def no_smooth(numerators: torch.Tensor, denominators: torch.Tensor) -> torch.Tensor:
+        return denominators.float().clamp(min=1).reciprocal() * numerators.float()
 
 
 class Bleu(Metric):
@@ -100,6 +110,12 @@ class Bleu(Metric):
         average: specifies which type of averaging to use (macro or micro)
             for more details refer https://www.nltk.org/_modules/nltk/translate/bleu_score.html
             Default: "macro"
+        num_workers: number of processes counting the n-grams of the sentences of a batch. A pool of processes
+            is created on each ``update``, such that it is only worth it for large batches, e.g. a whole corpus.
+            Default: 0, the n-grams are counted in the main process.
+
+    The n-grams of all the sentences of a batch are counted at once with tensor operations: tokens are mapped to
+    integer ids and the clipped counts are computed with ``torch.unique``.
 
     Examples:
 
@@ -127,6 +143,9 @@ class Bleu(Metric):
 
         - ``update`` method has changed and now works on batch of inputs.
         - added ``average`` option to handle micro and macro averaging modes.
+
+    .. versionchanged:: 0.6.0
+        the n-grams of a batch are counted with tensor operations, ``num_workers`` argument is added.
     """
 
     def __init__(
@@ -136,6 +155,7 @@ class Bleu(Metric):
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = torch.device("cpu"),
         average: str = "macro",
+        num_workers: int = 0,
     ):
         if ngram <= 0:
             raise ValueError(f"ngram order must be greater than zero (got: {ngram})")
@@ -146,6 +166,7 @@ class Bleu(Metric):
         if average not in ["macro", "micro"]:
             raise ValueError(f'Average must be either "macro" or "micro" (got: {average})')
         self.average = average
+        self.num_workers = num_workers
 
         if average == "micro":
             self._state_dict_all_req_keys = ("p_numerators", "p_denominators", "hyp_length_sum", "ref_length_sum")
@@ -154,65 +175,90 @@ class Bleu(Metric):
 
         super(Bleu, self).__init__(output_transform=output_transform, device=device)
 
-    def _n_gram_counter(
-        self,
-        references: Sequence[Sequence[Sequence[Any]]],
-        candidates: Sequence[Sequence[Any]],
-        p_numerators: torch.Tensor,
-        p_denominators: torch.Tensor,
-    ) -> Tuple[int, int]:
+    def _count(
+        self, references: Sequence[Sequence[Sequence[Any]]], candidates: Sequence[Sequence[Any]]
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Returns the numerators and denominators of the modified precisions of each order, indexed from 1, and
+        the hypothesis and closest reference lengths of each sentence."""
         if len(references) != len(candidates):
             raise ValueError(
                 f"nb of candidates should be equal to nb of reference lists ({len(candidates)} != "
                 f"{len(references)})"
             )
 
-        hyp_lengths = 0
-        ref_lengths = 0
+        chunk_size = max(1, math.ceil(len(candidates) / max(1, self.num_workers)))
+        chunks = [
+            (references[i : i + chunk_size], candidates[i : i + chunk_size], self.ngrams_order)
+            for i in range(0, len(candidates), chunk_size)
+        ]
+        numerators = torch.zeros(len(candidates), self.ngrams_order + 1, dtype=torch.long)
+        denominators = torch.zeros(len(candidates), self.ngrams_order + 1, dtype=torch.long)
+        if chunks:
+            results = _map_in_processes(_batched_modified_precision, chunks, self.num_workers)
+            numerators[:, 1:] = torch.cat([numerator for numerator, _ in results])
+            denominators[:, 1:] = torch.cat([denominator for _, denominator in results])
 
-        # Iterate through each hypothesis and their corresponding references.
-        for refs, hyp in zip(references, candidates):
-            # For each order of ngram, calculate the numerator and
-            # denominator for the corpus-level modified precision.
-            for i in range(1, self.ngrams_order + 1):
-                numerator, denominator = modified_precision(refs, hyp, i)
-                p_numerators[i] += numerator
-                p_denominators[i] += denominator
+        hyp_lengths = torch.tensor([len(hyp) for hyp in candidates], dtype=torch.long)
+        ref_lengths = _closest_ref_lengths(references, hyp_lengths)
+        return numerators, denominators, hyp_lengths, ref_lengths
 
-            # Calculate the hypothesis lengths
-            hyp_lengths += len(hyp)
+    def _n_gram_counter(
+        self,
+        references: Sequence[Sequence[Sequence[Any]]],
+        candidates: Sequence[Sequence[Any]],
+        p_numerators: torch.Tensor,
+        p_denominators: torch.Tensor,
+    ) -> Tuple[int, int]:
+        numerators, denominators, hyp_lengths, ref_lengths = self._count(references, candidates)
 
-            # Calculate the closest reference lengths.
-            ref_lengths += _closest_ref_length(refs, len(hyp))
+        # For each order of ngram, add the numerator and denominator
+        # for the corpus-level modified precision.
+        for i in range(1, self.ngrams_order + 1):
+            p_numerators[i] += numerators[:, i].sum().item()
+            p_denominators[i] += denominators[:, i].sum().item()
 
-        return hyp_lengths, ref_lengths
+        return int(hyp_lengths.sum().item()), int(ref_lengths.sum().item())
 
     def _brevity_penalty_smoothing(
         self, p_numerators: torch.Tensor, p_denominators: torch.Tensor, hyp_length_sum: int, ref_length_sum: int
     ) -> float:
+        return self._bleu_scores(p_numerators[None], p_denominators[None], [hyp_length_sum], [ref_length_sum])[0]
+
+    def _bleu_scores(
+        self,
+        p_numerators: torch.Tensor,
+        p_denominators: torch.Tensor,
+        hyp_lengths: Sequence[int],
+        ref_lengths: Sequence[int],
+    ) -> List[float]:
         # Returns 0 if there's no matching n-grams
-        # We only need to check for p_numerators[1] == 0, since if there's
+        # We only need to check for p_numerators[:, 1] == 0, since if there's
         # no unigrams, there won't be any higher order ngrams.
-        if p_numerators[1] == 0:
-            return 0
+        matched = p_numerators[:, 1] != 0
 
         # If no smoother, returns 0 if there's at least one a not matching n-grams]
-        if self.smoother.smooth == "no_smooth" and min(p_numerators[1:]).item() == 0:
-            return 0
-
-        # Calculate corpus-level brevity penalty.
-        if hyp_length_sum < ref_length_sum:
-            bp = math.exp(1 - ref_length_sum / hyp_length_sum) if hyp_length_sum > 0 else 0.0
-        else:
-            bp = 1.0
+        if self.smoother.smooth == "no_smooth":
+            matched &= p_numerators[:, 1:].min(dim=1).values != 0
 
         # Smoothing
-        p_n = self.smoother(p_numerators[1:], p_denominators[1:])
+        p_n = self.smoother(p_numerators[:, 1:], p_denominators[:, 1:]).tolist()
 
-        # Compute the geometric mean
-        s = [w_i * math.log(p_i) for w_i, p_i in zip(self.weights, p_n)]
-        gm = bp * math.exp(math.fsum(s))
-        return gm
+        scores: List[float] = []
+        for is_matched, p, hyp_length, ref_length in zip(matched.tolist(), p_n, hyp_lengths, ref_lengths):
+            if not is_matched:
+                scores.append(0)
+                continue
+
+            # Calculate corpus-level brevity penalty.
+            if hyp_length < ref_length:
+                bp = math.exp(1 - ref_length / hyp_length) if hyp_length > 0 else 0.0
+            else:
+                bp = 1.0
+
+            # Compute the geometric mean
+            s = [w_i * math.log(p_i) for w_i, p_i in zip(self.weights, p)]
+            scores.append(bp * math.exp(math.fsum(s)))
+        return scores
 
     def _sentence_bleu(self, references: Sequence[Sequence[Any]], candidates: Sequence[Any]) -> float:
         return self._corpus_bleu([references], [candidates])
@@ -250,16 +296,26 @@ class Bleu(Metric):
         y_pred, y = output
 
         if self.average == "macro":
-            for refs, hyp in zip(y, y_pred):
-                self._sum_of_bleu += self._sentence_bleu(references=refs, candidates=hyp)
-                self._num_sentences += 1
+            numerators, denominators, hyp_lengths, ref_lengths = self._count(references=y, candidates=y_pred)
+            scores = self._bleu_scores(
+                p_numerators=numerators.float(),
+                p_denominators=denominators.float(),
+                hyp_lengths=hyp_lengths.tolist(),
+                ref_lengths=ref_lengths.tolist(),
+            )
+            # add the scores one by one, as python floats
+            sum_of_bleu = self._sum_of_bleu.item()
+            for score in scores:
+                sum_of_bleu += score
+            self._sum_of_bleu.fill_(sum_of_bleu)
+            self._num_sentences += len(scores)
 
         elif self.average == "micro":
-            hyp_lengths, ref_lengths = self._n_gram_counter(
+            hyp_length_sum, ref_length_sum = self._n_gram_counter(
                 references=y, candidates=y_pred, p_numerators=self.p_numerators, p_denominators=self.p_denominators
             )
-            self.hyp_length_sum += hyp_lengths
-            self.ref_length_sum += ref_lengths
+            self.hyp_length_sum += hyp_length_sum
+            self.ref_length_sum += ref_length_sum
 
     @sync_all_reduce("_sum_of_bleu", "_num_sentences")
     def _compute_macro(self) -> torch.Tensor:
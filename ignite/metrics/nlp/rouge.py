@@ -1,6 +1,8 @@
+import math
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
-from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, Union
+from functools import partial
+from typing import Any, Callable, cast, List, Mapping, Optional, Sequence, Tuple, Union
 
 import torch
 
@@ -8,7 +10,7 @@ from ignite.exceptions import NotComputableError
 
 # These decorators helps with distributed settings
 from ignite.metrics.metric import Metric, reinit__is_reduced, sync_all_reduce
-from ignite.metrics.nlp.utils import lcs, ngrams
+from ignite.metrics.nlp.utils import _batched_lcs, _batched_modified_precision, _map_in_processes, lcs, ngrams
 
 __all__ = ["Rouge", "RougeN", "RougeL"]
 
@@ -82,6 +84,75 @@ def compute_lcs_scores(candidate: Sequence[Any], reference: Sequence[Any]) -> Sc
     return Score(match=match, candidate=len(candidate), reference=len(reference))
 
 
+def _compute_multiref_scores(
+    score_functions: Sequence[Callable[..., Score]],
+    candidates: Sequence[Sequence[Any]],
+    references: Sequence[Sequence[Sequence[Any]]],
+) -> List[List[List[Score]]]:
+    # for each score function, the scores of each candidate with each of its references
+    return [
+        [[fn(candidate=candidate, reference=ref) for ref in refs] for candidate, refs in zip(candidates, references)]
+        for fn in score_functions
+    ]
+
+
+def _compute_variants_multiref_scores(
+    ngram_orders: Sequence[Optional[int]],
+    candidates: Sequence[Sequence[Any]],
+    references: Sequence[Sequence[Sequence[Any]]],
+) -> List[List[List[Score]]]:
+    # for each variant, given by its n-gram order or None for Rouge-L, the scores of each candidate with each of its
+    # references. The n-grams of all orders of each pair of candidate and reference are counted at once, and the
+    # length of their longest common subsequence is computed once.
+    pairs = [(candidate, ref) for candidate, refs in zip(candidates, references) for ref in refs]
+    max_n = max([n for n in ngram_orders if n is not None], default=0)
+    if max_n > 0:
+        # the clipped counts of a candidate with a single reference are the n-gram co-occurences
+        matches, candidate_counts = _batched_modified_precision(
+            [[ref] for _, ref in pairs], [candidate for candidate, _ in pairs], max_n
+        )
+        ngram_matches, ngram_candidate_counts = matches.tolist(), candidate_counts.tolist()
+    lcs_matches = [lcs(candidate, ref) for candidate, ref in pairs] if None in ngram_orders else []
+
+    all_scores = []
+    for n in ngram_orders:
+        if n is None:
+            pair_scores = [
+                Score(match=match, candidate=len(candidate), reference=len(ref))
+                for match, (candidate, ref) in zip(lcs_matches, pairs)
+            ]
+        else:
+            pair_scores = [
+                Score(match=match[n - 1], candidate=count[n - 1], reference=max(len(ref) - n + 1, 0))
+                for match, count, (_, ref) in zip(ngram_matches, ngram_candidate_counts, pairs)
+            ]
+        scores = []
+        start = 0
+        for _, refs in zip(candidates, references):
+            scores.append(pair_scores[start : start + len(refs)])
+            start += len(refs)
+        all_scores.append(scores)
+    return all_scores
+
+
+def _map_multiref_scores(
+    compute_fn: Callable[..., List[List[List[Score]]]],
+    variants: Sequence[Any],
+    candidates: Sequence[Sequence[Any]],
+    references: Sequence[Sequence[Sequence[Any]]],
+    num_workers: int,
+) -> List[List[List[Score]]]:
+    # candidates are split in chunks computed by a pool of processes if num_workers is positive
+    num_candidates = min(len(candidates), len(references))
+    chunk_size = max(1, math.ceil(num_candidates / max(1, num_workers)))
+    chunks = [
+        (variants, candidates[i : i + chunk_size], references[i : i + chunk_size])
+        for i in range(0, num_candidates, chunk_size)
+    ]
+    results = _map_in_processes(compute_fn, chunks, num_workers)
+    return [[scores for result in results for scores in result[k]] for k in range(len(variants))]
+
+
 class MultiRefReducer(metaclass=ABCMeta):
     r"""
     Reducer interface for multi-reference
@@ -126,8 +197,10 @@ class _BaseRouge(Metric):
         alpha: float = 0,
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = torch.device("cpu"),
+        num_workers: int = 0,
     ) -> None:
         super(_BaseRouge, self).__init__(output_transform=output_transform, device=device)
+        self._num_workers = num_workers
         self._alpha = alpha
         if not 0 <= self._alpha <= 1:
             raise ValueError(f"alpha must be in interval [0, 1] (got : {self._alpha})")
@@ -152,8 +225,20 @@ class _BaseRouge(Metric):
     @reinit__is_reduced
     def update(self, output: Tuple[Sequence[Sequence[Any]], Sequence[Sequence[Sequence[Any]]]]) -> None:
         candidates, references = output
-        for _candidate, _reference in zip(candidates, references):
-            multiref_scores = [self._compute_score(candidate=_candidate, reference=_ref) for _ref in _reference]
+        self._update_scores(self._compute_multiref_scores(candidates, references))
+
+    def _compute_multiref_scores(
+        self, candidates: Sequence[Sequence[Any]], references: Sequence[Sequence[Sequence[Any]]]
+    ) -> List[List[Score]]:
+        if self._num_workers > 0:
+            return _map_multiref_scores(
+                _compute_multiref_scores, [self._score_function()], candidates, references, self._num_workers
+            )[0]
+        return _compute_multiref_scores([self._compute_score], candidates, references)[0]
+
+    @reinit__is_reduced
+    def _update_scores(self, scores: Sequence[Sequence[Score]]) -> None:
+        for multiref_scores in scores:
             score = self._mutliref_reducer(multiref_scores)
             precision = score.precision()
             recall = score.recall()
@@ -179,6 +264,10 @@ class _BaseRouge(Metric):
     def _compute_score(self, candidate: Sequence[Any], reference: Sequence[Any]) -> Score:
         pass
 
+    def _score_function(self) -> Callable[..., Score]:
+        # a picklable equivalent of _compute_score, called in worker processes
+        return self._compute_score
+
     @abstractmethod
     def _metric_name(self) -> str:
         pass
@@ -210,6 +299,9 @@ class RougeN(_BaseRouge):
         device: specifies which device updates are accumulated on. Setting the metric's
             device to be the same as your ``update`` arguments ensures the ``update`` method is non-blocking. By
             default, CPU.
+        num_workers: number of processes computing the scores of the candidates of a batch. A pool of processes
+            is created on each ``update``, such that it is only worth it for large batches. Default: 0, the scores
+            are computed in the main process.
 
     Examples:
 
@@ -236,6 +328,9 @@ class RougeN(_BaseRouge):
             {'Rouge-2-P': 0.5, 'Rouge-2-R': 0.4, 'Rouge-2-F': 0.4}
 
     .. versionadded:: 0.4.5
+
+    .. versionchanged:: 0.6.0
+        ``num_workers`` argument is added.
     """
 
     def __init__(
@@ -245,8 +340,15 @@ class RougeN(_BaseRouge):
         alpha: float = 0,
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = torch.device("cpu"),
+        num_workers: int = 0,
     ):
-        super(RougeN, self).__init__(multiref=multiref, alpha=alpha, output_transform=output_transform, device=device)
+        super(RougeN, self).__init__(
+            multiref=multiref,
+            alpha=alpha,
+            output_transform=output_transform,
+            device=device,
+            num_workers=num_workers,
+        )
         self._ngram = ngram
         if self._ngram < 1:
             raise ValueError(f"ngram order must be greater than zero (got : {self._ngram})")
@@ -254,6 +356,9 @@ class RougeN(_BaseRouge):
     def _compute_score(self, candidate: Sequence[Any], reference: Sequence[Any]) -> Score:
         return compute_ngram_scores(candidate=candidate, reference=reference, n=self._ngram)
 
+    def _score_function(self) -> Callable[..., Score]:
+        return partial(compute_ngram_scores, n=self._ngram)
+
     def _metric_name(self) -> str:
         return f"Rouge-{self._ngram}"
 
@@ -282,6 +387,9 @@ class RougeL(_BaseRouge):
         device: specifies which device updates are accumulated on. Setting the metric's
             device to be the same as your ``update`` arguments ensures the ``update`` method is non-blocking. By
             default, CPU.
+        num_workers: number of processes computing the scores of the candidates of a batch. A pool of processes
+            is created on each ``update``, such that it is only worth it for large batches. Default: 0, the scores
+            are computed in the main process.
 
     Examples:
 
@@ -307,7 +415,14 @@ class RougeL(_BaseRouge):
 
            {'Rouge-L-P': 0.6, 'Rouge-L-R': 0.5, 'Rouge-L-F': 0.5}
 
+    The length of the longest common subsequence is computed with a bit-parallel algorithm in linear memory. If the
+    candidates and the references are tensors of token ids on an accelerator, the lengths of a batch are computed
+    at once on the device.
+
     .. versionadded:: 0.4.5
+
+    .. versionchanged:: 0.6.0
+        ``num_workers`` argument is added.
     """
 
     def __init__(
@@ -316,12 +431,41 @@ class RougeL(_BaseRouge):
         alpha: float = 0,
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = torch.device("cpu"),
+        num_workers: int = 0,
     ):
-        super(RougeL, self).__init__(multiref=multiref, alpha=alpha, output_transform=output_transform, device=device)
+        super(RougeL, self).__init__(
+            multiref=multiref,
+            alpha=alpha,
+            output_transform=output_transform,
+            device=device,
+            num_workers=num_workers,
+        )
 
     def _compute_score(self, candidate: Sequence[Any], reference: Sequence[Any]) -> Score:
         return compute_lcs_scores(candidate=candidate, reference=reference)
 
+    def _score_function(self) -> Callable[..., Score]:
+        return compute_lcs_scores
+
+    def _compute_multiref_scores(
+        self, candidates: Sequence[Sequence[Any]], references: Sequence[Sequence[Sequence[Any]]]
+    ) -> List[List[Score]]:
+        pairs = [(candidate, ref) for candidate, refs in zip(candidates, references) for ref in refs]
+        on_accelerator = len(pairs) > 0 and all(
+            isinstance(seq, torch.Tensor) and seq.device.type != "cpu" for pair in pairs for seq in pair
+        )
+        if not on_accelerator:
+            return super(RougeL, self)._compute_multiref_scores(candidates, references)
+
+        # pad with values which do not match any token
+        seq_a = torch.nn.utils.rnn.pad_sequence([cast(torch.Tensor, candidate) for candidate, _ in pairs], True, -1)
+        seq_b = torch.nn.utils.rnn.pad_sequence([cast(torch.Tensor, ref) for _, ref in pairs], True, -2)
+        matches = iter(_batched_lcs(seq_a.long(), seq_b.long()).tolist())
+        return [
+            [Score(match=next(matches), candidate=len(candidate), reference=len(ref)) for ref in refs]
+            for candidate, refs in zip(candidates, references)
+        ]
+
     def _metric_name(self) -> str:
         return "Rouge-L"
 
@@ -329,6 +473,9 @@ class RougeL(_BaseRouge):
 class Rouge(Metric):
     r"""Calculates the Rouge score for multiples Rouge-N and Rouge-L metrics.
 
+    The n-grams of all the orders of a candidate and a reference are counted at once, and the length of their
+    longest common subsequence is computed once, for all the variants.
+
     More details can be found in `Lin 2004`__.
 
     __ https://www.aclweb.org/anthology/W04-1013.pdf
@@ -349,6 +496,9 @@ class Rouge(Metric):
         device: specifies which device updates are accumulated on. Setting the metric's
             device to be the same as your ``update`` arguments ensures the ``update`` method is non-blocking. By
             default, CPU.
+        num_workers: number of processes computing the scores of the candidates of a batch. A pool of processes
+            is created on each ``update``, such that it is only worth it for large batches. Default: 0, the scores
+            are computed in the main process.
 
     Examples:
 
@@ -377,6 +527,8 @@ class Rouge(Metric):
     .. versionadded:: 0.4.5
     .. versionchanged:: 0.4.7
         ``update`` method has changed and now works on batch of inputs.
+    .. versionchanged:: 0.6.0
+        ``num_workers`` argument is added, the scores of the variants are computed together.
     """
 
     _state_dict_all_req_keys = ("internal_metrics",)
@@ -388,6 +540,7 @@ class Rouge(Metric):
         alpha: float = 0,
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = torch.device("cpu"),
+        num_workers: int = 0,
     ):
         if variants is None or len(variants) == 0:
             variants = [1, 2, 4, "L"]
@@ -403,6 +556,7 @@ class Rouge(Metric):
             else:
                 raise ValueError("variant must be 'L' or integer greater to zero")
             self.internal_metrics.append(variant)
+        self._num_workers = num_workers
         super(Rouge, self).__init__(output_transform=output_transform, device=device)
 
     @reinit__is_reduced
@@ -412,8 +566,14 @@ class Rouge(Metric):
 
     @reinit__is_reduced
     def update(self, output: Tuple[Sequence[Sequence[Any]], Sequence[Sequence[Sequence[Any]]]]) -> None:
-        for m in self.internal_metrics:
-            m.update(output)
+        candidates, references = output
+        # the scores of all the variants are computed together and dispatched to the variants
+        ngram_orders = [m._ngram if isinstance(m, RougeN) else None for m in self.internal_metrics]
+        all_scores = _map_multiref_scores(
+            _compute_variants_multiref_scores, ngram_orders, candidates, references, self._num_workers
+        )
+        for m, scores in zip(self.internal_metrics, all_scores):
+            m._update_scores(scores)
 
     def compute(self) -> Mapping:
         results = {}
@@ -1,5 +1,9 @@
 from collections import Counter
-from typing import Any, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import torch
 
 __all__ = ["ngrams", "lcs", "modified_precision"]
 
@@ -25,6 +29,12 @@ def lcs(seq_a: Sequence[Any], seq_b: Sequence[Any]) -> int:
     Compute the length of the longest common subsequence in two sequence of items
     https://en.wikipedia.org/wiki/Longest_common_subsequence_problem
 
+    The length is computed with the bit-parallel algorithm of `Hyyrö 2004`__ in time O(m * n / w) and memory O(n),
+    the rows of the dynamic programming table being encoded as python integers. Sequences of unhashable items are
+    compared with a two-row dynamic programming table.
+
+    __ https://doi.org/10.1016/j.jda.2004.08.008
+
     Args:
         seq_a: first sequence of items
         seq_b: second sequence of items
@@ -33,22 +43,76 @@ def lcs(seq_a: Sequence[Any], seq_b: Sequence[Any]) -> int:
         The length of the longest common subsequence
 
     .. versionadded:: 0.4.5
+
+    .. versionchanged:: 0.6.0
+        the length is computed in linear memory.
     """
-    m = len(seq_a)
-    n = len(seq_b)
+    # tensors of token ids are compared by value
+    if isinstance(seq_a, torch.Tensor):
+        seq_a = seq_a.tolist()
+    if isinstance(seq_b, torch.Tensor):
+        seq_b = seq_b.tolist()
+
+    try:
+        return _lcs_bit_parallel(seq_a, seq_b)
+    except TypeError:
+        # unhashable items
+        return _lcs_two_rows(seq_a, seq_b)
+
+
+def _lcs_bit_parallel(seq_a: Sequence[Any], seq_b: Sequence[Any]) -> int:
+    # bit j of the mask of an item is set if seq_b[j] is the item
+    masks: Dict[Any, int] = {}
+    for j, item in enumerate(seq_b):
+        masks[item] = masks.get(item, 0) | (1 << j)
+
+    # zero bits of v are the columns where the row of the dynamic programming table increases
+    full = (1 << len(seq_b)) - 1
+    v = full
+    for item in seq_a:
+        u = v & masks.get(item, 0)
+        v = ((v + u) | (v - u)) & full
+    return len(seq_b) - bin(v).count("1")
+
+
+def _lcs_two_rows(seq_a: Sequence[Any], seq_b: Sequence[Any]) -> int:
+    previous = [0] * (len(seq_b) + 1)
+    for item_a in seq_a:
+        current = [0] * (len(seq_b) + 1)
+        for j, item_b in enumerate(seq_b, start=1):
+            if item_a == item_b:
+                current[j] = previous[j - 1] + 1
+            else:
+                current[j] = max(previous[j], current[j - 1])
+        previous = current
+    return previous[-1]
 
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
 
-    for i in range(m + 1):
-        for j in range(n + 1):
-            if i == 0 or j == 0:
-                dp[i][j] = 0
-            elif seq_a[i - 1] == seq_b[j - 1]:
-                dp[i][j] = dp[i - 1][j - 1] + 1
-            else:
-                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+def _batched_lcs(seq_a: torch.Tensor, seq_b: torch.Tensor) -> torch.Tensor:
+    """
+    Compute the length of the longest common subsequence of each pair of rows of two batches of token ids, on their
+    device. It needs one step per column of ``seq_a``, such that it is only faster than :func:`lcs` for large
+    batches on accelerators.
+
+    The rows of the dynamic programming table are computed one after the other for the whole batch: the value at
+    column j is the maximum, for k <= j, of the maximum of the previous row at k and the previous row at k - 1 plus
+    one if the tokens match at k, which is a cumulative maximum.
 
-    return dp[m][n]
+    Args:
+        seq_a: tensor of shape (batch_size, m) of token ids
+        seq_b: tensor of shape (batch_size, n) of token ids. Sequences of different lengths can be padded with
+            values which do not match any token of the other tensor, e.g. -1 in ``seq_a`` and -2 in ``seq_b``.
+
+    Returns:
+        Tensor of shape (batch_size,) of the lengths of the longest common subsequences.
+    """
+    batch_size, n = seq_b.shape
+    row = torch.zeros(batch_size, n + 1, dtype=torch.long, device=seq_b.device)
+    for i in range(seq_a.shape[1]):
+        matches = seq_b == seq_a[:, i : i + 1]
+        candidates = torch.maximum(row[:, 1:], row[:, :-1] + matches)
+        row[:, 1:] = torch.cummax(candidates, dim=1)[0]
+    return row[:, -1]
 
 
 def modified_precision(references: Sequence[Sequence[Any]], candidate: Any, n: int) -> Tuple[int, int]:
@@ -87,3 +151,95 @@ def modified_precision(references: Sequence[Sequence[Any]], candidate: Any, n: i
     clipped_counts = counts & max_counts
 
     return sum(clipped_counts.values()), sum(counts.values())
+
+
+def _batched_modified_precision(
+    references: Sequence[Sequence[Sequence[Any]]], candidates: Sequence[Sequence[Any]], max_n: int
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Compute the numerators and the denominators of :func:`modified_precision` of a batch of candidates for the
+    n-gram orders from 1 to ``max_n``, with tensor operations instead of counters of tuples.
+
+    Tokens are mapped to integer ids. The n-grams of order n of each candidate and its references are mapped to
+    integer keys by ranking the pairs made of the key of the (n-1)-gram and the id of the last token, the keys of
+    order 1 ranking the pairs made of the index of the candidate and the token id. Counts and clipped counts are
+    then computed per key.
+
+    Args:
+        references: list of lists of references R of each candidate
+        candidates: list of translations T
+        max_n: maximal n-gram order
+
+    Returns:
+        Two int64 tensors of shape (number of candidates, max_n), the number of clipped matched n-grams and the
+        number of n-grams of each candidate for each order.
+    """
+    num_sentences = len(candidates)
+    numerators = torch.zeros(num_sentences, max_n, dtype=torch.long)
+    denominators = torch.zeros(num_sentences, max_n, dtype=torch.long)
+
+    sequences_list: List[Sequence[Any]] = []
+    # index of the candidate each sequence is compared with, and whether it is a reference
+    sentence_indices: List[int] = []
+    is_reference_list: List[bool] = []
+    for i, (refs, candidate) in enumerate(zip(references, candidates)):
+        sequences_list.append(candidate)
+        sequences_list.extend(refs)
+        sentence_indices.extend([i] * (len(refs) + 1))
+        is_reference_list.append(False)
+        is_reference_list.extend([True] * len(refs))
+    tokens = list(chain.from_iterable(sequences_list))
+    if len(tokens) == 0:
+        return numerators, denominators
+    vocabulary: Dict[Any, int] = {token: i for i, token in enumerate(dict.fromkeys(tokens))}
+    ids = torch.tensor(list(map(vocabulary.__getitem__, tokens)), dtype=torch.long)
+
+    lengths = torch.tensor([len(sequence) for sequence in sequences_list], dtype=torch.long)
+    sentences = torch.tensor(sentence_indices, dtype=torch.long)
+    is_reference = torch.tensor(is_reference_list, dtype=torch.bool)
+    # sequence of each token and number of tokens from each token to the end of its sequence
+    token_sequences = torch.repeat_interleave(torch.arange(len(sequences_list)), lengths)
+    remaining = torch.cumsum(lengths, dim=0)[token_sequences] - torch.arange(len(tokens))
+
+    # pairs are lower than the number of tokens squared, ranking them avoids overflows
+    keys = sentences[token_sequences] * len(vocabulary) + ids
+    for n in range(1, max_n + 1):
+        if n > 1:
+            keys = keys[:-1] * len(vocabulary) + ids[n - 1 :]
+        keys = torch.unique(keys, return_inverse=True)[1]
+        valid = remaining[: len(keys)] >= n
+        if not valid.any():
+            break
+        ngram_keys = keys[valid]
+        ngram_sequences = token_sequences[: len(keys)][valid]
+        ngram_is_reference = is_reference[ngram_sequences]
+        num_keys = int(keys.max()) + 1
+
+        # counts of the n-grams of each candidate
+        candidate_counts = torch.bincount(ngram_keys[~ngram_is_reference], minlength=num_keys)
+        denominators[:, n - 1] = torch.bincount(
+            sentences[ngram_sequences[~ngram_is_reference]], minlength=num_sentences
+        )
+
+        # maximal counts over the references of each candidate of the n-grams found in the candidate
+        in_candidate = ngram_is_reference & (candidate_counts[ngram_keys] > 0)
+        reference_keys, reference_counts = torch.unique(
+            ngram_keys[in_candidate] * len(sequences_list) + ngram_sequences[in_candidate], return_counts=True
+        )
+        max_counts = torch.zeros_like(candidate_counts).scatter_reduce_(
+            0, reference_keys // len(sequences_list), reference_counts, "amax"
+        )
+
+        # clipped counts of the candidate n-grams
+        key_sentences = torch.zeros_like(candidate_counts).scatter_(0, ngram_keys, sentences[ngram_sequences])
+        numerators[:, n - 1].index_add_(0, key_sentences, torch.minimum(candidate_counts, max_counts))
+
+    return numerators, denominators
+
+
+def _map_in_processes(fn: Callable, chunks: Sequence[Tuple[Any, ...]], num_workers: int) -> List[Any]:
+    """Apply ``fn`` on the arguments of each chunk, in a pool of ``num_workers`` processes if it is positive."""
+    if num_workers <= 0 or len(chunks) <= 1:
+        return [fn(*args) for args in chunks]
+    with ProcessPoolExecutor(max_workers=min(num_workers, len(chunks))) as executor:
+        return list(executor.map(fn, *zip(*chunks)))
@@ -1,8 +1,14 @@
+import math
 from abc import abstractmethod
-from typing import Tuple
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, cast, Mapping, Optional, Sequence, Tuple, Union
 
 import torch
 
+import ignite.distributed as idist
+from ignite.exceptions import NotComputableError
+from ignite.metrics.epoch_metric import EpochMetric
 from ignite.metrics.metric import Metric, reinit__is_reduced
 
 
@@ -39,6 +45,83 @@ def _torch_median(output: torch.Tensor) -> float:
         return float(torch.kthvalue(output, len_ // 2 + 1)[0])
 
 
+def _torch_quantiles(output: torch.Tensor, quantiles: Sequence[float]) -> torch.Tensor:
+    # linear interpolation between the closest ranks, as torch.quantile which does not support large inputs
+    output = output.view(-1)
+    positions = torch.tensor(quantiles, dtype=torch.float64) * (len(output) - 1)
+    values = {}
+    for k in set(positions.floor().long().tolist()) | set(positions.ceil().long().tolist()):
+        values[k] = torch.kthvalue(output, k + 1)[0].double()
+    lower = torch.stack([values[int(p)] for p in positions.floor()])
+    upper = torch.stack([values[int(p)] for p in positions.ceil()])
+    weights = (positions - positions.floor()).to(lower.device)
+    return torch.where(lower == upper, lower, lower + weights * (upper - lower))
+
+
+def _quantiles_compute_fn(
+    errors_fn: Callable[[torch.Tensor, torch.Tensor], torch.Tensor],
+    quantiles: Sequence[float],
+    y_pred: torch.Tensor,
+    y: torch.Tensor,
+) -> torch.Tensor:
+    return _torch_quantiles(errors_fn(y_pred, y), quantiles)
+
+
+def _tdigest_size(compression: int) -> int:
+    return compression // 2 + 1
+
+
+def _tdigest_merge(centroids: torch.Tensor, values: torch.Tensor, compression: int) -> torch.Tensor:
+    """Merges the values, of weight 1, into the t-digest ``centroids``, a tensor of shape ``(size, 2)`` of the means
+    and weights of at most ``size`` centroids, padded with centroids of weight 0.
+
+    Centroids and values are sorted and clustered by the integer part of the scale function
+    :math:`k(q) = \\frac{\\delta}{2\\pi} \\arcsin(2q - 1)` at their mid-rank :math:`q`, such that the clusters are
+    small at the tails and there are at most ``size`` of them.
+    """
+    means = torch.cat([centroids[:, 0], values])
+    weights = torch.cat([centroids[:, 1], torch.ones_like(values)])
+    means, indices = torch.sort(means)
+    weights = weights[indices]
+
+    cumulative_weights = torch.cumsum(weights, dim=0)
+    q = (cumulative_weights - weights / 2) / cumulative_weights[-1]
+    k = compression / (2 * math.pi) * torch.asin((2 * q - 1).clamp(-1, 1)) + compression / 4
+    size = centroids.shape[0]
+    clusters = k.floor().long().clamp(0, size - 1)
+
+    merged = torch.zeros_like(centroids)
+    merged[:, 0].index_add_(0, clusters, means * weights)
+    merged[:, 1].index_add_(0, clusters, weights)
+    # non-empty clusters weigh at least 1, empty clusters are padding centroids of mean 0
+    merged[:, 0] /= merged[:, 1].clamp(min=1)
+    return merged
+
+
+def _tdigest_quantiles(
+    centroids: torch.Tensor, minimum: torch.Tensor, maximum: torch.Tensor, quantiles: Sequence[float]
+) -> torch.Tensor:
+    """Interpolates the quantiles between the mid-ranks of the centroids, and the minimum and the maximum at the
+    ranks 0 and the total weight.
+    """
+    centroids = centroids[centroids[:, 1] > 0]
+    means, indices = torch.sort(centroids[:, 0])
+    weights = centroids[indices, 1]
+    cumulative_weights = torch.cumsum(weights, dim=0)
+    total_weight = cumulative_weights[-1:]
+
+    values = torch.cat([minimum.view(1), means, maximum.view(1)])
+    ranks = torch.cat([torch.zeros_like(total_weight), cumulative_weights - weights / 2, total_weight])
+    targets = torch.tensor(quantiles, dtype=ranks.dtype, device=ranks.device) * total_weight
+    upper = torch.searchsorted(ranks, targets, right=True).clamp(1, len(ranks) - 1)
+    lower = upper - 1
+    fractions = (targets - ranks[lower]) / (ranks[upper] - ranks[lower]).clamp(min=1e-12)
+    lower_values, upper_values = values[lower], values[upper]
+    return torch.where(
+        lower_values == upper_values, lower_values, lower_values + fractions * (upper_values - lower_values)
+    )
+
+
 class _BaseRegression(Metric):
     # Base class for all regression metrics
     # `update` method check the shapes and call internal overloaded
@@ -61,3 +144,190 @@ class _BaseRegression(Metric):
     @abstractmethod
     def _update(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
         pass
+
+
+def _batch_moments(x: torch.Tensor) -> torch.Tensor:
+    """Returns the moments of the samples ``x`` of shape ``(N, k)``, packed as the count, the ``k`` means and the
+    ``k x k`` co-moments, the sums of the products of the deviations from the means.
+    """
+    means = x.mean(dim=0)
+    deviations = x - means
+    comoments = deviations.T @ deviations
+    return torch.cat([x.new_tensor([x.shape[0]]), means, comoments.view(-1)])
+
+
+def _merge_moments(moments: torch.Tensor, num_variables: int) -> torch.Tensor:
+    """Merges the packed moments of shape ``(m, 1 + k + k * k)`` of ``m`` partitions of the samples, as Chan et al.,
+    without the cancellation of the sums of squares.
+    """
+    counts = moments[:, 0]
+    means = moments[:, 1 : 1 + num_variables]
+    comoments = moments[:, 1 + num_variables :].view(-1, num_variables, num_variables)
+
+    count = counts.sum()
+    mean = (counts @ means) / count.clamp(min=1)
+    deviations = means - mean
+    comoment = comoments.sum(dim=0) + (counts[:, None] * deviations).T @ deviations
+    return torch.cat([count.view(1), mean, comoment.view(-1)])
+
+
+class _BaseMomentsRegression(_BaseRegression):
+    """Base class of the regression metrics computed from the count, the means and the co-moments of
+    ``_num_variables`` variables of the predictions and targets, returned by ``_variables``.
+
+    The moments are accumulated in float64 with a Welford-like parallel update, batch after batch, and merged across
+    processes with a single all-gather.
+    """
+
+    _num_variables = 2
+    _state_dict_all_req_keys = ("_moments",)
+
+    @reinit__is_reduced
+    def reset(self) -> None:
+        k = self._num_variables
+        self._moments = torch.zeros(1 + k + k * k, dtype=torch.float64, device=self._device)
+
+    @abstractmethod
+    def _variables(self, y_pred: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        pass
+
+    def _update(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
+        y_pred, y = output[0].detach(), output[1].detach()
+        if y.shape[0] == 0:
+            return
+        x = self._variables(y_pred.to(device=self._device, dtype=torch.float64), y.to(self._device, torch.float64))
+        self._moments = _merge_moments(torch.stack([self._moments, _batch_moments(x)]), self._num_variables)
+
+    def _reduce_moments(self) -> Tuple[int, torch.Tensor, torch.Tensor]:
+        """Returns the count, the means and the co-moments of the variables over all processes."""
+        moments = self._moments
+        if idist.get_world_size() > 1:
+            moments = _merge_moments(cast(torch.Tensor, idist.all_gather(moments.unsqueeze(0))), self._num_variables)
+        k = self._num_variables
+        return int(moments[0].item()), moments[1 : 1 + k], moments[1 + k :].view(k, k)
+
+
+class _QuantileEpochMetric(EpochMetric):
+    """EpochMetric of the median based regression metrics. ``errors_fn`` maps predictions and targets to the errors
+    whose median, or ``quantiles``, are computed.
+
+    If ``compression`` is given, the data is not stored but the errors are accumulated in a t-digest of fixed size,
+    merged across processes with a single all-gather, and the quantiles are approximated. Non-finite errors, e.g. the
+    relative errors of zero targets, would corrupt the means of the centroids and are left out of the t-digest.
+    """
+
+    def __init__(
+        self,
+        compute_fn: Callable[[torch.Tensor, torch.Tensor], Any],
+        errors_fn: Callable[[torch.Tensor, torch.Tensor], torch.Tensor],
+        quantiles: Optional[Sequence[float]] = None,
+        compression: Optional[int] = None,
+        output_transform: Callable = lambda x: x,
+        device: Union[str, torch.device] = torch.device("cpu"),
+    ) -> None:
+        if quantiles is not None:
+            if (
+                not isinstance(quantiles, Sequence)
+                or len(quantiles) < 1
+                or not all(isinstance(q, (int, float)) and 0 <= q <= 1 for q in quantiles)
+            ):
+                raise ValueError(
+                    f"Argument quantiles should be a non-empty sequence of numbers in [0, 1], but given {quantiles}"
+                )
+            quantiles = tuple(float(q) for q in quantiles)
+            compute_fn = partial(_quantiles_compute_fn, errors_fn, quantiles)
+        if compression is not None and (not isinstance(compression, int) or compression < 2):
+            raise ValueError(f"Argument compression should be an integer greater than 1, but given {compression}")
+
+        self._errors_fn = errors_fn
+        self._quantiles = quantiles
+        self._compression = compression
+        super(_QuantileEpochMetric, self).__init__(compute_fn, output_transform=output_transform, device=device)
+        if compression is not None:
+            self._state_dict_all_req_keys = ("_centroids", "_extrema")
+
+    @reinit__is_reduced
+    def reset(self) -> None:
+        super(_QuantileEpochMetric, self).reset()
+        if self._compression is not None:
+            size = _tdigest_size(self._compression)
+            self._centroids = torch.zeros(size, 2, dtype=torch.float64, device=self._device)
+            self._extrema = torch.tensor([math.inf, -math.inf], dtype=torch.float64, device=self._device)
+
+    def _batch_errors(self, y_pred: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        return self._errors_fn(y_pred, y)
+
+    @reinit__is_reduced
+    def update(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
+        if self._compression is None:
+            super(_QuantileEpochMetric, self).update(output)
+            return
+
+        self._check_shape(output)
+        y_pred, y = output[0].detach(), output[1].detach()
+
+        if y_pred.ndimension() == 2 and y_pred.shape[1] == 1:
+            y_pred = y_pred.squeeze(dim=-1)
+
+        if y.ndimension() == 2 and y.shape[1] == 1:
+            y = y.squeeze(dim=-1)
+
+        errors = self._batch_errors(y_pred.to(self._device), y.to(self._device)).reshape(-1).double()
+        errors = errors[torch.isfinite(errors)]
+        if errors.numel() == 0:
+            return
+        self._centroids = _tdigest_merge(self._centroids, errors, self._compression)
+        self._extrema = torch.stack(
+            [torch.minimum(self._extrema[0], errors.min()), torch.maximum(self._extrema[1], errors.max())]
+        )
+
+    def _compute_sketch(self) -> Any:
+        digest = torch.cat([self._centroids, self._extrema.view(1, 2)])
+        ws = idist.get_world_size()
+        if ws > 1:
+            digest = cast(torch.Tensor, idist.all_gather(digest))
+        digest = digest.view(max(ws, 1), -1, 2)
+        # centroids of all processes are interpolated together, without compressing them further
+        centroids = digest[:, :-1].reshape(-1, 2)
+        if not bool((centroids[:, 1] > 0).any()):
+            raise NotComputableError(
+                f"{self.__class__.__name__} must have at least one example before it can be computed."
+            )
+
+        quantiles = self._quantiles if self._quantiles is not None else (0.5,)
+        result = _tdigest_quantiles(centroids, digest[:, -1, 0].min(), digest[:, -1, 1].max(), quantiles)
+        return result if self._quantiles is not None else result.item()
+
+    def compute(self) -> Any:
+        if self._compression is not None:
+            return self._compute_sketch()
+        if self._quantiles is None:
+            return super(_QuantileEpochMetric, self).compute()
+
+        if len(self._predictions) < 1 or len(self._targets) < 1:
+            raise NotComputableError("EpochMetric must have at least one example before it can be computed.")
+
+        if self._result is None:
+            _prediction_tensor, _target_tensor = self._gather_stored_data()
+
+            result: Any = None
+            if idist.get_rank() == 0:
+                result = self.compute_fn(_prediction_tensor, _target_tensor)
+
+            if idist.get_world_size() > 1:
+                # the quantiles are a tensor, unknown to the other processes
+                result = idist.broadcast(result, src=0, safe_mode=True)
+            self._result = result
+
+        return self._result
+
+    def _state_dict_per_rank(self) -> OrderedDict:
+        if self._compression is not None:
+            return super(EpochMetric, self)._state_dict_per_rank()
+        return super(_QuantileEpochMetric, self)._state_dict_per_rank()
+
+    def _load_state_dict_per_rank(self, state_dict: Mapping) -> None:
+        if self._compression is not None:
+            super(EpochMetric, self)._load_state_dict_per_rank(state_dict)
+            return
+        super(_QuantileEpochMetric, self)._load_state_dict_per_rank(state_dict)
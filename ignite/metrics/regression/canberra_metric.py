@@ -69,7 +69,7 @@ class CanberraMetric(_BaseRegression):
 
     @reinit__is_reduced
     def reset(self) -> None:
-        self._sum_of_errors = torch.tensor(0.0, device=self._device)
+        self._sum_of_errors = torch.tensor(0.0, dtype=torch.double, device=self._device)
 
     def _update(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
         y_pred, y = output[0].detach(), output[1].detach()
@@ -64,7 +64,7 @@ class MeanAbsoluteRelativeError(_BaseRegression):
 
     @reinit__is_reduced
     def reset(self) -> None:
-        self._sum_of_absolute_relative_errors = torch.tensor(0.0, device=self._device)
+        self._sum_of_absolute_relative_errors = torch.tensor(0.0, dtype=torch.double, device=self._device)
         self._num_samples = 0
 
     def _update(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
@@ -1,18 +1,19 @@
-from typing import Callable, Union
+from typing import Callable, Optional, Sequence, Union
 
 import torch
 
-from ignite.metrics.epoch_metric import EpochMetric
+from ignite.metrics.regression._base import _QuantileEpochMetric, _torch_median
 
-from ignite.metrics.regression._base import _torch_median
+
+def _absolute_errors(y_pred: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+    return torch.abs(y.view_as(y_pred) - y_pred)
 
 
 def median_absolute_error_compute_fn(y_pred: torch.Tensor, y: torch.Tensor) -> float:
-    e = torch.abs(y.view_as(y_pred) - y_pred)
-    return _torch_median(e)
+    return _torch_median(_absolute_errors(y_pred, y))
 
 
-class MedianAbsoluteError(EpochMetric):
+class MedianAbsoluteError(_QuantileEpochMetric):
     r"""Calculates the Median Absolute Error.
 
     .. math::
@@ -28,7 +29,8 @@ class MedianAbsoluteError(EpochMetric):
     .. warning::
 
         Current implementation stores all input data (output and target) in as tensors before computing a metric.
-        This can potentially lead to a memory error if the input data is larger than available RAM.
+        This can potentially lead to a memory error if the input data is larger than available RAM. Use
+        ``compression`` to approximate the metric in constant memory instead.
 
 
     __ https://arxiv.org/abs/1809.03006
@@ -40,6 +42,13 @@ class MedianAbsoluteError(EpochMetric):
             you want to compute the metric with respect to one of the outputs.
             By default, metrics require the output as ``(y_pred, y)`` or ``{'y_pred': y_pred, 'y': y}``.
         device: optional device specification for internal storage.
+        quantiles: optional quantiles of the errors to compute instead of their median, numbers in ``[0, 1]``, e.g.
+            ``(0.5, 0.9, 0.99)``. If given, ``compute`` returns a tensor with the value of each quantile.
+        compression: if given, the data is not stored but the errors are accumulated in a t-digest, a mergeable
+            sketch of at most ``compression // 2 + 1`` centroids, and the median or ``quantiles`` are approximated.
+            The rank error of a quantile :math:`q` is bounded by about :math:`\pi \sqrt{q (1 - q)} / compression`,
+            i.e. 1.6% of the samples for the median and 0.3% for the 99th percentile with ``compression=100``, and
+            is much lower in practice.
 
 
     Examples:
@@ -62,11 +71,38 @@ class MedianAbsoluteError(EpochMetric):
         .. testoutput::
 
             0.625
+
+        The 50th and 90th percentiles of the errors can be approximated without storing the data:
+
+        .. testcode::
+
+            metric = MedianAbsoluteError(quantiles=(0.5, 0.9), compression=100)
+            metric.attach(default_evaluator, 'mae_quantiles')
+            y_true = torch.tensor([0, 1, 2, 3, 4, 5])
+            y_pred = y_true * 0.75
+            state = default_evaluator.run([[y_pred, y_true]])
+            print(state.metrics['mae_quantiles'])
+
+        .. testoutput::
+
+            tensor([0.6250, 1.2250], dtype=torch.float64)
+
+    .. versionchanged:: 0.6.0
+        ``quantiles`` and ``compression`` arguments are added.
     """
 
     def __init__(
-        self, output_transform: Callable = lambda x: x, device: Union[str, torch.device] = torch.device("cpu")
+        self,
+        output_transform: Callable = lambda x: x,
+        device: Union[str, torch.device] = torch.device("cpu"),
+        quantiles: Optional[Sequence[float]] = None,
+        compression: Optional[int] = None,
     ):
         super(MedianAbsoluteError, self).__init__(
-            median_absolute_error_compute_fn, output_transform=output_transform, device=device
+            median_absolute_error_compute_fn,
+            _absolute_errors,
+            quantiles=quantiles,
+            compression=compression,
+            output_transform=output_transform,
+            device=device,
         )
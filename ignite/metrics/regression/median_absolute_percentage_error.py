@@ -1,10 +1,12 @@
-from typing import Callable, Union
+from typing import Callable, Optional, Sequence, Union
 
 import torch
 
-from ignite.metrics.epoch_metric import EpochMetric
+from ignite.metrics.regression._base import _QuantileEpochMetric, _torch_median
 
-from ignite.metrics.regression._base import _torch_median
+
+def _absolute_percentage_errors(y_pred: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+    return 100.0 * torch.abs(y.view_as(y_pred) - y_pred) / torch.abs(y.view_as(y_pred))
 
 
 def median_absolute_percentage_error_compute_fn(y_pred: torch.Tensor, y: torch.Tensor) -> float:
@@ -12,7 +14,7 @@ def median_absolute_percentage_error_compute_fn(y_pred: torch.Tensor, y: torch.T
     return 100.0 * _torch_median(e)
 
 
-class MedianAbsolutePercentageError(EpochMetric):
+class MedianAbsolutePercentageError(_QuantileEpochMetric):
     r"""Calculates the Median Absolute Percentage Error.
 
     .. math::
@@ -28,7 +30,8 @@ class MedianAbsolutePercentageError(EpochMetric):
     .. warning::
 
         Current implementation stores all input data (output and target) in as tensors before computing a metric.
-        This can potentially lead to a memory error if the input data is larger than available RAM.
+        This can potentially lead to a memory error if the input data is larger than available RAM. Use
+        ``compression`` to approximate the metric in constant memory instead.
 
     __ https://arxiv.org/abs/1809.03006
 
@@ -39,6 +42,13 @@ class MedianAbsolutePercentageError(EpochMetric):
             you want to compute the metric with respect to one of the outputs.
             By default, metrics require the output as ``(y_pred, y)`` or ``{'y_pred': y_pred, 'y': y}``.
         device: optional device specification for internal storage.
+        quantiles: optional quantiles of the errors to compute instead of their median, numbers in ``[0, 1]``, e.g.
+            ``(0.5, 0.9, 0.99)``. If given, ``compute`` returns a tensor with the value of each quantile.
+        compression: if given, the data is not stored but the errors are accumulated in a t-digest, a mergeable
+            sketch of at most ``compression // 2 + 1`` centroids, and the median or ``quantiles`` are approximated.
+            The rank error of a quantile :math:`q` is bounded by about :math:`\pi \sqrt{q (1 - q)} / compression`,
+            i.e. 1.6% of the samples for the median and 0.3% for the 99th percentile with ``compression=100``, and
+            is much lower in practice. Non-finite errors, e.g. for zero targets, are left out of the t-digest.
 
     Examples:
         To use with ``Engine`` and ``process_function``, simply attach the metric instance to the engine.
@@ -60,11 +70,23 @@ class MedianAbsolutePercentageError(EpochMetric):
         .. testoutput::
 
             25.0...
+
+    .. versionchanged:: 0.6.0
+        ``quantiles`` and ``compression`` arguments are added.
     """
 
     def __init__(
-        self, output_transform: Callable = lambda x: x, device: Union[str, torch.device] = torch.device("cpu")
+        self,
+        output_transform: Callable = lambda x: x,
+        device: Union[str, torch.device] = torch.device("cpu"),
+        quantiles: Optional[Sequence[float]] = None,
+        compression: Optional[int] = None,
     ):
         super(MedianAbsolutePercentageError, self).__init__(
-            median_absolute_percentage_error_compute_fn, output_transform=output_transform, device=device
+            median_absolute_percentage_error_compute_fn,
+            _absolute_percentage_errors,
+            quantiles=quantiles,
+            compression=compression,
+            output_transform=output_transform,
+            device=device,
         )
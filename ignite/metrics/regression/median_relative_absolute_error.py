@@ -1,18 +1,24 @@
-from typing import Callable, Union
+from typing import Callable, Optional, Sequence, Union
 
 import torch
 
-from ignite.metrics.epoch_metric import EpochMetric
+from ignite.metrics.metric import reinit__is_reduced
+from ignite.metrics.regression._base import _QuantileEpochMetric, _torch_median
 
-from ignite.metrics.regression._base import _torch_median
+
+def _relative_absolute_errors(
+    y_pred: torch.Tensor, y: torch.Tensor, y_mean: Optional[torch.Tensor] = None
+) -> torch.Tensor:
+    if y_mean is None:
+        y_mean = torch.mean(y)
+    return torch.abs(y.view_as(y_pred) - y_pred) / torch.abs(y.view_as(y_pred) - y_mean)
 
 
 def median_relative_absolute_error_compute_fn(y_pred: torch.Tensor, y: torch.Tensor) -> float:
-    e = torch.abs(y.view_as(y_pred) - y_pred) / torch.abs(y.view_as(y_pred) - torch.mean(y))
-    return _torch_median(e)
+    return _torch_median(_relative_absolute_errors(y_pred, y))
 
 
-class MedianRelativeAbsoluteError(EpochMetric):
+class MedianRelativeAbsoluteError(_QuantileEpochMetric):
     r"""Calculates the Median Relative Absolute Error.
 
     .. math::
@@ -28,7 +34,8 @@ class MedianRelativeAbsoluteError(EpochMetric):
     .. warning::
 
         Current implementation stores all input data (output and target) in as tensors before computing a metric.
-        This can potentially lead to a memory error if the input data is larger than available RAM.
+        This can potentially lead to a memory error if the input data is larger than available RAM. Use
+        ``compression`` to approximate the metric in constant memory instead.
 
     __ https://arxiv.org/abs/1809.03006
 
@@ -39,6 +46,15 @@ class MedianRelativeAbsoluteError(EpochMetric):
             you want to compute the metric with respect to one of the outputs.
             By default, metrics require the output as ``(y_pred, y)`` or ``{'y_pred': y_pred, 'y': y}``.
         device: optional device specification for internal storage.
+        quantiles: optional quantiles of the errors to compute instead of their median, numbers in ``[0, 1]``, e.g.
+            ``(0.5, 0.9, 0.99)``. If given, ``compute`` returns a tensor with the value of each quantile.
+        compression: if given, the data is not stored but the errors are accumulated in a t-digest, a mergeable
+            sketch of at most ``compression // 2 + 1`` centroids, and the median or ``quantiles`` are approximated.
+            The rank error of a quantile :math:`q` is bounded by about :math:`\pi \sqrt{q (1 - q)} / compression`,
+            i.e. 1.6% of the samples for the median and 0.3% for the 99th percentile with ``compression=100``, and
+            is much lower in practice. The mean of the targets, unknown until the end of the epoch, is then
+            estimated by the running mean of the targets received by the process. Non-finite errors, for targets
+            equal to this mean, are left out of the t-digest.
 
     Examples:
         To use with ``Engine`` and ``process_function``, simply attach the metric instance to the engine.
@@ -60,11 +76,36 @@ class MedianRelativeAbsoluteError(EpochMetric):
         .. testoutput::
 
             0.5...
+
+    .. versionchanged:: 0.6.0
+        ``quantiles`` and ``compression`` arguments are added.
     """
 
     def __init__(
-        self, output_transform: Callable = lambda x: x, device: Union[str, torch.device] = torch.device("cpu")
+        self,
+        output_transform: Callable = lambda x: x,
+        device: Union[str, torch.device] = torch.device("cpu"),
+        quantiles: Optional[Sequence[float]] = None,
+        compression: Optional[int] = None,
     ):
         super(MedianRelativeAbsoluteError, self).__init__(
-            median_relative_absolute_error_compute_fn, output_transform=output_transform, device=device
+            median_relative_absolute_error_compute_fn,
+            _relative_absolute_errors,
+            quantiles=quantiles,
+            compression=compression,
+            output_transform=output_transform,
+            device=device,
         )
+        if compression is not None:
+            self._state_dict_all_req_keys = ("_centroids", "_extrema", "_sum_of_targets", "_num_targets")
+
+    @reinit__is_reduced
+    def reset(self) -> None:
+        super(MedianRelativeAbsoluteError, self).reset()
+        self._sum_of_targets = torch.tensor(0.0, dtype=torch.float64, device=self._device)
+        self._num_targets = 0
+
+    def _batch_errors(self, y_pred: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        self._sum_of_targets += y.sum()
+        self._num_targets += y.numel()
+        return _relative_absolute_errors(y_pred, y, self._sum_of_targets / max(self._num_targets, 1))
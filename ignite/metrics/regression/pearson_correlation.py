@@ -1,14 +1,13 @@
-from typing import Callable, Tuple, Union
+from typing import Callable, Union
 
 import torch
 
 from ignite.exceptions import NotComputableError
-from ignite.metrics.metric import reinit__is_reduced, sync_all_reduce
 
-from ignite.metrics.regression._base import _BaseRegression
+from ignite.metrics.regression._base import _BaseMomentsRegression
 
 
-class PearsonCorrelation(_BaseRegression):
+class PearsonCorrelation(_BaseMomentsRegression):
     r"""Calculates the
     `Pearson correlation coefficient <https://en.wikipedia.org/wiki/Pearson_correlation_coefficient>`_.
 
@@ -54,7 +53,11 @@ class PearsonCorrelation(_BaseRegression):
 
         .. testoutput::
 
-            0.9768688678741455
+            0.9768...
+
+    .. versionchanged:: 0.6.0
+        The means and co-moments of the predictions and targets are accumulated in float64 with parallel Welford
+        updates, instead of raw sums of squares and products, and merged across processes with a single collective.
     """
 
     def __init__(
@@ -67,57 +70,17 @@ class PearsonCorrelation(_BaseRegression):
 
         self.eps = eps
 
-    _state_dict_all_req_keys = (
-        "_sum_of_y_preds",
-        "_sum_of_ys",
-        "_sum_of_y_pred_squares",
-        "_sum_of_y_squares",
-        "_sum_of_products",
-        "_num_examples",
-    )
-
-    @reinit__is_reduced
-    def reset(self) -> None:
-        self._sum_of_y_preds = torch.tensor(0.0, device=self._device)
-        self._sum_of_ys = torch.tensor(0.0, device=self._device)
-        self._sum_of_y_pred_squares = torch.tensor(0.0, device=self._device)
-        self._sum_of_y_squares = torch.tensor(0.0, device=self._device)
-        self._sum_of_products = torch.tensor(0.0, device=self._device)
-        self._num_examples = 0
-
-    def _update(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
-        y_pred, y = output[0].detach(), output[1].detach()
-        self._sum_of_y_preds += y_pred.sum().to(self._device)
-        self._sum_of_ys += y.sum().to(self._device)
-        self._sum_of_y_pred_squares += y_pred.square().sum().to(self._device)
-        self._sum_of_y_squares += y.square().sum().to(self._device)
-        self._sum_of_products += (y_pred * y).sum().to(self._device)
-        self._num_examples += y.shape[0]
-
-    @sync_all_reduce(
-        "_sum_of_y_preds",
-        "_sum_of_ys",
-        "_sum_of_y_pred_squares",
-        "_sum_of_y_squares",
-        "_sum_of_products",
-        "_num_examples",
-    )
+    def _variables(self, y_pred: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        return torch.stack([y_pred, y], dim=1)
+
     def compute(self) -> float:
-        n = self._num_examples
+        n, _, comoments = self._reduce_moments()
         if n == 0:
             raise NotComputableError("PearsonCorrelation must have at least one example before it can be computed.")
 
-        # cov = E[xy] - E[x]*E[y]
-        cov = self._sum_of_products / n - self._sum_of_y_preds * self._sum_of_ys / (n * n)
-
-        # var = E[x^2] - E[x]^2
-        y_pred_mean = self._sum_of_y_preds / n
-        y_pred_var = self._sum_of_y_pred_squares / n - y_pred_mean * y_pred_mean
-        y_pred_var = torch.clamp(y_pred_var, min=0.0)
-
-        y_mean = self._sum_of_ys / n
-        y_var = self._sum_of_y_squares / n - y_mean * y_mean
-        y_var = torch.clamp(y_var, min=0.0)
+        cov = comoments[0, 1] / n
+        y_pred_var = comoments[0, 0] / n
+        y_var = comoments[1, 1] / n
 
         r = cov / torch.clamp(torch.sqrt(y_pred_var * y_var), min=self.eps)
         return float(r.item())
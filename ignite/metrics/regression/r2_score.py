@@ -1,14 +1,11 @@
-from typing import Tuple
-
 import torch
 
 from ignite.exceptions import NotComputableError
-from ignite.metrics.metric import reinit__is_reduced, sync_all_reduce
 
-from ignite.metrics.regression._base import _BaseRegression
+from ignite.metrics.regression._base import _BaseMomentsRegression
 
 
-class R2Score(_BaseRegression):
+class R2Score(_BaseMomentsRegression):
     r"""Calculates the R-Squared, the
     `coefficient of determination <https://en.wikipedia.org/wiki/Coefficient_of_determination>`_.
 
@@ -56,27 +53,19 @@ class R2Score(_BaseRegression):
 
     .. versionchanged:: 0.4.3
         Works with DDP.
-    """
-
-    _state_dict_all_req_keys = ("_num_examples", "_sum_of_errors", "_y_sq_sum", "_y_sum")
 
-    @reinit__is_reduced
-    def reset(self) -> None:
-        self._num_examples = 0
-        self._sum_of_errors = torch.tensor(0.0, device=self._device)
-        self._y_sq_sum = torch.tensor(0.0, device=self._device)
-        self._y_sum = torch.tensor(0.0, device=self._device)
-
-    def _update(self, output: Tuple[torch.Tensor, torch.Tensor]) -> None:
-        y_pred, y = output
-        self._num_examples += y.shape[0]
-        self._sum_of_errors += torch.sum(torch.pow(y_pred - y, 2)).to(self._device)
+    .. versionchanged:: 0.6.0
+        The means and co-moments of the targets and errors are accumulated in float64 with parallel Welford updates,
+        instead of raw sums of squares, and merged across processes with a single collective.
+    """
 
-        self._y_sum += torch.sum(y).to(self._device)
-        self._y_sq_sum += torch.sum(torch.pow(y, 2)).to(self._device)
+    def _variables(self, y_pred: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        return torch.stack([y, y_pred - y], dim=1)
 
-    @sync_all_reduce("_num_examples", "_sum_of_errors", "_y_sq_sum", "_y_sum")
     def compute(self) -> float:
-        if self._num_examples == 0:
+        n, means, comoments = self._reduce_moments()
+        if n == 0:
             raise NotComputableError("R2Score must have at least one example before it can be computed.")
-        return 1 - self._sum_of_errors.item() / (self._y_sq_sum.item() - (self._y_sum.item() ** 2) / self._num_examples)
+        # the sum of squared errors is the co-moment of the errors around their mean, plus their squared mean
+        sum_of_errors = comoments[1, 1] + n * means[1] ** 2
+        return 1 - sum_of_errors.item() / comoments[0, 0].item()
@@ -1,31 +1,25 @@
-from typing import Any, Callable, cast, Tuple, Union
+from typing import Any, Callable, cast, Optional, Tuple, Union
 
 import torch
 
 from ignite import distributed as idist
 from ignite.exceptions import NotComputableError
-from ignite.metrics.epoch_metric import EpochMetric
+from ignite.metrics._ranking import binned_roc_auc_score, binned_roc_curve, roc_auc_score, roc_curve
+from ignite.metrics.epoch_metric import _RankingEpochMetric
 
 
 def roc_auc_compute_fn(y_preds: torch.Tensor, y_targets: torch.Tensor) -> float:
-    from sklearn.metrics import roc_auc_score
-
-    y_true = y_targets.cpu().numpy()
-    y_pred = y_preds.cpu().numpy()
-    return roc_auc_score(y_true, y_pred)
+    return roc_auc_score(y_preds, y_targets)
 
 
 def roc_auc_curve_compute_fn(y_preds: torch.Tensor, y_targets: torch.Tensor) -> Tuple[Any, Any, Any]:
-    from sklearn.metrics import roc_curve
-
-    y_true = y_targets.cpu().numpy()
-    y_pred = y_preds.cpu().numpy()
-    return roc_curve(y_true, y_pred)
+    return roc_curve(y_preds, y_targets)
 
 
-class ROC_AUC(EpochMetric):
+class ROC_AUC(_RankingEpochMetric):
     """Computes Area Under the Receiver Operating Characteristic Curve (ROC AUC)
-    accumulating predictions and the ground-truth during an epoch and applying
+    accumulating predictions and the ground-truth during an epoch. The result is computed with torch on the device
+    of the stored data and matches
     `sklearn.metrics.roc_auc_score <https://scikit-learn.org/stable/modules/generated/
     sklearn.metrics.roc_auc_score.html#sklearn.metrics.roc_auc_score>`_ .
 
@@ -34,19 +28,31 @@ class ROC_AUC(EpochMetric):
             :class:`~ignite.engine.engine.Engine`'s ``process_function``'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
-        check_compute_fn: Default False. If True, `roc_curve
-            <https://scikit-learn.org/stable/modules/generated/sklearn.metrics.roc_auc_score.html#
-            sklearn.metrics.roc_auc_score>`_ is run on the first batch of data to ensure there are
-            no issues. User will be warned in case there are any issues computing the function.
+        check_compute_fn: Default False. If True, ``roc_auc_score``, the torch implementation computing
+            the metric, is run on the first batch of data to ensure there are no issues. User will be warned in case
+            there are any issues computing the function. Not applicable if ``num_bins`` is given.
         device: optional device specification for internal storage.
         skip_unrolling: specifies whether output should be unrolled before being fed to update method. Should be
             true for multi-output model, for example, if ``y_pred`` contains multi-ouput as ``(y_pred_a, y_pred_b)``
             Alternatively, ``output_transform`` can be used to handle this.
+        buffered: if True, predictions and targets are stored in geometrically growing contiguous buffers. See
+            :class:`~ignite.metrics.epoch_metric.EpochMetric`. Default, False.
+        mmap_dir: optional directory where the buffers are stored as memory-mapped files. Implies ``buffered=True``.
+        predictions_dtype: optional dtype to store the predictions with, e.g. ``torch.float16``.
+            Implies ``buffered=True``.
+        targets_dtype: optional dtype to store the targets with, e.g. ``torch.uint8``. Implies ``buffered=True``.
+        num_bins: optional number of thresholds evenly spaced in ``[0, 1]``. If given, the metric is approximated
+            from per-class histograms of the scores over these thresholds instead of storing all the data: memory is
+            O(num_bins), ``update`` is a single scatter-add and processes are synchronized with an ``all_reduce``.
+            The result is then exact for scores rounded down to the thresholds. Scores out of ``[0, 1]`` are clipped
+            and storage arguments are ignored. Default, None.
 
     Note:
 
         ROC_AUC expects y to be comprised of 0's and 1's. y_pred must either be probability estimates or confidence
-        values. To apply an activation to y_pred, use output_transform as shown below:
+        values. For multilabel inputs of shape ``(batch_size, n_classes)`` and multiclass inputs, i.e. y of shape
+        ``(batch_size, )`` with class indices and y_pred of shape ``(batch_size, n_classes)``, the scores of each
+        class (one-vs-rest) are macro averaged. To apply an activation to y_pred, use output_transform as shown below:
 
         .. code-block:: python
 
@@ -77,6 +83,10 @@ class ROC_AUC(EpochMetric):
 
     .. versionchanged:: 0.5.1
         ``skip_unrolling`` argument is added.
+
+    .. versionchanged:: 0.6.0
+        ``buffered``, ``mmap_dir``, ``predictions_dtype``, ``targets_dtype`` and ``num_bins`` arguments are added.
+        The metric is computed with torch, scikit-learn is no longer required.
     """
 
     def __init__(
@@ -85,24 +95,31 @@ class ROC_AUC(EpochMetric):
         check_compute_fn: bool = False,
         device: Union[str, torch.device] = torch.device("cpu"),
         skip_unrolling: bool = False,
+        buffered: bool = False,
+        mmap_dir: Optional[str] = None,
+        predictions_dtype: Optional[torch.dtype] = None,
+        targets_dtype: Optional[torch.dtype] = None,
+        num_bins: Optional[int] = None,
     ):
-        try:
-            from sklearn.metrics import roc_auc_score  # noqa: F401
-        except ImportError:
-            raise ModuleNotFoundError("This contrib module requires scikit-learn to be installed.")
-
         super(ROC_AUC, self).__init__(
             roc_auc_compute_fn,
+            binned_roc_auc_score,
+            num_bins=num_bins,
             output_transform=output_transform,
             check_compute_fn=check_compute_fn,
             device=device,
             skip_unrolling=skip_unrolling,
+            buffered=buffered,
+            mmap_dir=mmap_dir,
+            predictions_dtype=predictions_dtype,
+            targets_dtype=targets_dtype,
         )
 
 
-class RocCurve(EpochMetric):
+class RocCurve(_RankingEpochMetric):
     """Compute Receiver operating characteristic (ROC) for binary classification task
-    by accumulating predictions and the ground-truth during an epoch and applying
+    by accumulating predictions and the ground-truth during an epoch. The result is computed with torch on the device
+    of the stored data and matches
     `sklearn.metrics.roc_curve <https://scikit-learn.org/stable/modules/generated/
     sklearn.metrics.roc_curve.html#sklearn.metrics.roc_curve>`_ .
 
@@ -111,14 +128,24 @@ class RocCurve(EpochMetric):
             :class:`~ignite.engine.engine.Engine`'s ``process_function``'s output into the
             form expected by the metric. This can be useful if, for example, you have a multi-output model and
             you want to compute the metric with respect to one of the outputs.
-        check_compute_fn: Default False. If True, `sklearn.metrics.roc_curve
-            <https://scikit-learn.org/stable/modules/generated/sklearn.metrics.roc_curve.html#
-            sklearn.metrics.roc_curve>`_ is run on the first batch of data to ensure there are
-            no issues. User will be warned in case there are any issues computing the function.
+        check_compute_fn: Default False. If True, ``roc_curve``, the torch implementation computing
+            the metric, is run on the first batch of data to ensure there are no issues. User will be warned in case
+            there are any issues computing the function. Not applicable if ``num_bins`` is given.
         device: optional device specification for internal storage.
         skip_unrolling: specifies whether output should be unrolled before being fed to update method. Should be
             true for multi-output model, for example, if ``y_pred`` contains multi-ouput as ``(y_pred_a, y_pred_b)``
             Alternatively, ``output_transform`` can be used to handle this.
+        buffered: if True, predictions and targets are stored in geometrically growing contiguous buffers. See
+            :class:`~ignite.metrics.epoch_metric.EpochMetric`. Default, False.
+        mmap_dir: optional directory where the buffers are stored as memory-mapped files. Implies ``buffered=True``.
+        predictions_dtype: optional dtype to store the predictions with, e.g. ``torch.float16``.
+            Implies ``buffered=True``.
+        targets_dtype: optional dtype to store the targets with, e.g. ``torch.uint8``. Implies ``buffered=True``.
+        num_bins: optional number of thresholds evenly spaced in ``[0, 1]``. If given, the metric is approximated
+            from per-class histograms of the scores over these thresholds instead of storing all the data: memory is
+            O(num_bins), ``update`` is a single scatter-add and processes are synchronized with an ``all_reduce``.
+            The result is then exact for scores rounded down to the thresholds. Scores out of ``[0, 1]`` are clipped
+            and storage arguments are ignored. Default, None.
 
     Note:
         RocCurve expects y to be comprised of 0's and 1's. y_pred must either be probability estimates or confidence
@@ -160,6 +187,10 @@ class RocCurve(EpochMetric):
 
     .. versionchanged:: 0.5.1
         ``skip_unrolling`` argument is added.
+
+    .. versionchanged:: 0.6.0
+        ``buffered``, ``mmap_dir``, ``predictions_dtype``, ``targets_dtype`` and ``num_bins`` arguments are added.
+        The metric is computed with torch, scikit-learn is no longer required.
     """
 
     def __init__(
@@ -168,39 +199,40 @@ class RocCurve(EpochMetric):
         check_compute_fn: bool = False,
         device: Union[str, torch.device] = torch.device("cpu"),
         skip_unrolling: bool = False,
+        buffered: bool = False,
+        mmap_dir: Optional[str] = None,
+        predictions_dtype: Optional[torch.dtype] = None,
+        targets_dtype: Optional[torch.dtype] = None,
+        num_bins: Optional[int] = None,
     ) -> None:
-        try:
-            from sklearn.metrics import roc_curve  # noqa: F401
-        except ImportError:
-            raise ModuleNotFoundError("This contrib module requires scikit-learn to be installed.")
-
         super(RocCurve, self).__init__(
-            roc_auc_curve_compute_fn,  # type: ignore[arg-type]
+            roc_auc_curve_compute_fn,
+            binned_roc_curve,
+            num_bins=num_bins,
             output_transform=output_transform,
             check_compute_fn=check_compute_fn,
             device=device,
             skip_unrolling=skip_unrolling,
+            buffered=buffered,
+            mmap_dir=mmap_dir,
+            predictions_dtype=predictions_dtype,
+            targets_dtype=targets_dtype,
         )
 
     def compute(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:  # type: ignore[override]
+        if self._num_bins is not None:
+            return self._compute_binned()
+
         if len(self._predictions) < 1 or len(self._targets) < 1:
             raise NotComputableError("RocCurve must have at least one example before it can be computed.")
 
-        _prediction_tensor = torch.cat(self._predictions, dim=0)
-        _target_tensor = torch.cat(self._targets, dim=0)
+        _prediction_tensor, _target_tensor = self._gather_stored_data()
 
         ws = idist.get_world_size()
-        if ws > 1:
-            # All gather across all processes
-            _prediction_tensor = cast(torch.Tensor, idist.all_gather(_prediction_tensor))
-            _target_tensor = cast(torch.Tensor, idist.all_gather(_target_tensor))
 
         if idist.get_rank() == 0:
             # Run compute_fn on zero rank only
             fpr, tpr, thresholds = cast(Tuple, self.compute_fn(_prediction_tensor, _target_tensor))
-            fpr = torch.tensor(fpr, device=_prediction_tensor.device)
-            tpr = torch.tensor(tpr, device=_prediction_tensor.device)
-            thresholds = torch.tensor(thresholds, device=_prediction_tensor.device)
         else:
             fpr, tpr, thresholds = None, None, None
 
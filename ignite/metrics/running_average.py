@@ -30,6 +30,16 @@ class RunningAverage(Metric):
         skip_unrolling: specifies whether output should be unrolled before being fed to update method. Should be
             true for multi-output model, for example, if ``y_pred`` contains multi-ouput as ``(y_pred_a, y_pred_b)``
             Alternatively, ``output_transform`` can be used to handle this.
+        keep_on_device: if True and the running average of ``engine.state.output`` is accumulated on a non-CPU
+            device, the computed value is stored in ``engine.state.metrics`` as a 0-d tensor on that device instead
+            of a Python number, to avoid a device-to-host synchronization on each iteration. The value is converted
+            by the loggers when it is logged. See the example below. Default, False.
+        sync_every: if greater than 1 and ``src`` is None, each process accumulates the running average of its own
+            outputs, and the processes synchronize the value every ``sync_every`` updates, instead of reducing the
+            output on every iteration. As the running average is linear, the synchronized value is exactly the
+            running average of the outputs averaged across processes. In between, the computed value is the one of
+            the last synchronization, use a logging period multiple of ``sync_every`` to log up-to-date values.
+            Default, 1.
 
     Examples:
 
@@ -88,8 +98,24 @@ class RunningAverage(Metric):
             0.038423...
             0.057655...
 
+        Keep the loss on the device during the training and convert it to a number only when it is logged:
+
+        .. code-block:: python
+
+            trainer = create_supervised_trainer(
+                model, optimizer, loss_fn, device="cuda", output_transform=lambda x, y, y_pred, loss: loss.detach()
+            )
+            RunningAverage(output_transform=lambda x: x, device="cuda", keep_on_device=True).attach(trainer, "loss")
+            ProgressBar().attach(trainer, metric_names=["loss"])
+            tb_logger.attach_output_handler(
+                trainer, Events.ITERATION_COMPLETED(every=100), tag="training", metric_names=["loss"]
+            )
+
     .. versionchanged:: 0.5.1
         ``skip_unrolling`` argument is added.
+
+    .. versionchanged:: 0.6.0
+        ``keep_on_device`` and ``sync_every`` arguments are added.
     """
 
     required_output_keys = None
@@ -103,11 +129,17 @@ class RunningAverage(Metric):
         epoch_bound: Optional[bool] = None,
         device: Optional[Union[str, torch.device]] = None,
         skip_unrolling: bool = False,
+        keep_on_device: bool = False,
+        sync_every: int = 1,
     ):
         if not (isinstance(src, Metric) or src is None):
             raise TypeError("Argument src should be a Metric or None.")
         if not (0.0 < alpha <= 1.0):
             raise ValueError("Argument alpha should be a float between 0.0 and 1.0.")
+        if not (isinstance(sync_every, int) and sync_every >= 1):
+            raise ValueError(f"Argument sync_every should be a positive integer, but given {sync_every}")
+        if isinstance(src, Metric) and sync_every != 1:
+            raise ValueError("Argument sync_every should be 1 if src is a Metric.")
 
         if isinstance(src, Metric):
             if output_transform is not None:
@@ -138,6 +170,8 @@ class RunningAverage(Metric):
             )
         self.epoch_bound = epoch_bound
         self.alpha = alpha
+        self.keep_on_device = keep_on_device
+        self.sync_every = sync_every
         super(RunningAverage, self).__init__(
             output_transform=output_transform, device=device, skip_unrolling=skip_unrolling
         )
@@ -145,14 +179,18 @@ class RunningAverage(Metric):
     @reinit__is_reduced
     def reset(self) -> None:
         self._value: Optional[Union[float, torch.Tensor]] = None
+        # running average across processes, at the last synchronization, if sync_every > 1
+        self._synced_value: Optional[Union[float, torch.Tensor]] = None
+        self._num_updates = 0
         if isinstance(self.src, Metric):
             self.src.reset()
 
     @reinit__is_reduced
     def update(self, output: Union[torch.Tensor, float]) -> None:
+        local = self.src is None and self.sync_every > 1
         if self.src is None:
             output = output.detach().to(self._device, copy=True) if isinstance(output, torch.Tensor) else output
-            value = idist.all_reduce(output) / idist.get_world_size()
+            value = output if local else idist.all_reduce(output) / idist.get_world_size()
         else:
             value = self.src.compute()
             self.src.reset()
@@ -162,9 +200,27 @@ class RunningAverage(Metric):
         else:
             self._value = self._value * self.alpha + (1.0 - self.alpha) * value
 
+        if local:
+            self._num_updates += 1
+            # all processes update the metric the same number of times and synchronize at the same updates
+            if self._synced_value is None or self._num_updates % self.sync_every == 0:
+                value = self._value.clone() if isinstance(self._value, torch.Tensor) else self._value
+                self._synced_value = idist.all_reduce(value) / idist.get_world_size()
+
     def compute(self) -> Union[torch.Tensor, float]:
+        if self.src is None and self.sync_every > 1:
+            return cast(Union[torch.Tensor, float], self._synced_value)
         return cast(Union[torch.Tensor, float], self._value)
 
+    def completed(self, engine: Engine, name: str) -> None:
+        result = self.compute()
+        keep_on_device = self.keep_on_device and self.src is None
+        if keep_on_device and isinstance(result, torch.Tensor) and result.device.type != "cpu":
+            # no host synchronization here, loggers convert the value when they log it
+            engine.state.metrics[name] = result
+        else:
+            super().completed(engine, name)
+
     def attach(self, engine: Engine, name: str, usage: Union[str, MetricUsage] = RunningBatchWise()) -> None:
         r"""
         Attach the metric to the ``engine`` using the events determined by the ``usage``.
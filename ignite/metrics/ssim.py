@@ -1,5 +1,5 @@
 import warnings
-from typing import Callable, Optional, Sequence, Union
+from typing import Callable, Optional, Sequence, Tuple, Union
 
 import torch
 import torch.nn.functional as F
@@ -7,7 +7,7 @@ import torch.nn.functional as F
 from ignite.exceptions import NotComputableError
 from ignite.metrics.metric import Metric, reinit__is_reduced, sync_all_reduce
 
-__all__ = ["SSIM"]
+__all__ = ["SSIM", "MultiScaleSSIM"]
 
 
 class SSIM(Metric):
@@ -36,6 +36,12 @@ class SSIM(Metric):
         skip_unrolling: specifies whether output should be unrolled before being fed to update method. Should be
             true for multi-output model, for example, if ``y_pred`` contains multi-ouput as ``(y_pred_a, y_pred_b)``
             Alternatively, ``output_transform`` can be used to handle this.
+        channels_last: if True, inputs are converted to the channels last memory format before being filtered,
+            which is several times faster on CPU. Default, False.
+
+    The kernel is separable: local means and second moments are computed with two 1D convolutions along the height
+    and the width, one moment at a time, such that the memory used by ``update`` is a few times the size of the
+    inputs.
 
     Examples:
         To use with ``Engine`` and ``process_function``, simply attach the metric instance to the engine.
@@ -68,6 +74,9 @@ class SSIM(Metric):
 
     .. versionchanged:: 0.5.1
         ``skip_unrolling`` argument is added.
+
+    .. versionchanged:: 0.6.0
+        ``channels_last`` argument is added.
     """
 
     _state_dict_all_req_keys = ("_sum_of_ssim", "_num_examples", "_kernel")
@@ -83,6 +92,7 @@ class SSIM(Metric):
         output_transform: Callable = lambda x: x,
         device: Union[str, torch.device] = torch.device("cpu"),
         skip_unrolling: bool = False,
+        channels_last: bool = False,
     ):
         if isinstance(kernel_size, int):
             self.kernel_size: Sequence[int] = [kernel_size, kernel_size]
@@ -106,6 +116,7 @@ class SSIM(Metric):
 
         super(SSIM, self).__init__(output_transform=output_transform, device=device, skip_unrolling=skip_unrolling)
         self.gaussian = gaussian
+        self.channels_last = channels_last
         self.data_range = data_range
         self.c1 = (k1 * data_range) ** 2
         self.c2 = (k2 * data_range) ** 2
@@ -113,6 +124,7 @@ class SSIM(Metric):
         self.pad_w = (self.kernel_size[1] - 1) // 2
         self._kernel_2d = self._gaussian_or_uniform_kernel(kernel_size=self.kernel_size, sigma=self.sigma)
         self._kernel: Optional[torch.Tensor] = None
+        self._separable_kernels: Optional[Tuple[torch.Tensor, torch.Tensor, torch.Tensor]] = None
 
     @reinit__is_reduced
     def reset(self) -> None:
@@ -146,8 +158,7 @@ class SSIM(Metric):
 
         return torch.matmul(kernel_x.t(), kernel_y)  # (kernel_size, 1) * (1, kernel_size)
 
-    @reinit__is_reduced
-    def update(self, output: Sequence[torch.Tensor]) -> None:
+    def _prepare_inputs(self, output: Sequence[torch.Tensor]) -> Tuple[torch.Tensor, torch.Tensor]:
         y_pred, y = output[0].detach(), output[1].detach()
 
         if y_pred.dtype != y.dtype:
@@ -188,31 +199,63 @@ class SSIM(Metric):
                 y_pred = y_pred.to(device=self._kernel.device)
                 y = y.to(device=self._kernel.device)
 
+        if y_pred.dtype != self._kernel.dtype:
+            self._kernel = self._kernel.to(dtype=y_pred.dtype)
+
+        if self.channels_last:
+            y_pred = y_pred.contiguous(memory_format=torch.channels_last)
+            y = y.contiguous(memory_format=torch.channels_last)
+
+        return y_pred, y
+
+    def _get_separable_kernels(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        kernel: torch.Tensor = self._kernel  # type: ignore[assignment]
+        if self._separable_kernels is None or self._separable_kernels[0] is not kernel:
+            # the 2D kernel is the outer product of a kernel along the height and a kernel along the width
+            kernel_h = kernel.sum(dim=3, keepdim=True) / kernel.sum(dim=(2, 3), keepdim=True)
+            kernel_w = kernel.sum(dim=2, keepdim=True)
+            self._separable_kernels = (kernel, kernel_h, kernel_w)
+        return self._separable_kernels[1], self._separable_kernels[2]
+
+    def _luminance_and_contrast_structure(
+        self, y_pred: torch.Tensor, y: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Computes the luminance and the contrast-structure maps, whose product is the SSIM map."""
+        nb_channel = y_pred.size(1)
+        kernel_h, kernel_w = self._get_separable_kernels()
+
         y_pred = F.pad(y_pred, [self.pad_w, self.pad_w, self.pad_h, self.pad_h], mode="reflect")
         y = F.pad(y, [self.pad_w, self.pad_w, self.pad_h, self.pad_h], mode="reflect")
 
-        if y_pred.dtype != self._kernel.dtype:
-            self._kernel = self._kernel.to(dtype=y_pred.dtype)
+        def local_mean(x: torch.Tensor) -> torch.Tensor:
+            return F.conv2d(F.conv2d(x, kernel_h, groups=nb_channel), kernel_w, groups=nb_channel)
 
-        input_list = [y_pred, y, y_pred * y_pred, y * y, y_pred * y]
-        outputs = F.conv2d(torch.cat(input_list), self._kernel, groups=nb_channel)
-        batch_size = y_pred.size(0)
-        output_list = [outputs[x * batch_size : (x + 1) * batch_size] for x in range(len(input_list))]
+        mu_pred = local_mean(y_pred)
+        mu_target = local_mean(y)
+        mu_pred_sq = mu_pred.pow(2)
+        mu_target_sq = mu_target.pow(2)
+        mu_pred_target = mu_pred * mu_target
+        del mu_pred, mu_target
 
-        mu_pred_sq = output_list[0].pow(2)
-        mu_target_sq = output_list[1].pow(2)
-        mu_pred_target = output_list[0] * output_list[1]
+        luminance = (2 * mu_pred_target + self.c1) / (mu_pred_sq + mu_target_sq + self.c1)
 
-        sigma_pred_sq = output_list[2] - mu_pred_sq
-        sigma_target_sq = output_list[3] - mu_target_sq
-        sigma_pred_target = output_list[4] - mu_pred_target
+        # second moments are computed one at a time, such that the products of the inputs are freed
+        sigma_pred_target = local_mean(y_pred * y) - mu_pred_target
+        del mu_pred_target
+        sigma_sq_sum = local_mean(y_pred * y_pred) - mu_pred_sq
+        del mu_pred_sq
+        sigma_sq_sum += local_mean(y * y) - mu_target_sq
+        del mu_target_sq
 
-        a1 = 2 * mu_pred_target + self.c1
-        a2 = 2 * sigma_pred_target + self.c2
-        b1 = mu_pred_sq + mu_target_sq + self.c1
-        b2 = sigma_pred_sq + sigma_target_sq + self.c2
+        contrast_structure = (2 * sigma_pred_target + self.c2) / (sigma_sq_sum + self.c2)
+        return luminance, contrast_structure
 
-        ssim_idx = (a1 * a2) / (b1 * b2)
+    @reinit__is_reduced
+    def update(self, output: Sequence[torch.Tensor]) -> None:
+        y_pred, y = self._prepare_inputs(output)
+
+        luminance, contrast_structure = self._luminance_and_contrast_structure(y_pred, y)
+        ssim_idx = luminance.mul_(contrast_structure)
         self._sum_of_ssim += torch.mean(ssim_idx, (1, 2, 3), dtype=torch.float64).sum().to(device=self._device)
 
         self._num_examples += y.shape[0]
@@ -220,5 +263,139 @@ class SSIM(Metric):
     @sync_all_reduce("_sum_of_ssim", "_num_examples")
     def compute(self) -> float:
         if self._num_examples == 0:
-            raise NotComputableError("SSIM must have at least one example before it can be computed.")
+            raise NotComputableError(
+                f"{self.__class__.__name__} must have at least one example before it can be computed."
+            )
         return (self._sum_of_ssim / self._num_examples).item()
+
+
+class MultiScaleSSIM(SSIM):
+    """
+    Computes Multi-Scale Structural Similarity Index Measure, as described in `Multi-scale structural similarity
+    for image quality assessment`__.
+
+    __ https://ieeexplore.ieee.org/document/1292216
+
+    The images are downsampled by a factor 2 between scales. The contrast-structure term is averaged over each
+    image at every scale, and the luminance term only at the last scale. The metric value of an image is
+
+    .. math::
+        \\text{MS-SSIM} = \\text{SSIM}_M^{\\beta_M} \\prod_{j=1}^{M-1} \\text{cs}_j^{\\beta_j}
+
+    where :math:`M` is the number of scales and negative values of the terms are clamped to zero. The metric is
+    the average over the images.
+
+    - ``update`` must receive output of the form ``(y_pred, y)``. They have to be of the same type.
+        Valid :class:`torch.dtype` are the following:
+        - on CPU: `torch.float32`, `torch.float64`.
+        - on CUDA: `torch.float16`, `torch.bfloat16`, `torch.float32`, `torch.float64`.
+    - the height and the width of the images at the last scale must be larger than half the kernel size.
+
+    Args:
+        data_range: Range of the image. Typically, ``1.0`` or ``255``.
+        kernel_size: Size of the kernel. Default: (11, 11)
+        sigma: Standard deviation of the gaussian kernel.
+            Argument is used if ``gaussian=True``. Default: (1.5, 1.5)
+        k1: Parameter of SSIM. Default: 0.01
+        k2: Parameter of SSIM. Default: 0.03
+        gaussian: ``True`` to use gaussian kernel, ``False`` to use uniform kernel
+        betas: Exponents of the terms of each scale, the number of scales is the length of ``betas``.
+            Default: (0.0448, 0.2856, 0.3001, 0.2363, 0.1333)
+        output_transform: A callable that is used to transform the
+            :class:`~ignite.engine.engine.Engine`'s ``process_function``'s output into the
+            form expected by the metric.
+        device: specifies which device updates are accumulated on. Setting the metric's
+            device to be the same as your ``update`` arguments ensures the ``update`` method is non-blocking. By
+            default, CPU.
+        skip_unrolling: specifies whether output should be unrolled before being fed to update method. Should be
+            true for multi-output model, for example, if ``y_pred`` contains multi-ouput as ``(y_pred_a, y_pred_b)``
+            Alternatively, ``output_transform`` can be used to handle this.
+        channels_last: if True, inputs are converted to the channels last memory format before being filtered,
+            which is several times faster on CPU. Default, False.
+
+    Examples:
+        To use with ``Engine`` and ``process_function``, simply attach the metric instance to the engine.
+        The output of the engine's ``process_function`` needs to be in the format of
+        ``(y_pred, y)`` or ``{'y_pred': y_pred, 'y': y, ...}``. If not, ``output_tranform`` can be added
+        to the metric to transform the output into the form expected by the metric.
+
+        For more information on how metric works with :class:`~ignite.engine.engine.Engine`, visit :ref:`attach-engine`.
+
+        .. include:: defaults.rst
+            :start-after: :orphan:
+
+        .. testcode::
+
+            metric = MultiScaleSSIM(data_range=1.0)
+            metric.attach(default_evaluator, 'ms_ssim')
+            preds = torch.rand([4, 3, 256, 256])
+            target = preds * 0.75
+            state = default_evaluator.run([[preds, target]])
+            print(state.metrics['ms_ssim'])
+
+        .. testoutput::
+
+            0.9...
+
+    .. versionadded:: 0.6.0
+    """
+
+    def __init__(
+        self,
+        data_range: Union[int, float],
+        kernel_size: Union[int, Sequence[int]] = (11, 11),
+        sigma: Union[float, Sequence[float]] = (1.5, 1.5),
+        k1: float = 0.01,
+        k2: float = 0.03,
+        gaussian: bool = True,
+        betas: Sequence[float] = (0.0448, 0.2856, 0.3001, 0.2363, 0.1333),
+        output_transform: Callable = lambda x: x,
+        device: Union[str, torch.device] = torch.device("cpu"),
+        skip_unrolling: bool = False,
+        channels_last: bool = False,
+    ):
+        if len(betas) < 1:
+            raise ValueError("Argument betas should be a non-empty sequence of float.")
+        self.betas = tuple(betas)
+        super(MultiScaleSSIM, self).__init__(
+            data_range,
+            kernel_size=kernel_size,
+            sigma=sigma,
+            k1=k1,
+            k2=k2,
+            gaussian=gaussian,
+            output_transform=output_transform,
+            device=device,
+            skip_unrolling=skip_unrolling,
+            channels_last=channels_last,
+        )
+
+    @reinit__is_reduced
+    def update(self, output: Sequence[torch.Tensor]) -> None:
+        y_pred, y = self._prepare_inputs(output)
+
+        num_scales = len(self.betas)
+        height, width = y_pred.shape[-2] >> (num_scales - 1), y_pred.shape[-1] >> (num_scales - 1)
+        if height <= self.pad_h or width <= self.pad_w:
+            raise ValueError(
+                f"Expected y_pred and y to have a size larger than {self.pad_h} x {self.pad_w} at the last of "
+                f"{num_scales} scales, but got {height} x {width}. "
+                "Use larger images, a smaller kernel_size or fewer betas."
+            )
+
+        # (batch_size, num_scales) per-image average of contrast-structure, and of SSIM at the last scale
+        values = []
+        for i in range(num_scales):
+            if i > 0:
+                y_pred = F.avg_pool2d(y_pred, kernel_size=2)
+                y = F.avg_pool2d(y, kernel_size=2)
+            luminance, contrast_structure = self._luminance_and_contrast_structure(y_pred, y)
+            if i == num_scales - 1:
+                contrast_structure = luminance.mul_(contrast_structure)
+            values.append(torch.mean(contrast_structure, (1, 2, 3), dtype=torch.float64))
+
+        betas = torch.tensor(self.betas, dtype=torch.float64, device=y_pred.device)
+        ms_ssim = torch.stack(values, dim=1).relu().pow(betas).prod(dim=1)
+        self._sum_of_ssim += ms_ssim.sum().to(device=self._device)
+
+        self._num_examples += y.shape[0]
@@ -193,6 +193,13 @@ def _test_distrib_all_gather(device):
         true_res[i * 4 : (i + 1) * 4, ...] = torch.arange(100, device=device).reshape(4, 25) * (i + 1)
     assert (res == true_res).all()
 
+    # different first dimensions, rank 0 holds an empty tensor
+    t = torch.arange(3 * rank, device=device).reshape(rank, 3)
+    res = idist.all_gather(t)
+    true_res = torch.cat([torch.arange(3 * i, device=device).reshape(i, 3) for i in range(ws)])
+    assert res.dtype == t.dtype
+    assert torch.equal(res, true_res)
+
     if ws > 1 and idist.backend() != "xla-tpu":
         t = {
             "a": [rank + 1, rank + 2, torch.tensor(rank + 3, device=device)],
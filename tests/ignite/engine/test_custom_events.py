@@ -462,6 +462,61 @@ def test_every_before_and_after_event_filter_with_engine(event_name, event_attr,
     assert num_calls == expect_calls
 
 
+@pytest.mark.parametrize(
+    "event_filter",
+    [
+        CallableEventWithFilter.every_event_filter(3),
+        CallableEventWithFilter.once_event_filter([2, 7, 11]),
+        CallableEventWithFilter.before_and_after_event_filter(10, 3),
+        CallableEventWithFilter.before_and_after_event_filter(None, 3),
+        CallableEventWithFilter.before_and_after_event_filter(10, None),
+        CallableEventWithFilter.every_before_and_after_event_filter(4, 25, 5),
+        CallableEventWithFilter.every_before_and_after_event_filter(4, None, None),
+    ],
+)
+def test_builtin_event_filters_next_event(event_filter):
+    values = range(0, 40)
+    fired = [v for v in values if event_filter(None, v)]
+    for v in values:
+        expected = next((f for f in fired if f >= v), None)
+        if expected is None:
+            assert event_filter._next_event(v) is None or event_filter._next_event(v) >= values[-1]
+        else:
+            assert event_filter._next_event(v) == expected
+
+
+def test_scheduled_filtered_handlers_are_not_called_until_due():
+    engine = Engine(lambda e, b: 1)
+    calls = []
+
+    def handler(engine):
+        calls.append(engine.state.iteration)
+
+    engine.add_event_handler(Events.ITERATION_COMPLETED(every=5), handler)
+    ((wrapper, _, _),) = engine._event_handlers[Events.ITERATION_COMPLETED]
+    wrapped = MagicMock(wraps=wrapper)
+    wrapped._next_event = wrapper._next_event
+    engine._event_handlers[Events.ITERATION_COMPLETED][0] = (wrapped, (engine,), {})
+    engine._invalidate_compiled_event_handlers()
+
+    engine.run(range(12), max_epochs=2)
+    assert calls == [5, 10, 15, 20]
+    assert wrapped.call_count == 4
+
+    # new run restarts counters, schedule should follow
+    engine.run(range(12), max_epochs=2)
+    assert calls == [5, 10, 15, 20] * 2
+    assert wrapped.call_count == 8
+
+    # the same event fired again without changing the counter
+    engine.state.iteration = 20
+    engine.fire_event(Events.ITERATION_COMPLETED)
+    assert calls[-2:] == [20, 20]
+    engine.state.iteration = 3
+    engine.fire_event(Events.ITERATION_COMPLETED)
+    assert len(calls) == 9
+
+
 @pytest.mark.parametrize(
     "event_name, event_attr, once, expect_calls",
     [
@@ -14,6 +14,7 @@ from torch.utils.data import BatchSampler, DataLoader, RandomSampler
 import ignite.distributed as idist
 from ignite.engine import Events
 from ignite.engine.deterministic import (
+    _repr_rng_state,
     _set_rng_states,
     DeterministicEngine,
     keep_random_state,
@@ -890,3 +891,67 @@ def test_state_dict():
     assert "max_epochs" in sd and sd["max_epochs"] is None
     assert "epoch_length" in sd and sd["epoch_length"] is None
     assert "rng_states" in sd and sd["rng_states"] is not None
+
+
+@pytest.mark.parametrize("resume_iteration", [None, 13])
+def test_prefetch_keeps_dataflow(resume_iteration):
+    def random_train_data_loader(size):
+        data = torch.arange(0, size)
+        return DataLoader(data, batch_size=4, shuffle=True)
+
+    def run(prefetch, from_iteration=None):
+        batches = []
+        engine = DeterministicEngine(lambda e, b: batches.append(b.tolist()))
+        if prefetch:
+            engine.set_prefetch(num_batches=2)
+            assert not engine._prefetch_kwargs["use_thread"]
+        if from_iteration is not None:
+            engine.load_state_dict(
+                {"iteration": from_iteration, "epoch_length": 10, "max_epochs": 3, "rng_states": None}
+            )
+        manual_seed(12)
+        engine.run(random_train_data_loader(40), max_epochs=3)
+        return batches
+
+    expected = run(prefetch=False)
+    assert run(prefetch=True) == expected
+    if resume_iteration is not None:
+        assert run(prefetch=True, from_iteration=resume_iteration) == expected[resume_iteration:]
+
+
+def test_prefetch_random_transform_resume_in_the_middle():
+    class RandomTransformDataset(torch.utils.data.Dataset):
+        def __len__(self):
+            return 20
+
+        def __getitem__(self, index):
+            return index + torch.rand(1).item()
+
+    def run(prefetch, resume_state_dict=None, save_at=None):
+        batches, saved = [], {}
+
+        def update(engine, batch):
+            # random numbers are drawn by the model too, e.g. dropout
+            batches.append(batch.tolist() + torch.rand(1).tolist())
+            if engine.state.iteration == save_at:
+                saved.update(engine.state_dict())
+
+        engine = DeterministicEngine(update)
+        if prefetch:
+            engine.set_prefetch(num_batches=2, device="cpu")
+        if resume_state_dict is not None:
+            engine.load_state_dict(resume_state_dict)
+        manual_seed(12)
+        engine.run(DataLoader(RandomTransformDataset(), batch_size=4, shuffle=True), max_epochs=2)
+        return batches, saved
+
+    expected, state_dict = run(prefetch=False, save_at=7)
+    batches, prefetch_state_dict = run(prefetch=True, save_at=7)
+    assert batches == expected
+    assert _repr_rng_state(prefetch_state_dict["rng_states"]) == _repr_rng_state(state_dict["rng_states"])
+
+    # random states are restored before the first batch is fetched
+    expected, _ = run(prefetch=False, resume_state_dict=state_dict)
+    batches, _ = run(prefetch=True, resume_state_dict=state_dict)
+    assert len(batches) == 3
+    assert batches == expected
@@ -1407,3 +1407,104 @@ def test_engine_interrupt_restart():
     state = engine.run(data, max_epochs=max_epochs)
     assert state.iteration == max_epochs * len(data) and state.epoch == max_epochs
     assert num_calls_check_iter_epoch == 1
+
+
+@pytest.mark.parametrize("use_thread", [True, False])
+@pytest.mark.parametrize("num_batches", [1, 3])
+@pytest.mark.parametrize("epoch_length", [None, 7, 15])
+def test_engine_prefetch(use_thread, num_batches, epoch_length):
+    data = list(range(10))
+    max_epochs = 3
+
+    def expected_batches(engine):
+        return [data[i % len(data)] for i in range(engine.state.epoch_length * max_epochs)]
+
+    seen = []
+    engine = Engine(lambda e, b: seen.append(b))
+    engine.set_prefetch(num_batches=num_batches, use_thread=use_thread)
+
+    counter = {e: 0 for e in [Events.GET_BATCH_STARTED, Events.GET_BATCH_COMPLETED, Events.DATALOADER_STOP_ITERATION]}
+
+    def count(event):
+        counter[event] += 1
+
+    for e in counter:
+        engine.add_event_handler(e, count, e)
+
+    state = engine.run(data, max_epochs=max_epochs, epoch_length=epoch_length)
+    assert seen == expected_batches(engine)
+    assert counter[Events.GET_BATCH_STARTED] == counter[Events.GET_BATCH_COMPLETED] == state.iteration
+    assert engine._dataloader_iter is None
+
+
+@pytest.mark.parametrize("use_thread", [True, False])
+def test_engine_prefetch_iterator_and_set_data(use_thread):
+    def data_iter(start, size):
+        yield from range(start, start + size)
+
+    seen = []
+    engine = Engine(lambda e, b: seen.append(b))
+    engine.set_prefetch(num_batches=2, use_thread=use_thread)
+
+    @engine.on(Events.ITERATION_COMPLETED(once=5))
+    def switch_data():
+        engine.set_data(data_iter(100, 100))
+
+    engine.run(data_iter(0, 100), epoch_length=10, max_epochs=2)
+    assert seen == list(range(5)) + list(range(100, 115))
+
+
+@pytest.mark.parametrize("use_thread", [True, False])
+def test_engine_prefetch_stops_at_end_of_run(use_thread):
+    data = iter(range(100))
+    engine = Engine(lambda e, b: b)
+    engine.set_prefetch(num_batches=3, use_thread=use_thread)
+
+    prefetch_iters = []
+
+    @engine.on(Events.ITERATION_COMPLETED(once=1))
+    def store_iter():
+        prefetch_iters.append(engine._dataloader_iter)
+
+    engine.run(data, epoch_length=4, max_epochs=2)
+    assert next(data) == 8
+    assert prefetch_iters[0]._executor is None
+
+    engine = Engine(lambda e, b: b)
+    engine.set_prefetch(num_batches=3, use_thread=use_thread)
+
+    @engine.on(Events.ITERATION_COMPLETED(once=2))
+    def stop():
+        prefetch_iters.append(engine._dataloader_iter)
+        engine.terminate()
+
+    engine.run(data, epoch_length=4, max_epochs=2)
+    assert prefetch_iters[1]._executor is None
+    assert not prefetch_iters[1]._pending
+
+
+def test_engine_prefetch_to_device_and_errors():
+    data = [torch.rand(4, 3) for _ in range(5)]
+    engine = Engine(lambda e, b: b)
+    engine.set_prefetch(device="cpu")
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def check(e):
+        assert e.state.output is data[e.state.iteration - 1]
+
+    engine.run(data)
+
+    with pytest.raises(ValueError, match=r"Argument num_batches should be a non-negative integer"):
+        engine.set_prefetch(num_batches=-1)
+
+    def failing_data():
+        yield 1
+        raise RuntimeError("data loading failed")
+
+    engine = Engine(lambda e, b: b)
+    engine.set_prefetch()
+    with pytest.raises(RuntimeError, match=r"data loading failed"):
+        engine.run(failing_data(), epoch_length=2)
+
+    engine.set_prefetch(num_batches=0)
+    assert engine._prefetch_kwargs is None
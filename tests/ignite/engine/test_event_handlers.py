@@ -564,3 +564,70 @@ def test_event_handlers_with_decoration():
     engine.run([0], max_epochs=2)
 
     assert values == foo.values
+
+
+def test_compiled_event_handlers_are_rebuilt_on_add_and_remove():
+    engine = DummyEngine()
+
+    engine.run(1)
+    assert engine._compiled_event_handlers[Events.STARTED].handlers == ()
+
+    h1 = MagicMock(spec_set=True)
+    h2 = MagicMock(spec_set=True)
+    engine.add_event_handler(Events.STARTED, h1)
+    assert Events.STARTED not in engine._compiled_event_handlers
+    engine.run(1)
+    h1.assert_called_once_with(engine)
+
+    engine.add_event_handler(Events.STARTED, h2)
+    engine.run(1)
+    assert h1.call_count == 2
+    h2.assert_called_once_with(engine)
+
+    engine.remove_event_handler(h1, Events.STARTED)
+    engine.run(1)
+    assert h1.call_count == 2
+    assert h2.call_count == 2
+
+
+def test_handlers_modified_while_firing():
+    engine = DummyEngine()
+    calls = []
+
+    def added():
+        calls.append("added")
+
+    def adder():
+        calls.append("adder")
+        engine.add_event_handler(Events.STARTED, added)
+
+    def remover():
+        calls.append("remover")
+        engine.remove_event_handler(removed, Events.STARTED)
+
+    def removed():
+        calls.append("removed")
+
+    engine.add_event_handler(Events.STARTED, adder)
+    engine.add_event_handler(Events.STARTED, remover)
+    engine.add_event_handler(Events.STARTED, removed)
+    engine.fire_event(Events.STARTED)
+    # as with the plain list of handlers: appended handler is called, removed handler is still called once
+    assert calls == ["adder", "remover", "removed", "added"]
+
+    calls.clear()
+    engine.remove_event_handler(adder, Events.STARTED)
+    engine.remove_event_handler(remover, Events.STARTED)
+    engine.fire_event(Events.STARTED)
+    assert calls == ["added"]
+
+
+def test_event_args_and_kwargs_do_not_leak_into_handler_kwargs():
+    engine = DummyEngine()
+    handler = MagicMock(spec_set=True)
+    engine.add_event_handler(Events.TERMINATE_SINGLE_EPOCH, handler, 1, a=2)
+
+    engine._fire_event(Events.TERMINATE_SINGLE_EPOCH, iter_counter=3)
+    handler.assert_called_with(engine, 1, a=2, iter_counter=3)
+    engine._fire_event(Events.TERMINATE_SINGLE_EPOCH, 10, iter_counter=4)
+    handler.assert_called_with(engine, 10, 1, a=2, iter_counter=4)
@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+
+from ignite.engine import Engine, Events
+from ignite.handlers import AsyncHandler
+
+
+def test_arg_validation():
+    with pytest.raises(TypeError, match=r"Argument handler should be callable"):
+        AsyncHandler(12)
+
+    with pytest.raises(ValueError, match=r"Argument max_queue_size should be a positive integer"):
+        AsyncHandler(lambda: None, max_queue_size=0)
+
+
+def test_handler_runs_in_background_with_state_snapshot():
+    engine = Engine(lambda e, b: b)
+    main_thread = threading.get_ident()
+    calls = []
+
+    def handler(e, a, b=None):
+        time.sleep(0.01)
+        assert threading.get_ident() != main_thread
+        assert e is not engine
+        calls.append((e.state.iteration, e.state.output, a, b))
+
+    async_handler = AsyncHandler(handler, max_queue_size=4)
+    engine.add_event_handler(Events.ITERATION_COMPLETED(every=2), async_handler, 1, b=2)
+
+    engine.run(list(range(10)), max_epochs=2)
+    # pending calls are waited for on COMPLETED
+    assert async_handler.num_pending == 0
+    assert calls == [(i, (i - 1) % 10, 1, 2) for i in range(2, 21, 2)]
+    async_handler.close()
+
+
+def test_handler_without_engine_argument():
+    engine = Engine(lambda e, b: b)
+    calls = []
+
+    async_handler = AsyncHandler(lambda: calls.append(1))
+    engine.add_event_handler(Events.EPOCH_COMPLETED, async_handler)
+    engine.run([0, 1], max_epochs=3)
+    assert calls == [1, 1, 1]
+    async_handler.close()
+
+
+def test_non_blocking_skips_calls_when_queue_is_full():
+    engine = Engine(lambda e, b: b)
+    event = threading.Event()
+    calls = []
+
+    def handler(e):
+        event.wait()
+        calls.append(e.state.iteration)
+
+    async_handler = AsyncHandler(handler, max_queue_size=1, blocking=False)
+    engine.add_event_handler(Events.ITERATION_COMPLETED, async_handler)
+
+    @engine.on(Events.ITERATION_COMPLETED(once=5))
+    def release():
+        event.set()
+
+    engine.run(list(range(5)))
+    assert 0 < len(calls) < 5
+    assert calls == sorted(calls)
+    async_handler.close()
+
+
+def test_exception_is_reraised():
+    engine = Engine(lambda e, b: b)
+
+    def handler(e):
+        raise ValueError("handler failed")
+
+    async_handler = AsyncHandler(handler)
+    engine.add_event_handler(Events.ITERATION_COMPLETED, async_handler)
+    with pytest.raises(ValueError, match=r"handler failed"):
+        engine.run(list(range(5)))
+
+    async_handler.close()
+
+
+def test_exception_with_several_pending_calls():
+    engine = Engine(lambda e, b: b)
+    # pending calls are dropped by the worker and the engine's thread concurrently
+    for _ in range(50):
+        event = threading.Event()
+        calls = []
+
+        def handler(i):
+            event.wait()
+            if i == 0:
+                raise ValueError("handler failed")
+            calls.append(i)
+
+        async_handler = AsyncHandler(handler, max_queue_size=4)
+        for i in range(4):
+            async_handler(engine, i)
+        event.set()
+        while async_handler._error is None:
+            time.sleep(0)
+
+        with pytest.raises(ValueError, match=r"handler failed"):
+            async_handler(engine, 4)
+        # the calls left in the queue belong to the previous generation and are skipped by the worker
+        assert async_handler._generation == 1
+        async_handler.wait()
+        assert async_handler.num_pending == 0
+        assert calls == []
+
+        # the handler runs again after the error is reported
+        async_handler(engine, 5)
+        async_handler.close()
+        assert calls == [5]
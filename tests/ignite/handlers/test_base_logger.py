@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Union
 from unittest.mock import call, MagicMock
 
@@ -7,6 +8,8 @@ import torch
 from ignite.engine import Engine, Events, EventsList, State
 
 from ignite.handlers.base_logger import (
+    _BufferedScalarsMixin,
+    _ScalarBuffer,
     BaseLogger,
     BaseOptimizerParamsHandler,
     BaseOutputHandler,
@@ -158,6 +161,43 @@ def test_base_output_handler_setup_output_state_attrs():
     }
 
 
+def test_base_output_handler_render_tensors():
+    handler = DummyOutputHandler("tag", metric_names="all")
+    metrics_state_attrs = {
+        "a": torch.tensor([1.5, 2.5]),
+        "b": 3,
+        "c": torch.tensor(4),
+        "d": torch.tensor([5.5], requires_grad=True),
+        "e": torch.tensor(True),
+        "f": torch.tensor(6.5, dtype=torch.float64),
+    }
+    expected = {
+        ("tag", "a", "0"): 1.5,
+        ("tag", "a", "1"): 2.5,
+        ("tag", "b"): 3,
+        ("tag", "c"): 4,
+        ("tag", "d", "0"): 5.5,
+        ("tag", "e"): True,
+        ("tag", "f"): 6.5,
+    }
+    for _ in range(2):
+        rendered = handler._render_output_metrics_state_attrs(metrics_state_attrs)
+        assert list(rendered.items()) == list(expected.items())
+        assert [type(v) for v in rendered.values()] == [float, float, int, int, float, bool, float]
+
+    # keys are cached by metric and shape
+    assert len(handler._rendered_keys) == 5
+    keys = handler._rendered_keys[("tag", "a", torch.Size([2]), True)]
+    metrics_state_attrs["a"] = torch.tensor([7.5, 8.5])
+    assert handler._render_output_metrics_state_attrs(metrics_state_attrs)[("tag", "a", "1")] == 8.5
+    assert handler._rendered_keys[("tag", "a", torch.Size([2]), True)] is keys
+
+    metrics_state_attrs["a"] = torch.tensor([7.5, 8.5, 9.5])
+    rendered = handler._render_output_metrics_state_attrs(metrics_state_attrs, key_tuple=False)
+    assert rendered["tag/a/2"] == 9.5
+    assert len(handler._rendered_keys) == 10
+
+
 def test_opt_params_handler_on_non_torch_optimizers():
     tensor = torch.zeros([1], requires_grad=True)
     base_optimizer = torch.optim.SGD([tensor], lr=0.1234)
@@ -319,3 +359,131 @@ def test_base_weights_scalar_handler_wrong_setup():
 
     with pytest.raises(TypeError, match="Output of the reduction function should be a scalar"):
         DummyWeightsScalarHandler(model, reduction=lambda x: x)
+
+
+@pytest.mark.parametrize(
+    "reduction", [torch.norm, torch.max, torch.min, torch.mean, torch.sum, lambda t: t.abs().max().item()]
+)
+def test_base_weights_scalar_handler_reduce(reduction):
+    torch.manual_seed(12)
+    model = torch.nn.Sequential(torch.nn.Linear(4, 3), torch.nn.ReLU(), torch.nn.Linear(3, 2).double())
+    handler = DummyWeightsScalarHandler(model, reduction=reduction)
+
+    named_tensors = [(name, p.data) for name, p in model.named_parameters()]
+    reduced = handler._reduce(named_tensors)
+    assert [name for name, _ in reduced] == [name for name, _ in named_tensors]
+    for (_, value), (_, t) in zip(reduced, named_tensors):
+        expected = reduction(t)
+        if isinstance(expected, torch.Tensor):
+            assert isinstance(value, torch.Tensor) and value.ndimension() == 0
+            assert value.device.type == "cpu" and value.dtype == t.dtype
+            assert value.item() == pytest.approx(expected.item())
+        else:
+            assert value == expected
+
+    assert handler._reduce([]) == []
+
+
+def test_scalar_buffer_wrong_args():
+    with pytest.raises(ValueError, match=r"Argument max_buffer_size should be a positive integer"):
+        _ScalarBuffer(lambda *args: None, max_size=0)
+
+    with pytest.raises(ValueError, match=r"Argument flush_interval should be a positive number"):
+        _ScalarBuffer(lambda *args: None, flush_interval=-1.0)
+
+
+def test_scalar_buffer():
+    submitted = []
+    submission = threading.Event()
+
+    def submit_fn(keys, values, steps, timestamps):
+        assert len(keys) == len(values) == len(steps) == len(timestamps)
+        submitted.append((keys, values, steps))
+        submission.set()
+
+    scalar_buffer = _ScalarBuffer(submit_fn, max_size=4)
+    engine = Engine(lambda e, b: None)
+    engine.add_event_handler(
+        Events.ITERATION_COMPLETED,
+        lambda e: scalar_buffer.extend(e, [("a", e.state.iteration), ("b", torch.tensor(0.5))], e.state.iteration),
+    )
+
+    # submitted in background when max_size records are pending
+    engine.run([0, 1])
+    assert submission.wait(10.0)
+    assert submitted == [(["a", "b", "a", "b"], [1.0, 0.5, 2.0, 0.5], [1, 1, 2, 2])]
+    assert engine.has_event_handler(scalar_buffer.flush, Events.COMPLETED)
+
+    # pending records are submitted on COMPLETED
+    submitted.clear()
+    engine.run([0])
+    assert len(scalar_buffer) == 0
+    assert submitted == [(["a", "b"], [1.0, 0.5], [1, 1])]
+
+    submitted.clear()
+    scalar_buffer.extend(engine, [("c", 1)], 4)
+    scalar_buffer.close()
+    assert submitted == [(["c"], [1.0], [4])]
+    scalar_buffer.close()
+    assert len(submitted) == 1
+
+
+def test_scalar_buffer_flush_interval():
+    submitted = []
+    scalar_buffer = _ScalarBuffer(lambda keys, *args: submitted.append(keys), flush_interval=0.01)
+    scalar_buffer.extend(Engine(lambda e, b: None), [("a", 1.0)], 0)
+    for _ in range(1000):
+        if submitted:
+            break
+        threading.Event().wait(0.01)
+    assert submitted == [["a"]]
+    scalar_buffer.close()
+
+
+def test_scalar_buffer_error():
+    def submit_fn(*args):
+        raise RuntimeError("submission error")
+
+    scalar_buffer = _ScalarBuffer(submit_fn, max_size=1)
+    engine = Engine(lambda e, b: None)
+    scalar_buffer.extend(engine, [("a", 1.0)], 0)
+    for _ in range(1000):
+        if scalar_buffer._error is not None:
+            break
+        threading.Event().wait(0.01)
+
+    with pytest.raises(RuntimeError, match=r"submission error"):
+        scalar_buffer.extend(engine, [("a", 2.0)], 1)
+    assert len(scalar_buffer) == 0
+
+    scalar_buffer = _ScalarBuffer(submit_fn)
+    scalar_buffer.extend(engine, [("a", 1.0)], 0)
+    with pytest.raises(RuntimeError, match=r"submission error"):
+        scalar_buffer.close()
+
+
+def test_buffered_scalars_mixin():
+    class DummyBufferedLogger(DummyLogger, _BufferedScalarsMixin):
+        def __init__(self, max_buffer_size=None, flush_interval=None):
+            self.submitted = []
+            self._setup_scalar_buffer(max_buffer_size, flush_interval)
+
+        def _submit_scalars(self, keys, values, steps, timestamps):
+            self.submitted.append((keys, values, steps))
+
+    class IncompleteLogger(DummyLogger, _BufferedScalarsMixin):
+        pass
+
+    with pytest.raises(TypeError, match=r"abstract"):
+        IncompleteLogger()
+
+    assert not hasattr(DummyLogger(), "_setup_scalar_buffer")
+
+    logger = DummyBufferedLogger()
+    assert logger._scalar_buffer is None
+    logger.close()
+
+    logger = DummyBufferedLogger(max_buffer_size=10)
+    logger._scalar_buffer.extend(Engine(lambda e, b: None), [("a", 1.0)], 2)
+    logger._close_scalar_buffer()
+    assert logger.submitted == [(["a"], [1.0], [2])]
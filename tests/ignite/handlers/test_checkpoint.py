@@ -1,5 +1,6 @@
 import os
 import stat
+import threading
 import warnings
 from collections import OrderedDict
 from collections.abc import Mapping
@@ -793,6 +794,97 @@ def test_removes_each_score_at_most_once(dirname):
     # without futher assertions.
 
 
+def test_async_save_wrong_input(dirname):
+    with pytest.raises(ValueError, match=r"Argument max_pending_saves should be a positive integer"):
+        Checkpoint({"model": model}, dirname, async_save=True, max_pending_saves=0)
+
+
+@pytest.mark.parametrize("max_pending_saves", [1, 3])
+def test_async_save(dirname, max_pending_saves):
+    torch.manual_seed(12)
+    model = DummyModel()
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.1, momentum=0.9)
+
+    def update_fn(engine, batch):
+        optimizer.zero_grad()
+        model(torch.rand(4, 1)).sum().backward()
+        optimizer.step()
+
+    trainer = Engine(update_fn)
+    expected_weights = {}
+    trainer.add_event_handler(
+        Events.ITERATION_COMPLETED(every=2),
+        lambda e: expected_weights.update({e.state.iteration: model.net.weight.detach().clone()}),
+    )
+    to_save = {"model": model, "optimizer": optimizer}
+    checkpointer = Checkpoint(to_save, dirname, n_saved=2, async_save=True, max_pending_saves=max_pending_saves)
+    trainer.add_event_handler(Events.ITERATION_COMPLETED(every=2), checkpointer)
+    trainer.run(list(range(10)), max_epochs=2)
+
+    # pending saves are waited for on COMPLETED
+    assert trainer.has_event_handler(checkpointer.wait, Events.COMPLETED)
+    assert sorted(os.listdir(dirname)) == ["checkpoint_18.pt", "checkpoint_20.pt"]
+    assert checkpointer.last_checkpoint == Path(dirname) / "checkpoint_20.pt"
+    for i in [18, 20]:
+        checkpoint = torch.load(Path(dirname) / f"checkpoint_{i}.pt")
+        assert torch.equal(checkpoint["model"]["net.weight"], expected_weights[i])
+        assert checkpoint["model"]._metadata == model.state_dict()._metadata
+        assert set(checkpoint["optimizer"]["state"]) == {0, 1}
+
+
+class _BlockingSaver(BaseSaveHandler):
+    def __init__(self):
+        self.saved = {}
+        self.removed = []
+        self.can_save = threading.Event()
+        self.error = None
+
+    def __call__(self, checkpoint, filename, metadata=None):
+        assert self.can_save.wait(10.0)
+        if self.error is not None:
+            raise self.error
+        self.saved[filename] = checkpoint
+
+    def remove(self, filename):
+        self.removed.append(filename)
+
+
+def test_async_save_pending_checkpoints():
+    tensor = torch.zeros(3)
+    obj = MagicMock()
+    obj.state_dict = lambda: {"value": tensor}
+    save_handler = _BlockingSaver()
+    checkpointer = Checkpoint({"obj": obj}, save_handler, n_saved=1, async_save=True, max_pending_saves=2)
+    engine = Engine(lambda e, b: None)
+    engine.state = State(epoch=0, iteration=1)
+
+    checkpointer(engine)
+    tensor += 1
+    engine.state.iteration = 2
+    checkpointer(engine)
+
+    # the checkpoints are not saved yet
+    assert checkpointer.last_checkpoint is None
+    assert [item.filename for item in checkpointer._saved] == ["obj_2.pt"]
+
+    save_handler.can_save.set()
+    checkpointer.wait()
+    assert checkpointer.last_checkpoint == "obj_2.pt"
+    # the tensors are copied when the handler is called
+    assert torch.equal(save_handler.saved["obj_1.pt"]["value"], torch.zeros(3))
+    assert torch.equal(save_handler.saved["obj_2.pt"]["value"], torch.ones(3))
+    # the outdated checkpoint is removed once the new one is saved
+    assert save_handler.removed == ["obj_1.pt"]
+
+    # errors are re-raised by the next call
+    save_handler.error = RuntimeError("saving error")
+    engine.state.iteration = 3
+    checkpointer(engine)
+    with pytest.raises(RuntimeError, match=r"saving error"):
+        checkpointer.wait()
+    checkpointer.wait()
+
+
 def test_with_engine(dirname):
     def update_fn(_1, _2):
         pass
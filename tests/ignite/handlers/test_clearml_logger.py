@@ -1035,3 +1035,32 @@ def _test_save_model_optimizer_lr_scheduler_with_state_dict_xla_nprocs(index):
 def test_distrib_single_device_xla_nprocs(xmp_executor):
     n = int(os.environ["NUM_TPU_WORKERS"])
     xmp_executor(_test_save_model_optimizer_lr_scheduler_with_state_dict_xla_nprocs, args=(), nprocs=n)
+
+
+def test_buffered_scalars(dirname):
+    data = list(range(5))
+    trainer = Engine(lambda e, b: 0.5 * e.state.iteration)
+    model = torch.nn.Linear(2, 1)
+
+    with pytest.warns(UserWarning, match="ClearMLSaver: running in bypass mode"):
+        ClearMLLogger.set_bypass_mode(True)
+        logger = ClearMLLogger(output_uri=dirname, max_buffer_size=100)
+    logger.clearml_logger = MagicMock()
+    logger.attach_output_handler(
+        trainer, Events.ITERATION_COMPLETED, tag="training", output_transform=lambda loss: {"loss": loss}
+    )
+    logger.attach(trainer, WeightsScalarHandler(model), Events.EPOCH_COMPLETED)
+
+    trainer.run(data, max_epochs=2)
+    # the pending scalars are reported on COMPLETED
+    calls = [call(title="training", series="loss", value=0.5 * i, iteration=i) for i in range(1, 6)]
+    calls += [
+        call(title="weights_norm/weight", series="", value=pytest.approx(model.weight.norm().item()), iteration=1),
+        call(title="weights_norm/bias", series="", value=pytest.approx(model.bias.norm().item()), iteration=1),
+    ]
+    calls += [call(title="training", series="loss", value=0.5 * i, iteration=i) for i in range(6, 11)]
+    calls += [call(title=c.kwargs["title"], series="", value=c.kwargs["value"], iteration=2) for c in calls[5:7]]
+    assert logger.clearml_logger.report_scalar.call_args_list == calls
+
+    logger.close()
+    logger.clearml_logger.flush.assert_called_once_with()
@@ -334,6 +334,30 @@ def test_mlflow_bad_metric_name_handling(dirname):
         assert t == s.value
 
 
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Skip on Windows")
+def test_buffered_metrics(dirname):
+    import mlflow
+
+    optimizer = torch.optim.SGD([torch.tensor(0.0)], lr=0.0)
+
+    def update_fn(engine, batch):
+        optimizer.param_groups[0]["lr"] = 0.1 * engine.state.iteration
+
+    trainer = Engine(update_fn)
+
+    with MLflowLogger(str(dirname / "mlruns"), max_buffer_size=7) as mlflow_logger:
+        active_run = mlflow.active_run()
+        mlflow_logger.attach_opt_params_handler(trainer, Events.ITERATION_COMPLETED, optimizer=optimizer)
+        trainer.run(list(range(10)), max_epochs=3)
+
+    from mlflow.tracking import MlflowClient
+
+    client = MlflowClient(tracking_uri=str(dirname / "mlruns"))
+    stored_values = client.get_metric_history(active_run.info.run_id, "lr group_0")
+
+    assert sorted((s.step, s.value) for s in stored_values) == [(i, pytest.approx(0.1 * i)) for i in range(1, 31)]
+
+
 @pytest.mark.parametrize("no_site_packages", ["mlflow"], indirect=True)
 def test_no_mlflow_client(no_site_packages):
     with pytest.raises(ModuleNotFoundError, match=r"This contrib module requires mlflow to be installed."):
@@ -531,3 +531,24 @@ def test_logs_version():
         mode="debug",
     )
     assert logger[_INTEGRATION_VERSION_KEY].fetch() == __version__
+
+
+def test_buffered_scalars():
+    n_epochs = 3
+    data = list(range(5))
+    trainer = Engine(lambda e, b: 0.5 * e.state.iteration)
+    optimizer = torch.optim.SGD([torch.tensor(0.0)], lr=0.01)
+
+    npt_logger = NeptuneLogger(project="tests/dry-run", mode="debug", max_buffer_size=4)
+    npt_logger.attach_output_handler(
+        trainer, Events.ITERATION_COMPLETED, tag="training", output_transform=lambda loss: {"loss": loss}
+    )
+    npt_logger.attach_opt_params_handler(trainer, Events.EPOCH_COMPLETED, optimizer=optimizer)
+    trainer.run(data, max_epochs=n_epochs)
+
+    # pending values are submitted on COMPLETED, the debug mode does not keep the steps
+    loss = npt_logger["training/loss"].fetch_values()
+    assert loss.value.tolist() == [0.5 * i for i in range(1, n_epochs * len(data) + 1)]
+    lr = npt_logger["lr/group_0"].fetch_values()
+    assert lr.value.tolist() == pytest.approx([0.01] * n_epochs)
+    npt_logger.close()
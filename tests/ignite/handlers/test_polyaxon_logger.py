@@ -5,6 +5,7 @@ import pytest
 import torch
 
 from ignite.engine import Engine, Events, State
+from ignite.handlers.base_logger import _ScalarBuffer
 
 from ignite.handlers.polyaxon_logger import (
     global_step_from_engine,
@@ -295,3 +296,30 @@ def test_integration_as_context_manager():
 def test_no_polyaxon_client(no_site_packages):
     with pytest.raises(ModuleNotFoundError, match=r"This contrib module requires polyaxon"):
         PolyaxonLogger()
+
+
+def test_buffered_metrics():
+    optimizer = torch.optim.SGD([torch.tensor(0.0)], lr=0.01)
+    trainer = Engine(lambda e, b: 0.5 * e.state.iteration)
+
+    mock_logger = MagicMock(spec=PolyaxonLogger)
+    mock_logger.log_metrics = MagicMock()
+    mock_logger.experiment = MagicMock()
+    mock_logger._scalar_buffer = _ScalarBuffer(
+        lambda *args: PolyaxonLogger._submit_scalars(mock_logger, *args), max_size=100
+    )
+    output_handler = OutputHandler("tag", output_transform=lambda x: {"loss": x})
+    trainer.add_event_handler(Events.ITERATION_COMPLETED, output_handler, mock_logger, Events.ITERATION_COMPLETED)
+    opt_params_handler = OptimizerParamsHandler(optimizer)
+    trainer.add_event_handler(
+        Events.ITERATION_COMPLETED(every=2), opt_params_handler, mock_logger, Events.ITERATION_COMPLETED
+    )
+    trainer.run([0, 1, 2])
+
+    # the pending metrics are logged by step on COMPLETED
+    mock_logger.log_metrics.assert_not_called()
+    assert mock_logger.experiment.log_metrics.call_args_list == [
+        call(step=1, **{"tag/loss": 0.5}),
+        call(step=2, **{"tag/loss": 1.0, "lr/group_0": 0.01}),
+        call(step=3, **{"tag/loss": 1.5}),
+    ]
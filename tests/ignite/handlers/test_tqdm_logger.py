@@ -557,3 +557,65 @@ def test_tqdm_logger_iter_without_epoch_length(capsys):
     actual = err[-1]
     expected = "Epoch [5/5]: [11/11] 100%|████████████████████████████████████████ [00:00<00:00]"
     assert actual == expected
+
+
+def test_pbar_defers_rendering_of_device_tensors():
+    from ignite.handlers.base_logger import BaseOutputHandler
+    from ignite.handlers.tqdm_logger import _OutputHandler
+
+    assert _OutputHandler._has_device_tensors({"a": 1.0, "b": torch.tensor(1.0, device="meta")})
+    assert not _OutputHandler._has_device_tensors({"a": 1.0, "b": torch.tensor(1.0), "c": "abc"})
+
+    def _run(on_device):
+        engine = Engine(lambda e, b: torch.tensor(float(b)))
+        pbar = ProgressBar(mininterval=1000)
+        pbar.attach(engine, output_transform=lambda x: x)
+
+        with patch.object(_OutputHandler, "_has_device_tensors", return_value=on_device), patch.object(
+            _OutputHandler,
+            "_render_output_metrics_state_attrs",
+            autospec=True,
+            side_effect=BaseOutputHandler._render_output_metrics_state_attrs,
+        ) as render:
+            engine.run(list(range(10)), max_epochs=2)
+        return render.call_count
+
+    assert _run(on_device=False) == 20
+    # device values are only converted when the progress bar is redrawn: here, on the last iteration of each epoch
+    assert _run(on_device=True) == 2
+
+
+@pytest.mark.parametrize("closing_event_name", [Events.EPOCH_COMPLETED, Events.COMPLETED])
+def test_pbar_refreshes_deferred_device_tensors(capsys, closing_event_name):
+    from ignite.handlers.tqdm_logger import _OutputHandler
+
+    engine = Engine(lambda e, b: torch.tensor(float(b)))
+    pbar = ProgressBar(mininterval=1000, persist=True)
+    pbar.attach(engine, output_transform=lambda x: {"value": x}, closing_event_name=closing_event_name)
+
+    with patch.object(_OutputHandler, "_has_device_tensors", return_value=True):
+        # the length of the data is unknown: the last iteration of the epoch is not known to be the last one
+        engine.run(iter(range(10)))
+
+    # the values of the last iteration, deferred within mininterval, are shown before the progress bar is closed
+    err = list(filter(None, map(lambda x: x.strip(), capsys.readouterr().err.split("\r"))))
+    assert "value=9" in err[-1]
+    assert all("value=" not in line for line in err[:-2])
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="Skip if no GPU")
+def test_pbar_with_running_average_on_cuda(capsys):
+    def _run(device):
+        engine = Engine(lambda e, b: torch.tensor(float(b), device=device))
+        RunningAverage(output_transform=lambda x: x, device=device, keep_on_device=True).attach(engine, "avg")
+        ProgressBar(ncols=80).attach(engine, metric_names=["avg"])
+
+        @engine.on(Events.ITERATION_COMPLETED)
+        def check(e):
+            assert isinstance(e.state.metrics["avg"], torch.Tensor) == (device == "cuda")
+
+        engine.run([1, 2, 3, 4, 5], max_epochs=1)
+        captured = capsys.readouterr()
+        return list(filter(None, map(lambda x: x.strip(), captured.err.split("\r"))))[-1]
+
+    assert _run("cuda") == _run("cpu")
@@ -5,25 +5,36 @@ from unittest.mock import patch
 import pytest
 import pytorch_fid.fid_score as pytorch_fid_score
 import scipy
+import scipy.linalg
 import torch
 from numpy import cov
 
 import ignite.distributed as idist
-from ignite.metrics.gan.fid import FID, fid_score
+from ignite.metrics.gan.fid import _trace_sqrt_product, FID, fid_score
 
 
 @pytest.fixture()
 def mock_no_scipy():
-    with patch.dict("sys.modules", {"scipy": None}):
+    with patch.dict("sys.modules", {"scipy": None, "scipy.linalg": None}):
         yield scipy
 
 
-def test_no_scipy(mock_no_scipy):
-    with pytest.raises(ModuleNotFoundError, match=r"This module requires scipy to be installed."):
-        FID()
+def _check_fid_without_module():
+    train_samples, test_samples = torch.rand(10, 3), torch.rand(10, 3)
+    fid_scorer = FID(num_features=3, feature_extractor=torch.nn.Identity())
+    fid_scorer.update((train_samples, test_samples))
+    assert fid_scorer.compute() == pytest.approx(
+        fid_score(
+            train_samples.mean(dim=0),
+            test_samples.mean(dim=0),
+            torch.cov(train_samples.T.double()),
+            torch.cov(test_samples.T.double()),
+        )
+    )
+
 
-    with pytest.raises(ModuleNotFoundError, match=r"fid_score requires scipy to be installed."):
-        fid_score(0, 0, 0, 0)
+def test_no_scipy(mock_no_scipy):
+    _check_fid_without_module()
 
 
 @pytest.fixture()
@@ -33,11 +44,18 @@ def mock_no_numpy():
 
 
 def test_no_numpy(mock_no_numpy):
-    with pytest.raises(ModuleNotFoundError, match=r"This module requires numpy to be installed."):
-        FID()
+    _check_fid_without_module()
+
+
+@pytest.mark.parametrize("num_samples", [4, 50])
+def test_trace_sqrt_matches_scipy(num_samples):
+    torch.manual_seed(12)
+    # with fewer samples than features, covariances are singular
+    features1, features2 = torch.rand(num_samples, 20, dtype=torch.float64), torch.rand(num_samples, 20) * 3
+    sigma1, sigma2 = torch.cov(features1.T), torch.cov(features2.T.double())
+    covmean = scipy.linalg.sqrtm((sigma1 @ sigma2).numpy())
 
-    with pytest.raises(ModuleNotFoundError, match=r"fid_score requires numpy to be installed."):
-        fid_score(0, 0, 0, 0)
+    assert _trace_sqrt_product(sigma1, sigma2).item() == pytest.approx(covmean.trace().real, rel=1e-6)
 
 
 def test_fid_function():
@@ -137,11 +155,8 @@ def test_statistics():
     mu1, sigma1 = train_samples.mean(axis=0), torch.tensor(cov(train_samples, rowvar=False))
     mu2, sigma2 = test_samples.mean(axis=0), torch.tensor(cov(test_samples, rowvar=False))
 
-    fid_mu1 = fid_scorer._train_total / fid_scorer._num_examples
-    fid_sigma1 = fid_scorer._get_covariance(fid_scorer._train_sigma, fid_scorer._train_total)
-
-    fid_mu2 = fid_scorer._test_total / fid_scorer._num_examples
-    fid_sigma2 = fid_scorer._get_covariance(fid_scorer._test_sigma, fid_scorer._test_total)
+    fid_mu1, fid_sigma1 = fid_scorer._get_statistics(fid_scorer._train_moments)
+    fid_mu2, fid_sigma2 = fid_scorer._get_statistics(fid_scorer._test_moments)
 
     assert torch.isclose(mu1.double(), fid_mu1).all()
     for cov1, cov2 in zip(sigma1, fid_sigma1):
@@ -152,6 +167,117 @@ def test_statistics():
         assert torch.isclose(cov1.double(), cov2, rtol=1e-04, atol=1e-04).all()
 
 
+def test_batched_update_matches_outer_products():
+    features = torch.rand(7, 5, dtype=torch.float64)
+    moments = torch.zeros(1 + 5 + 5 * 5, dtype=torch.float64)
+    FID._online_update(features[:3], moments)
+    FID._online_update(features[3:3], moments)
+    FID._online_update(features[3:], moments)
+
+    deviations = features - features.mean(dim=0)
+    assert moments[0] == 7
+    assert torch.allclose(moments[1:6], features.mean(dim=0))
+    assert torch.allclose(moments[6:].view(5, 5), sum(torch.outer(d, d) for d in deviations))
+
+
+def test_statistics_large_mean():
+    torch.manual_seed(12)
+    # sums of products of features of mean 1e8 lose the variance to cancellation in float64
+    samples = 1e8 + torch.rand(100, 4, dtype=torch.float64)
+    fid_scorer = FID(num_features=4, feature_extractor=torch.nn.Identity())
+    for batch in samples.split(7):
+        fid_scorer.update((batch, batch))
+
+    mu, sigma = fid_scorer._get_statistics(fid_scorer._train_moments)
+    assert torch.allclose(mu, samples.mean(dim=0), rtol=0.0, atol=1e-6)
+    assert torch.allclose(sigma, torch.tensor(cov(samples.numpy(), rowvar=False)), rtol=1e-6, atol=1e-9)
+    assert fid_scorer.compute() == pytest.approx(0.0, abs=1e-6)
+
+
+class CountingIdentity(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.weight = torch.nn.Parameter(torch.ones(1))
+        self.num_calls = 0
+
+    def forward(self, x):
+        self.num_calls += 1
+        return x * self.weight
+
+
+def test_reference_statistics(tmp_path):
+    torch.manual_seed(12)
+    real_samples = torch.rand(20, 10)
+    data = [(real_samples[i : i + 5], torch.zeros(5)) for i in range(0, 20, 5)]
+
+    extractor = CountingIdentity()
+    fid_scorer = FID(num_features=10, feature_extractor=extractor)
+    mu, sigma = fid_scorer.compute_reference_statistics(
+        data, cache_dir=str(tmp_path), transform=lambda b: b[0], cache_key="real"
+    )
+    assert extractor.num_calls == 4
+    assert torch.allclose(mu, real_samples.double().mean(dim=0))
+    assert torch.allclose(sigma, torch.tensor(cov(real_samples, rowvar=False), dtype=torch.float64))
+    assert len(list(tmp_path.iterdir())) == 1
+
+    # statistics of the same key are loaded from the cache, without iterating over the data
+    extractor = CountingIdentity()
+    fid_scorer = FID(num_features=10, feature_extractor=extractor)
+    cached_mu, cached_sigma = fid_scorer.compute_reference_statistics(
+        iter([]), cache_dir=str(tmp_path), transform=lambda b: b[0], cache_key="real"
+    )
+    assert extractor.num_calls == 0
+    assert torch.equal(cached_mu, mu) and torch.equal(cached_sigma, sigma)
+
+    # other keys or numbers of features are different files
+    fid_scorer.compute_reference_statistics(
+        data[:3], cache_dir=str(tmp_path), transform=lambda b: b[0], cache_key="real-subset"
+    )
+    assert extractor.num_calls == 3
+    FID(num_features=5, feature_extractor=extractor).compute_reference_statistics(
+        [b[0][:, :5] for b in data], cache_dir=str(tmp_path), cache_key="real"
+    )
+    assert extractor.num_calls == 7
+    assert len(list(tmp_path.iterdir())) == 3
+
+    with pytest.raises(ValueError, match=r"Arguments cache_dir and cache_key should be given together"):
+        fid_scorer.compute_reference_statistics(data, cache_dir=str(tmp_path))
+
+    with pytest.raises(ValueError, match=r"Arguments cache_dir and cache_key should be given together"):
+        fid_scorer.compute_reference_statistics(data, cache_key="real")
+
+
+def test_compute_with_reference_statistics():
+    torch.manual_seed(12)
+    fake_samples, real_samples = torch.rand(10, 10), torch.rand(10, 10)
+    reference = FID(num_features=10, feature_extractor=torch.nn.Identity())
+    reference.update((fake_samples, real_samples))
+
+    fid_scorer = FID(num_features=10, feature_extractor=torch.nn.Identity())
+    mu, sigma = fid_scorer.compute_reference_statistics([real_samples[:6], real_samples[6:]])
+    # only the generated samples are given
+    fid_scorer.update(fake_samples[:5])
+    fid_scorer.update((fake_samples[5:], None))
+    assert torch.equal(fid_scorer._test_moments, torch.zeros(1 + 10 + 10 * 10, dtype=torch.float64))
+
+    with patch("ignite.metrics.gan.fid.fid_score", return_value=1.0) as mock_fid_score:
+        reference.compute()
+        fid_scorer.compute()
+    expected, actual = mock_fid_score.call_args_list[0][1], mock_fid_score.call_args_list[1][1]
+    for name in ["mu1", "mu2", "sigma1", "sigma2"]:
+        assert torch.allclose(expected[name], actual[name]), name
+
+    fid_scorer = FID(num_features=10, feature_extractor=torch.nn.Identity(), reference_statistics=(mu, sigma))
+    fid_scorer.update(fake_samples)
+    assert torch.equal(fid_scorer._reference_statistics[1], sigma)
+
+    with pytest.raises(ValueError, match=r"Reference statistics should have shapes \(10,\) and \(10, 10\)"):
+        FID(num_features=10, feature_extractor=torch.nn.Identity(), reference_statistics=(mu, mu))
+
+    with pytest.raises(ValueError, match=r"Reference data should have at least two examples, got: 1"):
+        fid_scorer.compute_reference_statistics([real_samples[:1]])
+
+
 def _test_distrib_integration(device):
     from ignite.engine import Engine
 
@@ -210,6 +336,38 @@ def test_distrib_cpu(distributed_context_single_node_gloo):
     _test_distrib_integration(device)
 
 
+def _test_distrib_reference_statistics(device, tmp_path):
+    rank, ws = idist.get_rank(), idist.get_world_size()
+    torch.manual_seed(12)
+    real_samples = torch.rand(8 * ws, 10)
+    # each process gives its shard of the data
+    data = [real_samples[8 * rank : 8 * rank + 4], real_samples[8 * rank + 4 : 8 * (rank + 1)]]
+
+    for i, metric_device in enumerate(["cpu", device]):
+        extractor = CountingIdentity()
+        fid_scorer = FID(num_features=10, feature_extractor=extractor, device=metric_device)
+        mu, sigma = fid_scorer.compute_reference_statistics(data, cache_dir=str(tmp_path), cache_key="real")
+        assert torch.allclose(mu.cpu(), real_samples.double().mean(dim=0))
+        assert torch.allclose(sigma.cpu(), torch.tensor(cov(real_samples, rowvar=False), dtype=torch.float64))
+        idist.barrier()
+        # all processes hit the cache written by the first process
+        assert len(list(tmp_path.iterdir())) == 1
+        assert extractor.num_calls == (2 if i == 0 else 0)
+
+
+@pytest.mark.distributed
+@pytest.mark.skipif(not idist.has_native_dist_support, reason="Skip if no native dist support")
+def test_distrib_reference_statistics_cpu(distributed_context_single_node_gloo, tmp_path_factory):
+    # a directory shared by the processes
+    tmp_path = tmp_path_factory.getbasetemp().parent / "fid_reference_statistics"
+    if idist.get_rank() == 0:
+        tmp_path.mkdir(exist_ok=True)
+        for f in tmp_path.iterdir():
+            f.unlink()
+    idist.barrier()
+    _test_distrib_reference_statistics(idist.device(), tmp_path)
+
+
 @pytest.mark.distributed
 @pytest.mark.skipif(not idist.has_hvd_support, reason="Skip if no Horovod dist support")
 @pytest.mark.skipif("WORLD_SIZE" in os.environ, reason="Skip if launched as multiproc")
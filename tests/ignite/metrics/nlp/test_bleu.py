@@ -178,6 +178,19 @@ def test_bleu_batch_micro():
     assert pytest.approx(bleu._corpus_bleu(refs, hypotheses)) == reference_bleu_score
 
 
+@pytest.mark.parametrize("average", ["macro", "micro"])
+def test_bleu_num_workers(average):
+    hypotheses = [corpus.cand_1, corpus.cand_2a, corpus.cand_2b, corpus.cand_3] * 4
+    refs = [corpus.references_1, corpus.references_2, corpus.references_2, corpus.references_2] * 4
+
+    bleu = Bleu(ngram=4, smooth="smooth1", average=average)
+    bleu.update((hypotheses, refs))
+    bleu_workers = Bleu(ngram=4, smooth="smooth1", average=average, num_workers=3)
+    bleu_workers.update((hypotheses, refs))
+
+    assert bleu_workers.compute() == bleu.compute()
+
+
 @pytest.mark.parametrize(
     "candidates, references",
     [
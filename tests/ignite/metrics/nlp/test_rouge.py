@@ -98,6 +98,49 @@ def test_rouge_n_alpha(ngram, candidate, reference, expected):
         assert results[f"Rouge-{ngram}-F"] == F
 
 
+@pytest.mark.parametrize("multiref", ["average", "best"])
+def test_rouge_matches_variants(multiref):
+    candidates = [candidate.lower().split() for candidate in corpus.sample_5[0]] + [[], ["a"]]
+    references = [[ref.lower().split() for ref in refs] for refs in corpus.sample_5[1]] + [[["a"]], [[], ["b", "a"]]]
+
+    m = Rouge(variants=[1, 2, 3, 5, "L"], multiref=multiref, alpha=0.5)
+    m.update((candidates, references))
+    results = m.compute()
+
+    for variant in [RougeN(ngram=n, multiref=multiref, alpha=0.5) for n in [1, 2, 3, 5]] + [
+        RougeL(multiref=multiref, alpha=0.5)
+    ]:
+        variant.update((candidates, references))
+        for key, value in variant.compute().items():
+            assert results[key] == value
+
+
+@pytest.mark.parametrize("multiref", ["average", "best"])
+def test_rouge_num_workers(multiref):
+    candidates = [candidate.lower().split() for candidate in corpus.sample_5[0]] * 3
+    references = [[ref.lower().split() for ref in refs] for refs in corpus.sample_5[1]] * 3
+
+    for metric_fn in [lambda **kw: Rouge(variants=[1, 2, 4, "L"], **kw), RougeL, RougeN]:
+        m = metric_fn(multiref=multiref, alpha=0.5)
+        m.update((candidates, references))
+        m_workers = metric_fn(multiref=multiref, alpha=0.5, num_workers=2)
+        m_workers.update((candidates, references))
+        assert m_workers.compute() == m.compute()
+
+
+@pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
+def test_rouge_l_cuda_token_ids():
+    torch.manual_seed(12)
+    candidates = [torch.randint(0, 10, size=(n,), device="cuda") for n in [5, 12, 0, 30]]
+    references = [[torch.randint(0, 10, size=(n,), device="cuda") for n in sizes] for sizes in [[3], [12, 4], [2], []]]
+
+    m = RougeL(alpha=0.5)
+    m.update((candidates, references))
+    m_cpu = RougeL(alpha=0.5)
+    m_cpu.update(([c.tolist() for c in candidates], [[r.tolist() for r in refs] for refs in references]))
+    assert m.compute() == m_cpu.compute()
+
+
 @pytest.mark.parametrize(
     "candidates, references", [corpus.sample_1, corpus.sample_2, corpus.sample_3, corpus.sample_4, corpus.sample_5]
 )
@@ -1,6 +1,9 @@
+import random
+
 import pytest
+import torch
 
-from ignite.metrics.nlp.utils import lcs, modified_precision, ngrams
+from ignite.metrics.nlp.utils import _batched_lcs, _batched_modified_precision, lcs, modified_precision, ngrams
 
 
 @pytest.mark.parametrize(
@@ -29,6 +32,44 @@ def test_lcs(seq_a, seq_b, expected):
     assert lcs(seq_a, seq_b) == expected
 
 
+def _lcs_full_table(seq_a, seq_b):
+    dp = [[0] * (len(seq_b) + 1) for _ in range(len(seq_a) + 1)]
+    for i in range(1, len(seq_a) + 1):
+        for j in range(1, len(seq_b) + 1):
+            if seq_a[i - 1] == seq_b[j - 1]:
+                dp[i][j] = dp[i - 1][j - 1] + 1
+            else:
+                dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
+    return dp[-1][-1]
+
+
+def test_lcs_random():
+    random.seed(12)
+    for _ in range(100):
+        seq_a = [random.randint(0, 4) for _ in range(random.randint(0, 150))]
+        seq_b = [random.randint(0, 5) for _ in range(random.randint(0, 150))]
+        expected = _lcs_full_table(seq_a, seq_b)
+        assert lcs(seq_a, seq_b) == expected
+        # unhashable items
+        assert lcs([[i] for i in seq_a], [[i] for i in seq_b]) == expected
+        assert lcs(torch.tensor(seq_a, dtype=torch.long), torch.tensor(seq_b, dtype=torch.long)) == expected
+
+
+def test_batched_lcs(available_device):
+    torch.manual_seed(12)
+    seq_a = torch.randint(0, 5, size=(16, 40))
+    seq_b = torch.randint(0, 5, size=(16, 30))
+    # padding
+    seq_a[::2, 25:] = -1
+    seq_b[::3, 10:] = -2
+
+    lengths = _batched_lcs(seq_a.to(available_device), seq_b.to(available_device))
+    assert lengths.shape == (16,)
+    for i in range(16):
+        expected = _lcs_full_table([t for t in seq_a[i].tolist() if t >= 0], [t for t in seq_b[i].tolist() if t >= 0])
+        assert lengths[i] == expected
+
+
 def test_modified_precision_empty():
     for k in range(1, 5):
         n, d = modified_precision([[]], [], k)
@@ -55,3 +96,23 @@ def test_modified_precision(references, candidate, expected):
     for n, (e_n, e_d) in enumerate(expected, start=1):
         n, d = modified_precision(references, candidate, n)
         assert n == e_n and d == e_d
+
+
+def test_batched_modified_precision():
+    random.seed(12)
+    references = [[[]], [[0]], [[]], [list(range(4))], [[0, 0, 0], [1, 2]], [[0, 1, 2], [0, 0, 3]], []]
+    candidates = [[], [], list(range(4)), [], [1, 2, 3, 4], [0, 0, 0, 1, 2], [0, 1]]
+    for _ in range(50):
+        candidates.append([random.choice("abcd") for _ in range(random.randint(0, 12))])
+        references.append(
+            [[random.choice("abcde") for _ in range(random.randint(0, 12))] for _ in range(random.randint(1, 3))]
+        )
+
+    numerators, denominators = _batched_modified_precision(references, candidates, 5)
+    assert numerators.shape == denominators.shape == (len(candidates), 5)
+    for i, (refs, candidate) in enumerate(zip(references, candidates)):
+        for k in range(1, 6):
+            assert (numerators[i, k - 1], denominators[i, k - 1]) == modified_precision(refs, candidate, k)
+
+    numerators, denominators = _batched_modified_precision([], [], 4)
+    assert numerators.shape == denominators.shape == (0, 4)
@@ -7,7 +7,16 @@ import torch
 
 import ignite.distributed as idist
 
-from ignite.metrics.regression._base import _BaseRegression, _torch_median
+from ignite.metrics.regression._base import (
+    _BaseRegression,
+    _batch_moments,
+    _merge_moments,
+    _tdigest_merge,
+    _tdigest_quantiles,
+    _tdigest_size,
+    _torch_median,
+    _torch_quantiles,
+)
 
 
 def test_base_regression_shapes():
@@ -68,3 +77,54 @@ def test_on_even_size_gpu(size):
 @pytest.mark.parametrize("size", [100, 101, (30, 3), (31, 3)])
 def test_create_even_size_cpu(size):
     test_torch_median_numpy(size, device="cpu")
+
+
+@pytest.mark.parametrize("size", [1, 100, 101, (31, 3)])
+def test_torch_quantiles_numpy(size):
+    data = torch.rand(size)
+    quantiles = (0.0, 0.1, 0.5, 0.5, 0.99, 1.0)
+    np.testing.assert_allclose(_torch_quantiles(data, quantiles).numpy(), np.quantile(data.numpy(), quantiles))
+
+
+@pytest.mark.parametrize("compression", [20, 100])
+@pytest.mark.parametrize("sort", [False, True])
+def test_tdigest(compression, sort):
+    torch.manual_seed(12)
+    data = torch.randn(50000, dtype=torch.float64).exp()
+    if sort:
+        data = data.sort()[0]
+    centroids = torch.zeros(_tdigest_size(compression), 2, dtype=torch.float64)
+    for batch in data.split(100):
+        centroids = _tdigest_merge(centroids, batch, compression)
+    assert centroids[:, 1].sum() == len(data)
+    assert centroids[:, 0] @ centroids[:, 1] == pytest.approx(data.sum().item())
+
+    quantiles = (0.01, 0.1, 0.5, 0.9, 0.99)
+    estimates = _tdigest_quantiles(centroids, data.min(), data.max(), quantiles)
+    for q, estimate in zip(quantiles, estimates):
+        rank = (data <= estimate).double().mean().item()
+        assert abs(rank - q) <= np.pi * np.sqrt(q * (1 - q)) / compression
+
+    # few values are kept exactly
+    data = torch.rand(7, dtype=torch.float64)
+    centroids = _tdigest_merge(torch.zeros(_tdigest_size(100), 2, dtype=torch.float64), data, 100)
+    quantiles = (0.0, 0.5, 1.0)
+    np.testing.assert_allclose(
+        _tdigest_quantiles(centroids, data.min(), data.max(), quantiles).numpy(), np.quantile(data, quantiles)
+    )
+
+
+def test_merge_moments():
+    torch.manual_seed(12)
+    # large magnitude, where the raw sums of squares cancel
+    x = torch.randn(1000, 3, dtype=torch.float64) + 1e8
+    moments = torch.zeros(1 + 3 + 9, dtype=torch.float64)
+    for batch in x.split(64):
+        moments = _merge_moments(torch.stack([moments, _batch_moments(batch)]), 3)
+
+    # partitions merged at once, including an empty one
+    partitions = torch.stack([_batch_moments(x[:300]), _batch_moments(x[300:]), torch.zeros_like(moments)])
+    for m in [moments, _merge_moments(partitions, 3)]:
+        assert m[0] == len(x)
+        np.testing.assert_allclose(m[1:4].numpy(), x.mean(dim=0).numpy())
+        np.testing.assert_allclose(m[4:].view(3, 3).numpy(), np.cov(x.numpy().T) * (len(x) - 1), rtol=1e-6)
@@ -77,6 +77,65 @@ def test_median_absolute_error_2():
     assert np_median_absolute_error == pytest.approx(m.compute())
 
 
+def test_wrong_quantiles_and_compression():
+    with pytest.raises(ValueError, match=r"Argument quantiles should be a non-empty sequence of numbers in \[0, 1\]"):
+        MedianAbsoluteError(quantiles=())
+
+    with pytest.raises(ValueError, match=r"Argument quantiles should be a non-empty sequence of numbers in \[0, 1\]"):
+        MedianAbsoluteError(quantiles=(0.5, 1.5))
+
+    with pytest.raises(ValueError, match=r"Argument compression should be an integer greater than 1"):
+        MedianAbsoluteError(compression=1)
+
+    m = MedianAbsoluteError(compression=100)
+    with pytest.raises(NotComputableError, match=r"MedianAbsoluteError must have at least one example"):
+        m.compute()
+
+
+def test_quantiles():
+    np.random.seed(1)
+    size = 105
+    np_y_pred = np.random.rand(size)
+    np_y = np.random.rand(size)
+    quantiles = (0.5, 0.9, 0.99)
+    np_quantiles = np.quantile(np.abs(np_y - np_y_pred), quantiles)
+
+    m = MedianAbsoluteError(quantiles=quantiles)
+    for y_pred, y in zip(torch.from_numpy(np_y_pred).split(16), torch.from_numpy(np_y).split(16)):
+        m.update((y_pred, y))
+
+    res = m.compute()
+    assert isinstance(res, torch.Tensor)
+    np.testing.assert_allclose(res.numpy(), np_quantiles)
+
+
+@pytest.mark.parametrize("quantiles", [None, (0.1, 0.5, 0.9, 0.99)])
+def test_compression(quantiles):
+    np.random.seed(1)
+    size = 20000
+    np_y_pred = np.random.rand(size)
+    np_y = np.random.rand(size)
+    e = np.abs(np_y - np_y_pred)
+
+    m = MedianAbsoluteError(quantiles=quantiles, compression=100)
+    for y_pred, y in zip(torch.from_numpy(np_y_pred).split(64), torch.from_numpy(np_y).split(64)):
+        m.update((y_pred, y))
+
+    res = m.compute()
+    if quantiles is None:
+        assert isinstance(res, float)
+        values = {0.5: res}
+    else:
+        values = dict(zip(quantiles, res.tolist()))
+    for q, value in values.items():
+        assert abs(np.mean(e <= value) - q) < 0.005
+
+    # the sketch is restored from the state dict
+    m2 = MedianAbsoluteError(quantiles=quantiles, compression=100)
+    m2.load_state_dict(m.state_dict())
+    assert torch.equal(torch.as_tensor(m2.compute()), torch.as_tensor(res))
+
+
 def test_integration_median_absolute_error():
     np.random.seed(1)
     size = 105
@@ -185,6 +244,24 @@ def _test_distrib_integration(device):
             _test(n_epochs=2, metric_device=metric_device)
 
 
+def _test_distrib_quantiles(device):
+    quantiles = (0.1, 0.5, 0.9)
+    for metric_device in ["cpu", idist.device()]:
+        torch.manual_seed(10 + idist.get_rank())
+        y_pred = torch.rand(2000, device=device)
+        y = torch.rand(2000, device=device)
+        exact = MedianAbsoluteError(quantiles=quantiles, device=metric_device)
+        approx = MedianAbsoluteError(quantiles=quantiles, compression=100, device=metric_device)
+        for batch in zip(y_pred.split(100), y.split(100)):
+            exact.update(batch)
+            approx.update(batch)
+
+        e = torch.abs(idist.all_gather(y) - idist.all_gather(y_pred)).cpu().numpy()
+        np.testing.assert_allclose(exact.compute().cpu().numpy(), np.quantile(e, quantiles), rtol=1e-6)
+        for q, value in zip(quantiles, approx.compute().tolist()):
+            assert abs(np.mean(e <= value) - q) < 0.01
+
+
 @pytest.mark.distributed
 @pytest.mark.skipif(not idist.has_native_dist_support, reason="Skip if no native dist support")
 @pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
@@ -192,6 +269,7 @@ def test_distrib_nccl_gpu(distributed_context_single_node_nccl):
     device = idist.device()
     _test_distrib_compute(device)
     _test_distrib_integration(device)
+    _test_distrib_quantiles(device)
 
 
 @pytest.mark.distributed
@@ -200,6 +278,7 @@ def test_distrib_gloo_cpu_or_gpu(distributed_context_single_node_gloo):
     device = idist.device()
     _test_distrib_compute(device)
     _test_distrib_integration(device)
+    _test_distrib_quantiles(device)
 
 
 @pytest.mark.distributed
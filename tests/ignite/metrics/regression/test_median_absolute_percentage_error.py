@@ -77,6 +77,40 @@ def test_median_absolute_percentage_error_2():
     assert np_median_absolute_percentage_error == pytest.approx(m.compute())
 
 
+@pytest.mark.parametrize("quantiles", [None, (0.1, 0.5, 0.9)])
+def test_compression(quantiles):
+    np.random.seed(1)
+    size = 20000
+    np_y_pred = np.random.rand(size)
+    np_y = np.random.rand(size) + 0.5
+    e = 100.0 * np.abs(np_y - np_y_pred) / np.abs(np_y)
+
+    m = MedianAbsolutePercentageError(quantiles=quantiles, compression=100)
+    for y_pred, y in zip(torch.from_numpy(np_y_pred).split(64), torch.from_numpy(np_y).split(64)):
+        m.update((y_pred, y))
+
+    res = m.compute()
+    if quantiles is None:
+        assert isinstance(res, float)
+        values = {0.5: res}
+    else:
+        values = dict(zip(quantiles, res.tolist()))
+    for q, value in values.items():
+        assert abs(np.mean(e <= value) - q) < 0.01
+
+
+def test_compression_zero_targets():
+    y_pred = torch.tensor([1.0, 2.0, 3.0, 4.0])
+    y = torch.tensor([0.0, 4.0, 0.0, 5.0])
+
+    m = MedianAbsolutePercentageError(compression=100)
+    m.update((y_pred, y))
+    m.update((y_pred[:1], y[:1]))
+
+    # the infinite errors of the zero targets are left out of the t-digest
+    assert m.compute() == pytest.approx(35.0)
+
+
 def test_integration_median_absolute_percentage_error():
     np.random.seed(1)
     size = 105
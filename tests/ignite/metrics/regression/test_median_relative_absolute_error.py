@@ -77,6 +77,29 @@ def test_median_relative_absolute_error_2():
     assert np_median_absolute_relative_error == pytest.approx(m.compute())
 
 
+@pytest.mark.parametrize("quantiles", [None, (0.1, 0.5, 0.9)])
+def test_compression(quantiles):
+    np.random.seed(1)
+    size = 20000
+    np_y_pred = np.random.rand(size)
+    np_y = np.random.rand(size) + 0.5
+    e = np.abs(np_y - np_y_pred) / np.abs(np_y - np_y.mean())
+
+    m = MedianRelativeAbsoluteError(quantiles=quantiles, compression=100)
+    for y_pred, y in zip(torch.from_numpy(np_y_pred).split(64), torch.from_numpy(np_y).split(64)):
+        m.update((y_pred, y))
+
+    res = m.compute()
+    if quantiles is None:
+        assert isinstance(res, float)
+        values = {0.5: res}
+    else:
+        values = dict(zip(quantiles, res.tolist()))
+    # the mean of the targets is estimated by their running mean
+    for q, value in values.items():
+        assert abs(np.mean(e <= value) - q) < 0.01
+
+
 def test_integration_median_relative_absolute_error_with_output_transform():
     np.random.seed(1)
     size = 105
@@ -131,6 +131,18 @@ def test_integration(n_times, test_case: Tuple[Tensor, Tensor, int]):
     assert pytest.approx(np_ans, rel=2e-4) == corr
 
 
+def test_large_magnitude():
+    torch.manual_seed(12)
+    y = torch.randn(10000, dtype=torch.float64) + 1e6
+    y_pred = y + 0.1 * torch.randn(10000, dtype=torch.float64)
+
+    m = PearsonCorrelation()
+    for batch in zip(y_pred.split(100), y.split(100)):
+        m.update(batch)
+
+    assert pytest.approx(scipy_corr(y_pred.numpy(), y.numpy()), rel=1e-9) == m.compute()
+
+
 def test_accumulator_detached():
     corr = PearsonCorrelation()
 
@@ -138,16 +150,7 @@ def test_accumulator_detached():
     y = torch.tensor([-2.0, -1.0])
     corr.update((y_pred, y))
 
-    assert all(
-        (not accumulator.requires_grad)
-        for accumulator in (
-            corr._sum_of_products,
-            corr._sum_of_y_pred_squares,
-            corr._sum_of_y_preds,
-            corr._sum_of_y_squares,
-            corr._sum_of_ys,
-        )
-    )
+    assert not corr._moments.requires_grad
 
 
 @pytest.mark.usefixtures("distributed")
@@ -231,14 +234,7 @@ class TestDistributed:
         for metric_device in metric_devices:
             corr = PearsonCorrelation(device=metric_device)
 
-            devices = (
-                corr._device,
-                corr._sum_of_products.device,
-                corr._sum_of_y_pred_squares.device,
-                corr._sum_of_y_preds.device,
-                corr._sum_of_y_squares.device,
-                corr._sum_of_ys.device,
-            )
+            devices = (corr._device, corr._moments.device)
             for dev in devices:
                 assert dev == metric_device, f"{type(dev)}:{dev} vs {type(metric_device)}:{metric_device}"
 
@@ -246,13 +242,6 @@ class TestDistributed:
             y = torch.tensor([-1.0, 1.0])
             corr.update((y_pred, y))
 
-            devices = (
-                corr._device,
-                corr._sum_of_products.device,
-                corr._sum_of_y_pred_squares.device,
-                corr._sum_of_y_preds.device,
-                corr._sum_of_y_squares.device,
-                corr._sum_of_ys.device,
-            )
+            devices = (corr._device, corr._moments.device)
             for dev in devices:
                 assert dev == metric_device, f"{type(dev)}:{dev} vs {type(metric_device)}:{metric_device}"
@@ -63,6 +63,18 @@ def test_r2_score_2():
     assert r2_score(np_y, np_y_pred) == pytest.approx(m.compute())
 
 
+def test_large_magnitude():
+    torch.manual_seed(12)
+    y = torch.randn(10000, dtype=torch.float64) + 1e6
+    y_pred = y + 0.1 * torch.randn(10000, dtype=torch.float64)
+
+    m = R2Score()
+    for batch in zip(y_pred.split(100), y.split(100)):
+        m.update(batch)
+
+    assert pytest.approx(r2_score(y.numpy(), y_pred.numpy()), rel=1e-9) == m.compute()
+
+
 def test_integration_r2_score():
     np.random.seed(1)
     size = 105
@@ -21,8 +21,9 @@ def mock_no_sklearn():
 
 
 def test_no_sklearn(mock_no_sklearn):
-    with pytest.raises(ModuleNotFoundError, match=r"This contrib module requires scikit-learn to be installed."):
-        AveragePrecision()
+    ap = AveragePrecision()
+    ap.update((torch.tensor([0.1, 0.4, 0.35, 0.8]), torch.tensor([0, 0, 1, 1])))
+    assert ap.compute() == pytest.approx(0.8333333)
 
 
 def test_no_update():
@@ -102,6 +103,32 @@ def test_binary_and_multilabel_inputs(n_times, test_data_binary_and_multilabel):
     assert average_precision_score(np_y, np_y_pred) == pytest.approx(res)
 
 
+def test_ties_match_sklearn():
+    torch.manual_seed(12)
+    # quantized scores produce many ties
+    y_pred = torch.randint(0, 5, size=(100,)).float() / 4
+    y = torch.randint(0, 2, size=(100,))
+    ap = AveragePrecision()
+    ap.update((y_pred, y))
+    assert average_precision_score(y.numpy(), y_pred.numpy()) == pytest.approx(ap.compute())
+
+
+def test_binned():
+    torch.manual_seed(12)
+    num_bins = 11
+    y_pred = torch.linspace(0, 1, num_bins)[torch.randint(0, num_bins, size=(100, 3))]
+    y = torch.randint(0, 2, size=(100, 3))
+    ap = AveragePrecision(num_bins=num_bins)
+    ap.update((y_pred, y))
+    assert average_precision_score(y.numpy(), y_pred.numpy()) == pytest.approx(ap.compute())
+
+    y_pred = torch.rand(1000)
+    y = torch.randint(0, 2, size=(1000,))
+    ap = AveragePrecision(num_bins=1000)
+    ap.update((y_pred, y))
+    assert average_precision_score(y.numpy(), y_pred.numpy()) == pytest.approx(ap.compute(), abs=1e-2)
+
+
 @pytest.fixture(params=[item for item in range(4)])
 def test_data_integration_binary_and_multilabel(request):
     return [
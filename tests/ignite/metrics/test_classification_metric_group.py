@@ -0,0 +1,194 @@
+import pytest
+import torch
+
+import ignite.distributed as idist
+from ignite.engine import Engine
+from ignite.exceptions import NotComputableError
+from ignite.metrics import (
+    Accuracy,
+    ClassificationMetricGroup,
+    ClassificationReport,
+    ConfusionMatrix,
+    Fbeta,
+    Loss,
+    mIoU,
+    Precision,
+    Recall,
+    TopKCategoricalAccuracy,
+)
+
+
+def _create_metrics(num_classes):
+    precision = Precision(average=False)
+    recall = Recall(average=False)
+    cm = ConfusionMatrix(num_classes)
+    return {
+        "accuracy": Accuracy(),
+        "precision": precision,
+        "recall": recall,
+        "macro_precision": Precision(average="macro"),
+        "weighted_precision": Precision(average="weighted"),
+        "micro_recall": Recall(average="micro"),
+        "f1": Fbeta(1.0, precision=precision, recall=recall),
+        "report": ClassificationReport(output_dict=True),
+        "cm": cm,
+        "cm_recall": ConfusionMatrix(num_classes, average="recall"),
+        "cm_samples": ConfusionMatrix(num_classes, average="samples"),
+        "miou": mIoU(cm),
+        "top2": TopKCategoricalAccuracy(k=2),
+        "top3": TopKCategoricalAccuracy(k=3),
+    }
+
+
+def _assert_equal_metrics(metrics, expected_metrics, names):
+    for name in names:
+        value, expected = metrics[name], expected_metrics[name]
+        if isinstance(expected, torch.Tensor):
+            assert value.dtype == expected.dtype
+            assert torch.allclose(value, expected), name
+        elif isinstance(expected, dict):
+            for key in expected:
+                assert value[key] == pytest.approx(expected[key]), name
+        else:
+            assert type(value) is type(expected)
+            assert value == pytest.approx(expected), name
+
+
+def test_arg_validation():
+    with pytest.raises(TypeError, match=r"Argument metrics should be a non-empty dictionary of metrics"):
+        ClassificationMetricGroup({}, num_classes=3)
+
+    with pytest.raises(ValueError, match=r"Argument num_classes needs to be > 1"):
+        ClassificationMetricGroup({"accuracy": Accuracy()}, num_classes=1)
+
+    with pytest.raises(ValueError, match=r"Accuracy with is_multilabel=True is not supported"):
+        ClassificationMetricGroup({"accuracy": Accuracy(is_multilabel=True)}, num_classes=3)
+
+    with pytest.raises(ValueError, match=r"Recall with average='samples' is not supported"):
+        ClassificationMetricGroup({"recall": Recall(average="samples")}, num_classes=3)
+
+    with pytest.raises(ValueError, match=r"ConfusionMatrix has a different number of classes: 4 vs 3"):
+        ClassificationMetricGroup({"cm": ConfusionMatrix(4)}, num_classes=3)
+
+    with pytest.raises(ValueError, match=r"TopKCategoricalAccuracy k should be in \[1, 3\], got 5"):
+        ClassificationMetricGroup({"top5": TopKCategoricalAccuracy(k=5)}, num_classes=3)
+
+    with pytest.raises(TypeError, match=r"Metric Loss can not be computed by ClassificationMetricGroup"):
+        ClassificationMetricGroup({"loss": Loss(torch.nn.functional.cross_entropy)}, num_classes=3)
+
+    with pytest.raises(TypeError, match=r"Metric Loss can not be computed by ClassificationMetricGroup"):
+        ClassificationMetricGroup({"loss": Loss(torch.nn.functional.cross_entropy) * 2}, num_classes=3)
+
+
+def test_no_update():
+    metrics = ClassificationMetricGroup({"accuracy": Accuracy()}, num_classes=3)
+    with pytest.raises(NotComputableError, match=r"ClassificationMetricGroup must have at least one example"):
+        metrics.compute()
+
+
+def test_wrong_inputs():
+    metrics = ClassificationMetricGroup({"accuracy": Accuracy()}, num_classes=3)
+    with pytest.raises(ValueError, match=r"y_pred must have shape \(batch_size, num_classes \(currently set to 3\)"):
+        metrics.update((torch.rand(10), torch.randint(0, 3, size=(10,))))
+
+    with pytest.raises(ValueError, match=r"y_pred must have shape \(batch_size, num_classes \(currently set to 3\)"):
+        metrics.update((torch.rand(10, 4), torch.randint(0, 3, size=(10,))))
+
+    with pytest.raises(ValueError, match=r"and y must have shape of \(batch_size, ...\)"):
+        metrics.update((torch.rand(10, 3), torch.randint(0, 3, size=(10, 2))))
+
+
+@pytest.mark.parametrize("shape", [(16,), (4, 5, 6)])
+def test_matches_individual_metrics(shape):
+    torch.manual_seed(12)
+    num_classes = 5
+    data = [
+        (torch.rand(shape[0], num_classes, *shape[1:]), torch.randint(0, num_classes, size=shape)) for _ in range(5)
+    ]
+    metrics = _create_metrics(num_classes)
+    if len(shape) > 1:
+        # TopKCategoricalAccuracy supports only (batch_size, num_classes) inputs
+        del metrics["top2"], metrics["top3"]
+
+    engine = Engine(lambda e, batch: batch)
+    ClassificationMetricGroup(metrics, num_classes=num_classes).attach(engine, "group")
+    state = engine.run(data)
+    assert set(state.metrics["group"]) == set(metrics)
+
+    expected_engine = Engine(lambda e, batch: batch)
+    for name, metric in _create_metrics(num_classes).items():
+        if name in metrics:
+            metric.attach(expected_engine, name)
+    expected_state = expected_engine.run(data)
+
+    _assert_equal_metrics(state.metrics, expected_state.metrics, metrics)
+
+
+def test_out_of_range_targets_and_state_dict():
+    torch.manual_seed(12)
+    num_classes = 3
+    data = [(torch.rand(8, num_classes), torch.randint(0, num_classes, size=(8,))) for _ in range(3)]
+    # ignore index
+    for _, y in data:
+        y[::3] = 255
+
+    def create_metrics():
+        cm = ConfusionMatrix(num_classes)
+        return {"accuracy": Accuracy(), "top2": TopKCategoricalAccuracy(k=2), "cm": cm, "miou": mIoU(cm)}
+
+    metrics = ClassificationMetricGroup(create_metrics(), num_classes)
+    for batch in data:
+        metrics.update(batch)
+    res = metrics.compute()
+
+    expected_engine = Engine(lambda e, batch: batch)
+    for name, metric in create_metrics().items():
+        metric.attach(expected_engine, name)
+    expected_state = expected_engine.run(data)
+    _assert_equal_metrics(res, expected_state.metrics, res)
+
+    state_dict = metrics.state_dict()
+    metrics = ClassificationMetricGroup(create_metrics(), num_classes)
+    metrics.load_state_dict(state_dict)
+    assert metrics.compute()["accuracy"] == res["accuracy"]
+
+    metrics = ClassificationMetricGroup({"recall": Recall(average="macro")}, num_classes)
+    with pytest.raises(ValueError, match=r"y contains targets out of \[0, 3\), which are not supported"):
+        metrics.update(data[0])
+
+
+def _test_distrib_integration(device):
+    rank = idist.get_rank()
+    torch.manual_seed(12 + rank)
+    num_classes = 5
+    data = [
+        (torch.rand(16, num_classes, device=device), torch.randint(0, num_classes, size=(16,), device=device))
+        for _ in range(4)
+    ]
+
+    for metric_device in ["cpu", idist.device()]:
+        engine = Engine(lambda e, batch: batch)
+        ClassificationMetricGroup(_create_metrics(num_classes), num_classes, device=metric_device).attach(
+            engine, "group"
+        )
+        state = engine.run(data)
+
+        expected_engine = Engine(lambda e, batch: batch)
+        for name, metric in _create_metrics(num_classes).items():
+            metric.attach(expected_engine, name)
+        expected_state = expected_engine.run(data)
+
+        _assert_equal_metrics(state.metrics, expected_state.metrics, state.metrics["group"])
+
+
+@pytest.mark.distributed
+@pytest.mark.skipif(not idist.has_native_dist_support, reason="Skip if no native dist support")
+@pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
+def test_distrib_nccl_gpu(distributed_context_single_node_nccl):
+    _test_distrib_integration(idist.device())
+
+
+@pytest.mark.distributed
+@pytest.mark.skipif(not idist.has_native_dist_support, reason="Skip if no native dist support")
+def test_distrib_gloo_cpu_or_gpu(distributed_context_single_node_gloo):
+    _test_distrib_integration(idist.device())
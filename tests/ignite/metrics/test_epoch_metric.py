@@ -4,7 +4,7 @@ import torch
 import ignite.distributed as idist
 from ignite.engine import Engine
 from ignite.metrics import EpochMetric
-from ignite.metrics.epoch_metric import EpochMetricWarning, NotComputableError
+from ignite.metrics.epoch_metric import _GrowableBuffer, EpochMetricWarning, NotComputableError
 
 
 def test_epoch_metric_wrong_setup_or_input():
@@ -85,6 +85,116 @@ def test_epoch_metric():
     assert em.compute() == 0.0
 
 
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_buffered_epoch_metric(use_mmap, tmp_path, monkeypatch):
+    # small capacity to check that buffers grow
+    monkeypatch.setattr(_GrowableBuffer, "_min_capacity", 3)
+
+    def compute_fn(y_preds, y_targets):
+        return torch.mean(((y_preds - y_targets.type_as(y_preds)) ** 2)).item()
+
+    kwargs = {"mmap_dir": str(tmp_path)} if use_mmap else {"buffered": True}
+    em = EpochMetric(compute_fn, **kwargs)
+    ref_em = EpochMetric(compute_fn)
+    assert isinstance(em._predictions, _GrowableBuffer)
+
+    for _ in range(5):
+        output = (torch.rand(4, 3), torch.randint(0, 2, size=(4, 3), dtype=torch.long))
+        em.update(output)
+        ref_em.update(output)
+
+    # capacities: 4, 8, 16, 32
+    assert em._predictions._storage.shape[0] == 32
+    assert torch.equal(em._predictions.data, torch.cat(ref_em._predictions))
+    assert torch.equal(em._targets.data, torch.cat(ref_em._targets))
+    assert em.compute() == ref_em.compute()
+    # mmap files are removed once mapped
+    assert list(tmp_path.iterdir()) == []
+
+    with pytest.raises(ValueError, match=r"Incoherent shapes between input tensor and stored tensors"):
+        em.update((torch.rand(4, 2), torch.randint(0, 2, size=(4, 2), dtype=torch.long)))
+
+    em.reset()
+    with pytest.raises(NotComputableError, match=r"EpochMetric must have at least one example"):
+        em.compute()
+
+
+def test_buffered_epoch_metric_reduced_precision():
+    received_dtypes = []
+
+    def compute_fn(y_preds, y_targets):
+        received_dtypes.append((y_preds.dtype, y_targets.dtype))
+        return 0.0
+
+    em = EpochMetric(compute_fn, predictions_dtype=torch.bfloat16, targets_dtype=torch.uint8)
+    y_pred, y = torch.rand(4, 3), torch.randint(0, 2, size=(4, 3), dtype=torch.long)
+    em.update((y_pred, y))
+    em.compute()
+
+    assert em._predictions.data.dtype == torch.bfloat16 and em._targets.data.dtype == torch.uint8
+    assert torch.equal(em._targets.data, y.to(torch.uint8))
+    assert torch.allclose(em._predictions.data.float(), y_pred, atol=1e-2)
+    # bfloat16 predictions are given as float32 to compute_fn
+    assert received_dtypes == [(torch.float32, torch.uint8), (torch.float32, torch.uint8)]
+
+    # input dtypes are still checked
+    with pytest.raises(ValueError, match=r"Incoherent types between input y_pred and stored predictions"):
+        em.update((torch.rand(4, 3).double(), y))
+
+
+def test_buffered_epoch_metric_state_dict():
+    def compute_fn(y_preds, y_targets):
+        return (y_preds * y_targets).sum().item()
+
+    em = EpochMetric(compute_fn, buffered=True)
+    ref_em = EpochMetric(compute_fn)
+    for _ in range(2):
+        output = (torch.rand(4), torch.randint(0, 2, size=(4,)))
+        em.update(output)
+        ref_em.update(output)
+
+    # state dicts of non-buffered metrics can be loaded too
+    for src in [em, ref_em]:
+        dst = EpochMetric(compute_fn, buffered=True)
+        dst.load_state_dict(src.state_dict())
+        assert dst.compute() == pytest.approx(ref_em.compute())
+
+    empty_em = EpochMetric(compute_fn, buffered=True)
+    empty_em.load_state_dict(EpochMetric(compute_fn, buffered=True).state_dict())
+    assert len(empty_em._predictions) == 0
+
+
+def test_buffered_epoch_metric_reduced_precision_state_dict():
+    def compute_fn(y_preds, y_targets):
+        return (y_preds * y_targets).sum().item()
+
+    em = EpochMetric(compute_fn, predictions_dtype=torch.float16)
+    ref_em = EpochMetric(compute_fn)
+    output = (torch.rand(4), torch.randint(0, 2, size=(4,)))
+    em.update(output)
+    ref_em.update((output[0].half().float(), output[1]))
+
+    dst = EpochMetric(compute_fn, predictions_dtype=torch.float16)
+    dst.load_state_dict(em.state_dict())
+    # float32 inputs are accepted after loading float16 stored predictions
+    output = (torch.rand(4), torch.randint(0, 2, size=(4,)))
+    dst.update(output)
+    ref_em.update((output[0].half().float(), output[1]))
+    assert dst._predictions.data.dtype == torch.float16
+    assert dst.compute() == pytest.approx(ref_em.compute(), abs=1e-2)
+
+    with pytest.raises(ValueError, match=r"Incoherent types between input y_pred and stored predictions"):
+        dst.update((torch.rand(4).double(), output[1]))
+
+
+def test_buffered_epoch_metric_wrong_setup(tmp_path):
+    with pytest.raises(ValueError, match=r"Argument mmap_dir should be an existing directory"):
+        EpochMetric(lambda x, y: 0.0, mmap_dir=str(tmp_path / "missing"))
+
+    with pytest.raises(ValueError, match=r"Argument mmap_dir can only be used with a CPU device"):
+        EpochMetric(lambda x, y: 0.0, mmap_dir=str(tmp_path), device="cuda")
+
+
 def test_mse_epoch_metric():
     def compute_fn(y_preds, y_targets):
         return torch.mean(((y_preds - y_targets.type_as(y_preds)) ** 2)).item()
@@ -188,6 +298,30 @@ def test_distrib_integration(distributed):
     assert ep_metric.compute() == ep_metric_true
 
 
+def test_distrib_integration_uneven_shards(distributed):
+    device = idist.device() if idist.device().type != "xla" else "cpu"
+    rank = idist.get_rank()
+    ws = idist.get_world_size()
+
+    # each rank holds a different number of samples, like with DistributedSampler(drop_last=False)
+    def get_data(r):
+        y_true = torch.arange(r + 2, device=device) + 10 * r
+        return [(y_true[: r + 1].float(), y_true[: r + 1]), (y_true[r + 1 :].float(), y_true[r + 1 :])]
+
+    def compute_fn(y_preds, y):
+        # depends on the number and the order of the gathered samples
+        assert y_preds.shape == y.shape
+        return (y.cpu() * torch.arange(1, len(y) + 1)).sum().item()
+
+    y_true = torch.cat([torch.arange(r + 2) + 10 * r for r in range(ws)])
+    for buffered in [False, True]:
+        engine = Engine(lambda e, batch: batch)
+        ep_metric = EpochMetric(compute_fn, check_compute_fn=False, device=device, buffered=buffered)
+        ep_metric.attach(engine, "epm")
+        engine.run(get_data(rank), max_epochs=1)
+        assert engine.state.metrics["epm"] == compute_fn(y_true, y_true)
+
+
 def test_skip_unrolling():
     def compute_fn(y_preds, y_targets):
         return 0.0
@@ -1,7 +1,7 @@
 import numbers
 import os
 from typing import Dict, List
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -12,10 +12,12 @@ from sklearn.metrics import confusion_matrix, f1_score, precision_score, recall_
 
 import ignite.distributed as idist
 from ignite.engine import Engine, Events, State
-from ignite.metrics import Accuracy, ConfusionMatrix, Precision, Recall
+from ignite.metrics import Accuracy, ConfusionMatrix, MetricsLambda, Precision, Recall
 from ignite.metrics.metric import (
+    _all_reduce_coalesced,
     BatchFiltered,
     BatchWise,
+    coalesce_sync_all_reduce,
     EpochWise,
     Metric,
     reinit__is_reduced,
@@ -703,6 +705,79 @@ def _test_distrib_sync_all_reduce_decorator(device):
     m.compute()
 
 
+def test_all_reduce_coalesced():
+    a = torch.tensor([[1.0, 2.0], [3.0, 4.0]])
+    b = torch.tensor(5.0)
+    c = torch.tensor([1, 2], dtype=torch.long)
+    values_ops = [(a, "SUM"), (1, "SUM"), (b, "SUM"), (2.5, "SUM"), (c, "SUM"), (3, "SUM"), (b, "MAX")]
+
+    with patch.object(idist, "all_reduce", wraps=idist.all_reduce) as all_reduce:
+        results = _all_reduce_coalesced(values_ops)
+
+    # SUM on float tensors, SUM on long tensors, SUM on ints, SUM on floats, MAX on float tensors
+    assert all_reduce.call_count == 5
+    for (value, _), result in zip(values_ops, results):
+        if isinstance(value, torch.Tensor):
+            assert result.dtype == value.dtype and result.shape == value.shape
+            assert (result == value).all()
+            assert result.data_ptr() != value.data_ptr()
+        else:
+            assert type(result) is type(value) and result == value
+
+
+def _test_distrib_coalesce_sync_all_reduce(device):
+    class DummyMetric(Metric):
+        @reinit__is_reduced
+        def reset(self):
+            self.a = torch.zeros(3, device=self._device)
+            self.n = 0
+            self.m = 0
+
+        @reinit__is_reduced
+        def update(self, output):
+            self.a += output
+            self.n += 1
+            self.m = max(self.m, idist.get_rank())
+
+        @sync_all_reduce("a", "n", "m:MAX")
+        def compute(self):
+            return self.a.sum().item() / self.n + self.m
+
+    rank = idist.get_rank()
+    ws = idist.get_world_size()
+    metric_device = device if torch.device(device).type != "xla" else "cpu"
+    data = [torch.full((3,), float(rank + i)) for i in range(4)]
+
+    def run(coalesce):
+        engine = Engine(lambda e, b: b)
+        metrics = [DummyMetric(device=metric_device) for _ in range(3)]
+        for i, m in enumerate(metrics[:2]):
+            m.attach(engine, f"m{i}")
+        metric_lambda = MetricsLambda(lambda x, y: x + y, metrics[2], 1.0)
+        metric_lambda.attach(engine, "m2")
+        if coalesce:
+            coalesce_sync_all_reduce(engine, [metrics[0], metrics[1], metric_lambda])
+        with patch.object(idist, "all_reduce", wraps=idist.all_reduce) as all_reduce:
+            engine.run(data, max_epochs=2)
+        return engine.state.metrics, all_reduce.call_count
+
+    metrics, num_calls = run(coalesce=False)
+    coalesced_metrics, coalesced_num_calls = run(coalesce=True)
+
+    expected = 3 * sum(r + i for r in range(ws) for i in range(4)) / (4 * ws) + ws - 1
+    assert metrics == {"m0": approx(expected), "m1": approx(expected), "m2": approx(expected + 1.0)}
+    assert coalesced_metrics == metrics
+    if ws > 1:
+        # per metric: a, n, m:MAX in 3 collectives vs a single round of 3 collectives for all metrics
+        assert num_calls == 2 * 3 * 3
+        assert coalesced_num_calls == 2 * 3
+
+
+def test_coalesce_sync_all_reduce_wrong_input():
+    with pytest.raises(TypeError, match=r"Argument metrics should be an iterable of Metric"):
+        coalesce_sync_all_reduce(Engine(lambda e, b: b), [DummyMetric1(true_output=(0, 1)), 1.0])
+
+
 def _test_creating_on_xla_fails(device):
     with pytest.raises(ValueError, match=r"Cannot create metric on an XLA device. Use device='cpu' instead."):
         DummyMetric2(device=device)
@@ -717,6 +792,7 @@ def test_distrib_nccl_gpu(distributed_context_single_node_nccl):
     _test_distrib_sync_all_reduce_decorator(device)
     _test_invalid_sync_all_reduce(device)
     _test_compute_with_sync_all_reduce_doesnt_change_attributes(device)
+    _test_distrib_coalesce_sync_all_reduce(device)
 
     test_state_dict()
     test_load_state_dict()
@@ -730,6 +806,7 @@ def test_distrib_gloo_cpu_or_gpu(distributed_context_single_node_gloo):
     _test_distrib_sync_all_reduce_decorator(device)
     _test_invalid_sync_all_reduce(device)
     _test_compute_with_sync_all_reduce_doesnt_change_attributes(device)
+    _test_distrib_coalesce_sync_all_reduce(device)
     test_state_dict()
     test_load_state_dict()
 
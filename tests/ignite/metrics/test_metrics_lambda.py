@@ -1,4 +1,5 @@
 import os
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -7,7 +8,7 @@ from pytest import approx
 from sklearn.metrics import f1_score, precision_score, recall_score
 
 import ignite.distributed as idist
-from ignite.engine import Engine
+from ignite.engine import Engine, Events
 from ignite.metrics import Accuracy, Metric, MetricsLambda, Precision, Recall
 
 
@@ -419,6 +420,103 @@ def test_recursive_attachment():
     _test(some_metric, "some metric", compute_true_somemetric)
 
 
+class CountingMetric(ListGatherMetric):
+    def __init__(self, index):
+        self.num_computes = 0
+        super(CountingMetric, self).__init__(index)
+
+    def compute(self):
+        self.num_computes += 1
+        return super(CountingMetric, self).compute()
+
+
+def test_shared_dependencies_computed_once():
+    m0 = CountingMetric(0)
+    m1 = CountingMetric(1)
+
+    num_lambda_computes = []
+
+    def add(x, y):
+        num_lambda_computes.append(1)
+        return x + y
+
+    # diamond: m0 and m1 are shared by all the lambdas, shared is shared by two of them
+    shared = MetricsLambda(add, m0, m1)
+    lambdas = {
+        "a": MetricsLambda(lambda x, y: x * y, m0, m1),
+        "b": MetricsLambda(lambda x, y: x - y, shared, m0),
+        "c": MetricsLambda(lambda x, y: x + y, shared, m1),
+        "d": shared * 2,
+    }
+
+    engine = Engine(lambda e, i: [i, 2 * i])
+    # the lambdas reuse the result of the attached metric
+    m0.attach(engine, "m0")
+    for name, m in lambdas.items():
+        m.attach(engine, name)
+
+    metrics = []
+    engine.add_event_handler(Events.EPOCH_COMPLETED, lambda e: metrics.append(dict(e.state.metrics)))
+    engine.run([1, 2, 3], max_epochs=2)
+
+    assert m0.num_computes == 2
+    assert m1.num_computes == 2
+    assert len(num_lambda_computes) == 2
+    assert metrics[-1] == {"a": 18, "b": 6, "c": 15, "d": 18, "m0": 3}
+
+
+def test_memoized_result_invalidated_on_reset_and_update():
+    m0 = CountingMetric(0)
+    m1 = CountingMetric(1)
+    f = MetricsLambda(lambda x, y: x + y, m0, m1)
+    g = MetricsLambda(lambda x, y: x * y, m0, m1)
+
+    engine = Engine(lambda e, i: [i, 2 * i])
+    f.attach(engine, "f")
+    g.attach(engine, "g", usage="batch_wise")
+
+    metrics = []
+    engine.add_event_handler(Events.ITERATION_COMPLETED, lambda e: metrics.append(dict(e.state.metrics)))
+    engine.run([1, 2, 3], max_epochs=2)
+
+    assert metrics[1] == {"g": 8}
+    assert metrics[-1] == {"f": 9, "g": 18}
+    # computed for g on each iteration, f reuses the results of the last one
+    assert m0.num_computes == 6
+
+    # dependencies updated without an engine are computed again
+    h = m0 - m1
+    h.update([1, 3])
+    assert h.compute() == -2
+    h.update([4, 3])
+    assert h.compute() == 1
+
+
+def _test_distrib_shared_dependencies_reduced_once(device):
+    rank = idist.get_rank()
+    torch.manual_seed(12 + rank)
+    n_classes = 10
+    data = [(torch.rand(16, n_classes).to(device), torch.randint(0, n_classes, size=(16,)).to(device))] * 4
+
+    def Fbeta(r, p, beta):
+        return torch.mean((1 + beta**2) * p * r / (beta**2 * p + r + 1e-20)).item()
+
+    num_all_reduce_calls = []
+    for num_lambdas in [1, 4]:
+        evaluator = Engine(lambda e, batch: batch)
+        precision = Precision(average=False, device=device)
+        recall = Recall(average=False, device=device)
+        for beta in range(1, num_lambdas + 1):
+            MetricsLambda(Fbeta, recall, precision, beta).attach(evaluator, f"F{beta}")
+
+        with patch.object(idist, "all_reduce", wraps=idist.all_reduce) as all_reduce:
+            state = evaluator.run(data)
+        num_all_reduce_calls.append(all_reduce.call_count)
+        assert 0 < state.metrics["F1"] < 1
+
+    assert num_all_reduce_calls[0] == num_all_reduce_calls[1]
+
+
 def _test_distrib_integration(device):
     rank = idist.get_rank()
 
@@ -524,6 +622,7 @@ def test_distrib_nccl_gpu(distributed_context_single_node_nccl):
     device = idist.device()
     _test_distrib_integration(device)
     _test_distrib_metrics_on_diff_devices(device)
+    _test_distrib_shared_dependencies_reduced_once(device)
 
 
 @pytest.mark.distributed
@@ -531,6 +630,7 @@ def test_distrib_nccl_gpu(distributed_context_single_node_nccl):
 def test_distrib_gloo_cpu_or_gpu(distributed_context_single_node_gloo):
     device = idist.device()
     _test_distrib_integration(device)
+    _test_distrib_shared_dependencies_reduced_once(device)
 
 
 @pytest.mark.distributed
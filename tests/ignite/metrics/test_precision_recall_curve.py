@@ -21,11 +21,12 @@ def mock_no_sklearn():
 
 
 def test_no_sklearn(mock_no_sklearn):
-    with pytest.raises(ModuleNotFoundError, match=r"This contrib module requires scikit-learn to be installed."):
-        y = torch.tensor([1, 1])
-        pr_curve = PrecisionRecallCurve()
-        pr_curve.update((y, y))
-        pr_curve.compute()
+    y = torch.tensor([1, 1])
+    pr_curve = PrecisionRecallCurve()
+    pr_curve.update((y, y))
+    precision, recall, thresholds = pr_curve.compute()
+    assert precision.tolist() == [1.0, 1.0]
+    assert recall.tolist() == [1.0, 0.0]
 
 
 def test_precision_recall_curve():
@@ -121,6 +122,23 @@ def test_integration_precision_recall_curve_with_activated_output_transform():
     np.testing.assert_array_almost_equal(thresholds, sk_thresholds)
 
 
+def test_binned_matches_exact_on_thresholds():
+    torch.manual_seed(12)
+    num_bins = 11
+    y_pred = torch.linspace(0, 1, num_bins)[torch.randint(0, num_bins, size=(100,))]
+    y = torch.randint(0, 2, size=(100,))
+
+    pr_curve = PrecisionRecallCurve(num_bins=num_bins)
+    for i in range(0, 100, 16):
+        pr_curve.update((y_pred[i : i + 16], y[i : i + 16]))
+    precision, recall, thresholds = pr_curve.compute()
+
+    sk_precision, sk_recall, sk_thresholds = precision_recall_curve(y.numpy(), y_pred.numpy())
+    np.testing.assert_array_almost_equal(precision.numpy(), sk_precision)
+    np.testing.assert_array_almost_equal(recall.numpy(), sk_recall)
+    np.testing.assert_array_almost_equal(thresholds.numpy(), sk_thresholds)
+
+
 def test_check_compute_fn():
     y_pred = torch.zeros((8, 13))
     y_pred[:, 1] = 1
@@ -7,10 +7,11 @@ import torch
 from sklearn.metrics import roc_auc_score
 
 import ignite.distributed as idist
-from ignite.engine import Engine
+from ignite.engine import Engine, Events
 from ignite.exceptions import NotComputableError
 from ignite.metrics import ROC_AUC
 from ignite.metrics.epoch_metric import EpochMetricWarning
+from ignite.metrics.metric import RunningBatchWise
 
 torch.manual_seed(12)
 
@@ -22,8 +23,9 @@ def mock_no_sklearn():
 
 
 def test_no_sklearn(mock_no_sklearn):
-    with pytest.raises(ModuleNotFoundError, match=r"This contrib module requires scikit-learn to be installed."):
-        ROC_AUC()
+    roc_auc = ROC_AUC()
+    roc_auc.update((torch.tensor([0.1, 0.4, 0.35, 0.8]), torch.tensor([0, 0, 1, 1])))
+    assert roc_auc.compute() == pytest.approx(0.75)
 
 
 def test_no_update():
@@ -103,6 +105,93 @@ def test_binary_and_multilabel_inputs(n_times, test_data_binary_and_multilabel):
     assert roc_auc_score(np_y, np_y_pred) == pytest.approx(res)
 
 
+def test_buffered_storage(tmp_path, test_data_binary_and_multilabel):
+    y_pred, y, batch_size = test_data_binary_and_multilabel
+    roc_auc = ROC_AUC(mmap_dir=str(tmp_path), predictions_dtype=torch.float16, targets_dtype=torch.uint8)
+    for i in range(0, y.shape[0], batch_size):
+        roc_auc.update((y_pred[i : i + batch_size], y[i : i + batch_size]))
+
+    res = roc_auc.compute()
+    assert isinstance(res, float)
+    assert roc_auc_score(y.numpy(), y_pred.half().numpy()) == pytest.approx(res)
+
+
+def test_ties_and_multiclass_match_sklearn():
+    torch.manual_seed(12)
+    # quantized scores produce many ties
+    y_pred = torch.randint(0, 5, size=(100,)).float() / 4
+    y = torch.randint(0, 2, size=(100,))
+    roc_auc = ROC_AUC()
+    roc_auc.update((y_pred, y))
+    assert roc_auc_score(y.numpy(), y_pred.numpy()) == pytest.approx(roc_auc.compute())
+
+    y_pred = torch.softmax(torch.rand(100, 4), dim=1)
+    y = torch.randint(0, 4, size=(100,))
+    roc_auc = ROC_AUC()
+    roc_auc.update((y_pred, y))
+    assert roc_auc_score(y.numpy(), y_pred.numpy(), multi_class="ovr") == pytest.approx(roc_auc.compute())
+
+
+def test_binned_arg_validation():
+    with pytest.raises(ValueError, match=r"Argument num_bins should be an integer greater than 1"):
+        ROC_AUC(num_bins=1)
+
+    roc_auc = ROC_AUC(num_bins=10)
+    with pytest.raises(NotComputableError, match=r"ROC_AUC must have at least one example before it can be computed"):
+        roc_auc.compute()
+
+    roc_auc.update((torch.rand(4, 3), torch.randint(0, 2, size=(4, 3))))
+    with pytest.raises(ValueError, match=r"Incoherent number of classes between input and accumulated histograms"):
+        roc_auc.update((torch.rand(4, 2), torch.randint(0, 2, size=(4, 2))))
+
+
+@pytest.mark.parametrize("shape", [(100,), (100, 3)])
+def test_binned_matches_exact_on_thresholds(shape):
+    torch.manual_seed(12)
+    num_bins = 11
+    # scores on the thresholds are not approximated
+    y_pred = torch.linspace(0, 1, num_bins)[torch.randint(0, num_bins, size=shape)]
+    y = torch.randint(0, 2, size=shape)
+
+    roc_auc = ROC_AUC(num_bins=num_bins)
+    for i in range(0, 100, 16):
+        roc_auc.update((y_pred[i : i + 16], y[i : i + 16]))
+    res = roc_auc.compute()
+    assert isinstance(res, float)
+    assert roc_auc_score(y.numpy(), y_pred.numpy()) == pytest.approx(res)
+
+
+def test_binned_multiclass_and_state_dict():
+    torch.manual_seed(12)
+    y_pred = torch.softmax(torch.rand(500, 4), dim=1)
+    y = torch.randint(0, 4, size=(500,))
+
+    roc_auc = ROC_AUC(num_bins=1000)
+    roc_auc.update((y_pred, y))
+    res = roc_auc.compute()
+    assert roc_auc_score(y.numpy(), y_pred.numpy(), multi_class="ovr") == pytest.approx(res, abs=1e-3)
+
+    state_dict = roc_auc.state_dict()
+    roc_auc = ROC_AUC(num_bins=1000)
+    roc_auc.load_state_dict(state_dict)
+    assert roc_auc.compute() == res
+
+
+def test_binned_running_batch_wise():
+    torch.manual_seed(12)
+    data = [(torch.rand(16), torch.randint(0, 2, size=(16,))) for _ in range(5)]
+    engine = Engine(lambda e, batch: batch)
+    ROC_AUC(num_bins=100).attach(engine, "roc_auc", usage=RunningBatchWise())
+    results = []
+    engine.add_event_handler(Events.ITERATION_COMPLETED, lambda e: results.append(e.state.metrics["roc_auc"]))
+    engine.run(data)
+
+    for i, res in enumerate(results):
+        y_pred = torch.cat([d[0] for d in data[: i + 1]]).numpy()
+        y = torch.cat([d[1] for d in data[: i + 1]]).numpy()
+        assert roc_auc_score(y, y_pred) == pytest.approx(res, abs=2e-2)
+
+
 def test_check_compute_fn():
     y_pred = torch.zeros((8, 13))
     y_pred[:, 1] = 1
@@ -161,9 +250,9 @@ def test_integration_binary_and_multilabel_inputs(n_times, test_data_integration
 def _test_distrib_binary_and_multilabel_inputs(device):
     rank = idist.get_rank()
 
-    def _test(y_pred, y, batch_size, metric_device):
+    def _test(y_pred, y, batch_size, metric_device, num_bins=None):
         metric_device = torch.device(metric_device)
-        roc_auc = ROC_AUC(device=metric_device)
+        roc_auc = ROC_AUC(device=metric_device, num_bins=num_bins)
 
         roc_auc.reset()
         if batch_size > 1:
@@ -207,6 +296,8 @@ def _test_distrib_binary_and_multilabel_inputs(device):
         test_cases = get_test_cases()
         for y_pred, y, batch_size in test_cases:
             _test(y_pred, y, batch_size, "cpu")
+            # binary inputs fall on the thresholds, binned results are exact
+            _test(y_pred, y, batch_size, "cpu", num_bins=2)
             if device.type != "xla":
                 _test(y_pred, y, batch_size, idist.device())
 
@@ -29,8 +29,11 @@ def mock_no_sklearn():
 
 
 def test_no_sklearn(mock_no_sklearn):
-    with pytest.raises(ModuleNotFoundError, match=r"This contrib module requires scikit-learn to be installed"):
-        RocCurve()
+    roc_curve = RocCurve()
+    roc_curve.update((torch.tensor([0.1, 0.4, 0.35, 0.8]), torch.tensor([0, 0, 1, 1])))
+    fpr, tpr, thresholds = roc_curve.compute()
+    assert fpr.tolist() == [0.0, 0.0, 0.5, 0.5, 1.0]
+    assert tpr.tolist() == [0.0, 0.5, 0.5, 1.0, 1.0]
 
 
 def test_roc_curve():
@@ -118,6 +121,27 @@ def test_integration_roc_curve_with_activated_output_transform():
     np.testing.assert_array_almost_equal(thresholds, sk_thresholds)
 
 
+def test_binned_matches_exact_on_thresholds():
+    torch.manual_seed(12)
+    num_bins = 11
+    y_pred = torch.linspace(0, 1, num_bins)[torch.randint(0, num_bins, size=(100,))]
+    y = torch.randint(0, 2, size=(100,))
+
+    roc_curve_metric = RocCurve(num_bins=num_bins)
+    roc_curve_metric.update((y_pred, y))
+    fpr, tpr, thresholds = roc_curve_metric.compute()
+
+    sk_fpr, sk_tpr, sk_thresholds = roc_curve(y.numpy(), y_pred.numpy())
+    np.testing.assert_array_almost_equal(fpr.numpy(), sk_fpr)
+    np.testing.assert_array_almost_equal(tpr.numpy(), sk_tpr)
+    np.testing.assert_array_almost_equal(thresholds.numpy(), sk_thresholds)
+
+    roc_curve_metric = RocCurve(num_bins=num_bins)
+    roc_curve_metric.update((torch.rand(4, 2), torch.randint(0, 2, size=(4, 2))))
+    with pytest.raises(ValueError, match=r"roc_curve supports only binary targets"):
+        roc_curve_metric.compute()
+
+
 def test_check_compute_fn():
     y_pred = torch.zeros((8, 13))
     y_pred[:, 1] = 1
@@ -31,6 +31,12 @@ def test_wrong_input_args():
     with pytest.warns(UserWarning, match=r"`epoch_bound` is deprecated and will be removed in the future."):
         m = RunningAverage(Accuracy(), epoch_bound=True)
 
+    with pytest.raises(ValueError, match=r"Argument sync_every should be a positive integer"):
+        RunningAverage(output_transform=lambda x: x, sync_every=0)
+
+    with pytest.raises(ValueError, match=r"Argument sync_every should be 1 if src is a Metric"):
+        RunningAverage(Accuracy(), sync_every=10)
+
 
 @pytest.mark.filterwarnings("ignore")
 @pytest.mark.parametrize("epoch_bound, usage", [(False, RunningBatchWise()), (True, SingleEpochRunningBatchWise())])
@@ -250,6 +256,31 @@ def test_output_is_tensor():
     assert not v.requires_grad
 
 
+def test_output_on_device_is_not_synchronized():
+    # "meta" tensors can not be converted to numbers: any device-to-host transfer would fail
+    engine = Engine(lambda e, b: torch.tensor(float(b), device="meta"))
+    RunningAverage(output_transform=lambda x: x, device="meta", keep_on_device=True).attach(engine, "avg")
+
+    @engine.on(Events.ITERATION_COMPLETED)
+    def check(e):
+        assert isinstance(e.state.metrics["avg"], torch.Tensor)
+        assert e.state.metrics["avg"].device.type == "meta"
+
+    engine.run(list(range(5)))
+
+    # without opting in, values are converted to numbers
+    engine = Engine(lambda e, b: torch.tensor(float(b), device="meta"))
+    RunningAverage(output_transform=lambda x: x, device="meta").attach(engine, "avg")
+    with pytest.raises(RuntimeError, match=r"meta"):
+        engine.run(list(range(5)))
+
+    # values accumulated on CPU are still converted to numbers
+    engine = Engine(lambda e, b: torch.tensor(float(b)))
+    RunningAverage(output_transform=lambda x: x).attach(engine, "avg")
+    engine.run(list(range(5)))
+    assert isinstance(engine.state.metrics["avg"], float)
+
+
 @pytest.mark.usefixtures("distributed")
 class TestDistributed:
     @pytest.mark.parametrize("usage", [RunningBatchWise(), SingleEpochRunningBatchWise()])
@@ -375,6 +406,38 @@ class TestDistributed:
         if device.type != "xla":
             _test(idist.device())
 
+    @pytest.mark.parametrize("as_tensor", [False, True])
+    def test_sync_every(self, as_tensor):
+        device = idist.device()
+        rank = idist.get_rank()
+        ws = idist.get_world_size()
+        alpha = 0.9
+        sync_every = 3
+        torch.manual_seed(12)
+        all_loss_values = torch.rand(ws, 10, dtype=torch.float64)
+
+        def update_fn(engine, batch):
+            loss_value = all_loss_values[rank, engine.state.iteration - 1].to(device)
+            return loss_value if as_tensor else loss_value.item()
+
+        trainer = Engine(update_fn)
+        metric_device = device if device.type != "xla" else "cpu"
+        avg_output = RunningAverage(
+            output_transform=lambda x: x, alpha=alpha, device=metric_device, sync_every=sync_every
+        )
+        avg_output.attach(trainer, "running_avg_output")
+
+        expected = list(accumulate(all_loss_values.mean(dim=0).tolist(), lambda a, o: a * alpha + (1.0 - alpha) * o))
+
+        @trainer.on(Events.ITERATION_COMPLETED)
+        def check_running_avg_output(engine):
+            i = engine.state.iteration
+            # the value of the last synchronization, on the first update and every sync_every updates
+            last_sync = max(1, i - i % sync_every)
+            assert engine.state.metrics["running_avg_output"] == pytest.approx(expected[last_sync - 1])
+
+        trainer.run(range(10))
+
     def test_accumulator_device(self):
         device = idist.device()
         metric_devices = [torch.device("cpu")]
@@ -7,7 +7,7 @@ from skimage.metrics import structural_similarity as ski_ssim
 
 import ignite.distributed as idist
 from ignite.exceptions import NotComputableError
-from ignite.metrics import SSIM
+from ignite.metrics import MultiScaleSSIM, SSIM
 
 
 def test_zero_div():
@@ -253,6 +253,94 @@ def test_ssim_uint8(available_device, shape, kernel_size, gaussian, use_sample_c
     assert np.allclose(ignite_ssim, skimg_ssim, atol=1e-5)
 
 
+def test_ssim_channels_last(available_device):
+    y_pred = torch.rand(4, 3, 64, 64, device=available_device)
+    y = y_pred * 0.8
+
+    ssim = SSIM(data_range=1.0, device=available_device)
+    ssim.update((y_pred, y))
+    ssim_channels_last = SSIM(data_range=1.0, channels_last=True, device=available_device)
+    ssim_channels_last.update((y_pred, y))
+
+    assert ssim_channels_last.compute() == pytest.approx(ssim.compute(), abs=1e-6)
+
+
+def _reference_ms_ssim(y_pred, y, betas, data_range=1.0, kernel_size=11, sigma=1.5, k1=0.01, k2=0.03):
+    # direct implementation with a 2D kernel applied to each moment
+    nb_channel = y_pred.size(1)
+    coords = torch.arange(kernel_size, dtype=torch.float64) - (kernel_size - 1) / 2
+    kernel_1d = torch.exp(-(coords**2) / (2 * sigma**2))
+    kernel_1d /= kernel_1d.sum()
+    kernel = torch.outer(kernel_1d, kernel_1d).expand(nb_channel, 1, -1, -1)
+    c1, c2 = (k1 * data_range) ** 2, (k2 * data_range) ** 2
+    pad = (kernel_size - 1) // 2
+
+    def filt(x):
+        return torch.nn.functional.conv2d(x, kernel, groups=nb_channel)
+
+    y_pred, y = y_pred.double(), y.double()
+    result = torch.ones(y_pred.size(0), dtype=torch.float64)
+    for i, beta in enumerate(betas):
+        if i > 0:
+            y_pred = torch.nn.functional.avg_pool2d(y_pred, 2)
+            y = torch.nn.functional.avg_pool2d(y, 2)
+        p = torch.nn.functional.pad(y_pred, [pad] * 4, mode="reflect")
+        t = torch.nn.functional.pad(y, [pad] * 4, mode="reflect")
+        mu_p, mu_t = filt(p), filt(t)
+        sigma_p = filt(p * p) - mu_p**2
+        sigma_t = filt(t * t) - mu_t**2
+        sigma_pt = filt(p * t) - mu_p * mu_t
+        cs = (2 * sigma_pt + c2) / (sigma_p + sigma_t + c2)
+        if i == len(betas) - 1:
+            cs = cs * (2 * mu_p * mu_t + c1) / (mu_p**2 + mu_t**2 + c1)
+        result *= cs.mean(dim=(1, 2, 3)).clamp(min=0) ** beta
+    return result.mean().item()
+
+
+def test_ms_ssim_invalid():
+    with pytest.raises(ValueError, match=r"Argument betas should be a non-empty sequence of float."):
+        MultiScaleSSIM(data_range=1.0, betas=())
+
+    ms_ssim = MultiScaleSSIM(data_range=1.0)
+    with pytest.raises(NotComputableError, match=r"MultiScaleSSIM must have at least one example"):
+        ms_ssim.compute()
+
+    y_pred = torch.rand(2, 3, 64, 64)
+    with pytest.raises(ValueError, match=r"Expected y_pred and y to have a size larger than 5 x 5 at the last of 5"):
+        ms_ssim.update((y_pred, y_pred * 0.8))
+
+    with pytest.raises(ValueError, match=r"Expected y_pred and y to have the same shape."):
+        ms_ssim.update((y_pred, y_pred[0]))
+
+
+def test_ms_ssim_single_scale():
+    torch.manual_seed(12)
+    y_pred = torch.rand(4, 3, 64, 64)
+    y = y_pred * 0.8
+
+    ssim = SSIM(data_range=1.0)
+    ssim.update((y_pred, y))
+    ms_ssim = MultiScaleSSIM(data_range=1.0, betas=(1.0,))
+    ms_ssim.update((y_pred, y))
+
+    assert ms_ssim.compute() == pytest.approx(ssim.compute(), abs=1e-6)
+
+
+@pytest.mark.parametrize("betas", [(0.0448, 0.2856, 0.3001, 0.2363, 0.1333), (0.5, 0.5)])
+def test_ms_ssim(available_device, betas):
+    torch.manual_seed(12)
+    y_pred = torch.rand(6, 3, 192, 192)
+    y = (y_pred * 0.8 + 0.1 * torch.rand_like(y_pred)).clamp(0, 1)
+
+    ms_ssim = MultiScaleSSIM(data_range=1.0, betas=betas, device=available_device)
+    for i in range(0, 6, 2):
+        ms_ssim.update((y_pred[i : i + 2].to(available_device), y[i : i + 2].to(available_device)))
+    res = ms_ssim.compute()
+
+    assert isinstance(res, float)
+    assert res == pytest.approx(_reference_ms_ssim(y_pred, y, betas), abs=1e-5)
+
+
 @pytest.mark.usefixtures("distributed")
 class TestDistributed:
     @pytest.mark.parametrize("metric_device", ["cpu", "process_device"])